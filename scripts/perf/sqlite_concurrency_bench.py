@@ -0,0 +1,185 @@
+"""SQLite read latency under a concurrent writer.
+
+Compares the default SQLite storage adapter (fresh connection per call,
+rollback journal) against high-throughput mode (WAL, per-thread connections,
+writer queue). A background writer saves evaluation runs back to back while
+reader threads time ``get_run`` / ``list_run_summaries`` calls, mimicking the
+Web UI polling while an evaluation persists results. ``--writer process`` runs
+the writer in its own process (a CLI evaluation next to the API server) so the
+numbers are not dominated by GIL contention.
+
+Log format (JSONL):
+  - event: sqlite.bench.mode
+  - ts: unix epoch seconds (float)
+  - run_id: unique identifier for this benchmark run
+  - metrics: flat fields per event (see output)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from evalvault.adapters.outbound.storage.sqlite_adapter import SQLiteStorageAdapter
+from evalvault.adapters.outbound.storage.sqlite_tuning import SQLiteTuning
+from evalvault.domain.entities import EvaluationRun, MetricScore, TestCaseResult
+
+
+def _make_run(run_id: str, size: int, dataset_name: str = "bench") -> EvaluationRun:
+    return EvaluationRun(
+        run_id=run_id,
+        dataset_name=dataset_name,
+        model_name="bench-model",
+        started_at=datetime.now(),
+        metrics_evaluated=["faithfulness", "answer_relevancy"],
+        results=[
+            TestCaseResult(
+                test_case_id=f"tc-{index:05d}",
+                metrics=[
+                    MetricScore(name="faithfulness", score=0.8, threshold=0.7),
+                    MetricScore(name="answer_relevancy", score=0.6, threshold=0.7),
+                ],
+                question="q" * 200,
+                answer="a" * 400,
+                contexts=["c" * 800],
+            )
+            for index in range(size)
+        ],
+    )
+
+
+def _write_until(
+    db_path: Path, tuning: SQLiteTuning | None, size: int, stop: Any, counter: Any
+) -> None:
+    adapter = SQLiteStorageAdapter(db_path=db_path, tuning=tuning)
+    try:
+        while not stop.is_set():
+            adapter.save_run(_make_run(f"write-{counter.value}", size))
+            with counter.get_lock():
+                counter.value += 1
+    finally:
+        adapter.close()
+
+
+def _percentile(values: list[float], value: float) -> float:
+    if not values:
+        return 0.0
+    return float(np.percentile(values, value))
+
+
+def _bench_mode(mode: str, tuning: SQLiteTuning | None, args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        adapter = SQLiteStorageAdapter(db_path=Path(tmp) / "bench.db", tuning=tuning)
+        seed_id = "seed-run"
+        # Reads target the seed dataset so their cost does not grow with the writer's output.
+        adapter.save_run(_make_run(seed_id, args.read_run_size, dataset_name="bench-seed"))
+
+        if args.writer == "process":
+            ctx = multiprocessing.get_context("spawn")
+            stop: Any = ctx.Event()
+            counter: Any = ctx.Value("i", 0)
+            writer_worker: Any = ctx.Process(
+                target=_write_until,
+                args=(adapter.db_path, tuning, args.write_run_size, stop, counter),
+                daemon=True,
+            )
+        else:
+            stop = threading.Event()
+            counter = multiprocessing.Value("i", 0)
+            writer_worker = threading.Thread(
+                target=_write_until,
+                args=(adapter.db_path, tuning, args.write_run_size, stop, counter),
+                daemon=True,
+            )
+
+        latencies: list[float] = []
+        errors = 0
+        lock = threading.Lock()
+
+        def reader() -> None:
+            nonlocal errors
+            for index in range(args.reads):
+                start = time.perf_counter()
+                try:
+                    if index % 2:
+                        adapter.list_run_summaries(limit=20, dataset_name="bench-seed")
+                    else:
+                        adapter.get_run(seed_id)
+                except Exception:
+                    with lock:
+                        errors += 1
+                    continue
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    latencies.append(elapsed)
+
+        writer_worker.start()
+        # Measure only while the writer is actually writing (spawned imports are slow).
+        while counter.value == 0 and writer_worker.is_alive():
+            time.sleep(0.05)
+        readers = [threading.Thread(target=reader) for _ in range(args.readers)]
+        wall_start = time.perf_counter()
+        for thread in readers:
+            thread.start()
+        for thread in readers:
+            thread.join()
+        wall_s = time.perf_counter() - wall_start
+        stop.set()
+        writer_worker.join()
+        adapter.close()
+
+    return {
+        "mode": mode,
+        "writer": args.writer,
+        "readers": args.readers,
+        "reads": len(latencies),
+        "read_errors": errors,
+        "read_p50_ms": round(_percentile(latencies, 50), 3),
+        "read_p95_ms": round(_percentile(latencies, 95), 3),
+        "read_p99_ms": round(_percentile(latencies, 99), 3),
+        "read_max_ms": round(max(latencies, default=0.0), 3),
+        "reads_per_sec": round(len(latencies) / wall_s, 3) if wall_s else 0.0,
+        "runs_written": counter.value,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite read latency under a concurrent writer.")
+    parser.add_argument("--writer", choices=("thread", "process"), default="process")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--reads", type=int, default=200, help="Reads per reader thread.")
+    parser.add_argument("--read-run-size", type=int, default=200)
+    parser.add_argument("--write-run-size", type=int, default=500)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    run_id = f"sqlite-bench-{int(time.time())}"
+    sink = args.output.open("a", encoding="utf-8") if args.output else None
+    try:
+        for mode, tuning in (("default", None), ("high_throughput", SQLiteTuning())):
+            record = {
+                "event": "sqlite.bench.mode",
+                "ts": time.time(),
+                "run_id": run_id,
+                **_bench_mode(mode, tuning, args),
+            }
+            line = json.dumps(record, ensure_ascii=True)
+            print(line)
+            if sink:
+                sink.write(line + "\n")
+    finally:
+        if sink:
+            sink.close()
+
+
+if __name__ == "__main__":
+    main()
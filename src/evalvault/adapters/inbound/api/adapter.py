@@ -6,6 +6,7 @@ import asyncio
 import difflib
 import json
 import logging
+import threading
 import time
 from collections.abc import Callable
 from dataclasses import asdict, dataclass
@@ -14,18 +15,26 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast
 from urllib.request import urlopen
 
+from evalvault.adapters.inbound.api.analysis_cache import (
+    AnalysisCacheKey,
+    AnalysisResultCache,
+    get_analysis_cache,
+)
 from evalvault.adapters.inbound.api.path_safety import (
     ensure_within_project_resource,
     project_resource_root,
     resolve_user_path,
     safe_upload_filename,
 )
+from evalvault.adapters.inbound.api.retriever_registry import (
+    get_retriever_registry,
+    parse_warmup_corpora,
+)
 from evalvault.adapters.outbound.analysis import (
     CausalAnalysisAdapter,
     NLPAnalysisAdapter,
     StatisticalAnalysisAdapter,
 )
-from evalvault.adapters.outbound.cache import MemoryCacheAdapter
 from evalvault.adapters.outbound.judge_calibration_reporter import JudgeCalibrationReporter
 from evalvault.adapters.outbound.ops.report_renderer import render_json, render_markdown
 from evalvault.adapters.outbound.report import MarkdownReportAdapter
@@ -274,6 +283,9 @@ class WebUIAdapter:
                                 "phoenix_annotations_enabled",
                                 True,
                             ),
+                            annotation_batch_size=getattr(
+                                settings, "phoenix_annotation_batch_size", 100
+                            ),
                         ),
                     )
                 )
@@ -334,6 +346,14 @@ class WebUIAdapter:
                 resource_name="Retriever docs path",
             )
 
+        registry = get_retriever_registry(settings)
+        retriever, doc_ids = registry.get_or_build(path, mode, self._build_retriever_index)
+
+        top_k = int(config.get("top_k") or 5)
+        return retriever, doc_ids, top_k, mode, str(path)
+
+    def _build_retriever_index(self, path: Path, mode: str) -> tuple[Any, list[str], list[str]]:
+        """Load a docs file and build its retriever (registry builder)."""
         documents, doc_ids = self._load_retriever_documents(path)
 
         try:
@@ -345,9 +365,16 @@ class WebUIAdapter:
         retriever = toolkit.build_retriever(documents, use_hybrid=mode == "hybrid", verbose=False)
         if retriever is None:
             raise RuntimeError("Retriever initialization failed.")
+        return retriever, doc_ids, documents
 
-        top_k = int(config.get("top_k") or 5)
-        return retriever, doc_ids, top_k, mode, str(path)
+    def warm_up_retrievers(self, settings: Settings | None = None) -> threading.Thread | None:
+        """Start building the corpora listed in ``api_retriever_warmup`` in the background."""
+        settings = settings or self._settings or Settings()
+        corpora = parse_warmup_corpora(getattr(settings, "api_retriever_warmup", ""))
+        if not corpora:
+            return None
+        registry = get_retriever_registry(settings)
+        return registry.warm_up(corpora, self._build_retriever_index)
 
     def _load_retriever_documents(self, file_path: Path) -> tuple[list[str], list[str]]:
         suffix = file_path.suffix.lower()
@@ -869,6 +896,32 @@ class WebUIAdapter:
 
         return result
 
+    async def learn_from_evaluation(
+        self,
+        run: EvaluationRun,
+        memory_config: dict[str, Any],
+    ) -> None:
+        """평가 결과로 도메인 메모리를 학습합니다 (스트리밍 실행/worker 공용)."""
+        from evalvault.adapters.outbound.domain_memory import build_domain_memory_adapter
+        from evalvault.domain.services.domain_learning_hook import DomainLearningHook
+
+        settings = self._settings or Settings()
+        if memory_config.get("db_path"):
+            memory_db = memory_config.get("db_path")
+        elif settings.db_backend == "sqlite":
+            memory_db = settings.evalvault_memory_db_path
+        else:
+            memory_db = None
+        memory_adapter = build_domain_memory_adapter(
+            settings=settings, db_path=Path(memory_db) if memory_db else None
+        )
+        hook = DomainLearningHook(memory_adapter)
+        await hook.on_evaluation_complete(
+            evaluation_run=run,
+            domain=memory_config.get("domain") or "default",
+            language=memory_config.get("language") or "ko",
+        )
+
     def _auto_generate_cluster_map(
         self,
         run: EvaluationRun,
@@ -914,12 +967,14 @@ class WebUIAdapter:
         offset: int = 0,
         filters: RunFilters | None = None,
         project_id: str | None = None,
+        after: tuple[datetime, str] | None = None,
     ) -> list[RunSummary]:
         """평가 목록 조회.
 
         Args:
             limit: 최대 조회 개수
             filters: 필터 조건
+            after: 이전 페이지 마지막 run의 ``(started_at, run_id)`` keyset 커서
 
         Returns:
             평가 요약 목록
@@ -932,7 +987,19 @@ class WebUIAdapter:
 
         try:
             # 저장소에서 평가 목록 조회 (G4: project_id 지정 시 저장소 단 필터링)
-            runs = self._storage.list_runs(limit=limit, offset=offset, project_id=project_id)
+            list_summaries = getattr(self._storage, "list_run_summaries", None)
+            if callable(list_summaries):
+                # 집계 SQL 경로: 테스트 케이스 본문을 적재하지 않고 요약만 조회
+                runs = list_summaries(
+                    limit=limit,
+                    offset=offset,
+                    after=after,
+                    dataset_name=filters.dataset_name if filters else None,
+                    model_name=filters.model_name if filters else None,
+                    project_id=project_id,
+                )
+            else:
+                runs = self._storage.list_runs(limit=limit, offset=offset, project_id=project_id)
 
             # RunSummary로 변환
             summaries = []
@@ -1223,6 +1290,7 @@ class WebUIAdapter:
         )
         metadata["judge_calibration_history"] = history
         storage.update_run_metadata(run_id, metadata)
+        self._analysis_cache().invalidate_run(run_id, storage=storage)
         return payload
 
     def get_judge_calibration(self, calibration_id: str) -> dict[str, object]:
@@ -1485,10 +1553,20 @@ class WebUIAdapter:
             return False
 
         try:
-            return self._storage.delete_run(run_id)
+            deleted = self._storage.delete_run(run_id)
         except Exception as e:
             logger.error(f"Failed to delete run {run_id}: {e}")
             return False
+        if deleted:
+            self._analysis_cache().invalidate_run(run_id)
+        return deleted
+
+    def _analysis_cache(self) -> AnalysisResultCache:
+        return get_analysis_cache(self._settings or Settings())
+
+    def get_analysis_cache_stats(self) -> dict[str, Any]:
+        """서버 공용 분석 캐시 통계 (누적 + 직전 조회 이후 hit rate)."""
+        return self._analysis_cache().stats_window()
 
     def _build_analysis_bundle(
         self,
@@ -1504,8 +1582,24 @@ class WebUIAdapter:
         if not run.results:
             raise ValueError("Run has no results to analyze")
 
+        # 같은 run의 반복 요청(대시보드/리포트)은 서버 공용 캐시로 재사용.
+        # 결과 수/종료 시각을 옵션에 포함해 결과가 추가되는 run은 새 키가 된다.
+        cache = self._analysis_cache()
+        cache_key = AnalysisCacheKey.build(
+            run.run_id,
+            "bundle",
+            {
+                "nlp": include_nlp,
+                "causal": include_causal,
+                "results": len(run.results),
+                "finished_at": run.finished_at.isoformat() if run.finished_at else None,
+            },
+        )
+        cached = cache.get(cache_key, storage=self._storage)
+        if cached is not None:
+            return cached
+
         analysis_adapter = StatisticalAnalysisAdapter()
-        cache_adapter = MemoryCacheAdapter()
 
         nlp_adapter = None
         if include_nlp:
@@ -1531,9 +1625,12 @@ class WebUIAdapter:
             analysis_adapter=analysis_adapter,
             nlp_adapter=nlp_adapter,
             causal_adapter=causal_adapter,
-            cache_adapter=cache_adapter,
         )
-        return service.analyze_run(run, include_nlp=include_nlp, include_causal=include_causal)
+        bundle = service.analyze_run(run, include_nlp=include_nlp, include_causal=include_causal)
+        # LLM 초기화 실패로 NLP가 빠진 결과는 캐시하지 않는다 (다음 요청에서 재시도)
+        if not include_nlp or nlp_adapter is not None:
+            cache.set(cache_key, bundle, storage=self._storage)
+        return bundle
 
     @staticmethod
     def _build_dashboard_payload(bundle: AnalysisBundle) -> dict[str, Any]:
@@ -2346,7 +2443,7 @@ def create_adapter() -> WebUIAdapter:
 
     # Evaluator 생성
     llm_factory = SettingsLLMFactory(settings)
-    korean_toolkit = try_create_korean_toolkit()
+    korean_toolkit = try_create_korean_toolkit(settings)
     evaluator = RagasEvaluator(korean_toolkit=korean_toolkit, llm_factory=llm_factory)
 
     return WebUIAdapter(
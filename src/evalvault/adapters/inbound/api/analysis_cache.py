@@ -0,0 +1,203 @@
+"""Server-scoped analysis result cache for the API.
+
+Dashboard and analysis-report endpoints used to hand ``AnalysisService`` a
+fresh ``MemoryCacheAdapter`` per request, so statistical/NLP/causal analysis of
+the same finished run was recomputed on every call. This cache is shared by
+the whole server process:
+
+- Keys: run id, analysis type and options. Options include the result count
+  and finish time, so a run that is still receiving results gets a new key.
+- Memory tier: ``HybridCache`` (hot/cold LRU + TTL).
+- Optional persistent tier: the ``analysis_cache`` table of the run DB, which
+  survives restarts and cascades with run deletion.
+- ``invalidate_run`` drops every entry of a run (deletion, metadata update).
+- ``get_stats`` is ``CacheStatsTracker`` compatible.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import pickle
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from evalvault.adapters.outbound.cache import HybridCache
+from evalvault.domain.services.cache_metrics import CacheStatsTracker
+
+if TYPE_CHECKING:
+    from evalvault.config.settings import Settings
+    from evalvault.ports.outbound.storage_port import StoragePort
+
+logger = logging.getLogger(__name__)
+
+# 영속 계층 payload 포맷 버전 (엔티티 구조 변경 시 증가시켜 이전 row를 무효화)
+_PAYLOAD_VERSION = b"evalvault-analysis-v1:"
+
+
+@dataclass(frozen=True)
+class AnalysisCacheKey:
+    """Identity of a cached analysis: run id, analysis type and options digest."""
+
+    run_id: str
+    analysis_type: str
+    options_digest: str
+
+    @classmethod
+    def build(cls, run_id: str, analysis_type: str, options: dict[str, Any]) -> AnalysisCacheKey:
+        encoded = json.dumps(options, sort_keys=True, default=str).encode("utf-8")
+        return cls(run_id, analysis_type, hashlib.sha256(encoded).hexdigest()[:32])
+
+    @property
+    def cache_key(self) -> str:
+        return f"{run_prefix(self.run_id)}{self.analysis_type}:{self.options_digest}"
+
+
+def run_prefix(run_id: str) -> str:
+    return f"analysis:{run_id}:"
+
+
+class AnalysisResultCache:
+    """Two-tier cache of analysis results shared across API requests."""
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 256,
+        ttl_seconds: int = 24 * 3600,
+        persist: bool = False,
+    ) -> None:
+        self.enabled = max_size > 0
+        self.persist = persist
+        self._memory = HybridCache(max_size=max(1, max_size), ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._tracker = CacheStatsTracker(self.get_stats)
+        self._tracker.reset()
+
+    def get(self, key: AnalysisCacheKey, *, storage: StoragePort | None = None) -> Any | None:
+        """Return the cached value from memory, then from the run DB, or ``None``."""
+        if not self.enabled:
+            return None
+        value = self._memory.get(key.cache_key)
+        if value is not None:
+            with self._lock:
+                self._hits += 1
+            return value
+
+        value = self._load_persistent(key, storage)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._persistent_hits += 1
+        if value is not None:
+            self._memory.set(key.cache_key, value)
+        return value
+
+    def set(self, key: AnalysisCacheKey, value: Any, *, storage: StoragePort | None = None) -> None:
+        if not self.enabled or value is None:
+            return
+        self._memory.set(key.cache_key, value)
+        if self.persist and storage is not None:
+            try:
+                payload = _PAYLOAD_VERSION + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                storage.save_analysis_cache_entry(
+                    key.cache_key, key.run_id, key.analysis_type, payload
+                )
+            except Exception as exc:
+                logger.warning("Failed to persist analysis cache for %s: %s", key.run_id, exc)
+
+    def invalidate_run(self, run_id: str, *, storage: StoragePort | None = None) -> int:
+        """Drop every cached analysis of ``run_id``; returns the memory entries removed."""
+        removed = self._memory.delete_prefix(run_prefix(run_id))
+        with self._lock:
+            self._invalidations += 1
+        if self.persist and storage is not None:
+            try:
+                storage.delete_analysis_cache_entries(run_id)
+            except Exception as exc:
+                logger.warning("Failed to invalidate analysis cache for %s: %s", run_id, exc)
+        return removed
+
+    def _load_persistent(self, key: AnalysisCacheKey, storage: StoragePort | None) -> Any | None:
+        if not self.persist or storage is None:
+            return None
+        try:
+            payload = storage.get_analysis_cache_entry(key.cache_key)
+        except Exception as exc:
+            logger.debug("Analysis cache lookup failed for %s: %s", key.run_id, exc)
+            return None
+        if not payload or not payload.startswith(_PAYLOAD_VERSION):
+            return None
+        try:
+            return pickle.loads(payload[len(_PAYLOAD_VERSION) :])  # noqa: S301 - own run DB
+        except Exception as exc:
+            logger.debug("Discarding unreadable analysis cache row for %s: %s", key.run_id, exc)
+            return None
+
+    def clear(self) -> None:
+        self._memory.clear()
+        with self._lock:
+            self._hits = self._persistent_hits = self._misses = self._invalidations = 0
+        self._tracker.reset()
+
+    def get_stats(self) -> dict[str, Any]:
+        memory = self._memory.get_stats()
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "persist": self.persist,
+                "total_size": memory["total_size"],
+                "max_size": memory["max_size"],
+                "hits": self._hits,
+                "memory_hits": self._hits - self._persistent_hits,
+                "persistent_hits": self._persistent_hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "invalidations": self._invalidations,
+            }
+
+    def stats_window(self) -> dict[str, Any]:
+        """Cumulative stats plus the hit rate since the previous call."""
+        window = self._tracker.window()
+        stats = self.get_stats()
+        stats["window"] = {
+            "hits": window.hits,
+            "misses": window.misses,
+            "hit_rate": window.hit_rate,
+            "duration_seconds": window.duration_seconds,
+        }
+        return stats
+
+
+_cache: AnalysisResultCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_analysis_cache(settings: Settings | None = None) -> AnalysisResultCache:
+    """Return the process-wide analysis cache, created from ``settings`` on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = AnalysisResultCache(
+                max_size=int(getattr(settings, "api_analysis_cache_size", 256)),
+                ttl_seconds=int(getattr(settings, "api_analysis_cache_ttl_seconds", 24 * 3600)),
+                persist=bool(getattr(settings, "api_analysis_cache_persist", False)),
+            )
+        return _cache
+
+
+__all__ = [
+    "AnalysisCacheKey",
+    "AnalysisResultCache",
+    "get_analysis_cache",
+    "run_prefix",
+]
@@ -0,0 +1,228 @@
+"""Out-of-process evaluation worker (``evalvault worker``).
+
+``POST /api/v1/jobs`` only records a job; a worker claims it from the job table
+and runs ``WebUIAdapter.run_evaluation`` in a dedicated child process, so long
+CPU phases (Kiwi, embeddings) never share the API server's event loop and an
+evaluation outlives any HTTP connection.
+
+- Bounded concurrency: ``concurrency`` child processes per worker and
+  ``max_per_project`` running jobs per project across all workers.
+- Progress is written to the job row (throttled) so any client can re-attach.
+- Cancellation: the supervisor terminates the child when ``cancel_requested``
+  is set on a running job.
+- Recovery: the supervisor heartbeats its jobs; jobs whose heartbeat goes stale
+  (crashed or killed worker) are requeued up to ``max_attempts`` times.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from evalvault.domain.entities.job import EvaluationJob, JobStatus
+from evalvault.ports.inbound.web_port import EvalProgress, EvalRequest
+from evalvault.ports.outbound.job_queue_port import JobQueuePort
+
+if TYPE_CHECKING:
+    from evalvault.adapters.inbound.api.adapter import WebUIAdapter
+
+logger = logging.getLogger(__name__)
+
+# 진행 상황 DB 기록 최소 간격 (상태 변경은 즉시 기록)
+_PROGRESS_INTERVAL_SECONDS = 0.5
+_TERMINATE_TIMEOUT_SECONDS = 10.0
+
+
+def execute_job(
+    job: EvaluationJob,
+    *,
+    queue: JobQueuePort,
+    adapter: WebUIAdapter,
+    progress_interval: float = _PROGRESS_INTERVAL_SECONDS,
+) -> JobStatus:
+    """Run one claimed job to completion and record its outcome."""
+    request = EvalRequest(**job.payload)
+    last_write = 0.0
+    last_status: str | None = None
+
+    def on_progress(progress: EvalProgress) -> None:
+        nonlocal last_write, last_status
+        now = time.monotonic()
+        if progress.status == last_status and now - last_write < progress_interval:
+            return
+        last_write, last_status = now, progress.status
+        try:
+            queue.update_progress(job.job_id, progress.to_event_data())
+        except Exception as exc:
+            logger.warning("Failed to record progress for job %s: %s", job.job_id, exc)
+
+    try:
+        run = asyncio.run(adapter.run_evaluation(request, on_progress=on_progress))
+    except Exception as exc:
+        logger.exception("Evaluation job %s failed", job.job_id)
+        queue.finish(job.job_id, JobStatus.FAILED, error=str(exc) or type(exc).__name__)
+        return JobStatus.FAILED
+
+    memory_config = request.memory_config or {}
+    if memory_config.get("enabled"):
+        try:
+            asyncio.run(adapter.learn_from_evaluation(run, memory_config))
+        except Exception as exc:
+            logger.warning("Domain learning failed for job %s: %s", job.job_id, exc)
+
+    queue.finish(job.job_id, JobStatus.SUCCEEDED, run_id=run.run_id)
+    return JobStatus.SUCCEEDED
+
+
+def run_job_process(job_id: str) -> None:
+    """Child process entry point: build fresh adapters and execute ``job_id``."""
+    from evalvault.adapters.inbound.api.adapter import create_adapter
+    from evalvault.adapters.outbound.storage.job_queue_factory import build_job_queue_adapter
+    from evalvault.config.settings import get_settings
+
+    queue = build_job_queue_adapter(get_settings())
+    job = queue.get_job(job_id)
+    if job is None or job.status != JobStatus.RUNNING:
+        return
+    execute_job(job, queue=queue, adapter=create_adapter())
+
+
+@dataclass
+class _RunningJob:
+    job_id: str
+    process: Any
+    last_heartbeat: float
+
+
+class JobWorker:
+    """Supervisor that claims jobs and runs each in its own process."""
+
+    def __init__(
+        self,
+        queue: JobQueuePort,
+        *,
+        concurrency: int = 4,
+        max_per_project: int = 2,
+        poll_interval: float = 1.0,
+        stale_after_seconds: float = 300.0,
+        max_attempts: int = 3,
+        worker_id: str | None = None,
+        target: Callable[[str], None] = run_job_process,
+        mp_context: Any = None,
+    ) -> None:
+        self.queue = queue
+        self.concurrency = max(1, concurrency)
+        self.max_per_project = max(1, max_per_project)
+        self.poll_interval = poll_interval
+        self.stale_after_seconds = stale_after_seconds
+        self.max_attempts = max_attempts
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._target = target
+        # 서버 라이브러리(스레드/커넥션 풀) 상태를 물려받지 않도록 기본은 spawn
+        self._context = mp_context or multiprocessing.get_context("spawn")
+        self._running: dict[str, _RunningJob] = {}
+        self._last_recovery = 0.0
+
+    @property
+    def running_job_ids(self) -> list[str]:
+        return list(self._running)
+
+    def run(self, stop_event: threading.Event) -> None:
+        """Poll until ``stop_event`` is set, then wait for running jobs to finish."""
+        logger.info("Worker %s started (concurrency=%d)", self.worker_id, self.concurrency)
+        while not stop_event.is_set():
+            self.tick()
+            stop_event.wait(self.poll_interval)
+        self.drain()
+
+    def tick(self) -> None:
+        """One supervision round: reap, cancel/heartbeat, recover, then claim."""
+        self._reap()
+        self._cancel_or_heartbeat()
+        self._recover_stale()
+        self._fill()
+
+    def drain(self, timeout: float | None = None) -> None:
+        """Wait for running jobs; jobs still running after ``timeout`` are left to recovery."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._running:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            self._reap()
+            self._cancel_or_heartbeat()
+            time.sleep(min(self.poll_interval, 0.5))
+
+    def terminate_all(self) -> None:
+        """Stop child processes immediately; their jobs are requeued once stale."""
+        for running in self._running.values():
+            running.process.terminate()
+        for running in self._running.values():
+            running.process.join(_TERMINATE_TIMEOUT_SECONDS)
+        self._running.clear()
+
+    def _reap(self) -> None:
+        for job_id, running in list(self._running.items()):
+            if running.process.is_alive():
+                continue
+            running.process.join()
+            exitcode = running.process.exitcode
+            # 정상 종료한 자식은 이미 결과를 기록했으므로 finish는 no-op
+            if self.queue.finish(
+                job_id,
+                JobStatus.FAILED,
+                error=f"Worker process exited with code {exitcode} before finishing",
+            ):
+                logger.warning("Job %s process exited with code %s", job_id, exitcode)
+            del self._running[job_id]
+
+    def _cancel_or_heartbeat(self) -> None:
+        now = time.monotonic()
+        heartbeat_every = max(self.poll_interval, self.stale_after_seconds / 5)
+        for job_id, running in list(self._running.items()):
+            job = self.queue.get_job(job_id)
+            if job is not None and job.cancel_requested:
+                running.process.terminate()
+                running.process.join(_TERMINATE_TIMEOUT_SECONDS)
+                self.queue.finish(job_id, JobStatus.CANCELLED, error="Cancelled by request")
+                del self._running[job_id]
+                logger.info("Job %s cancelled", job_id)
+                continue
+            if now - running.last_heartbeat >= heartbeat_every:
+                self.queue.update_progress(job_id)
+                running.last_heartbeat = now
+
+    def _recover_stale(self) -> None:
+        now = time.monotonic()
+        if now - self._last_recovery < self.stale_after_seconds / 2:
+            return
+        self._last_recovery = now
+        requeued = self.queue.requeue_stale(
+            self.stale_after_seconds, max_attempts=self.max_attempts
+        )
+        if requeued:
+            logger.warning("Requeued %d job(s) abandoned by other workers", requeued)
+
+    def _fill(self) -> None:
+        while len(self._running) < self.concurrency:
+            job = self.queue.claim_next(self.worker_id, max_per_project=self.max_per_project)
+            if job is None:
+                return
+            process = self._context.Process(
+                target=self._target,
+                args=(job.job_id,),
+                name=f"evalvault-job-{job.job_id[:8]}",
+            )
+            process.start()
+            self._running[job.job_id] = _RunningJob(job.job_id, process, time.monotonic())
+            logger.info("Job %s started in process %s", job.job_id, process.pid)
+
+
+__all__ = ["JobWorker", "execute_job", "run_job_process"]
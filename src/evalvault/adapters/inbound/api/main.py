@@ -28,6 +28,7 @@ from evalvault.config.settings import Settings, get_settings, is_production_prof
 from evalvault.domain.services.authorization import Principal
 from evalvault.ports.outbound.auth_port import PasswordHasherPort, TokenError, TokenServicePort
 from evalvault.ports.outbound.identity_port import IdentityStoragePort
+from evalvault.ports.outbound.job_queue_port import JobQueuePort
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +77,10 @@ async def lifespan(app: FastAPI):
     adapter = create_adapter()
     app.state.adapter = adapter
     ensure_local_observability(get_settings())
+    try:
+        adapter.warm_up_retrievers(get_settings())
+    except Exception as exc:
+        logger.warning("Retriever warm-up failed to start: %s", exc)
     try:
         from evalvault.adapters.inbound.api.routers.chat import warm_rag_index
 
@@ -83,8 +88,10 @@ async def lifespan(app: FastAPI):
     except Exception as exc:
         logger.warning("RAG preload failed: %s", exc)
     yield
-    # Shutdown: Cleanup if necessary
-    pass
+    # Shutdown: release pooled PostgreSQL connections opened by async routes
+    from evalvault.adapters.outbound.storage.postgres_pool import close_async_connection_pools
+
+    await close_async_connection_pools()
 
 
 auth_scheme = HTTPBearer(auto_error=False)
@@ -276,9 +283,7 @@ def _handle_project_access_denied(request: Request, exc: Exception) -> JSONRespo
 
 
 def _handle_insufficient_role(request: Request, exc: Exception) -> JSONResponse:
-    return JSONResponse(
-        status_code=403, content={"detail": "Insufficient role for this operation"}
-    )
+    return JSONResponse(status_code=403, content={"detail": "Insufficient role for this operation"})
 
 
 def create_app() -> FastAPI:
@@ -344,6 +349,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     from .routers import (
@@ -352,6 +358,7 @@ def create_app() -> FastAPI:
         chat,
         config,
         domain,
+        jobs,
         knowledge,
         mcp,
         pipeline,
@@ -418,6 +425,12 @@ def create_app() -> FastAPI:
         tags=["calibration"],
         dependencies=auth_dependencies,
     )
+    app.include_router(
+        jobs.router,
+        prefix="/api/v1/jobs",
+        tags=["jobs"],
+        dependencies=auth_dependencies,
+    )
 
     @app.get("/health")
     def health_check():
@@ -444,3 +457,18 @@ def get_web_adapter(request: Request) -> WebUIAdapter:
 
 
 AdapterDep = Annotated[WebUIAdapter, Depends(get_web_adapter)]
+
+
+def get_job_queue(request: Request) -> JobQueuePort:
+    """FastAPI dependency for the evaluation job queue (built lazily from settings)."""
+    queue = getattr(request.app.state, "job_queue", None)
+    if queue is not None:
+        return queue
+    from evalvault.adapters.outbound.storage.job_queue_factory import build_job_queue_adapter
+
+    queue = build_job_queue_adapter(get_settings())
+    request.app.state.job_queue = queue
+    return queue
+
+
+JobQueueDep = Annotated[JobQueuePort, Depends(get_job_queue)]
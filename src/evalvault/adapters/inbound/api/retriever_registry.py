@@ -0,0 +1,260 @@
+"""Process-wide retriever registry for the API server.
+
+``POST /api/runs/start`` with a ``retriever_config`` used to reload the docs
+file and rebuild the retriever (Kiwi tokenization + embeddings) on every
+request. The registry keeps built retrievers keyed by corpus fingerprint
+(resolved path, mtime, size, content hash) and mode, so consecutive runs over
+the same corpus reuse one index.
+
+- Single-flight: concurrent requests for the same key wait on one build.
+- LRU eviction by an estimated memory footprint (``api_retriever_cache_mb``).
+- ``warm_up`` builds configured corpora in the background at server start.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from evalvault.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# 토큰/역색인 등 텍스트에서 파생되는 구조의 대략적인 배수
+_TEXT_OVERHEAD = 4
+_FOOTPRINT_SCAN_DEPTH = 3
+
+
+@dataclass(frozen=True)
+class CorpusKey:
+    """Identity of a retriever build: corpus file fingerprint plus mode."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    content_hash: str
+    mode: str
+
+
+@dataclass
+class RetrieverEntry:
+    retriever: Any
+    doc_ids: list[str]
+    footprint_bytes: int
+
+
+RetrieverBuilder = Callable[[Path, str], tuple[Any, list[str], Sequence[str]]]
+
+
+def estimate_footprint(retriever: Any, documents: Sequence[str]) -> int:
+    """Estimate the resident size of a built retriever in bytes.
+
+    Counts the corpus text (times an overhead factor for tokens and postings)
+    plus every numpy array reachable from the retriever's attributes, which is
+    where dense embeddings live.
+    """
+    text_bytes = sum(len(document.encode("utf-8")) for document in documents)
+    return text_bytes * _TEXT_OVERHEAD + _array_bytes(retriever, _FOOTPRINT_SCAN_DEPTH, set())
+
+
+def _array_bytes(obj: Any, depth: int, seen: set[int]) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if depth <= 0:
+        return 0
+    if isinstance(obj, dict):
+        children: Iterable[Any] = obj.values()
+    elif isinstance(obj, list | tuple):
+        children = obj if obj and isinstance(obj[0], np.ndarray) else ()
+    elif hasattr(obj, "__dict__"):
+        children = vars(obj).values()
+    else:
+        return 0
+    return sum(_array_bytes(child, depth - 1, seen) for child in children)
+
+
+class RetrieverRegistry:
+    """LRU cache of built retrievers with single-flight construction."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries: OrderedDict[CorpusKey, RetrieverEntry] = OrderedDict()
+        self._building: dict[CorpusKey, Future[RetrieverEntry]] = {}
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def corpus_key(self, path: Path, mode: str) -> CorpusKey:
+        """Fingerprint ``path``; the content hash is recomputed only when mtime/size change."""
+        resolved = path.resolve()
+        stat = resolved.stat()
+        stat_key = (str(resolved), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._digests.get(stat_key)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with resolved.open("rb") as handle:
+                for block in iter(lambda: handle.read(1 << 20), b""):
+                    hasher.update(block)
+            digest = hasher.hexdigest()
+            with self._lock:
+                self._digests = {
+                    key: value for key, value in self._digests.items() if key[0] != stat_key[0]
+                }
+                self._digests[stat_key] = digest
+        return CorpusKey(
+            path=stat_key[0],
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=digest,
+            mode=mode,
+        )
+
+    def get_or_build(
+        self, path: Path, mode: str, builder: RetrieverBuilder
+    ) -> tuple[Any, list[str]]:
+        """Return the cached retriever for ``path``/``mode``, building it at most once.
+
+        ``builder(path, mode)`` returns ``(retriever, doc_ids, documents)``.
+        A failed build is not cached; every waiter receives the exception.
+        """
+        key = self.corpus_key(path, mode)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.retriever, entry.doc_ids
+            self._misses += 1
+            future = self._building.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._building[key] = future
+        assert future is not None
+
+        if not owner:
+            entry = future.result()
+            return entry.retriever, entry.doc_ids
+
+        try:
+            retriever, doc_ids, documents = builder(path, mode)
+            entry = RetrieverEntry(
+                retriever=retriever,
+                doc_ids=list(doc_ids),
+                footprint_bytes=estimate_footprint(retriever, documents),
+            )
+        except BaseException as exc:
+            with self._lock:
+                self._building.pop(key, None)
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._building.pop(key, None)
+            if self.max_bytes:
+                self._store(key, entry)
+        future.set_result(entry)
+        return entry.retriever, entry.doc_ids
+
+    def _store(self, key: CorpusKey, entry: RetrieverEntry) -> None:
+        # 같은 경로의 이전 버전(파일 변경 전 인덱스)은 더 이상 쓰이지 않으므로 제거
+        for stale in [k for k in self._entries if k.path == key.path and k.mode == key.mode]:
+            del self._entries[stale]
+            self._evictions += 1
+        self._entries[key] = entry
+        total = sum(item.footprint_bytes for item in self._entries.values())
+        # 가장 최근 항목은 예산을 넘더라도 유지 (방금 요청한 run이 사용)
+        while total > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            total -= evicted.footprint_bytes
+            self._evictions += 1
+
+    def warm_up(
+        self, corpora: Iterable[tuple[str, Path]], builder: RetrieverBuilder
+    ) -> threading.Thread:
+        """Build ``(mode, path)`` corpora on a daemon thread; failures are logged."""
+
+        targets = list(corpora)
+
+        def run() -> None:
+            for mode, path in targets:
+                try:
+                    self.get_or_build(path, mode, builder)
+                    logger.info("Retriever warm-up finished: %s (%s)", path, mode)
+                except Exception as exc:
+                    logger.warning("Retriever warm-up failed for %s (%s): %s", path, mode, exc)
+
+        thread = threading.Thread(target=run, name="retriever-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._digests.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "building": len(self._building),
+                "footprint_bytes": sum(item.footprint_bytes for item in self._entries.values()),
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+
+def parse_warmup_corpora(raw: str | None) -> list[tuple[str, Path]]:
+    """Parse ``mode:path`` pairs separated by commas (mode defaults to bm25)."""
+    corpora: list[tuple[str, Path]] = []
+    for item in (raw or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        mode, sep, path = item.partition(":")
+        if not sep or mode.strip().lower() not in {"bm25", "hybrid"}:
+            mode, path = "bm25", item
+        corpora.append((mode.strip().lower(), Path(path.strip())))
+    return corpora
+
+
+_registry: RetrieverRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_retriever_registry(settings: Settings | None = None) -> RetrieverRegistry:
+    """Return the process-wide registry, created from ``settings`` on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            max_mb = int(getattr(settings, "api_retriever_cache_mb", 2048)) if settings else 2048
+            _registry = RetrieverRegistry(max_bytes=max_mb * 1024 * 1024)
+        return _registry
+
+
+__all__ = [
+    "CorpusKey",
+    "RetrieverEntry",
+    "RetrieverRegistry",
+    "estimate_footprint",
+    "get_retriever_registry",
+    "parse_warmup_corpora",
+]
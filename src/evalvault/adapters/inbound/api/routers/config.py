@@ -107,6 +107,44 @@ def update_config(
     )
 
 
+@router.get("/storage-pool")
+async def get_storage_pool(ping: bool = False):
+    """PostgreSQL connection pool saturation and wait-time metrics.
+
+    ``ping=true`` checks out a connection from the shared async pool and runs
+    ``SELECT 1`` without occupying a threadpool worker.
+    """
+    import time
+
+    from evalvault.adapters.outbound.storage.postgres_pool import (
+        PostgresPoolConfig,
+        build_postgres_conninfo,
+        get_async_connection_pool,
+        pool_stats,
+    )
+
+    settings = get_settings()
+    payload: dict[str, object] = {"backend": settings.db_backend, "pools": pool_stats()}
+    pool_config = PostgresPoolConfig.from_settings(settings)
+    payload["pooling"] = pool_config is not None
+    if ping and settings.db_backend == "postgres" and pool_config is not None:
+        started = time.perf_counter()
+        try:
+            pool = await get_async_connection_pool(build_postgres_conninfo(settings), pool_config)
+            async with pool.connection() as conn:
+                await conn.execute("SELECT 1")
+            payload["ping_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        except Exception as exc:
+            payload["ping_error"] = str(exc)
+    return payload
+
+
+@router.get("/analysis-cache")
+def get_analysis_cache_stats(adapter: AdapterDep):
+    """Server-wide analysis cache hit rates (cumulative and since the previous call)."""
+    return adapter.get_analysis_cache_stats()
+
+
 @router.get("/profiles")
 def list_profiles():
     """List available model profiles for selection."""
@@ -0,0 +1,174 @@
+"""Durable evaluation jobs.
+
+``POST /jobs`` records an evaluation in the job table and returns immediately;
+an ``evalvault worker`` process claims and runs it. Progress lives on the job
+row, so any client can re-attach through ``GET /jobs/{job_id}/events``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import asdict
+from typing import Any, Literal
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from evalvault.adapters.inbound.api.main import JobQueueDep, PrincipalDep, ProjectIdDep
+from evalvault.adapters.inbound.api.principal import (
+    ProjectAccessDeniedError,
+    require_member,
+    require_role,
+)
+from evalvault.adapters.inbound.api.routers.runs import (
+    StartEvaluationRequest,
+    build_eval_request,
+)
+from evalvault.config.settings import get_settings
+from evalvault.domain.entities.auth import DEFAULT_PROJECT_ID, Role
+from evalvault.domain.entities.job import EvaluationJob, JobStatus
+from evalvault.domain.services.authorization import Principal
+from evalvault.ports.outbound.job_queue_port import JobQueuePort
+
+router = APIRouter()
+
+
+def _get_scoped_job(
+    queue: JobQueuePort,
+    job_id: str,
+    principal: Principal | None,
+    project_id: str | None,
+) -> EvaluationJob:
+    """Load a job; with a project context, a foreign job is reported as missing."""
+    if project_id is not None:
+        require_member(principal, project_id)
+    job = queue.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if project_id is not None and job.project_id != project_id:
+        raise ProjectAccessDeniedError(job_id)
+    return job
+
+
+def _job_event(job: EvaluationJob) -> dict[str, Any]:
+    if job.status == JobStatus.SUCCEEDED:
+        return {
+            "type": "result",
+            "data": {"run_id": job.run_id, "status": "completed", "job_id": job.job_id},
+        }
+    if job.status == JobStatus.CANCELLED:
+        return {"type": "cancelled", "data": {"job_id": job.job_id}}
+    return {"type": "error", "message": job.error or "Evaluation job failed"}
+
+
+def _format_event(event: dict[str, Any], fmt: str) -> str:
+    payload = json.dumps(event, ensure_ascii=False)
+    if fmt == "sse":
+        return f"event: {event['type']}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+
+@router.post("", status_code=202)
+def enqueue_evaluation_job(
+    request: StartEvaluationRequest,
+    queue: JobQueueDep,
+    principal: PrincipalDep,
+    project_id: ProjectIdDep,
+) -> dict[str, Any]:
+    """Queue an evaluation for an ``evalvault worker`` (same body as ``/runs/start``)."""
+    eval_req = build_eval_request(request, principal, project_id)
+    job = EvaluationJob(
+        payload=asdict(eval_req),
+        project_id=eval_req.project_id or DEFAULT_PROJECT_ID,
+    )
+    queue.enqueue(job)
+    return job.to_dict()
+
+
+@router.get("")
+def list_evaluation_jobs(
+    queue: JobQueueDep,
+    principal: PrincipalDep,
+    project_id: ProjectIdDep,
+    status: list[JobStatus] | None = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+) -> list[dict[str, Any]]:
+    """List recent jobs, newest first."""
+    if project_id is not None:
+        require_member(principal, project_id)
+    jobs = queue.list_jobs(project_id=project_id, statuses=status, limit=limit)
+    return [job.to_dict() for job in jobs]
+
+
+@router.get("/{job_id}")
+def get_evaluation_job(
+    job_id: str,
+    queue: JobQueueDep,
+    principal: PrincipalDep,
+    project_id: ProjectIdDep,
+) -> dict[str, Any]:
+    return _get_scoped_job(queue, job_id, principal, project_id).to_dict()
+
+
+@router.post("/{job_id}/cancel")
+def cancel_evaluation_job(
+    job_id: str,
+    queue: JobQueueDep,
+    principal: PrincipalDep,
+    project_id: ProjectIdDep,
+) -> dict[str, Any]:
+    """Cancel a job: queued jobs stop at once, running ones when the worker notices."""
+    job = _get_scoped_job(queue, job_id, principal, project_id)
+    if project_id is not None:
+        require_role(principal, project_id, Role.editor)
+    if job.status.is_terminal:
+        raise HTTPException(status_code=409, detail=f"Job already {job.status.value}")
+    cancelled = queue.request_cancel(job_id)
+    if cancelled is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return cancelled.to_dict()
+
+
+@router.get("/{job_id}/events")
+async def stream_evaluation_job(
+    job_id: str,
+    queue: JobQueueDep,
+    principal: PrincipalDep,
+    project_id: ProjectIdDep,
+    format: Literal["ndjson", "sse"] = Query("ndjson"),
+) -> StreamingResponse:
+    """Stream job progress until it finishes; safe to (re-)attach at any time.
+
+    Events use the ``/runs/start`` shapes (``progress`` / ``result`` / ``error``)
+    plus ``status`` on queue transitions and ``cancelled``.
+    """
+    job = _get_scoped_job(queue, job_id, principal, project_id)
+    poll_interval = get_settings().job_poll_interval_seconds
+
+    async def event_generator():
+        current = job
+        last_status: JobStatus | None = None
+        last_progress: dict[str, Any] | None = None
+        while True:
+            if current.status != last_status:
+                last_status = current.status
+                yield _format_event(
+                    {"type": "status", "data": {"job_id": job_id, "status": current.status}},
+                    format,
+                )
+            if current.progress and current.progress != last_progress:
+                last_progress = current.progress
+                yield _format_event({"type": "progress", "data": current.progress}, format)
+            if current.status.is_terminal:
+                yield _format_event(_job_event(current), format)
+                return
+            await asyncio.sleep(poll_interval)
+            refreshed = await asyncio.to_thread(queue.get_job, job_id)
+            if refreshed is None:
+                yield _format_event({"type": "error", "message": "Job not found"}, format)
+                return
+            current = refreshed
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(event_generator(), media_type=media_type)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import base64
 import csv
 import json
 from datetime import datetime
@@ -31,16 +32,14 @@ from evalvault.adapters.outbound.dataset.templates import (
     render_dataset_template_xlsx,
 )
 from evalvault.adapters.outbound.debug.report_renderer import render_markdown
-from evalvault.adapters.outbound.domain_memory import build_domain_memory_adapter
 from evalvault.adapters.outbound.report import DashboardGenerator
-from evalvault.config.settings import get_settings
 from evalvault.domain.entities import (
     CalibrationResult,
     EvaluationRun,
     SatisfactionFeedback,
 )
 from evalvault.domain.entities.auth import Role
-from evalvault.domain.services.domain_learning_hook import DomainLearningHook
+from evalvault.domain.services.authorization import Principal
 from evalvault.domain.services.ragas_prompt_overrides import (
     PromptOverrideError,
     normalize_ragas_prompt_overrides,
@@ -920,18 +919,17 @@ def compare_runs(
     }
 
 
-@router.post("/start", status_code=200)
-async def start_evaluation_endpoint(
+def build_eval_request(
     request: StartEvaluationRequest,
-    adapter: AdapterDep,
-    principal: PrincipalDep,
-    project_id: ProjectIdDep,
-):
-    """Start evaluation with streaming progress.
+    principal: Principal | None,
+    project_id: str | None,
+) -> EvalRequest:
+    """Validate a start request and convert it to an ``EvalRequest``.
 
     When a project context is supplied (``X-Project-Id`` / ``project_id`` query /
     request-body ``project_id``, in that precedence), the caller must be an
     editor of that project; the resolved project is persisted on the new run.
+    Shared by ``POST /runs/start`` and ``POST /jobs``.
     """
     ragas_prompt_overrides = None
     if request.ragas_prompts_yaml or request.ragas_prompts:
@@ -961,7 +959,7 @@ async def start_evaluation_endpoint(
     except UnsafePathError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    eval_req = EvalRequest(
+    return EvalRequest(
         dataset_path=str(safe_dataset_path),
         metrics=request.metrics,
         model_name=request.model,
@@ -984,25 +982,26 @@ async def start_evaluation_endpoint(
         ragas_prompt_overrides=ragas_prompt_overrides,
     )
 
+
+@router.post("/start", status_code=200)
+async def start_evaluation_endpoint(
+    request: StartEvaluationRequest,
+    adapter: AdapterDep,
+    principal: PrincipalDep,
+    project_id: ProjectIdDep,
+):
+    """Start evaluation with streaming progress.
+
+    The evaluation lives as long as this response stream; use ``POST /api/v1/jobs``
+    to run it on an ``evalvault worker`` process instead.
+    """
+    eval_req = build_eval_request(request, principal, project_id)
+
     queue = asyncio.Queue()
 
     def progress_callback(progress: EvalProgress):
         # 진행 상황을 큐에 추가
-        queue.put_nowait(
-            {
-                "type": "progress",
-                "data": {
-                    "current": progress.current,
-                    "total": progress.total,
-                    "percent": progress.percent,
-                    "status": progress.status,
-                    "message": progress.current_metric or progress.error_message or "",
-                    "elapsed_seconds": progress.elapsed_seconds,
-                    "eta_seconds": progress.eta_seconds,
-                    "rate": progress.rate,
-                },
-            }
-        )
+        queue.put_nowait({"type": "progress", "data": progress.to_event_data()})
 
     async def event_generator():
         # 평가 테스크 시작
@@ -1040,26 +1039,7 @@ async def start_evaluation_endpoint(
                 )
 
                 try:
-                    from pathlib import Path
-
-                    settings = get_settings()
-                    if memory_config.get("db_path"):
-                        memory_db = memory_config.get("db_path")
-                    elif settings.db_backend == "sqlite":
-                        memory_db = settings.evalvault_memory_db_path
-                    else:
-                        memory_db = None
-                    domain = memory_config.get("domain") or "default"
-                    language = memory_config.get("language") or "ko"
-                    memory_adapter = build_domain_memory_adapter(
-                        settings=settings, db_path=Path(memory_db) if memory_db else None
-                    )
-                    hook = DomainLearningHook(memory_adapter)
-                    await hook.on_evaluation_complete(
-                        evaluation_run=result,
-                        domain=domain,
-                        language=language,
-                    )
+                    await adapter.learn_from_evaluation(result, memory_config)
                     yield json.dumps({"type": "info", "message": "Domain memory updated."}) + "\n"
                 except Exception as e:
                     yield (
@@ -1081,13 +1061,33 @@ async def start_evaluation_endpoint(
     return StreamingResponse(event_generator(), media_type="application/x-ndjson")
 
 
+RUN_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_run_cursor(started_at: datetime, run_id: str) -> str:
+    raw = json.dumps([started_at.isoformat(), run_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_run_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        started_at, run_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(started_at), str(run_id)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
 @router.get("/", response_model=list[RunSummaryResponse])
 def list_runs(
     adapter: AdapterDep,
     principal: PrincipalDep,
     project_id: ProjectIdDep,
+    response: Response,
     limit: int = 50,
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: str | None = Query(
+        None, description=f"Keyset cursor from the previous page's {RUN_CURSOR_HEADER} header"
+    ),
     dataset_name: str | None = Query(None, description="Filter by dataset name"),
     model_name: str | None = Query(None, description="Filter by model name"),
     include_feedback: bool = Query(False, description="Include feedback count"),
@@ -1096,15 +1096,21 @@ def list_runs(
 
     When a project context (``X-Project-Id`` / ``project_id``) is supplied, the
     caller must be a member and results are storage-filtered to that project.
+    A full page sets the ``X-Next-Cursor`` header; pass it back as ``cursor`` to
+    fetch the next page without offset scans.
     """
     from evalvault.ports.inbound.web_port import RunFilters
 
     if project_id is not None:
         require_member(principal, project_id)
+    after = _decode_run_cursor(cursor) if cursor else None
     filters = RunFilters(dataset_name=dataset_name, model_name=model_name)
     summaries = adapter.list_runs(
-        limit=limit, offset=offset, filters=filters, project_id=project_id
+        limit=limit, offset=offset, filters=filters, project_id=project_id, after=after
     )
+    if summaries and len(summaries) >= limit:
+        last = summaries[-1]
+        response.headers[RUN_CURSOR_HEADER] = _encode_run_cursor(last.started_at, last.run_id)
     feedback_counts: dict[str, int] = {}
     if include_feedback:
         feedback_counts = {
@@ -36,6 +36,7 @@ from .prompts import create_prompts_app
 from .regress import register_regress_commands
 from .run import register_run_commands
 from .stage import create_stage_app
+from .worker import register_worker_command
 
 CommandFactory = Callable[[Console], typer.Typer]
 CommandRegistrar = Callable[..., Any]
@@ -74,6 +75,7 @@ COMMAND_MODULES: tuple[CommandModule, ...] = (
     CommandModule(register_config_commands),
     CommandModule(register_langfuse_commands),
     CommandModule(register_api_command),
+    CommandModule(register_worker_command),
 )
 
 
@@ -170,7 +170,7 @@ def create_benchmark_app(console: Console) -> typer.Typer:
         kg: Path | None = typer.Option(
             None,
             "--kg",
-            help="Knowledge graph JSON file (required for GraphRAG method).",
+            help="Knowledge graph JSON file or columnar KG directory (required for GraphRAG).",
         ),
         output: Path | None = typer.Option(
             None,
@@ -64,7 +64,7 @@ def create_graph_rag_app(console: Console) -> typer.Typer:
             ...,
             "--kg",
             "-k",
-            help="Knowledge graph JSON file for GraphRAG.",
+            help="Knowledge graph JSON file or columnar KG directory for GraphRAG.",
             exists=True,
             readable=True,
         ),
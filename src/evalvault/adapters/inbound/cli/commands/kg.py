@@ -11,6 +11,8 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from evalvault.adapters.outbound.kg.columnar_graph import ColumnarKnowledgeGraph
+from evalvault.adapters.outbound.kg.networkx_adapter import NetworkXKnowledgeGraph
 from evalvault.adapters.outbound.kg.parallel_kg_builder import (
     KGBuilderStats,
     KGBuildResult,
@@ -22,6 +24,9 @@ from evalvault.config.settings import Settings, apply_profile
 from evalvault.domain.services.kg_generator import KnowledgeGraphGenerator
 
 from ..utils.options import profile_option
+from .run_helpers import load_knowledge_graph
+
+_OUTPUT_FORMATS = ("json", "columnar")
 
 
 def create_kg_app(console: Console) -> typer.Typer:
@@ -128,7 +133,13 @@ def create_kg_app(console: Console) -> typer.Typer:
             None,
             "--output",
             "-o",
-            help="그래프를 JSON으로 저장할 경로.",
+            help="그래프 저장 경로 (json: 파일, columnar: 디렉터리).",
+        ),
+        output_format: str = typer.Option(
+            "json",
+            "--format",
+            "-f",
+            help="저장 형식: json 또는 columnar (메모리 매핑 로드용 컬럼형 디렉터리).",
         ),
         workers: int = typer.Option(
             4,
@@ -158,6 +169,12 @@ def create_kg_app(console: Console) -> typer.Typer:
     ) -> None:
         """문서 집합으로 지식그래프를 병렬 구축합니다."""
 
+        if output_format not in _OUTPUT_FORMATS:
+            console.print(
+                f"[red]Error:[/red] --format은 {', '.join(_OUTPUT_FORMATS)} 중 하나여야 합니다."
+            )
+            raise typer.Exit(1)
+
         try:
             documents = _load_documents_from_source(source)
         except Exception as exc:  # pragma: no cover - defensive logging
@@ -192,10 +209,80 @@ def create_kg_app(console: Console) -> typer.Typer:
         result = builder.build(documents)
         _display_build_result(result, console)
 
-        if output:
+        if output and output_format == "columnar":
+            _save_build_result_columnar(
+                output, result, source, workers, batch_size, store_documents
+            )
+            console.print(f"[green]Saved columnar KG to {output}[/green]")
+        elif output:
             _save_build_result(output, result, source, workers, batch_size, store_documents)
             console.print(f"[green]Saved KG build result to {output}[/green]")
 
+    @kg_app.command("convert")
+    def kg_convert(
+        source: Path = typer.Argument(
+            ...,
+            exists=True,
+            dir_okay=False,
+            readable=True,
+            help="KG JSON 파일 (kg build 결과 또는 entities/relations JSON).",
+        ),
+        output: Path = typer.Argument(..., help="컬럼형 KG를 저장할 디렉터리."),
+    ) -> None:
+        """KG JSON을 메모리 매핑 로드용 컬럼형 디렉터리로 변환합니다."""
+
+        try:
+            graph = load_knowledge_graph(source)
+        except Exception as exc:
+            console.print(f"[red]Error loading knowledge graph:[/red] {exc}")
+            raise typer.Exit(1) from exc
+
+        if isinstance(graph, ColumnarKnowledgeGraph):
+            graph = graph.to_networkx()
+        ColumnarKnowledgeGraph.save(
+            graph,
+            output,
+            metadata={"type": "kg_convert", "source": str(source)},
+        )
+        console.print(
+            f"[green]Saved columnar KG to {output}[/green] "
+            f"({graph.get_node_count()} entities, {graph.get_edge_count()} relations)"
+        )
+
+    @kg_app.command("inspect")
+    def kg_inspect(
+        graph_path: Path = typer.Argument(
+            ...,
+            exists=True,
+            readable=True,
+            help="KG JSON 파일 또는 컬럼형 KG 디렉터리.",
+        ),
+        entity: str | None = typer.Option(
+            None,
+            "--entity",
+            "-e",
+            help="관계와 이웃을 조회할 엔티티 이름.",
+        ),
+        depth: int = typer.Option(1, "--depth", "-d", min=1, help="이웃 탐색 깊이."),
+        limit: int = typer.Option(20, "--limit", "-n", min=1, help="출력할 최대 행 수."),
+    ) -> None:
+        """저장된 지식그래프의 통계와 엔티티 주변 관계를 조회합니다."""
+
+        try:
+            graph = load_knowledge_graph(graph_path)
+        except Exception as exc:
+            console.print(f"[red]Error loading knowledge graph:[/red] {exc}")
+            raise typer.Exit(1) from exc
+
+        if entity is None:
+            _display_kg_stats(graph.get_statistics(), console)
+            return
+
+        if not graph.has_entity(entity):
+            console.print(f"[red]Error:[/red] 엔티티를 찾을 수 없습니다: {entity}")
+            raise typer.Exit(1)
+        _display_entity_neighborhood(graph, entity, depth=depth, limit=limit, console=console)
+
     return kg_app
 
 
@@ -277,8 +364,10 @@ def _display_kg_stats(stats: dict, console: Console | None = None) -> None:
 
     summary.add_row("Entities", str(stats.get("num_entities", 0)))
     summary.add_row("Relations", str(stats.get("num_relations", 0)))
+    # isolated_entities can be int (from a stored graph) or list (from the generator)
     isolated = stats.get("isolated_entities", [])
-    summary.add_row("Isolated Entities", str(len(isolated)))
+    isolated_count = isolated if isinstance(isolated, int) else len(isolated)
+    summary.add_row("Isolated Entities", str(isolated_count))
 
     build_metrics = stats.get("build_metrics", {})
     summary.add_row("Documents Processed", str(build_metrics.get("documents_processed", 0)))
@@ -302,7 +391,7 @@ def _display_kg_stats(stats: dict, console: Console | None = None) -> None:
             relation_table.add_row(relation_type, str(count))
         console.print(relation_table)
 
-    if isolated:
+    if isinstance(isolated, list) and isolated:
         preview = ", ".join(isolated[:5])
         console.print(
             f"[yellow]Isolated entities ({len(isolated)}):[/yellow] "
@@ -487,17 +576,64 @@ def _display_build_result(result: KGBuildResult, console: Console) -> None:
         )
 
 
-def _save_build_result(
-    output: Path,
+def _display_entity_neighborhood(
+    graph: NetworkXKnowledgeGraph | ColumnarKnowledgeGraph,
+    name: str,
+    *,
+    depth: int,
+    limit: int,
+    console: Console,
+) -> None:
+    """엔티티의 관계와 이웃 엔티티를 Rich 테이블로 출력."""
+
+    entity = graph.get_entity(name)
+    if entity is not None:
+        console.print(
+            f"[bold]{entity.name}[/bold] ({entity.entity_type}, "
+            f"confidence={entity.confidence:.2f}, source={entity.source_document_id or '-'})"
+        )
+
+    relations = graph.get_outgoing_relations(name) + graph.get_incoming_relations(name)
+    relation_table = Table(
+        title=f"Relations ({len(relations)})", show_header=True, header_style="bold cyan"
+    )
+    relation_table.add_column("Source")
+    relation_table.add_column("Relation")
+    relation_table.add_column("Target")
+    relation_table.add_column("Confidence", justify="right")
+    for relation in relations[:limit]:
+        relation_table.add_row(
+            relation.source,
+            relation.relation_type,
+            relation.target,
+            f"{relation.confidence:.2f}",
+        )
+    console.print(relation_table)
+
+    neighbors = graph.find_neighbors(name, depth=depth)
+    neighbor_table = Table(
+        title=f"Neighbors within {depth} hop(s) ({len(neighbors)})",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    neighbor_table.add_column("Name")
+    neighbor_table.add_column("Type")
+    neighbor_table.add_column("Source")
+    for neighbor in neighbors[:limit]:
+        neighbor_table.add_row(
+            neighbor.name, neighbor.entity_type, str(neighbor.source_document_id or "-")
+        )
+    console.print(neighbor_table)
+
+
+def _build_result_metadata(
     result: KGBuildResult,
     source: Path,
     workers: int,
     batch_size: int,
     store_documents: bool,
-) -> None:
-    """kg build 결과를 JSON 파일로 저장."""
-
-    payload: dict[str, Any] = {
+) -> dict[str, Any]:
+    return {
         "type": "kg_build_result",
         "generated_at": datetime.now().isoformat(),
         "source": str(source),
@@ -507,6 +643,39 @@ def _save_build_result(
             "store_documents": store_documents,
         },
         "stats": result.stats.snapshot(),
+    }
+
+
+def _save_build_result_columnar(
+    output: Path,
+    result: KGBuildResult,
+    source: Path,
+    workers: int,
+    batch_size: int,
+    store_documents: bool,
+) -> None:
+    """kg build 결과를 컬럼형 KG 디렉터리로 저장."""
+
+    metadata = _build_result_metadata(result, source, workers, batch_size, store_documents)
+    ColumnarKnowledgeGraph.save(result.graph, output, metadata=metadata)
+    if store_documents and result.documents_by_id:
+        (output / "documents.json").write_text(
+            json.dumps(result.documents_by_id, ensure_ascii=False), encoding="utf-8"
+        )
+
+
+def _save_build_result(
+    output: Path,
+    result: KGBuildResult,
+    source: Path,
+    workers: int,
+    batch_size: int,
+    store_documents: bool,
+) -> None:
+    """kg build 결과를 JSON 파일로 저장."""
+
+    payload: dict[str, Any] = {
+        **_build_result_metadata(result, source, workers, batch_size, store_documents),
         "graph": result.graph.to_dict(),
     }
 
@@ -525,5 +694,7 @@ __all__ = [
     "_log_kg_stats_to_langfuse",
     "_save_kg_report",
     "_display_build_result",
+    "_display_entity_neighborhood",
     "_save_build_result",
+    "_save_build_result_columnar",
 ]
@@ -17,6 +17,7 @@ from rich.console import Console
 from rich.table import Table
 
 from evalvault.adapters.outbound.analysis.pipeline_factory import build_analysis_pipeline_service
+from evalvault.adapters.outbound.cache.llm_response_cache import parse_llm_cache_mode
 from evalvault.adapters.outbound.dataset import get_loader, load_multiturn_dataset
 from evalvault.adapters.outbound.documents.versioned_loader import (
     load_versioned_chunks_from_pdf_dir,
@@ -59,6 +60,7 @@ from evalvault.domain.services.retriever_context import apply_versioned_retrieve
 from evalvault.domain.services.stage_event_builder import StageEventBuilder
 from evalvault.ports.outbound.domain_memory_port import DomainMemoryPort
 from evalvault.ports.outbound.korean_nlp_port import RetrieverPort
+from evalvault.ports.outbound.storage_port import StoragePort
 
 from ..utils.analysis_io import (
     build_metric_scorecard,
@@ -90,10 +92,13 @@ from .run_helpers import (
     _log_to_trackers,
     _option_was_provided,
     _print_run_mode_banner,
+    _record_llm_cache_stats,
     _resolve_thresholds,
     _save_multiturn_to_db,
     _save_results,
     _save_to_db,
+    _start_llm_cache_tracking,
+    _summarize_llm_cache_stats,
     _write_stage_events_jsonl,
     enrich_dataset_with_memory,
     format_dataset_preprocess_summary,
@@ -107,6 +112,15 @@ _merge_evaluation_runs = run_helpers._merge_evaluation_runs
 apply_retriever_to_dataset = run_helpers.apply_retriever_to_dataset
 
 
+def _index_dense_retriever(dense_retriever: Any, documents: list[str], settings: Settings) -> None:
+    """Index documents, reusing a persisted embedding index when one matches."""
+    cache_dir = getattr(settings, "dense_index_cache_dir", "")
+    if cache_dir:
+        dense_retriever.index_with_cache(documents, cache_dir)
+    else:
+        dense_retriever.index(documents)
+
+
 def _build_dense_retriever(
     *,
     documents: list[str],
@@ -134,7 +148,7 @@ def _build_dense_retriever(
                     model_name=embedding_model,
                     ollama_adapter=ollama_adapter,
                 )
-            dense_retriever.index(documents)
+            _index_dense_retriever(dense_retriever, documents, settings)
             return dense_retriever
 
     if settings.llm_provider == "vllm":
@@ -145,12 +159,12 @@ def _build_dense_retriever(
             model_name=settings.vllm_embedding_model,
             ollama_adapter=adapter,
         )
-        dense_retriever.index(documents)
+        _index_dense_retriever(dense_retriever, documents, settings)
         return dense_retriever
 
     try:
         dense_retriever = KoreanDenseRetriever()
-        dense_retriever.index(documents)
+        _index_dense_retriever(dense_retriever, documents, settings)
         return dense_retriever
     except Exception as exc:
         raise RuntimeError(
@@ -290,7 +304,7 @@ def register_run_commands(
             None,
             "--kg",
             "-k",
-            help="Knowledge graph JSON file for GraphRAG retriever.",
+            help="Knowledge graph JSON file or columnar KG directory for GraphRAG retriever.",
             rich_help_panel="Full mode options",
         ),
         retriever_top_k: int = typer.Option(
@@ -539,12 +553,34 @@ def register_run_commands(
             "--stream-chunk-size",
             help="Chunk size when streaming evaluation is enabled (default: 200).",
         ),
+        resume: str | None = typer.Option(
+            None,
+            "--resume",
+            help=(
+                "Resume an interrupted streaming run by run ID, skipping test cases "
+                "already stored for it (implies --stream)."
+            ),
+        ),
         claim_level: bool = typer.Option(
             False,
             "--claim-level",
             help="Enable claim-level faithfulness analysis for detailed results.",
             rich_help_panel="Full mode options",
         ),
+        llm_cache: str | None = typer.Option(
+            None,
+            "--llm-cache",
+            help=(
+                "Persistent judge response cache: off, readwrite, readonly, refresh "
+                "(default: LLM_CACHE_MODE or off)."
+            ),
+        ),
+        metric_concurrency: int = typer.Option(
+            1,
+            "--metric-concurrency",
+            min=1,
+            help="Number of metrics scored concurrently per test case (default: 1, sequential).",
+        ),
     ) -> None:
         """Run RAG evaluation on a dataset.
 
@@ -583,9 +619,15 @@ def register_run_commands(
           # Parallel evaluation for faster processing
           evalvault run data.json -m faithfulness -P -b 10
 
+          # Score a sample's metrics concurrently as well
+          evalvault run data.json -m faithfulness,answer_relevancy -P --metric-concurrency 4
+
           # Streaming for large datasets
           evalvault run large.json -m faithfulness --stream
 
+          # Reuse cached judge responses when re-running the same dataset
+          evalvault run data.json -m faithfulness --llm-cache readwrite
+
         \b
         See also:
           evalvault metrics     — List available metrics
@@ -832,6 +874,8 @@ def register_run_commands(
                 fixes=["예: --stream-chunk-size 200"],
             )
             raise typer.Exit(1)
+        if resume:
+            stream = True
 
         domain_memory_requested = (
             use_domain_memory or memory_domain is not None or memory_augment_context
@@ -914,6 +958,18 @@ def register_run_commands(
             else:
                 settings.openai_model = model
 
+        if isinstance(llm_cache, str):
+            try:
+                settings.llm_cache_mode = parse_llm_cache_mode(llm_cache).value
+            except ValueError as exc:
+                print_cli_error(
+                    console,
+                    "--llm-cache 값이 올바르지 않습니다.",
+                    details=str(exc),
+                    fixes=["사용 가능: off, readwrite, readonly, refresh"],
+                )
+                raise typer.Exit(2) from exc
+
         if settings.llm_provider == "openai" and not settings.openai_api_key:
             print_cli_error(
                 console,
@@ -1048,7 +1104,7 @@ def register_run_commands(
 
         if preset.name == "multiturn":
             llm_factory = SettingsLLMFactory(settings)
-            korean_toolkit = try_create_korean_toolkit()
+            korean_toolkit = try_create_korean_toolkit(settings)
             evaluator = RagasEvaluator(korean_toolkit=korean_toolkit, llm_factory=llm_factory)
             try:
                 llm_adapter = get_llm_adapter(settings)
@@ -1099,6 +1155,13 @@ def register_run_commands(
                 raise typer.Exit(1) from exc
             _log_duration(console, verbose, "멀티턴 데이터셋 로딩 완료", multiturn_started_at)
 
+            if resume:
+                print_cli_error(
+                    console,
+                    "멀티턴 모드에서는 --resume을 사용할 수 없습니다.",
+                    fixes=["--resume 없이 다시 실행하세요."],
+                )
+                raise typer.Exit(1)
             if stream:
                 print_cli_warning(
                     console,
@@ -1127,6 +1190,7 @@ def register_run_commands(
                 if trimmed:
                     console.print(f"[dim]Trimmed turns in {trimmed} conversation(s).[/dim]")
 
+            llm_cache_tracker = _start_llm_cache_tracking(llm_adapter)
             evaluation_started_at = datetime.now()
             multiturn_evaluator = MultiTurnEvaluator(evaluator=evaluator, llm=llm_adapter)
             results = []
@@ -1157,6 +1221,7 @@ def register_run_commands(
                 ]
                 if scores:
                     multiturn_summary[metric] = sum(scores) / len(scores)
+            llm_cache_stats = _summarize_llm_cache_stats(llm_cache_tracker, console)
 
             payload = {
                 "dataset": {
@@ -1169,6 +1234,8 @@ def register_run_commands(
                 "summary": multiturn_summary,
                 "conversations": [asdict(item) for item in results],
             }
+            if llm_cache_stats is not None:
+                payload["llm_cache"] = llm_cache_stats
 
             table = Table(title="Multi-turn Summary", show_header=True, header_style="bold cyan")
             table.add_column("Metric", style="bold")
@@ -1202,7 +1269,10 @@ def register_run_commands(
                     metrics_evaluated=list(metric_list),
                     drift_threshold=drift_threshold,
                     summary=multiturn_summary,
-                    metadata={"dataset": multiturn_dataset.metadata},
+                    metadata={
+                        "dataset": multiturn_dataset.metadata,
+                        **({"llm_cache": llm_cache_stats} if llm_cache_stats else {}),
+                    },
                 )
                 conversation_records = [
                     MultiTurnConversationRecord(
@@ -1583,11 +1653,7 @@ def register_run_commands(
                                     tips=[str(exc)],
                                 )
 
-                            kg_doc_ids = {
-                                str(entity.source_document_id)
-                                for entity in kg_graph.get_all_entities()
-                                if entity.source_document_id
-                            }
+                            kg_doc_ids = kg_graph.get_source_document_ids()
                             if kg_doc_ids and not (kg_doc_ids & set(doc_ids)):
                                 preview = ", ".join(sorted(kg_doc_ids)[:3])
                                 print_cli_warning(
@@ -1740,7 +1806,7 @@ def register_run_commands(
             ensure_phoenix_instrumentation(settings, console=console, force=True)
 
         llm_factory = SettingsLLMFactory(settings)
-        korean_toolkit = try_create_korean_toolkit()
+        korean_toolkit = try_create_korean_toolkit(settings)
         evaluator = RagasEvaluator(korean_toolkit=korean_toolkit, llm_factory=llm_factory)
         llm_adapter = None
         try:
@@ -1791,6 +1857,7 @@ def register_run_commands(
                 raise typer.Exit(1) from exc
 
         assert llm_adapter is not None
+        llm_cache_tracker = _start_llm_cache_tracking(llm_adapter)
 
         memory_adapter: DomainMemoryPort | None = None
         memory_evaluator: MemoryAwareEvaluator | None = None
@@ -1890,6 +1957,9 @@ def register_run_commands(
         # Apply preset parallelization settings if not explicitly overridden
         final_parallel = parallel
         final_batch_size = batch_size
+        final_metric_concurrency = (
+            max(1, metric_concurrency) if isinstance(metric_concurrency, int) else 1
+        )
         if eval_preset_config:
             if not _option_was_provided(ctx, "parallel"):
                 final_parallel = eval_preset_config.parallel
@@ -1924,7 +1994,25 @@ def register_run_commands(
                 "평가 시작 "
                 f"(mode={eval_mode_label}, cases={len(ds)}, metrics={', '.join(metric_list)})",
             )
+        stream_storage: StoragePort | None = None
+        stream_checkpoints: list[str] = []
         if stream:
+            try:
+                stream_storage = build_storage_adapter(settings=settings, db_path=db_path)
+            except Exception as exc:
+                if resume:
+                    print_cli_error(
+                        console,
+                        "--resume에 필요한 저장소를 열 수 없습니다.",
+                        details=str(exc),
+                        fixes=["--db 경로 또는 DB 연결 설정을 확인하세요."],
+                    )
+                    raise typer.Exit(1) from exc
+                print_cli_warning(
+                    console,
+                    "저장소를 열 수 없어 청크별 중간 저장 없이 스트리밍합니다.",
+                    tips=[str(exc)],
+                )
             with streaming_progress(console, description=status_msg) as update_progress:
                 stream_update = cast(Callable[[int, int | None, str | None], None], update_progress)
                 try:
@@ -1941,19 +2029,29 @@ def register_run_commands(
                             batch_size=final_batch_size,
                             prompt_overrides=ragas_prompt_overrides or None,
                             on_progress=lambda c, t, msg: stream_update(c, t, msg),
+                            metric_concurrency=final_metric_concurrency,
+                            storage=stream_storage,
+                            resume_run_id=resume,
+                            on_checkpoint=stream_checkpoints.append,
                         )
                     )
                     _log_duration(console, verbose, "평가 완료", evaluation_started_at)
                 except Exception as exc:  # pragma: no cover - surfaced to CLI
                     _log_duration(console, verbose, "평가 실패", evaluation_started_at)
+                    fixes = [
+                        "LLM API 키/쿼터 상태와 dataset 스키마를 확인하세요.",
+                        "추가 로그는 --verbose 옵션으로 확인할 수 있습니다.",
+                    ]
+                    if stream_checkpoints:
+                        fixes.append(
+                            "완료된 청크는 저장되었습니다. 이어서 실행: "
+                            f"evalvault run {dataset} --resume {stream_checkpoints[-1]}"
+                        )
                     print_cli_error(
                         console,
                         "평가 실행 중 오류가 발생했습니다.",
                         details=str(exc),
-                        fixes=[
-                            "LLM API 키/쿼터 상태와 dataset 스키마를 확인하세요.",
-                            "추가 로그는 --verbose 옵션으로 확인할 수 있습니다.",
-                        ],
+                        fixes=fixes,
                     )
                     raise typer.Exit(1) from exc
         else:
@@ -1978,6 +2076,7 @@ def register_run_commands(
                                 prompt_overrides=ragas_prompt_overrides or None,
                                 on_progress=lambda c, _t, msg: eval_update(c, msg),
                                 claim_level=claim_level,
+                                metric_concurrency=final_metric_concurrency,
                             )
                         )
                     else:
@@ -1995,6 +2094,7 @@ def register_run_commands(
                                 prompt_overrides=ragas_prompt_overrides or None,
                                 on_progress=lambda c, _t, msg: eval_update(c, msg),
                                 claim_level=claim_level,
+                                metric_concurrency=final_metric_concurrency,
                             )
                         )
                     _log_duration(console, verbose, "평가 완료", evaluation_started_at)
@@ -2019,6 +2119,7 @@ def register_run_commands(
             result.retrieval_metadata = merged_retriever_metadata
 
         result.tracker_metadata.setdefault("run_mode", preset.name)
+        _record_llm_cache_stats(result, llm_cache_tracker, console)
         tracker_meta = result.tracker_metadata or {}
         result.tracker_metadata = tracker_meta
         ragas_snapshots = tracker_meta.get("ragas_prompt_snapshots")
@@ -2320,6 +2421,7 @@ def register_run_commands(
             console,
             prompt_bundle=prompt_bundle,
             export_excel=excel_output is None,
+            results_persisted=stream_storage is not None,
         )
         _log_duration(console, verbose, "DB 저장 완료", db_started_at)
         if excel_output:
@@ -2500,7 +2602,7 @@ def register_run_commands(
         kg: Path | None = typer.Option(
             None,
             "--kg",
-            help="Knowledge graph JSON file for GraphRAG retriever.",
+            help="Knowledge graph JSON file or columnar KG directory for GraphRAG retriever.",
         ),
         retriever_top_k: int = typer.Option(
             5,
@@ -2651,6 +2753,28 @@ def register_run_commands(
             "--stream-chunk-size",
             help="Chunk size when streaming evaluation is enabled (default: 200).",
         ),
+        resume: str | None = typer.Option(
+            None,
+            "--resume",
+            help=(
+                "Resume an interrupted streaming run by run ID, skipping test cases "
+                "already stored for it (implies --stream)."
+            ),
+        ),
+        llm_cache: str | None = typer.Option(
+            None,
+            "--llm-cache",
+            help=(
+                "Persistent judge response cache: off, readwrite, readonly, refresh "
+                "(default: LLM_CACHE_MODE or off)."
+            ),
+        ),
+        metric_concurrency: int = typer.Option(
+            1,
+            "--metric-concurrency",
+            min=1,
+            help="Number of metrics scored concurrently per test case (default: 1, sequential).",
+        ),
     ) -> None:
         """Alias for simple mode presets."""
         try:
@@ -2705,6 +2829,9 @@ def register_run_commands(
                 batch_size=batch_size,
                 stream=stream,
                 stream_chunk_size=stream_chunk_size,
+                resume=resume,
+                llm_cache=llm_cache,
+                metric_concurrency=metric_concurrency,
                 mode="simple",
             )
         finally:
@@ -2795,7 +2922,7 @@ def register_run_commands(
         kg: Path | None = typer.Option(
             None,
             "--kg",
-            help="Knowledge graph JSON file for GraphRAG retriever.",
+            help="Knowledge graph JSON file or columnar KG directory for GraphRAG retriever.",
         ),
         retriever_top_k: int = typer.Option(
             5,
@@ -2946,6 +3073,28 @@ def register_run_commands(
             "--stream-chunk-size",
             help="Chunk size when streaming evaluation is enabled (default: 200).",
         ),
+        resume: str | None = typer.Option(
+            None,
+            "--resume",
+            help=(
+                "Resume an interrupted streaming run by run ID, skipping test cases "
+                "already stored for it (implies --stream)."
+            ),
+        ),
+        llm_cache: str | None = typer.Option(
+            None,
+            "--llm-cache",
+            help=(
+                "Persistent judge response cache: off, readwrite, readonly, refresh "
+                "(default: LLM_CACHE_MODE or off)."
+            ),
+        ),
+        metric_concurrency: int = typer.Option(
+            1,
+            "--metric-concurrency",
+            min=1,
+            help="Number of metrics scored concurrently per test case (default: 1, sequential).",
+        ),
     ) -> None:
         """Alias for full mode presets."""
         try:
@@ -3000,6 +3149,9 @@ def register_run_commands(
                 batch_size=batch_size,
                 stream=stream,
                 stream_chunk_size=stream_chunk_size,
+                resume=resume,
+                llm_cache=llm_cache,
+                metric_concurrency=metric_concurrency,
                 mode="full",
             )
         finally:
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
+import sys
 from collections.abc import Callable, Sequence
 from dataclasses import asdict, dataclass
 from pathlib import Path
@@ -17,6 +20,7 @@ from rich.table import Table
 
 from evalvault.adapters.outbound.dataset import StreamingConfig, StreamingDatasetLoader
 from evalvault.adapters.outbound.dataset.thresholds import extract_thresholds_from_rows
+from evalvault.adapters.outbound.kg.columnar_graph import ColumnarKnowledgeGraph, is_columnar_kg
 from evalvault.adapters.outbound.kg.networkx_adapter import NetworkXKnowledgeGraph
 from evalvault.adapters.outbound.storage.factory import build_storage_adapter
 from evalvault.adapters.outbound.storage.postgres_adapter import PostgreSQLStorageAdapter
@@ -40,6 +44,7 @@ from evalvault.domain.entities import (
     StageEvent,
 )
 from evalvault.domain.services import retriever_context
+from evalvault.domain.services.cache_metrics import CacheStatsTracker
 from evalvault.domain.services.dataset_preprocessor import merge_preprocess_summaries
 from evalvault.domain.services.evaluator import RagasEvaluator
 from evalvault.domain.services.memory_aware_evaluator import MemoryAwareEvaluator
@@ -53,6 +58,7 @@ from evalvault.domain.services.threshold_profiles import (
     apply_threshold_profile,
 )
 from evalvault.ports.outbound.llm_port import LLMPort
+from evalvault.ports.outbound.storage_port import StoragePort
 from evalvault.ports.outbound.tracker_port import TrackerPort
 
 from ..utils.console import print_cli_error, print_cli_warning
@@ -379,6 +385,7 @@ def _get_tracker(
                 service_name="evalvault",
                 project_name=getattr(settings, "phoenix_project_name", None),
                 annotations_enabled=getattr(settings, "phoenix_annotations_enabled", True),
+                annotation_batch_size=getattr(settings, "phoenix_annotation_batch_size", 100),
             )
         except ImportError:
             message = "Phoenix extra가 설치되지 않았습니다."
@@ -462,12 +469,34 @@ def _log_to_trackers(
             )
             raise typer.Exit(2) from exc
 
+    _apply_tracker_trace_ids(
+        settings,
+        result,
+        multi.last_trace_ids,
+        console,
+        phoenix_tracker=multi.get_tracker("phoenix"),
+        phoenix_options=phoenix_options,
+        log_phoenix_traces_fn=log_phoenix_traces_fn,
+    )
+
+
+def _apply_tracker_trace_ids(
+    settings: Settings,
+    result: EvaluationRun,
+    trace_ids: dict[str, str],
+    console: Console,
+    *,
+    phoenix_tracker: Any | None = None,
+    phoenix_options: dict[str, Any] | None = None,
+    log_phoenix_traces_fn: Callable[..., int] | None = None,
+) -> None:
+    """Record per-provider trace IDs on ``result`` and log Phoenix RAG traces."""
     # A-S4: surface per-provider trace IDs through the domain entity's
     # ``tracker_trace_ids`` dict so the persistence layer can store the
     # whole map instead of just the legacy Langfuse field.
-    if multi.last_trace_ids:
-        result.tracker_trace_ids.update(multi.last_trace_ids)
-    for provider, trace_id in multi.last_trace_ids.items():
+    if trace_ids:
+        result.tracker_trace_ids.update(trace_ids)
+    for provider, trace_id in trace_ids.items():
         tracker_name = provider.capitalize()
         console.print(f"[green]Logged to {tracker_name}[/green] (trace_id: {trace_id})")
         provider_meta = result.tracker_metadata.setdefault(provider, {})
@@ -490,7 +519,6 @@ def _log_to_trackers(
             if trace_url:
                 console.print(f"[dim]Phoenix Trace: {trace_url}[/dim]")
 
-            phoenix_tracker = multi.get_tracker("phoenix")
             if phoenix_tracker is not None:
                 options = phoenix_options or {}
                 log_traces = log_phoenix_traces_fn or log_phoenix_traces
@@ -506,6 +534,179 @@ def _log_to_trackers(
                     )
 
 
+def _spool_tracker_export(
+    settings: Settings,
+    db_path: Path | None,
+    result: EvaluationRun,
+    console: Console,
+    tracker_type: str,
+    *,
+    phoenix_options: dict[str, Any] | None = None,
+    spawn: bool = True,
+) -> Path | None:
+    """Queue a persisted run for background tracker export (``--tracker-async``).
+
+    Writes a durable spool entry and starts a detached ``evalvault ops
+    drain-trackers`` process, so the CLI returns right after local persistence.
+    An entry left behind by a failed or killed drainer is exported by the next
+    drain.
+    """
+    try:
+        tracker_types = _resolve_tracker_list(tracker_type)
+    except ValueError as exc:
+        print_cli_error(console, "Tracker 설정이 올바르지 않습니다.", details=str(exc))
+        raise typer.Exit(2) from exc
+    if not tracker_types or tracker_types == ["none"]:
+        return None
+
+    from evalvault.adapters.outbound.tracker.export_pipeline import (
+        SpoolEntry,
+        TrackerExportSpool,
+    )
+
+    spool = TrackerExportSpool(settings.tracker_spool_dir)
+    entry_path = spool.add(
+        SpoolEntry(
+            run_id=result.run_id,
+            providers=tracker_types,
+            db_path=str(db_path) if db_path else None,
+            phoenix_options=phoenix_options or {},
+        )
+    )
+    if spawn:
+        _spawn_tracker_drain(spool.directory)
+    console.print(
+        f"[dim]Tracker export queued in background ({', '.join(tracker_types)}): "
+        f"{entry_path}[/dim]"
+    )
+    return entry_path
+
+
+def _spawn_tracker_drain(spool_dir: Path) -> None:
+    """Start ``evalvault ops drain-trackers`` detached from this process."""
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    command = [
+        sys.executable,
+        "-c",
+        "from evalvault.adapters.inbound.cli import app; app()",
+        "ops",
+        "drain-trackers",
+        "--spool-dir",
+        str(spool_dir),
+    ]
+    with (spool_dir / "drain.log").open("ab") as log_file:
+        subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=os.name != "nt",
+        )
+
+
+def drain_tracker_spool(
+    settings: Settings,
+    console: Console,
+    *,
+    spool_dir: Path | None = None,
+    limit: int | None = None,
+    max_attempts: int = 5,
+    stale_after_seconds: float = 3600.0,
+) -> dict[str, int]:
+    """Export spooled runs through :class:`TrackerExportPipeline`.
+
+    Runs sharing a provider set go through one pipeline (one thread per
+    backend). Trace IDs are written back to the stored run; providers that
+    failed stay in the spool entry for the next drain, up to ``max_attempts``.
+
+    Returns:
+        Counts of ``exported``, ``retry`` and ``failed`` entries.
+    """
+    from evalvault.adapters.outbound.tracker.export_pipeline import (
+        TrackerExportPipeline,
+        TrackerExportSpool,
+    )
+
+    spool = TrackerExportSpool(spool_dir or settings.tracker_spool_dir)
+    spool.recover_stale(stale_after_seconds)
+    summary = {"exported": 0, "retry": 0, "failed": 0}
+
+    def give_up_or_retry(entry, claim_path: Path, error: str) -> None:
+        if entry.attempts + 1 >= max_attempts:
+            spool.dead_letter(entry, claim_path, error=error)
+            summary["failed"] += 1
+            print_cli_warning(console, f"Tracker export gave up for {entry.run_id}: {error}")
+        else:
+            spool.release(entry, claim_path, error=error)
+            summary["retry"] += 1
+
+    groups: dict[tuple[str, ...], list[tuple[Any, Path]]] = {}
+    for entry, claim_path in spool.claim(limit):
+        groups.setdefault(tuple(entry.providers), []).append((entry, claim_path))
+
+    storages: dict[str | None, StoragePort] = {}
+    for providers, claims in groups.items():
+        loaded: list[tuple[Any, Path, StoragePort, EvaluationRun]] = []
+        for entry, claim_path in claims:
+            try:
+                if entry.db_path not in storages:
+                    storages[entry.db_path] = build_storage_adapter(
+                        settings=settings,
+                        db_path=Path(entry.db_path) if entry.db_path else None,
+                    )
+                storage = storages[entry.db_path]
+                run = storage.get_run(entry.run_id)
+            except Exception as exc:
+                give_up_or_retry(entry, claim_path, f"Run not loadable: {exc}")
+                continue
+            run.tracker_metadata.setdefault("tracker_providers", list(entry.providers))
+            loaded.append((entry, claim_path, storage, run))
+
+        tracker_pairs: list[tuple[str, TrackerPort]] = []
+        for provider in providers:
+            tracker = _get_tracker(settings, provider, console, required=False)
+            if tracker is not None:
+                tracker_pairs.append((provider, tracker))
+        if not tracker_pairs:
+            for entry, claim_path, _, _ in loaded:
+                give_up_or_retry(entry, claim_path, "No tracker available")
+            continue
+
+        completed: dict[str, dict[str, str]] = {}
+        with TrackerExportPipeline(
+            tracker_pairs, queue_size=settings.tracker_export_queue_size
+        ) as pipeline:
+            for _, _, _, run in loaded:
+                pipeline.submit(
+                    run, on_complete=lambda run, ids: completed.__setitem__(run.run_id, ids)
+                )
+            pipeline.drain()
+
+        # Phoenix RAG traces and DB updates run here, after the backend threads
+        # are idle, so they never interleave with another run's export.
+        phoenix_tracker = dict(tracker_pairs).get("phoenix")
+        for entry, claim_path, storage, run in loaded:
+            trace_ids = completed.get(run.run_id, {})
+            if trace_ids:
+                _apply_tracker_trace_ids(
+                    settings,
+                    run,
+                    trace_ids,
+                    console,
+                    phoenix_tracker=phoenix_tracker if "phoenix" in trace_ids else None,
+                    phoenix_options=entry.phoenix_options,
+                )
+                storage.append_run_results(run, [])
+            missing = [provider for provider in entry.providers if provider not in trace_ids]
+            if not missing:
+                spool.complete(claim_path)
+                summary["exported"] += 1
+                continue
+            entry.providers = missing
+            give_up_or_retry(entry, claim_path, f"Export failed for: {', '.join(missing)}")
+    return summary
+
+
 def _log_analysis_artifacts(
     settings: Settings,
     result: EvaluationRun,
@@ -582,8 +783,13 @@ def _save_to_db(
     *,
     prompt_bundle: PromptSetBundle | None = None,
     export_excel: bool = True,
+    results_persisted: bool = False,
 ) -> None:
-    """Persist evaluation run (and optional prompt set) to database."""
+    """Persist evaluation run (and optional prompt set) to database.
+
+    ``results_persisted`` marks a run whose results were already appended
+    chunk by chunk (streaming); only its run record is refreshed then.
+    """
     storage = build_storage_adapter(settings=settings, db_path=db_path)
     storage_label = (
         "PostgreSQL" if isinstance(storage, PostgreSQLStorageAdapter) else f"SQLite ({db_path})"
@@ -593,7 +799,10 @@ def _save_to_db(
         try:
             if prompt_bundle:
                 storage.save_prompt_set(prompt_bundle)
-            storage.save_run(result)
+            if results_persisted:
+                storage.append_run_results(result, [])
+            else:
+                storage.save_run(result)
             if prompt_bundle:
                 storage.link_prompt_set_to_run(
                     result.run_id,
@@ -753,8 +962,13 @@ def enrich_dataset_with_memory(
     return enriched
 
 
-def load_knowledge_graph(file_path: Path) -> NetworkXKnowledgeGraph:
-    """Load a knowledge graph JSON file."""
+def load_knowledge_graph(file_path: Path) -> NetworkXKnowledgeGraph | ColumnarKnowledgeGraph:
+    """Load a knowledge graph JSON file or a memory-mapped columnar KG directory."""
+
+    if file_path.is_dir():
+        if not is_columnar_kg(file_path):
+            raise ValueError("directory is not a columnar knowledge graph (manifest.json missing)")
+        return ColumnarKnowledgeGraph.load(file_path)
 
     try:
         payload = json.loads(file_path.read_text(encoding="utf-8"))
@@ -763,6 +977,9 @@ def load_knowledge_graph(file_path: Path) -> NetworkXKnowledgeGraph:
 
     if isinstance(payload, dict) and "knowledge_graph" in payload:
         payload = payload["knowledge_graph"]
+    elif isinstance(payload, dict) and isinstance(payload.get("graph"), dict):
+        # `evalvault kg build --output` 결과 파일
+        payload = payload["graph"]
 
     if not isinstance(payload, dict):
         raise ValueError("knowledge graph JSON must be an object with entities and relations")
@@ -944,6 +1161,54 @@ def _is_oss_open_model(model_name: str | None) -> bool:
     return normalized.startswith("gpt-oss-")
 
 
+def _start_llm_cache_tracking(llm: LLMPort) -> CacheStatsTracker | None:
+    """Baseline the LLM response cache counters before evaluation starts."""
+
+    get_cache = getattr(llm, "get_response_cache", None)
+    cache = get_cache() if callable(get_cache) else None
+    if cache is None:
+        return None
+    tracker = CacheStatsTracker(cache.get_stats)
+    tracker.reset()
+    return tracker
+
+
+def _summarize_llm_cache_stats(
+    tracker: CacheStatsTracker | None,
+    console: Console | None = None,
+) -> dict[str, Any] | None:
+    """Summarize LLM response cache hit/miss counts since tracking started."""
+
+    if tracker is None:
+        return None
+    window = tracker.window()
+    if console is not None and window.total_requests:
+        console.print(
+            f"[dim]LLM cache: {window.hits} hit(s), {window.misses} miss(es) "
+            f"(hit rate {window.hit_rate:.1%})[/dim]"
+        )
+    return {
+        "hits": window.hits,
+        "misses": window.misses,
+        "hit_rate": round(window.hit_rate, 4),
+        "evictions": window.evictions,
+        "expired": window.expired,
+        "size": window.end.size,
+    }
+
+
+def _record_llm_cache_stats(
+    run: EvaluationRun,
+    tracker: CacheStatsTracker | None,
+    console: Console | None = None,
+) -> None:
+    """Attach per-run LLM response cache hit/miss counts to tracker metadata."""
+
+    summary = _summarize_llm_cache_stats(tracker, console)
+    if summary is not None:
+        run.tracker_metadata["llm_cache"] = summary
+
+
 def _build_streaming_dataset_template(dataset_path: Path) -> Dataset:
     """Construct a Dataset stub for streaming mode using metadata from source file."""
 
@@ -1118,47 +1383,74 @@ async def _evaluate_streaming_run(
     batch_size: int,
     prompt_overrides: dict[str, str] | None = None,
     on_progress: Callable[[int, int | None, str], None] | None = None,
+    metric_concurrency: int = 1,
+    storage: StoragePort | None = None,
+    resume_run_id: str | None = None,
+    on_checkpoint: Callable[[str], None] | None = None,
 ) -> EvaluationRun:
-    """Evaluate a dataset in streaming mode, chunk by chunk."""
+    """Evaluate a dataset in streaming mode, chunk by chunk.
+
+    With ``storage``, each finished chunk is appended to the run in storage
+    together with a checkpoint in ``tracker_metadata["streaming"]``, and its
+    results are released from memory, so memory is bounded by the chunk size.
+    ``resume_run_id`` continues such a run, skipping the test cases already
+    stored for it; ``on_checkpoint`` receives the run ID after every stored
+    chunk. The returned run is re-read from storage.
+    """
+
+    if resume_run_id is not None and storage is None:
+        raise ValueError("resume_run_id requires storage")
 
     config = StreamingConfig(chunk_size=chunk_size)
     loader = StreamingDatasetLoader(config)
     merged_run: EvaluationRun | None = None
+    completed_ids: set[str] = set()
+    if storage is not None and resume_run_id is not None:
+        merged_run = storage.get_run(resume_run_id)
+        # 이전 결과는 저장소에 있으므로 헤더만 유지
+        merged_run.results = []
+        completed_ids = storage.list_completed_test_case_ids(resume_run_id)
     metadata_template = dict(dataset_template.metadata or {})
     threshold_template = dict(dataset_template.thresholds or {})
     source_file = dataset_template.source_file or str(dataset_path)
     processed_total = 0
-    progress_callback_wrapper: Callable[[int, int, str], None] | None = None
 
     iterator = loader.stream(dataset_path)
     estimated_total = iterator.stats.estimated_total_rows
-    chunk: list[Any] = []
 
-    for test_case in iterator:
-        chunk.append(test_case)
-        if len(chunk) < chunk_size:
-            continue
-        chunk_offset = processed_total
-        chunk_dataset = Dataset(
+    def make_dataset(test_cases: list[Any]) -> Dataset:
+        return Dataset(
             name=dataset_template.name,
             version=dataset_template.version,
-            test_cases=list(chunk),
+            test_cases=test_cases,
             metadata=dict(metadata_template),
             source_file=source_file,
             thresholds=dict(threshold_template),
         )
+
+    def checkpoint(run: EvaluationRun, status: str, *, appended: int = 0) -> None:
+        state = dict(run.tracker_metadata.get("streaming") or {})
+        state["status"] = status
+        state["chunk_size"] = chunk_size
+        state["source_file"] = source_file
+        state["completed_cases"] = int(state.get("completed_cases", 0)) + appended
+        state["chunks"] = int(state.get("chunks", 0)) + (1 if appended else 0)
+        run.tracker_metadata["streaming"] = state
+
+    async def evaluate_chunk(chunk: list[Any]) -> None:
+        nonlocal merged_run, processed_total, estimated_total
         if iterator.stats.estimated_total_rows is not None:
             estimated_total = iterator.stats.estimated_total_rows
         progress_callback_wrapper = None
         if on_progress:
             progress_callback_wrapper = _build_streaming_progress_callback(
                 on_progress,
-                offset=chunk_offset,
+                offset=processed_total,
                 total_estimate=estimated_total,
             )
 
         chunk_run = await evaluator.evaluate(
-            dataset=chunk_dataset,
+            dataset=make_dataset(list(chunk)),
             metrics=metrics,
             llm=llm,
             thresholds=thresholds,
@@ -1166,6 +1458,7 @@ async def _evaluate_streaming_run(
             batch_size=batch_size,
             prompt_overrides=prompt_overrides,
             on_progress=progress_callback_wrapper,
+            metric_concurrency=metric_concurrency,
         )
         merged_run = _merge_evaluation_runs(
             merged_run,
@@ -1175,60 +1468,31 @@ async def _evaluate_streaming_run(
             metrics=metrics,
             thresholds=thresholds,
         )
+        if storage is not None:
+            checkpoint(merged_run, "in_progress", appended=len(merged_run.results))
+            storage.append_run_results(merged_run, merged_run.results)
+            merged_run.results = []
+            if on_checkpoint:
+                on_checkpoint(merged_run.run_id)
         processed_total += len(chunk)
+
+    chunk: list[Any] = []
+    for test_case in iterator:
+        if test_case.id in completed_ids:
+            processed_total += 1
+            continue
+        chunk.append(test_case)
+        if len(chunk) < chunk_size:
+            continue
+        await evaluate_chunk(chunk)
         chunk = []
 
     if chunk:
-        chunk_offset = processed_total
-        chunk_dataset = Dataset(
-            name=dataset_template.name,
-            version=dataset_template.version,
-            test_cases=list(chunk),
-            metadata=dict(metadata_template),
-            source_file=source_file,
-            thresholds=dict(threshold_template),
-        )
-        if iterator.stats.estimated_total_rows is not None:
-            estimated_total = iterator.stats.estimated_total_rows
-        progress_callback_wrapper = None
-        if on_progress:
-            progress_callback_wrapper = _build_streaming_progress_callback(
-                on_progress,
-                offset=chunk_offset,
-                total_estimate=estimated_total,
-            )
-
-        chunk_run = await evaluator.evaluate(
-            dataset=chunk_dataset,
-            metrics=metrics,
-            llm=llm,
-            thresholds=thresholds,
-            parallel=parallel,
-            batch_size=batch_size,
-            prompt_overrides=prompt_overrides,
-            on_progress=progress_callback_wrapper,
-        )
-        merged_run = _merge_evaluation_runs(
-            merged_run,
-            chunk_run,
-            dataset_name=dataset_template.name,
-            dataset_version=dataset_template.version,
-            metrics=metrics,
-            thresholds=thresholds,
-        )
-        processed_total += len(chunk)
+        await evaluate_chunk(chunk)
 
     if merged_run is None:
-        empty_dataset = Dataset(
-            name=dataset_template.name,
-            version=dataset_template.version,
-            test_cases=[],
-            metadata=dict(metadata_template),
-            source_file=source_file,
-            thresholds=dict(threshold_template),
-        )
         merged_run = await evaluator.evaluate(
-            dataset=empty_dataset,
+            dataset=make_dataset([]),
             metrics=metrics,
             llm=llm,
             thresholds=thresholds,
@@ -1241,7 +1505,17 @@ async def _evaluate_streaming_run(
     merged_run.metrics_evaluated = list(metrics)
     merged_run.dataset_name = dataset_template.name
     merged_run.dataset_version = dataset_template.version
-    return merged_run
+    if storage is None:
+        return merged_run
+
+    # 최종 보고/트래커 로깅용으로 전체 결과를 저장소에서 다시 읽음
+    final_run = storage.get_run(merged_run.run_id)
+    final_run.tracker_metadata = merged_run.tracker_metadata
+    final_run.thresholds = merged_run.thresholds
+    final_run.metrics_evaluated = merged_run.metrics_evaluated
+    checkpoint(final_run, "completed")
+    storage.append_run_results(final_run, [])
+    return final_run
 
 
 def _collect_prompt_metadata(
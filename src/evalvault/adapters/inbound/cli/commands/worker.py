@@ -0,0 +1,85 @@
+"""Evaluation job worker command for EvalVault CLI."""
+
+from __future__ import annotations
+
+import signal
+import threading
+
+import typer
+from rich.console import Console
+
+from evalvault.config.settings import get_settings
+
+
+def register_worker_command(app: typer.Typer, console: Console) -> None:
+    """Attach the `worker` command to the root Typer app."""
+
+    @app.command("worker")
+    def worker(
+        concurrency: int | None = typer.Option(
+            None,
+            "--concurrency",
+            "-c",
+            min=1,
+            help="Jobs to run at once, one process each (default: JOB_WORKER_CONCURRENCY).",
+        ),
+        max_per_project: int | None = typer.Option(
+            None,
+            "--max-per-project",
+            min=1,
+            help="Running jobs allowed per project across workers (default: JOB_MAX_PER_PROJECT).",
+        ),
+        poll_interval: float | None = typer.Option(
+            None,
+            "--poll-interval",
+            min=0.1,
+            help="Seconds between job table polls (default: JOB_POLL_INTERVAL_SECONDS).",
+        ),
+    ) -> None:
+        """Run queued evaluation jobs submitted through POST /api/v1/jobs."""
+        from evalvault.adapters.inbound.api.job_worker import JobWorker
+        from evalvault.adapters.outbound.storage.job_queue_factory import (
+            build_job_queue_adapter,
+        )
+
+        settings = get_settings()
+        try:
+            queue = build_job_queue_adapter(settings)
+        except Exception as exc:
+            console.print(f"[red]Error:[/red] Job queue unavailable: {exc}")
+            raise typer.Exit(1) from exc
+
+        job_worker = JobWorker(
+            queue,
+            concurrency=concurrency or settings.job_worker_concurrency,
+            max_per_project=max_per_project or settings.job_max_per_project,
+            poll_interval=poll_interval or settings.job_poll_interval_seconds,
+            stale_after_seconds=settings.job_stale_after_seconds,
+            max_attempts=settings.job_max_attempts,
+        )
+        stop_event = threading.Event()
+
+        def request_stop(signum, frame) -> None:  # noqa: ARG001
+            if stop_event.is_set():
+                raise KeyboardInterrupt
+            console.print("[yellow]Stopping: waiting for running jobs (repeat to abort).[/yellow]")
+            stop_event.set()
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+        console.print(
+            f"[bold green]EvalVault worker[/bold green] {job_worker.worker_id} "
+            f"(concurrency {job_worker.concurrency}, "
+            f"{job_worker.max_per_project} per project)"
+        )
+        try:
+            job_worker.run(stop_event)
+        except KeyboardInterrupt:
+            job_worker.terminate_all()
+            console.print("[yellow]Aborted; unfinished jobs will be requeued.[/yellow]")
+            raise typer.Exit(130) from None
+        console.print("[dim]Worker stopped.[/dim]")
+
+
+__all__ = ["register_worker_command"]
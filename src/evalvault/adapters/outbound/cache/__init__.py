@@ -5,11 +5,21 @@ from evalvault.adapters.outbound.cache.hybrid_cache import (
     HybridCache,
     make_cache_key,
 )
+from evalvault.adapters.outbound.cache.llm_response_cache import (
+    LLMCacheMode,
+    SQLiteLLMResponseCache,
+    get_llm_response_cache,
+    make_llm_cache_key,
+)
 from evalvault.adapters.outbound.cache.memory_cache import MemoryCacheAdapter
 
 __all__ = [
     "CacheEntry",
     "HybridCache",
+    "LLMCacheMode",
     "MemoryCacheAdapter",
+    "SQLiteLLMResponseCache",
+    "get_llm_response_cache",
     "make_cache_key",
+    "make_llm_cache_key",
 ]
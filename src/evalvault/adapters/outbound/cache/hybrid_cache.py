@@ -205,6 +205,23 @@ class HybridCache:
                 return True
             return False
 
+    def delete_prefix(self, prefix: str) -> int:
+        """주어진 접두사로 시작하는 모든 키를 삭제합니다.
+
+        Args:
+            prefix: 삭제할 키 접두사
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            removed = 0
+            for region in (self._hot, self._cold):
+                for key in [k for k in region if k.startswith(prefix)]:
+                    del region[key]
+                    removed += 1
+            return removed
+
     def clear(self) -> None:
         """모든 캐시를 삭제합니다."""
         with self._lock:
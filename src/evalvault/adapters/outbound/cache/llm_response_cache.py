@@ -0,0 +1,469 @@
+"""Persistent, content-addressed cache for LLM judge responses.
+
+Re-running an evaluation with the same judge model, prompts and samples
+produces byte-identical chat-completion requests. This cache stores the raw
+response payload on disk (SQLite) keyed by a hash of the request so repeated
+runs can skip the provider round-trip entirely.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from contextlib import suppress
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from openai import NotGiven, Omit
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from evalvault.config.settings import Settings
+    from evalvault.ports.outbound.llm_port import ThinkingConfig
+
+# Request kwargs that never influence the generated content.
+_NON_SEMANTIC_REQUEST_KEYS = frozenset({"timeout", "extra_headers", "stream_options"})
+
+
+class LLMCacheMode(StrEnum):
+    """How the LLM response cache participates in a run."""
+
+    OFF = "off"
+    READ_WRITE = "readwrite"
+    READ_ONLY = "readonly"
+    REFRESH = "refresh"
+
+    @property
+    def readable(self) -> bool:
+        return self in (LLMCacheMode.READ_WRITE, LLMCacheMode.READ_ONLY)
+
+    @property
+    def writable(self) -> bool:
+        return self in (LLMCacheMode.READ_WRITE, LLMCacheMode.REFRESH)
+
+
+def parse_llm_cache_mode(value: str | LLMCacheMode | None) -> LLMCacheMode:
+    """Normalize user input (CLI/env) into an :class:`LLMCacheMode`."""
+    if isinstance(value, LLMCacheMode):
+        return value
+    normalized = (value or "").strip().lower().replace("-", "").replace("_", "")
+    aliases = {
+        "": LLMCacheMode.OFF,
+        "none": LLMCacheMode.OFF,
+        "disabled": LLMCacheMode.OFF,
+        "false": LLMCacheMode.OFF,
+        "on": LLMCacheMode.READ_WRITE,
+        "true": LLMCacheMode.READ_WRITE,
+        "rw": LLMCacheMode.READ_WRITE,
+        "ro": LLMCacheMode.READ_ONLY,
+    }
+    if normalized in aliases:
+        return aliases[normalized]
+    try:
+        return LLMCacheMode(normalized)
+    except ValueError as exc:
+        choices = ", ".join(mode.value for mode in LLMCacheMode)
+        raise ValueError(f"Unsupported LLM cache mode: '{value}'. Supported: {choices}") from exc
+
+
+def _thinking_fingerprint(thinking_config: ThinkingConfig | None) -> dict[str, Any] | None:
+    if thinking_config is None:
+        return None
+    return {
+        "enabled": thinking_config.enabled,
+        "budget_tokens": thinking_config.budget_tokens,
+        "think_level": thinking_config.think_level,
+    }
+
+
+def _canonicalize(value: Any) -> Any:
+    """Convert request values into plain JSON data for hashing.
+
+    Pydantic ``response_format`` classes hash by their JSON schema so that a
+    schema change invalidates cached responses. Anything that cannot be
+    represented faithfully raises ``TypeError`` instead of being stringified.
+    """
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return {"__schema__": value.__name__, "schema": value.model_json_schema()}
+    if isinstance(value, Mapping):
+        return {
+            str(key): _canonicalize(item)
+            for key, item in value.items()
+            if not isinstance(item, NotGiven | Omit)
+        }
+    if isinstance(value, list | tuple):
+        return [_canonicalize(item) for item in value]
+    raise TypeError(f"Unsupported value in LLM request: {type(value).__name__}")
+
+
+def make_llm_cache_key(
+    provider: str,
+    request: Mapping[str, Any],
+    thinking_config: ThinkingConfig | None = None,
+) -> str:
+    """Build a stable content hash for a chat-completion request.
+
+    The key covers the provider, the model, the prompt messages, sampling
+    parameters (temperature etc.), tool/response schemas and the thinking
+    configuration. Keys are order-independent for dict-valued arguments.
+
+    Raises:
+        TypeError: If the request contains values that cannot be hashed
+            deterministically; such requests should bypass the cache.
+    """
+    payload = {
+        "provider": provider,
+        "thinking": _thinking_fingerprint(thinking_config),
+        "request": _canonicalize(
+            {
+                key: value
+                for key, value in request.items()
+                if key not in _NON_SEMANTIC_REQUEST_KEYS and value is not None
+            }
+        ),
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SQLiteLLMResponseCache:
+    """Disk-backed LLM response cache with TTL and size-based LRU eviction.
+
+    Values are JSON-serializable response payloads (e.g. ``ChatCompletion``
+    dumped via ``model_dump(mode="json")``). Hit/miss/eviction counters use the
+    same keys as the in-memory caches so they can be fed into
+    :class:`~evalvault.domain.services.cache_metrics.CacheStatsTracker`.
+
+    Each thread keeps one long-lived WAL connection, so concurrent readers do
+    not serialize on a process lock. LRU access times are buffered in memory
+    and written in batches (at most once per ``touch_interval_seconds`` per
+    entry) instead of an ``UPDATE`` on every hit.
+    """
+
+    _TOUCH_FLUSH_THRESHOLD = 256
+
+    def __init__(
+        self,
+        db_path: str | Path = "data/cache/llm_responses.db",
+        *,
+        mode: LLMCacheMode | str = LLMCacheMode.READ_WRITE,
+        max_entries: int = 100_000,
+        ttl_seconds: int | None = 7 * 24 * 3600,
+        touch_interval_seconds: float = 60.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite file path (``:memory:`` is not supported across threads).
+            mode: Read/write participation of the cache.
+            max_entries: Maximum stored responses; least recently used are evicted.
+            ttl_seconds: Entry lifetime in seconds. ``None``/``0`` disables expiry.
+            touch_interval_seconds: Minimum age of an entry's access time before
+                a hit refreshes it for LRU ordering.
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.mode = parse_llm_cache_mode(mode)
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = int(ttl_seconds) if ttl_seconds else None
+        self._touch_interval = max(0.0, float(touch_interval_seconds))
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        # Guards counters, pending touches and the connection registry only;
+        # SQLite I/O runs outside of it.
+        self._lock = threading.Lock()
+        self._pending_touches: dict[str, float] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        self._expired = 0
+        self._init_db()
+        self._approx_size = self._count()
+
+    @property
+    def readable(self) -> bool:
+        return self.mode.readable
+
+    @property
+    def writable(self) -> bool:
+        return self.mode.writable
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._conn()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                cache_key TEXT PRIMARY KEY,
+                provider TEXT,
+                model TEXT,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                last_accessed REAL NOT NULL,
+                hit_count INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed "
+            "ON llm_response_cache(last_accessed)"
+        )
+        conn.commit()
+
+    def _count(self) -> int:
+        row = self._conn().execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()
+        return int(row[0]) if row else 0
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached payload for ``key`` or ``None`` on miss/expiry."""
+        if not self.readable:
+            return None
+        now = time.time()
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT payload, expires_at, last_accessed FROM llm_response_cache WHERE cache_key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            with self._lock:
+                self._misses += 1
+            return None
+        payload, expires_at, last_accessed = row
+        if expires_at is not None and expires_at <= now:
+            conn.execute("DELETE FROM llm_response_cache WHERE cache_key = ?", (key,))
+            conn.commit()
+            with self._lock:
+                self._expired += 1
+                self._misses += 1
+                self._pending_touches.pop(key, None)
+            return None
+        try:
+            value = json.loads(payload)
+        except (TypeError, ValueError):
+            self.delete(key)
+            with self._lock:
+                self._misses += 1
+            return None
+        flush = False
+        with self._lock:
+            self._hits += 1
+            if now - float(last_accessed) >= self._touch_interval:
+                self._pending_touches[key] = now
+                flush = len(self._pending_touches) >= self._TOUCH_FLUSH_THRESHOLD
+        if flush:
+            self.flush()
+        return value
+
+    def set(
+        self,
+        key: str,
+        payload: Mapping[str, Any],
+        *,
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> bool:
+        """Store ``payload`` under ``key``. Returns ``False`` when not writable."""
+        if not self.writable:
+            return False
+        try:
+            encoded = json.dumps(payload, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return False
+        now = time.time()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds else None
+        conn = self._conn()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO llm_response_cache (
+                cache_key, provider, model, payload, created_at, expires_at,
+                last_accessed, hit_count
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+            """,
+            (key, provider, model, encoded, now, expires_at, now),
+        )
+        conn.commit()
+        with self._lock:
+            self._writes += 1
+            self._approx_size += 1
+            self._pending_touches.pop(key, None)
+            overflow = self._approx_size > self.max_entries
+        if overflow:
+            self.flush()
+            self._evict_overflow()
+        return True
+
+    def flush(self) -> None:
+        """Write buffered LRU access times to disk."""
+        with self._lock:
+            touches = list(self._pending_touches.items())
+            self._pending_touches.clear()
+        if not touches:
+            return
+        conn = self._conn()
+        conn.executemany(
+            "UPDATE llm_response_cache SET last_accessed = ?, hit_count = hit_count + 1 "
+            "WHERE cache_key = ?",
+            [(accessed, key) for key, accessed in touches],
+        )
+        conn.commit()
+
+    def delete(self, key: str) -> bool:
+        conn = self._conn()
+        cursor = conn.execute("DELETE FROM llm_response_cache WHERE cache_key = ?", (key,))
+        conn.commit()
+        with self._lock:
+            self._pending_touches.pop(key, None)
+        return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Remove every cached response and reset counters."""
+        conn = self._conn()
+        conn.execute("DELETE FROM llm_response_cache")
+        conn.commit()
+        with self._lock:
+            self._pending_touches.clear()
+            self._approx_size = 0
+            self._hits = 0
+            self._misses = 0
+            self._writes = 0
+            self._evictions = 0
+            self._expired = 0
+
+    def cleanup_expired(self) -> int:
+        """Delete expired entries. Returns the number of removed rows."""
+        conn = self._conn()
+        cursor = conn.execute(
+            "DELETE FROM llm_response_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        conn.commit()
+        removed = max(cursor.rowcount, 0)
+        with self._lock:
+            self._expired += removed
+        return removed
+
+    def size(self) -> int:
+        return self._count()
+
+    def close(self) -> None:
+        """Flush pending access times and close every per-thread connection."""
+        self.flush()
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for conn in connections:
+            with suppress(sqlite3.Error):
+                conn.close()
+        self._local = threading.local()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return counters compatible with ``CacheStatsSnapshot.from_stats``."""
+        size = self.size()
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "mode": self.mode.value,
+                "path": str(self.db_path),
+                "size": size,
+                "max_size": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total > 0 else 0.0,
+                "writes": self._writes,
+                "evictions": self._evictions,
+                "expired": self._expired,
+                "default_ttl_seconds": self.ttl_seconds,
+            }
+
+    def _evict_overflow(self) -> None:
+        conn = self._conn()
+        size = self._count()
+        overflow = size - self.max_entries
+        evicted = 0
+        if overflow > 0:
+            cursor = conn.execute(
+                """
+                DELETE FROM llm_response_cache WHERE cache_key IN (
+                    SELECT cache_key FROM llm_response_cache
+                    ORDER BY last_accessed ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+            conn.commit()
+            evicted = max(cursor.rowcount, 0)
+        with self._lock:
+            self._evictions += evicted
+            self._approx_size = size - evicted
+
+
+_shared_caches: dict[tuple[str, str, int, int], SQLiteLLMResponseCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_llm_response_cache(settings: Settings) -> SQLiteLLMResponseCache | None:
+    """Return the process-wide response cache configured by ``settings``.
+
+    Adapters built from the same settings (e.g. the judge and the faithfulness
+    fallback) share one instance so hit/miss counters aggregate per run.
+    Returns ``None`` when ``llm_cache_mode`` is ``off``.
+    """
+    mode = parse_llm_cache_mode(getattr(settings, "llm_cache_mode", None))
+    if mode is LLMCacheMode.OFF:
+        return None
+    path = str(getattr(settings, "llm_cache_path", "data/cache/llm_responses.db"))
+    ttl_seconds = int(settings.llm_cache_ttl_seconds)
+    max_entries = int(settings.llm_cache_max_entries)
+    key = (path, mode.value, ttl_seconds, max_entries)
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = SQLiteLLMResponseCache(
+                path,
+                mode=mode,
+                max_entries=max_entries,
+                ttl_seconds=ttl_seconds,
+            )
+            _shared_caches[key] = cache
+        return cache
+
+
+@atexit.register
+def _flush_shared_caches() -> None:
+    with _shared_caches_lock:
+        caches = list(_shared_caches.values())
+    for cache in caches:
+        with suppress(sqlite3.Error):
+            cache.flush()
+
+
+__all__ = [
+    "LLMCacheMode",
+    "SQLiteLLMResponseCache",
+    "get_llm_response_cache",
+    "make_llm_cache_key",
+    "parse_llm_cache_mode",
+]
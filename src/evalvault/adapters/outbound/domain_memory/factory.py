@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 
 from evalvault.adapters.outbound.domain_memory.postgres_adapter import PostgresDomainMemoryAdapter
 from evalvault.adapters.outbound.domain_memory.sqlite_adapter import SQLiteDomainMemoryAdapter
+from evalvault.adapters.outbound.storage.postgres_pool import PostgresPoolConfig
+from evalvault.adapters.outbound.storage.sqlite_tuning import SQLiteTuning
 
 if TYPE_CHECKING:
     from evalvault.config.settings import Settings
@@ -42,7 +44,9 @@ def build_domain_memory_adapter(
         resolved_db_path = resolved_settings.evalvault_memory_db_path
         if resolved_db_path is None:
             raise RuntimeError("SQLite backend selected but evalvault_memory_db_path is not set.")
-        return SQLiteDomainMemoryAdapter(db_path=resolved_db_path)
+        return SQLiteDomainMemoryAdapter(
+            db_path=resolved_db_path, tuning=SQLiteTuning.from_settings(resolved_settings)
+        )
 
     conn_string = resolved_settings.postgres_connection_string
     if not conn_string:
@@ -54,7 +58,10 @@ def build_domain_memory_adapter(
         conn_string = f"host={host} port={port} dbname={database} user={user} password={password}"
 
     try:
-        return PostgresDomainMemoryAdapter(connection_string=conn_string)
+        return PostgresDomainMemoryAdapter(
+            connection_string=conn_string,
+            pool_config=PostgresPoolConfig.from_settings(resolved_settings),
+        )
     except Exception as exc:
         if not fallback_to_sqlite:
             raise
@@ -62,7 +69,9 @@ def build_domain_memory_adapter(
         resolved_db_path = resolved_settings.evalvault_memory_db_path
         if resolved_db_path is None:
             raise
-        return SQLiteDomainMemoryAdapter(db_path=resolved_db_path)
+        return SQLiteDomainMemoryAdapter(
+            db_path=resolved_db_path, tuning=SQLiteTuning.from_settings(resolved_settings)
+        )
 
 
 __all__ = ["build_domain_memory_adapter"]
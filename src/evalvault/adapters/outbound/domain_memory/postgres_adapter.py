@@ -14,9 +14,15 @@ import logging
 import re
 from datetime import datetime
 from pathlib import Path
+from typing import cast
 
 import psycopg
 
+from evalvault.adapters.outbound.storage.postgres_pool import (
+    PooledConnection,
+    PostgresPoolConfig,
+    get_connection_pool,
+)
 from evalvault.domain.entities.memory import (
     BehaviorEntry,
     BehaviorHandbook,
@@ -40,17 +46,28 @@ class PostgresDomainMemoryAdapter:
     Implements DomainMemoryPort using PostgreSQL for persistent storage.
     """
 
-    def __init__(self, connection_string: str | None = None):
+    def __init__(
+        self,
+        connection_string: str | None = None,
+        pool_config: PostgresPoolConfig | None = None,
+    ):
         """Initialize PostgreSQL domain memory adapter.
 
         Args:
             connection_string: PostgreSQL connection string
                 (e.g., "host=localhost port=5432 dbname=evalvault user=postgres password=...")
+            pool_config: Share long-lived connections through a psycopg pool
+                (default: connect per operation)
         """
         self.connection_string = connection_string or (
             "host=localhost port=5432 dbname=evalvault user=postgres password="
         )
         self._init_db()
+        self._pool = (
+            get_connection_pool(self.connection_string, pool_config)
+            if pool_config is not None
+            else None
+        )
 
     def _init_db(self) -> None:
         """Initialize database schema."""
@@ -68,7 +85,9 @@ class PostgresDomainMemoryAdapter:
             raise
 
     def _get_connection(self) -> psycopg.Connection:
-        """Get a database connection."""
+        """Get a database connection (pooled connections return to the pool on close)."""
+        if self._pool is not None:
+            return cast(psycopg.Connection, PooledConnection(self._pool, self._pool.getconn()))
         return psycopg.connect(self.connection_string)
 
     def _row_to_fact(self, row: tuple) -> FactualFact:
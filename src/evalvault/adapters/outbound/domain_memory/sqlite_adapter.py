@@ -15,8 +15,14 @@ import re
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
+from evalvault.adapters.outbound.storage.sqlite_tuning import (
+    SQLiteTuning,
+    SQLiteWriteQueue,
+    ThreadLocalConnections,
+    route_writes_through,
+)
 from evalvault.domain.entities.memory import (
     BehaviorEntry,
     BehaviorHandbook,
@@ -35,15 +41,54 @@ class SQLiteDomainMemoryAdapter:
     Implements DomainMemoryPort using SQLite for local persistence.
     """
 
-    def __init__(self, db_path: str | Path = "data/db/evalvault_memory.db"):
+    # Routed through the writer queue in high-throughput mode.
+    _QUEUED_WRITE_METHODS = (
+        "save_fact",
+        "update_fact",
+        "delete_fact",
+        "save_learning",
+        "save_behavior",
+        "update_behavior",
+        "save_context",
+        "update_context",
+        "delete_context",
+        "consolidate_facts",
+        "forget_obsolete",
+        "decay_verification_scores",
+        "extract_facts_from_evaluation",
+        "extract_patterns_from_evaluation",
+        "extract_behaviors_from_evaluation",
+        "link_fact_to_kg",
+        "import_kg_as_facts",
+        "create_summary_fact",
+        "rebuild_fts_indexes",
+    )
+
+    def __init__(
+        self,
+        db_path: str | Path = "data/db/evalvault_memory.db",
+        *,
+        tuning: SQLiteTuning | None = None,
+    ):
         """Initialize SQLite domain memory adapter.
 
         Args:
             db_path: Path to SQLite database file
+            tuning: High-throughput mode (WAL, per-thread connections, writer queue)
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._tuning = tuning
+        self._connections = ThreadLocalConnections(self._open_connection) if tuning else None
+        self._writer = SQLiteWriteQueue() if tuning and tuning.writer_queue else None
         self._init_db()
+        if self._writer is not None:
+            route_writes_through(self._writer, self, self._QUEUED_WRITE_METHODS)
+
+    def _open_connection(self) -> sqlite3.Connection:
+        if self._tuning is not None:
+            return self._tuning.connect(self.db_path)
+        return sqlite3.connect(self.db_path)
 
     def _init_db(self) -> None:
         """Initialize database schema."""
@@ -51,7 +96,7 @@ class SQLiteDomainMemoryAdapter:
         with open(schema_path, encoding="utf-8") as f:
             schema_sql = f.read()
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._open_connection()
         conn.execute("PRAGMA foreign_keys = ON")
         conn.executescript(schema_sql)
 
@@ -76,7 +121,7 @@ class SQLiteDomainMemoryAdapter:
         This ensures FTS5 tables are synchronized with the source data,
         fixing any corruption from INSERT OR REPLACE operations.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._open_connection()
         cursor = conn.cursor()
 
         try:
@@ -150,11 +195,24 @@ class SQLiteDomainMemoryAdapter:
         self._rebuild_fts_indexes()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with foreign keys enabled."""
+        """Get a database connection with foreign keys enabled.
+
+        In high-throughput mode this is the calling thread's cached connection;
+        ``close()`` hands it back instead of closing it.
+        """
+        if self._connections is not None:
+            return cast(sqlite3.Connection, self._connections.checkout())
         conn = sqlite3.connect(self.db_path)
         conn.execute("PRAGMA foreign_keys = ON")
         return conn
 
+    def close(self) -> None:
+        """Drain the writer queue and close cached connections (high-throughput mode)."""
+        if self._writer is not None:
+            self._writer.close()
+        if self._connections is not None:
+            self._connections.close_all()
+
     # =========================================================================
     # Factual Layer - 검증된 사실 저장 (Phase 1)
     # =========================================================================
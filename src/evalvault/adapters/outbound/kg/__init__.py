@@ -1,5 +1,6 @@
 """Knowledge Graph adapters for EvalVault."""
 
+from evalvault.adapters.outbound.kg.columnar_graph import ColumnarKnowledgeGraph
 from evalvault.adapters.outbound.kg.graph_rag_retriever import GraphRAGResult, GraphRAGRetriever
 from evalvault.adapters.outbound.kg.networkx_adapter import NetworkXKnowledgeGraph
 from evalvault.adapters.outbound.kg.query_strategies import (
@@ -10,6 +11,7 @@ from evalvault.adapters.outbound.kg.query_strategies import (
 )
 
 __all__ = [
+    "ColumnarKnowledgeGraph",
     "GraphRAGResult",
     "GraphRAGRetriever",
     "NetworkXKnowledgeGraph",
@@ -0,0 +1,585 @@
+"""Columnar on-disk knowledge graph with memory-mapped loading.
+
+``NetworkXKnowledgeGraph.to_dict()``/``from_dict()`` JSON 왕복은 엔티티/관계마다
+dict와 Pydantic 모델을 만들고 ``networkx.MultiDiGraph``를 다시 구성하므로
+대형 그래프(수만 엔티티, 수십만 관계)를 불러오는 데 시간과 메모리가 많이 듭니다.
+
+이 모듈의 형식은 디렉터리 하나에 다음을 저장합니다.
+
+- 문자열 테이블: 엔티티 이름, canonical name, 출처 문서 ID, provenance,
+  속성 JSON 문자열을 한 번만 저장한 UTF-8 blob + 오프셋 배열.
+  엔티티 이름은 정렬되어 테이블 앞부분(ID 0..N-1)에 위치하므로 이름 조회는
+  이진 탐색으로 처리됩니다. 엔티티/관계 타입 목록은 manifest에 저장됩니다.
+- 엔티티/관계 컬럼: 문자열 ID, confidence 등 고정 폭 ``.npy`` 배열.
+- 인접 CSR: 관계를 (source, relation_type, target) 순으로 정렬한 out-edge
+  ``indptr``와, (target, relation_type, source) 순의 in-edge 인덱스.
+  노드별 관계 범위 안에서는 관계 타입으로 다시 구간을 찾을 수 있습니다.
+
+모든 배열은 ``np.load(mmap_mode="r")``로 복사 없이 매핑되며,
+``ColumnarKnowledgeGraph``는 ``networkx`` 그래프를 만들지 않고 GraphRAG와
+CLI가 사용하는 조회 API를 제공합니다. ``manifest.json``은 마지막에 기록되므로
+중단된 저장은 로드되지 않습니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from evalvault.adapters.outbound.kg.networkx_adapter import NetworkXKnowledgeGraph
+from evalvault.domain.entities.kg import EntityModel, RelationModel
+
+COLUMNAR_KG_FORMAT = "evalvault-kg-columnar"
+COLUMNAR_KG_VERSION = 1
+_MANIFEST = "manifest.json"
+_NONE = -1
+
+_ENTITY_COLUMNS = (
+    "entity_type",
+    "entity_canonical",
+    "entity_source_document",
+    "entity_provenance",
+    "entity_attributes",
+    "entity_confidence",
+)
+_RELATION_COLUMNS = (
+    "relation_source",
+    "relation_target",
+    "relation_type",
+    "relation_provenance",
+    "relation_attributes",
+    "relation_confidence",
+)
+_INDEX_COLUMNS = ("out_indptr", "in_indptr", "in_relations")
+
+
+def is_columnar_kg(path: str | Path) -> bool:
+    """경로가 컬럼형 KG 디렉터리인지 확인합니다."""
+    manifest_path = Path(path) / _MANIFEST
+    if not manifest_path.is_file():
+        return False
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return False
+    return isinstance(manifest, dict) and manifest.get("format") == COLUMNAR_KG_FORMAT
+
+
+class ColumnarKnowledgeGraph:
+    """메모리 매핑된 읽기 전용 지식 그래프.
+
+    ``NetworkXKnowledgeGraph``의 조회 API(엔티티/관계 조회, 이웃 탐색, 통계)를
+    동일한 반환 타입으로 제공합니다. 그래프를 수정하려면 ``to_networkx()``로
+    변환하세요.
+
+    Example:
+        >>> ColumnarKnowledgeGraph.save(kg, "data/kg/insurance")
+        >>> graph = ColumnarKnowledgeGraph.load("data/kg/insurance")
+        >>> graph.find_neighbors("암진단특약", depth=2)
+    """
+
+    def __init__(self, path: Path, manifest: dict[str, Any], arrays: dict[str, np.ndarray]):
+        self._path = path
+        self._manifest = manifest
+        self._blob = arrays["string_blob"]
+        self._offsets = arrays["string_offsets"]
+        self._columns = arrays
+        self._entity_types: list[str] = list(manifest.get("entity_types", []))
+        self._relation_types: list[str] = list(manifest.get("relation_types", []))
+        self._num_entities = int(manifest["num_entities"])
+        self._num_relations = int(manifest["num_relations"])
+        self._entity = lru_cache(maxsize=4096)(self._build_entity)
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def save(
+        cls,
+        kg: NetworkXKnowledgeGraph,
+        path: str | Path,
+        *,
+        metadata: dict[str, Any] | None = None,
+    ) -> Path:
+        """그래프를 컬럼형 디렉터리로 저장합니다.
+
+        Args:
+            kg: 저장할 그래프
+            path: 출력 디렉터리
+            metadata: manifest에 함께 기록할 부가 정보 (빌드 설정 등)
+
+        Returns:
+            저장된 디렉터리 경로
+        """
+        target = Path(path)
+        target.mkdir(parents=True, exist_ok=True)
+        manifest_path = target / _MANIFEST
+        manifest_path.unlink(missing_ok=True)
+
+        entities = sorted(kg.get_all_entities(), key=lambda entity: entity.name)
+        strings: dict[str, int] = {}
+
+        def intern(value: str | None) -> int:
+            if value is None:
+                return _NONE
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            return index
+
+        def intern_attributes(attributes: dict[str, Any]) -> int:
+            if not attributes:
+                return _NONE
+            return intern(json.dumps(attributes, ensure_ascii=False, sort_keys=True))
+
+        # 엔티티 이름이 문자열 ID 0..N-1을 차지하도록 먼저 등록
+        for entity in entities:
+            intern(entity.name)
+        entity_index = {entity.name: index for index, entity in enumerate(entities)}
+        entity_types = sorted({entity.entity_type for entity in entities})
+        entity_type_index = {name: index for index, name in enumerate(entity_types)}
+
+        arrays: dict[str, np.ndarray] = {
+            "entity_type": np.array([entity_type_index[e.entity_type] for e in entities], np.int32),
+            "entity_canonical": np.array([intern(e.canonical_name) for e in entities], np.int32),
+            "entity_source_document": np.array(
+                [
+                    intern(None if e.source_document_id is None else str(e.source_document_id))
+                    for e in entities
+                ],
+                np.int32,
+            ),
+            "entity_provenance": np.array([intern(e.provenance) for e in entities], np.int32),
+            "entity_attributes": np.array(
+                [intern_attributes(e.attributes) for e in entities], np.int32
+            ),
+            "entity_confidence": np.array([e.confidence for e in entities], np.float64),
+        }
+
+        relations = [
+            relation
+            for relation in kg.get_all_relations()
+            if relation.source in entity_index and relation.target in entity_index
+        ]
+        relation_types = sorted({relation.relation_type for relation in relations})
+        type_index = {name: index for index, name in enumerate(relation_types)}
+        sources = np.array([entity_index[r.source] for r in relations], np.int32)
+        targets = np.array([entity_index[r.target] for r in relations], np.int32)
+        types = np.array([type_index[r.relation_type] for r in relations], np.int32)
+        original = np.arange(len(relations))
+        order = np.lexsort((original, targets, types, sources))
+        relation_columns = {
+            "relation_source": sources,
+            "relation_target": targets,
+            "relation_type": types,
+            "relation_provenance": np.array([intern(r.provenance) for r in relations], np.int32),
+            "relation_attributes": np.array(
+                [intern_attributes(r.attributes) for r in relations], np.int32
+            ),
+            "relation_confidence": np.array([r.confidence for r in relations], np.float64),
+        }
+        for name, column in relation_columns.items():
+            arrays[name] = column[order]
+
+        num_entities = len(entities)
+        arrays["out_indptr"] = _indptr(arrays["relation_source"], num_entities)
+        arrays["in_relations"] = np.lexsort(
+            (arrays["relation_source"], arrays["relation_type"], arrays["relation_target"])
+        ).astype(np.int64)
+        arrays["in_indptr"] = _indptr(arrays["relation_target"], num_entities)
+
+        encoded = [value.encode("utf-8") for value in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        arrays["string_offsets"] = offsets
+        arrays["string_blob"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+        for name, array in arrays.items():
+            np.save(target / f"{name}.npy", np.ascontiguousarray(array))
+
+        manifest = {
+            "format": COLUMNAR_KG_FORMAT,
+            "version": COLUMNAR_KG_VERSION,
+            "num_entities": num_entities,
+            "num_relations": len(relations),
+            "num_strings": len(encoded),
+            "entity_types": entity_types,
+            "relation_types": relation_types,
+            "created_at": datetime.now(UTC).isoformat(),
+            "metadata": metadata or {},
+        }
+        tmp_path = target / f"{_MANIFEST}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, manifest_path)
+        return target
+
+    @classmethod
+    def load(cls, path: str | Path) -> ColumnarKnowledgeGraph:
+        """컬럼형 디렉터리를 메모리 매핑으로 엽니다.
+
+        Raises:
+            ValueError: manifest가 없거나 형식/버전이 맞지 않는 경우
+        """
+        source = Path(path)
+        manifest_path = source / _MANIFEST
+        if not manifest_path.is_file():
+            raise ValueError(f"columnar knowledge graph manifest not found: {manifest_path}")
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as exc:
+            raise ValueError("invalid columnar knowledge graph manifest") from exc
+        if manifest.get("format") != COLUMNAR_KG_FORMAT:
+            raise ValueError(f"not a columnar knowledge graph: {source}")
+        if manifest.get("version") != COLUMNAR_KG_VERSION:
+            raise ValueError(
+                f"unsupported columnar knowledge graph version: {manifest.get('version')}"
+            )
+
+        names = ("string_blob", "string_offsets", *_ENTITY_COLUMNS, *_RELATION_COLUMNS)
+        arrays = {
+            name: np.load(source / f"{name}.npy", mmap_mode="r")
+            for name in (*names, *_INDEX_COLUMNS)
+        }
+        return cls(source, manifest, arrays)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """저장 시 기록한 부가 정보."""
+        return dict(self._manifest.get("metadata") or {})
+
+    @property
+    def entity_revision(self) -> int:
+        """읽기 전용 그래프이므로 항상 0."""
+        return 0
+
+    # -------------------------------------------------------------------------
+    # Entity Operations
+    # -------------------------------------------------------------------------
+
+    def get_entity(self, name: str) -> EntityModel | None:
+        index = self._find(name)
+        return None if index is None else self._entity(index)
+
+    def has_entity(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    def get_all_entities(self) -> list[EntityModel]:
+        return [self._build_entity(index) for index in range(self._num_entities)]
+
+    def get_entities_by_type(self, entity_type: str) -> list[EntityModel]:
+        try:
+            type_id = self._entity_types.index(entity_type)
+        except ValueError:
+            return []
+        indices = np.flatnonzero(self._columns["entity_type"] == type_id)
+        return [self._entity(int(index)) for index in indices]
+
+    def iter_entity_keys(self) -> Iterator[tuple[str, str | None]]:
+        """엔티티 모델을 만들지 않고 (이름, canonical name)을 순회합니다."""
+        canonical = self._columns["entity_canonical"]
+        for index in range(self._num_entities):
+            yield self._string(index), self._optional_string(int(canonical[index]))
+
+    def get_source_document_ids(self) -> set[str]:
+        """엔티티 출처 문서 ID 집합."""
+        column = np.asarray(self._columns["entity_source_document"])
+        return {self._string(int(value)) for value in np.unique(column[column != _NONE])}
+
+    # -------------------------------------------------------------------------
+    # Relation Operations
+    # -------------------------------------------------------------------------
+
+    def get_outgoing_relations(
+        self, name: str, relation_type: str | None = None
+    ) -> list[RelationModel]:
+        """엔티티에서 나가는 관계 (``relation_type``으로 필터 가능)."""
+        index = self._find(name)
+        if index is None:
+            return []
+        start, end = self._out_range(index, relation_type)
+        return [self._relation(position) for position in range(start, end)]
+
+    def get_incoming_relations(
+        self, name: str, relation_type: str | None = None
+    ) -> list[RelationModel]:
+        """엔티티로 들어오는 관계 (``relation_type``으로 필터 가능)."""
+        index = self._find(name)
+        if index is None:
+            return []
+        positions = self._in_positions(index)
+        if relation_type is not None:
+            type_id = self._relation_type_id(relation_type)
+            if type_id is None:
+                return []
+            types = self._columns["relation_type"][positions]
+            positions = positions[types == type_id]
+        return [self._relation(int(position)) for position in positions]
+
+    def get_relations_for_entity(self, name: str) -> list[RelationModel]:
+        return self.get_outgoing_relations(name) + self.get_incoming_relations(name)
+
+    def get_relations(self, source: str, target: str) -> list[RelationModel]:
+        source_index = self._find(source)
+        target_index = self._find(target)
+        if source_index is None or target_index is None:
+            return []
+        start, end = self._out_range(source_index)
+        targets = self._columns["relation_target"][start:end]
+        return [
+            self._relation(start + int(offset))
+            for offset in np.flatnonzero(targets == target_index)
+        ]
+
+    def has_relation(self, source: str, target: str) -> bool:
+        return bool(self.get_relations(source, target))
+
+    def get_all_relations(self) -> list[RelationModel]:
+        return [self._relation(position) for position in range(self._num_relations)]
+
+    # -------------------------------------------------------------------------
+    # Graph Traversal
+    # -------------------------------------------------------------------------
+
+    def find_neighbors(self, entity_id: str, depth: int = 1) -> list[EntityModel]:
+        """이웃 엔티티 탐색 (BFS, 양방향)."""
+        start = self._find(entity_id)
+        if start is None or depth < 1:
+            return []
+        visited = {start}
+        frontier = [start]
+        for _ in range(depth):
+            next_level: list[int] = []
+            for node in frontier:
+                for neighbor in self._neighbor_indices(node):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_level.append(neighbor)
+            frontier = next_level
+            if not frontier:
+                break
+        visited.discard(start)
+        return [self._entity(index) for index in sorted(visited)]
+
+    def get_successors(self, name: str) -> list[str]:
+        index = self._find(name)
+        if index is None:
+            return []
+        start, end = self._out_range(index)
+        targets = self._columns["relation_target"][start:end]
+        return [self._string(int(value)) for value in dict.fromkeys(targets.tolist())]
+
+    def get_predecessors(self, name: str) -> list[str]:
+        index = self._find(name)
+        if index is None:
+            return []
+        sources = self._columns["relation_source"][self._in_positions(index)]
+        return [self._string(int(value)) for value in dict.fromkeys(sources.tolist())]
+
+    # -------------------------------------------------------------------------
+    # Graph Statistics
+    # -------------------------------------------------------------------------
+
+    def get_node_count(self) -> int:
+        return self._num_entities
+
+    def get_edge_count(self) -> int:
+        return self._num_relations
+
+    def get_degree(self, name: str) -> int:
+        return self.get_in_degree(name) + self.get_out_degree(name)
+
+    def get_in_degree(self, name: str) -> int:
+        index = self._find(name)
+        if index is None:
+            return 0
+        indptr = self._columns["in_indptr"]
+        return int(indptr[index + 1] - indptr[index])
+
+    def get_out_degree(self, name: str) -> int:
+        index = self._find(name)
+        if index is None:
+            return 0
+        indptr = self._columns["out_indptr"]
+        return int(indptr[index + 1] - indptr[index])
+
+    def get_isolated_entities(self) -> list[EntityModel]:
+        return [self._entity(int(index)) for index in np.flatnonzero(self._degrees() == 0)]
+
+    def get_statistics(self) -> dict[str, Any]:
+        """``NetworkXKnowledgeGraph.get_statistics()``와 같은 형식의 통계."""
+        entity_counts = np.bincount(
+            np.asarray(self._columns["entity_type"]), minlength=len(self._entity_types)
+        )
+        entity_types = {
+            name: int(count)
+            for name, count in zip(self._entity_types, entity_counts, strict=True)
+            if count
+        }
+        relation_counts = np.bincount(
+            np.asarray(self._columns["relation_type"]), minlength=len(self._relation_types)
+        )
+        relation_types = {
+            name: int(count)
+            for name, count in zip(self._relation_types, relation_counts, strict=True)
+            if count
+        }
+        confidence = np.asarray(self._columns["entity_confidence"])
+        avg_confidence = float(confidence.mean()) if self._num_entities else 0.0
+        return {
+            "num_entities": self._num_entities,
+            "num_relations": self._num_relations,
+            "entity_types": entity_types,
+            "relation_types": relation_types,
+            "isolated_entities": int(np.count_nonzero(self._degrees() == 0)),
+            "average_entity_confidence": round(avg_confidence, 3),
+        }
+
+    # -------------------------------------------------------------------------
+    # Conversion
+    # -------------------------------------------------------------------------
+
+    def to_networkx(self) -> NetworkXKnowledgeGraph:
+        """수정 가능한 ``NetworkXKnowledgeGraph``로 변환합니다."""
+        kg = NetworkXKnowledgeGraph()
+        for index in range(self._num_entities):
+            kg.add_entity(self._build_entity(index))
+        for position in range(self._num_relations):
+            kg.add_relation(self._relation(position))
+        return kg
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "entities": [entity.model_dump() for entity in self.get_all_entities()],
+            "relations": [relation.model_dump() for relation in self.get_all_relations()],
+            "statistics": self.get_statistics(),
+        }
+
+    # -------------------------------------------------------------------------
+    # Iterator Support
+    # -------------------------------------------------------------------------
+
+    def __iter__(self) -> Iterator[EntityModel]:
+        return (self._build_entity(index) for index in range(self._num_entities))
+
+    def __len__(self) -> int:
+        return self._num_entities
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._find(name) is not None
+
+    # -------------------------------------------------------------------------
+    # Private Helpers
+    # -------------------------------------------------------------------------
+
+    def _string(self, index: int) -> str:
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._blob[start:end].tobytes().decode("utf-8")
+
+    def _optional_string(self, index: int) -> str | None:
+        return None if index == _NONE else self._string(index)
+
+    def _find(self, name: str) -> int | None:
+        """정렬된 엔티티 이름에서 이진 탐색."""
+        lo, hi = 0, self._num_entities
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = self._string(mid)
+            if current < name:
+                lo = mid + 1
+            elif current > name:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def _build_entity(self, index: int) -> EntityModel:
+        columns = self._columns
+        attributes = self._optional_string(int(columns["entity_attributes"][index]))
+        source_document = self._optional_string(int(columns["entity_source_document"][index]))
+        # 저장 시 검증/정규화된 값이므로 검증 없이 복원
+        return EntityModel.model_construct(
+            name=self._string(index),
+            entity_type=self._entity_types[int(columns["entity_type"][index])],
+            canonical_name=self._optional_string(int(columns["entity_canonical"][index])),
+            source_document_id=source_document,
+            attributes=json.loads(attributes) if attributes else {},
+            confidence=float(columns["entity_confidence"][index]),
+            provenance=self._string(int(columns["entity_provenance"][index])),
+        )
+
+    def _relation(self, position: int) -> RelationModel:
+        columns = self._columns
+        attributes = self._optional_string(int(columns["relation_attributes"][position]))
+        return RelationModel.model_construct(
+            source=self._string(int(columns["relation_source"][position])),
+            target=self._string(int(columns["relation_target"][position])),
+            relation_type=self._relation_types[int(columns["relation_type"][position])],
+            attributes=json.loads(attributes) if attributes else {},
+            confidence=float(columns["relation_confidence"][position]),
+            provenance=self._string(int(columns["relation_provenance"][position])),
+        )
+
+    def _relation_type_id(self, relation_type: str) -> int | None:
+        try:
+            return self._relation_types.index(relation_type)
+        except ValueError:
+            return None
+
+    def _out_range(self, index: int, relation_type: str | None = None) -> tuple[int, int]:
+        indptr = self._columns["out_indptr"]
+        start, end = int(indptr[index]), int(indptr[index + 1])
+        if relation_type is None:
+            return start, end
+        type_id = self._relation_type_id(relation_type)
+        if type_id is None:
+            return start, start
+        # 노드 구간 안에서 관계 타입 순으로 정렬되어 있음
+        types = self._columns["relation_type"][start:end]
+        return (
+            start + int(np.searchsorted(types, type_id, side="left")),
+            start + int(np.searchsorted(types, type_id, side="right")),
+        )
+
+    def _in_positions(self, index: int) -> np.ndarray:
+        indptr = self._columns["in_indptr"]
+        return np.asarray(
+            self._columns["in_relations"][int(indptr[index]) : int(indptr[index + 1])]
+        )
+
+    def _neighbor_indices(self, index: int) -> list[int]:
+        start, end = self._out_range(index)
+        successors = self._columns["relation_target"][start:end].tolist()
+        predecessors = self._columns["relation_source"][self._in_positions(index)].tolist()
+        return successors + predecessors
+
+    def _degrees(self) -> np.ndarray:
+        return np.diff(np.asarray(self._columns["out_indptr"])) + np.diff(
+            np.asarray(self._columns["in_indptr"])
+        )
+
+
+def _indptr(keys: np.ndarray, size: int) -> np.ndarray:
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size), out=indptr[1:])
+    return indptr
+
+
+__all__ = [
+    "COLUMNAR_KG_FORMAT",
+    "COLUMNAR_KG_VERSION",
+    "ColumnarKnowledgeGraph",
+    "is_columnar_kg",
+]
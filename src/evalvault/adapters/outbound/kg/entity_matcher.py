@@ -0,0 +1,143 @@
+"""Aho-Corasick multi-pattern matcher for KG entity names.
+
+GraphRAG 검색은 쿼리에 등장하는 KG 엔티티 이름(및 canonical name)을 찾아야
+합니다. 엔티티마다 부분 문자열 검사를 하면 검색당 O(엔티티 수 x 쿼리 길이)가
+들지만, 이 매처는 모든 패턴을 하나의 오토마톤으로 묶어 쿼리 길이에 비례하는
+시간(+ 매칭 수)으로 찾습니다.
+
+엔티티 추가/삭제는 trie와 패턴 소유자 매핑만 갱신하며, 실패 링크는 새 trie
+노드가 생긴 경우에만 다음 매칭 시점에 다시 계산합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterable
+
+_ROOT = 0
+_NO_NODE = -1
+
+
+class EntityNameMatcher:
+    """Map every entity whose patterns occur in a text, via one automaton pass.
+
+    Example:
+        >>> matcher = EntityNameMatcher()
+        >>> matcher.add("암진단특약", ["암진단특약", "암진단"])
+        >>> matcher.match("암진단 보장 금액은?")
+        {'암진단특약'}
+    """
+
+    def __init__(self) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [_ROOT]
+        # 실패 링크 체인에서 가장 가까운 종결 노드 (없으면 _NO_NODE)
+        self._output_link: list[int] = [_NO_NODE]
+        self._terminal: dict[int, str] = {}
+        self._owners: dict[str, set[str]] = {}
+        self._entity_patterns: dict[str, tuple[str, ...]] = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entity_patterns)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entity_patterns
+
+    def add(self, name: str, patterns: Iterable[str]) -> None:
+        """Register (or replace) the patterns that identify an entity."""
+        resolved = tuple(dict.fromkeys(pattern for pattern in patterns if pattern))
+        with self._lock:
+            if self._entity_patterns.get(name) == resolved:
+                return
+            self._discard_locked(name)
+            if not resolved:
+                return
+            self._entity_patterns[name] = resolved
+            for pattern in resolved:
+                self._insert(pattern)
+                self._owners.setdefault(pattern, set()).add(name)
+
+    def discard(self, name: str) -> bool:
+        """Forget an entity. Returns whether it was registered."""
+        with self._lock:
+            return self._discard_locked(name)
+
+    def names(self) -> set[str]:
+        with self._lock:
+            return set(self._entity_patterns)
+
+    def match(self, text: str) -> set[str]:
+        """Return the names of all entities with a pattern occurring in ``text``."""
+        with self._lock:
+            if self._dirty:
+                self._build_links()
+            goto, fail, output_link = self._goto, self._fail, self._output_link
+            terminal, owners = self._terminal, self._owners
+            found: set[str] = set()
+            node = _ROOT
+            for char in text:
+                while node and char not in goto[node]:
+                    node = fail[node]
+                node = goto[node].get(char, _ROOT)
+                hit = node if node in terminal else output_link[node]
+                while hit != _NO_NODE:
+                    found.update(owners.get(terminal[hit], ()))
+                    hit = output_link[hit]
+            return found
+
+    def _discard_locked(self, name: str) -> bool:
+        patterns = self._entity_patterns.pop(name, None)
+        if patterns is None:
+            return False
+        for pattern in patterns:
+            owners = self._owners.get(pattern)
+            if owners is None:
+                continue
+            owners.discard(name)
+            if not owners:
+                # trie 노드는 남겨 두고 소유자만 제거 (매칭 결과에서 제외됨)
+                del self._owners[pattern]
+        return True
+
+    def _insert(self, pattern: str) -> None:
+        node = _ROOT
+        for char in pattern:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._fail.append(_ROOT)
+                self._output_link.append(_NO_NODE)
+                self._dirty = True
+            node = child
+        if node not in self._terminal:
+            self._terminal[node] = pattern
+            self._dirty = True
+
+    def _build_links(self) -> None:
+        queue: deque[int] = deque()
+        for child in self._goto[_ROOT].values():
+            self._fail[child] = _ROOT
+            self._output_link[child] = _NO_NODE
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, _ROOT)
+                self._fail[child] = target if target != child else _ROOT
+                link = self._fail[child]
+                self._output_link[child] = (
+                    link if link in self._terminal else self._output_link[link]
+                )
+                queue.append(child)
+        self._dirty = False
+
+
+__all__ = ["EntityNameMatcher"]
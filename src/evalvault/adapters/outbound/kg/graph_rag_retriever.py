@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from collections import OrderedDict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import Any
 
+from evalvault.adapters.outbound.kg.columnar_graph import ColumnarKnowledgeGraph
+from evalvault.adapters.outbound.kg.entity_matcher import EntityNameMatcher
 from evalvault.adapters.outbound.kg.networkx_adapter import NetworkXKnowledgeGraph
 from evalvault.config.phoenix_support import instrumentation_span, set_span_attributes
 from evalvault.domain.entities.kg import EntityModel, RelationModel
@@ -17,6 +21,11 @@ from evalvault.ports.outbound.korean_nlp_port import RetrieverResultProtocol
 
 logger = logging.getLogger(__name__)
 
+# 동시 검색(여러 질문) x 3개 leg를 감당할 공용 워커 수
+_LEG_WORKERS = 8
+
+_LegResult = tuple[list[str], dict[str, dict[str, Any]]]
+
 
 @dataclass
 class GraphRAGResult(RetrieverResultProtocol):
@@ -33,11 +42,17 @@ class GraphRAGRetriever:
     """LightRAG-inspired retriever.
 
     It fuses KG-derived candidates with BM25/Dense retrieval using RRF.
+
+    With ``concurrent_legs`` (default) the KG, BM25 and dense legs run in a
+    shared thread pool, so search latency approaches that of the slowest leg.
+    ``leg_timeout_seconds`` bounds the wait: legs that miss the budget are
+    dropped from the fusion (reported via ``retriever.graphrag.degraded_legs``)
+    instead of failing the search.
     """
 
     def __init__(
         self,
-        kg: NetworkXKnowledgeGraph,
+        kg: NetworkXKnowledgeGraph | ColumnarKnowledgeGraph,
         *,
         bm25_retriever: Any | None = None,
         dense_retriever: Any | None = None,
@@ -53,10 +68,15 @@ class GraphRAGRetriever:
         cache_size: int = 128,
         documents: list[str] | None = None,
         document_ids: list[str] | None = None,
+        concurrent_legs: bool = True,
+        leg_timeout_seconds: float | None = None,
     ) -> None:
         if hop_limit < 0:
             msg = "hop_limit must be >= 0"
             raise ValueError(msg)
+        if leg_timeout_seconds is not None and leg_timeout_seconds <= 0:
+            msg = "leg_timeout_seconds must be > 0"
+            raise ValueError(msg)
         if documents and document_ids and len(documents) != len(document_ids):
             msg = "documents and document_ids length must match"
             raise ValueError(msg)
@@ -77,10 +97,19 @@ class GraphRAGRetriever:
         self._cache_size = max(cache_size, 0)
         self._document_ids = document_ids
         self._documents_by_id = self._build_document_lookup(documents, document_ids)
-        self._canonical_lookup = self._build_canonical_lookup()
+        self._canonical_lookup: dict[str, str] = {}
+        # 엔티티 이름/canonical name 오토마톤 (update_graph에서 증분 갱신)
+        self._entity_matcher = EntityNameMatcher()
+        self._matched_revision = -1
+        self._sync_entity_matcher()
         self._query_cache: OrderedDict[str, tuple[list[str], dict[str, dict[str, Any]]]] = (
             OrderedDict()
         )
+        self._cache_lock = threading.Lock()
+        self._concurrent_legs = concurrent_legs
+        self._leg_timeout_seconds = leg_timeout_seconds
+        self._leg_executor: ThreadPoolExecutor | None = None
+        self._leg_executor_lock = threading.Lock()
 
     def search(self, query: str, top_k: int = 5) -> list[GraphRAGResult]:
         """Search documents with KG + BM25 + Dense fusion."""
@@ -100,19 +129,10 @@ class GraphRAGRetriever:
 
         with instrumentation_span("retriever.graphrag.search", span_attrs) as span:
             started_at = time.perf_counter()
-            kg_candidates, kg_metadata = self._retrieve_from_kg(query)
-            bm25_candidates, bm25_metadata = self._retrieve_from_chunks(
-                self._bm25_retriever,
-                query,
-                top_k,
-                source="bm25",
-            )
-            dense_candidates, dense_metadata = self._retrieve_from_chunks(
-                self._dense_retriever,
-                query,
-                top_k,
-                source="dense",
-            )
+            leg_results, leg_ms, degraded = self._run_legs(query, top_k)
+            kg_candidates, kg_metadata = leg_results["kg"]
+            bm25_candidates, bm25_metadata = leg_results["bm25"]
+            dense_candidates, dense_metadata = leg_results["dense"]
 
             ranked_lists = {
                 "kg": kg_candidates,
@@ -124,6 +144,14 @@ class GraphRAGRetriever:
                 has_dense=bool(dense_candidates),
             )
             fused_scores = self._rrf_merge(ranked_lists, weights)
+            if span:
+                leg_attrs: dict[str, Any] = {
+                    f"retriever.graphrag.{leg}_ms": round(ms, 3) for leg, ms in leg_ms.items()
+                }
+                leg_attrs["retriever.graphrag.concurrent_legs"] = self._concurrent_legs
+                if degraded:
+                    leg_attrs["retriever.graphrag.degraded_legs"] = ",".join(degraded)
+                set_span_attributes(span, leg_attrs)
             if not fused_scores:
                 return []
 
@@ -157,11 +185,96 @@ class GraphRAGRetriever:
 
             return results
 
-    def update_graph(self, kg: NetworkXKnowledgeGraph) -> dict[str, int]:
-        """Merge a new graph into the retriever's KG."""
+    def close(self) -> None:
+        """Release the leg thread pool (recreated on the next concurrent search)."""
+        with self._leg_executor_lock:
+            executor, self._leg_executor = self._leg_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_legs(
+        self, query: str, top_k: int
+    ) -> tuple[dict[str, _LegResult], dict[str, float], list[str]]:
+        """Run the KG/BM25/dense legs and return (results, per-leg ms, degraded legs)."""
+        legs: dict[str, Callable[[], _LegResult]] = {"kg": lambda: self._retrieve_from_kg(query)}
+        for source, retriever in (("bm25", self._bm25_retriever), ("dense", self._dense_retriever)):
+            if retriever is not None:
+                legs[source] = lambda retriever=retriever, source=source: (
+                    self._retrieve_from_chunks(retriever, query, top_k, source=source)
+                )
+
+        results: dict[str, _LegResult] = {"kg": ([], {}), "bm25": ([], {}), "dense": ([], {})}
+        leg_ms: dict[str, float] = {}
+
+        def timed(leg: str, func: Callable[[], _LegResult]) -> _LegResult:
+            leg_started = time.perf_counter()
+            try:
+                return func()
+            finally:
+                leg_ms[leg] = (time.perf_counter() - leg_started) * 1000
+
+        if not self._concurrent_legs or len(legs) == 1:
+            for leg, func in legs.items():
+                results[leg] = timed(leg, func)
+            return results, leg_ms, []
+
+        executor = self._ensure_leg_executor()
+        futures: dict[str, Future[_LegResult]] = {
+            leg: executor.submit(timed, leg, func) for leg, func in legs.items()
+        }
+        wait(futures.values(), timeout=self._leg_timeout_seconds)
+        degraded: list[str] = []
+        for leg, future in futures.items():
+            if future.done():
+                results[leg] = future.result()
+                continue
+            # 예산을 넘긴 leg는 결과 없이 진행 (스레드는 백그라운드에서 종료)
+            future.cancel()
+            degraded.append(leg)
+            logger.warning(
+                "GraphRAG %s leg exceeded %.3fs budget; continuing without it",
+                leg,
+                self._leg_timeout_seconds,
+            )
+        return results, dict(leg_ms), degraded
 
-        stats = self._kg.merge(kg)
-        self._canonical_lookup = self._build_canonical_lookup()
+    def _ensure_leg_executor(self) -> ThreadPoolExecutor:
+        with self._leg_executor_lock:
+            if self._leg_executor is None:
+                self._leg_executor = ThreadPoolExecutor(
+                    max_workers=_LEG_WORKERS, thread_name_prefix="graphrag-leg"
+                )
+            return self._leg_executor
+
+    def update_graph(self, kg: NetworkXKnowledgeGraph) -> dict[str, int]:
+        """Merge a new graph into the retriever's KG.
+
+        A memory-mapped ``ColumnarKnowledgeGraph`` is read-only, so it is
+        materialized into a ``NetworkXKnowledgeGraph`` before the first merge.
+        """
+
+        stale = self._kg.entity_revision != self._matched_revision
+        target = self._kg
+        if isinstance(target, ColumnarKnowledgeGraph):
+            target = self._kg = target.to_networkx()
+            stale = True
+        stats = target.merge(kg)
+        if stale:
+            self._sync_entity_matcher()
+        else:
+            # 병합된 엔티티만 매처/canonical lookup에 반영
+            merged = [self._kg.get_entity(entity.name) for entity in kg.get_all_entities()]
+            for entity in merged:
+                if (
+                    entity
+                    and entity.canonical_name
+                    and entity.canonical_name not in self._canonical_lookup
+                ):
+                    self._canonical_lookup[entity.canonical_name] = entity.name
+            self._index_entities(
+                (entity.name, entity.canonical_name) for entity in merged if entity
+            )
+            self._matched_revision = self._kg.entity_revision
         self._query_cache.clear()
         return stats
 
@@ -189,10 +302,11 @@ class GraphRAGRetriever:
     def _retrieve_from_kg(self, query: str) -> tuple[list[str], dict[str, dict[str, Any]]]:
         cache_key = self._cache_key(query)
         if self._cache_size > 0:
-            cached = self._query_cache.get(cache_key)
-            if cached:
-                self._query_cache.move_to_end(cache_key)
-                return cached
+            with self._cache_lock:
+                cached = self._query_cache.get(cache_key)
+                if cached:
+                    self._query_cache.move_to_end(cache_key)
+                    return cached
 
         entity_names = self._extract_query_entities(query)
         if not entity_names:
@@ -253,18 +367,28 @@ class GraphRAGRetriever:
             if resolved:
                 matched.add(resolved)
 
-        query_lower = query.lower()
-        for entity in self._kg.get_all_entities():
-            if len(entity.name) < self._min_entity_match_length:
-                continue
-            if entity.name.lower() in query_lower:
-                matched.add(entity.name)
-                continue
-            if entity.canonical_name and entity.canonical_name in query_lower:
-                matched.add(entity.name)
+        if self._kg.entity_revision != self._matched_revision:
+            # update_graph를 거치지 않고 KG가 직접 변경된 경우
+            self._sync_entity_matcher()
+        matched.update(self._entity_matcher.match(query.lower()))
 
         return list(matched)
 
+    def _index_entities(self, keys: Iterable[tuple[str, str | None]]) -> None:
+        for name, canonical_name in keys:
+            if len(name) < self._min_entity_match_length:
+                self._entity_matcher.discard(name)
+                continue
+            self._entity_matcher.add(name, (name.lower(), canonical_name or ""))
+
+    def _sync_entity_matcher(self) -> None:
+        keys = list(self._kg.iter_entity_keys())
+        for name in self._entity_matcher.names() - {name for name, _ in keys}:
+            self._entity_matcher.discard(name)
+        self._index_entities(keys)
+        self._canonical_lookup = self._build_canonical_lookup(keys)
+        self._matched_revision = self._kg.entity_revision
+
     def _resolve_entity_name(self, name: str) -> str | None:
         if self._kg.has_entity(name):
             return name
@@ -452,11 +576,12 @@ class GraphRAGRetriever:
             return {document_ids[idx]: doc for idx, doc in enumerate(documents)}
         return {str(idx): doc for idx, doc in enumerate(documents)}
 
-    def _build_canonical_lookup(self) -> dict[str, str]:
+    @staticmethod
+    def _build_canonical_lookup(keys: Iterable[tuple[str, str | None]]) -> dict[str, str]:
         lookup: dict[str, str] = {}
-        for entity in self._kg.get_all_entities():
-            if entity.canonical_name and entity.canonical_name not in lookup:
-                lookup[entity.canonical_name] = entity.name
+        for name, canonical_name in keys:
+            if canonical_name and canonical_name not in lookup:
+                lookup[canonical_name] = name
         return lookup
 
     @staticmethod
@@ -471,7 +596,8 @@ class GraphRAGRetriever:
     ) -> None:
         if self._cache_size <= 0:
             return
-        self._query_cache[cache_key] = (ranked_doc_ids, metadata)
-        self._query_cache.move_to_end(cache_key)
-        if len(self._query_cache) > self._cache_size:
-            self._query_cache.popitem(last=False)
+        with self._cache_lock:
+            self._query_cache[cache_key] = (ranked_doc_ids, metadata)
+            self._query_cache.move_to_end(cache_key)
+            if len(self._query_cache) > self._cache_size:
+                self._query_cache.popitem(last=False)
@@ -28,12 +28,18 @@ class NetworkXKnowledgeGraph:
         self._graph: nx.MultiDiGraph = nx.MultiDiGraph()
         self._entity_metadata: dict[str, EntityModel] = {}
         self._relation_metadata: dict[tuple[str, str, int], RelationModel] = {}
+        self._entity_revision = 0
 
     @property
     def graph(self) -> nx.MultiDiGraph:
         """Return the underlying NetworkX graph."""
         return self._graph
 
+    @property
+    def entity_revision(self) -> int:
+        """엔티티 추가/갱신/삭제 시마다 증가하는 변경 번호 (파생 인덱스 동기화용)."""
+        return self._entity_revision
+
     # -------------------------------------------------------------------------
     # Entity Operations
     # -------------------------------------------------------------------------
@@ -53,6 +59,7 @@ class NetworkXKnowledgeGraph:
         else:
             self._graph.add_node(entity.name, **attributes)
         self._entity_metadata[entity.name] = entity
+        self._entity_revision += 1
 
     def get_entity(self, name: str) -> EntityModel | None:
         """엔티티 조회.
@@ -90,6 +97,7 @@ class NetworkXKnowledgeGraph:
 
         self._graph.remove_node(name)
         self._entity_metadata.pop(name, None)
+        self._entity_revision += 1
 
         # 관련 관계 메타데이터 정리
         keys_to_remove = [
@@ -108,6 +116,19 @@ class NetworkXKnowledgeGraph:
         """
         return list(self._entity_metadata.values())
 
+    def iter_entity_keys(self) -> Iterator[tuple[str, str | None]]:
+        """(엔티티 이름, canonical name) 순회."""
+        for entity in self._entity_metadata.values():
+            yield entity.name, entity.canonical_name
+
+    def get_source_document_ids(self) -> set[str]:
+        """엔티티 출처 문서 ID 집합."""
+        return {
+            str(entity.source_document_id)
+            for entity in self._entity_metadata.values()
+            if entity.source_document_id
+        }
+
     def get_entities_by_type(self, entity_type: str) -> list[EntityModel]:
         """특정 타입의 엔티티 조회.
 
@@ -610,6 +631,7 @@ class NetworkXKnowledgeGraph:
         self._graph.clear()
         self._entity_metadata.clear()
         self._relation_metadata.clear()
+        self._entity_revision += 1
 
     # -------------------------------------------------------------------------
     # Iterator Support
@@ -4,23 +4,16 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import deque
 from collections.abc import Callable, Iterable, Iterator
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from itertools import islice
 from typing import Any
 
 from evalvault.adapters.outbound.kg.networkx_adapter import NetworkXKnowledgeGraph
 from evalvault.domain.entities.kg import EntityModel, RelationModel
-from evalvault.domain.services.entity_extractor import (
-    Entity as ExtractedEntity,
-)
-from evalvault.domain.services.entity_extractor import (
-    EntityExtractor,
-)
-from evalvault.domain.services.entity_extractor import (
-    Relation as ExtractedRelation,
-)
+from evalvault.domain.services.entity_extractor import EntityExtractor
 
 logger = logging.getLogger(__name__)
 
@@ -64,25 +57,80 @@ class KGBuildResult:
     documents_by_id: dict[str, str] = field(default_factory=dict)
 
 
+# 워커 -> 부모로 전송하는 압축 표현 (dataclass 대신 튜플로 pickle 크기를 줄임)
+# (name, entity_type, confidence, provenance, attributes, doc_id)
+_EntityRow = tuple[str, str, float, str, dict[str, str], str]
+# (source, target, relation_type, confidence, provenance, evidence)
+_RelationRow = tuple[str, str, str, float, str, str | None]
+
+
 @dataclass
-class _ExtractionResult:
-    doc_id: str
-    entities: list[ExtractedEntity]
-    relations: list[ExtractedRelation]
-    document: str | None = None
-
-
-def _extract_document(payload: tuple[str, str, bool]) -> _ExtractionResult:
-    doc_id, document, keep_document = payload
-    extractor = EntityExtractor()
-    entities = extractor.extract_entities(document)
-    relations = extractor.extract_relations(document, entities)
-    stored = document if keep_document else None
-    return _ExtractionResult(
-        doc_id=doc_id,
-        entities=entities,
-        relations=relations,
-        document=stored,
+class _BatchExtraction:
+    documents: int
+    entities_seen: int
+    entities: list[_EntityRow]
+    relations: list[_RelationRow]
+
+
+# 프로세스마다 한 번만 생성하는 추출기 (정규식 컴파일 비용을 문서마다 반복하지 않음)
+_worker_extractor: EntityExtractor | None = None
+
+
+def _init_worker() -> None:
+    global _worker_extractor
+    _worker_extractor = EntityExtractor()
+
+
+def _get_extractor() -> EntityExtractor:
+    if _worker_extractor is None:
+        _init_worker()
+    assert _worker_extractor is not None
+    return _worker_extractor
+
+
+def _extract_batch(batch: list[tuple[str, str]]) -> _BatchExtraction:
+    """배치 단위 추출 + 로컬 중복 제거.
+
+    엔티티는 이름별로 신뢰도가 가장 높은(동률이면 먼저 나온) 항목만,
+    관계는 (source, target, relation_type)별 첫 항목만 남깁니다. 부모 프로세스의
+    병합 규칙과 같으므로 배치 안에서 미리 줄여도 결과 그래프는 동일합니다.
+    """
+    extractor = _get_extractor()
+    entities: dict[str, _EntityRow] = {}
+    relations: dict[tuple[str, str, str], _RelationRow] = {}
+    entities_seen = 0
+    for doc_id, document in batch:
+        extracted = extractor.extract_entities(document)
+        entities_seen += len(extracted)
+        for entity in extracted:
+            existing = entities.get(entity.name)
+            if existing is not None and existing[2] >= entity.confidence:
+                continue
+            entities[entity.name] = (
+                entity.name,
+                entity.entity_type,
+                entity.confidence,
+                entity.provenance,
+                entity.attributes,
+                doc_id,
+            )
+        for relation in extractor.extract_relations(document, extracted):
+            key = (relation.source, relation.target, relation.relation_type)
+            if key in relations:
+                continue
+            relations[key] = (
+                relation.source,
+                relation.target,
+                relation.relation_type,
+                relation.confidence,
+                relation.provenance,
+                relation.evidence,
+            )
+    return _BatchExtraction(
+        documents=len(batch),
+        entities_seen=entities_seen,
+        entities=list(entities.values()),
+        relations=list(relations.values()),
     )
 
 
@@ -123,37 +171,13 @@ class ParallelKGBuilder:
         relation_keys: set[tuple[str, str, str]] = set()
         self._stats = KGBuilderStats()
 
-        if self._workers > 1:
-            with ProcessPoolExecutor(max_workers=self._workers) as executor:
-                for batch in self._iter_batches(documents, document_ids, id_prefix):
-                    payloads = [(doc_id, doc, self._store_documents) for doc_id, doc in batch]
-                    results = executor.map(
-                        _extract_document,
-                        payloads,
-                        chunksize=max(1, len(payloads) // self._workers),
-                    )
-                    self._consume_results(results, graph, documents_by_id, relation_keys)
-                    self._stats.chunks_processed += 1
-                    self._notify_progress()
-        else:
-            extractor = EntityExtractor()
-            for batch in self._iter_batches(documents, document_ids, id_prefix):
-                results = []
-                for doc_id, doc in batch:
-                    entities = extractor.extract_entities(doc)
-                    relations = extractor.extract_relations(doc, entities)
-                    stored = doc if self._store_documents else None
-                    results.append(
-                        _ExtractionResult(
-                            doc_id=doc_id,
-                            entities=entities,
-                            relations=relations,
-                            document=stored,
-                        )
-                    )
-                self._consume_results(results, graph, documents_by_id, relation_keys)
-                self._stats.chunks_processed += 1
-                self._notify_progress()
+        batches = self._iter_batches(documents, document_ids, id_prefix)
+        for batch, extraction in self._iter_extractions(batches):
+            if self._store_documents:
+                documents_by_id.update(batch)
+            self._merge_extraction(extraction, graph, relation_keys)
+            self._stats.chunks_processed += 1
+            self._notify_progress()
 
         return KGBuildResult(
             graph=graph,
@@ -179,40 +203,79 @@ class ParallelKGBuilder:
                 break
             yield batch
 
-    def _consume_results(
+    def _iter_extractions(
+        self, batches: Iterator[list[tuple[str, str]]]
+    ) -> Iterator[tuple[list[tuple[str, str]], _BatchExtraction]]:
+        """배치 추출 결과를 입력 순서대로 스트리밍합니다.
+
+        병렬 모드에서는 최대 ``workers * 2``개 배치만 미리 제출하므로, 부모가
+        앞선 배치를 병합하는 동안 워커는 다음 배치를 계속 처리하고 입력
+        이터러블은 필요한 만큼만 소비됩니다. 순서를 유지해 동률 엔티티의
+        출처 문서가 실행마다 달라지지 않습니다.
+        """
+        if self._workers == 1:
+            for batch in batches:
+                yield batch, _extract_batch(batch)
+            return
+
+        max_in_flight = self._workers * 2
+        with ProcessPoolExecutor(max_workers=self._workers, initializer=_init_worker) as executor:
+            pending: deque[tuple[list[tuple[str, str]], Future[_BatchExtraction]]] = deque()
+            for batch in batches:
+                pending.append((batch, executor.submit(_extract_batch, batch)))
+                if len(pending) >= max_in_flight:
+                    batch, future = pending.popleft()
+                    yield batch, future.result()
+            while pending:
+                batch, future = pending.popleft()
+                yield batch, future.result()
+
+    def _merge_extraction(
         self,
-        results: Iterable[_ExtractionResult],
+        extraction: _BatchExtraction,
         graph: NetworkXKnowledgeGraph,
-        documents_by_id: dict[str, str],
         relation_keys: set[tuple[str, str, str]],
     ) -> None:
-        for result in results:
-            self._stats.documents_processed += 1
-            if result.document and self._store_documents:
-                documents_by_id[result.doc_id] = result.document
-
-            for entity in result.entities:
-                self._stats.entities_processed += 1
-                model = self._to_entity_model(entity, result.doc_id)
-                added = self._upsert_entity(graph, model)
-                if added:
-                    self._stats.entities_added += 1
-
-            for relation in result.relations:
-                try:
-                    model = self._to_relation_model(relation)
-                except ValueError:
-                    continue
-
-                if not graph.has_entity(model.source) or not graph.has_entity(model.target):
-                    continue
-
-                key = (model.source, model.target, model.relation_type)
-                if key in relation_keys:
-                    continue
-                relation_keys.add(key)
-                graph.add_relation(model)
-                self._stats.relations_added += 1
+        self._stats.documents_processed += extraction.documents
+        self._stats.entities_processed += extraction.entities_seen
+
+        for name, entity_type, confidence, provenance, attributes, doc_id in extraction.entities:
+            existing = graph.get_entity(name)
+            if existing and existing.confidence >= confidence:
+                continue
+            graph.add_entity(
+                EntityModel(
+                    name=name,
+                    entity_type=entity_type,
+                    attributes=attributes,
+                    provenance=provenance,
+                    confidence=confidence,
+                    source_document_id=doc_id,
+                )
+            )
+            if existing is None:
+                self._stats.entities_added += 1
+
+        for source, target, relation_type, confidence, provenance, evidence in extraction.relations:
+            key = (source, target, relation_type)
+            if key in relation_keys:
+                continue
+            if not graph.has_entity(source) or not graph.has_entity(target):
+                continue
+            try:
+                model = RelationModel(
+                    source=source,
+                    target=target,
+                    relation_type=relation_type,
+                    provenance=provenance,
+                    confidence=confidence,
+                    attributes={"evidence": evidence} if evidence else {},
+                )
+            except ValueError:
+                continue
+            relation_keys.add(key)
+            graph.add_relation(model)
+            self._stats.relations_added += 1
 
         self._stats.touch()
 
@@ -223,36 +286,5 @@ class ParallelKGBuilder:
             except Exception:  # pragma: no cover - progress hooks are best-effort
                 logger.debug("progress_callback failed", exc_info=True)
 
-    @staticmethod
-    def _to_entity_model(entity: ExtractedEntity, document_id: str) -> EntityModel:
-        return EntityModel(
-            name=entity.name,
-            entity_type=entity.entity_type,
-            attributes=entity.attributes,
-            provenance=entity.provenance,
-            confidence=entity.confidence,
-            source_document_id=document_id,
-        )
-
-    @staticmethod
-    def _to_relation_model(relation: ExtractedRelation) -> RelationModel:
-        attributes = {"evidence": relation.evidence} if relation.evidence else {}
-        return RelationModel(
-            source=relation.source,
-            target=relation.target,
-            relation_type=relation.relation_type,
-            provenance=relation.provenance,
-            confidence=relation.confidence,
-            attributes=attributes,
-        )
-
-    @staticmethod
-    def _upsert_entity(graph: NetworkXKnowledgeGraph, model: EntityModel) -> bool:
-        existing = graph.get_entity(model.name)
-        if existing and existing.confidence >= model.confidence:
-            return False
-        graph.add_entity(model)
-        return existing is None
-
 
 __all__ = ["KGBuildResult", "KGBuilderStats", "ParallelKGBuilder"]
@@ -14,6 +14,10 @@ from evalvault.adapters.outbound.llm.factory import (
     create_llm_adapter_for_model,
 )
 from evalvault.adapters.outbound.llm.llm_relation_augmenter import LLMRelationAugmenter
+from evalvault.domain.services.batch_executor import (
+    configure_provider_concurrency,
+    parse_provider_concurrency,
+)
 from evalvault.ports.outbound.llm_port import LLMPort
 
 if TYPE_CHECKING:
@@ -46,8 +50,15 @@ def __getattr__(name: str) -> Any:
     return value
 
 
+def _apply_provider_concurrency(settings: Settings) -> None:
+    limits = getattr(settings, "llm_provider_concurrency", None)
+    if isinstance(limits, str) and limits.strip():
+        configure_provider_concurrency(parse_provider_concurrency(limits))
+
+
 def get_llm_adapter(settings: Settings) -> LLMPort:
     provider = settings.llm_provider.lower()
+    _apply_provider_concurrency(settings)
 
     if provider == "openai":
         from evalvault.adapters.outbound.llm.openai_adapter import OpenAIAdapter
@@ -2,6 +2,7 @@
 
 from ragas.embeddings.base import BaseRagasEmbeddings, embedding_factory
 
+from evalvault.adapters.outbound.cache.llm_response_cache import get_llm_response_cache
 from evalvault.adapters.outbound.llm.base import BaseLLMAdapter
 from evalvault.adapters.outbound.llm.instructor_factory import create_instructor_llm
 from evalvault.adapters.outbound.llm.token_aware_chat import TokenTrackingAsyncAzureOpenAI
@@ -30,6 +31,7 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
         super().__init__(
             model_name=f"azure/{settings.azure_deployment or 'unset'}",
             retry_policy=settings.azure_retry_policy,
+            response_cache=get_llm_response_cache(settings),
         )
 
         # Validate Azure settings using common helper
@@ -47,6 +49,7 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
         # Create Azure OpenAI client
         self._client = TokenTrackingAsyncAzureOpenAI(
             usage_tracker=self._token_usage,
+            response_cache=self._response_cache,
             azure_endpoint=settings.azure_endpoint,
             api_key=settings.azure_api_key,
             api_version=settings.azure_api_version,
@@ -13,7 +13,8 @@ from typing import Any, ClassVar
 from pydantic import BaseModel, ConfigDict
 from pydantic import Field as PydanticField
 
-from evalvault.ports.outbound.llm_port import LLMPort, ThinkingConfig
+from evalvault.adapters.outbound.cache.llm_response_cache import SQLiteLLMResponseCache
+from evalvault.ports.outbound.llm_port import LLMPort, ThinkingConfig, record_scoped_usage
 
 logger = logging.getLogger(__name__)
 
@@ -186,11 +187,16 @@ class TokenUsage:
     _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     def add(self, prompt: int, completion: int, total: int | None = None) -> None:
-        """Add token counts (thread-safe)."""
+        """Add token counts (thread-safe).
+
+        Usage is also attributed to the active per-test-case scope
+        (see :func:`evalvault.ports.outbound.llm_port.token_usage_scope`).
+        """
         with self._lock:
             self.prompt_tokens += prompt
             self.completion_tokens += completion
             self.total_tokens += total if total is not None else prompt + completion
+        record_scoped_usage(prompt, completion, total)
 
     def reset(self) -> None:
         """Reset all counters."""
@@ -216,6 +222,7 @@ class BaseLLMAdapter(LLMPort):
     - Token usage tracking
     - Ragas LLM/Embeddings management
     - Thinking/reasoning configuration
+    - Optional persistent LLM response cache
     - Settings validation helpers
     """
 
@@ -232,6 +239,7 @@ class BaseLLMAdapter(LLMPort):
         model_name: str,
         thinking_config: ThinkingConfig | None = None,
         retry_policy: RetryPolicy | None = None,
+        response_cache: SQLiteLLMResponseCache | None = None,
     ):
         self._model_name = model_name
         self._ragas_llm: Any | None = None
@@ -239,6 +247,7 @@ class BaseLLMAdapter(LLMPort):
         self._token_usage = TokenUsage()
         self._thinking_config = thinking_config or ThinkingConfig(enabled=False)
         self._retry_policy = retry_policy or self.default_retry_policy
+        self._response_cache = response_cache
 
     # -- Retry helpers ----------------------------------------------------------
     def get_retry_policy(self) -> RetryPolicy:
@@ -321,6 +330,10 @@ class BaseLLMAdapter(LLMPort):
     def get_thinking_config(self) -> ThinkingConfig:
         return self._thinking_config
 
+    def get_response_cache(self) -> SQLiteLLMResponseCache | None:
+        """Return the persistent response cache, or None when caching is off."""
+        return self._response_cache
+
     def get_token_usage(self) -> tuple[int, int, int]:
         return (
             self._token_usage.prompt_tokens,
@@ -15,6 +15,7 @@ import instructor
 from openai import AsyncOpenAI
 from ragas.embeddings import OpenAIEmbeddings as RagasOpenAIEmbeddings
 
+from evalvault.adapters.outbound.cache.llm_response_cache import get_llm_response_cache
 from evalvault.adapters.outbound.llm.base import BaseLLMAdapter
 from evalvault.adapters.outbound.llm.instructor_factory import create_instructor_llm
 from evalvault.adapters.outbound.llm.token_aware_chat import ThinkingTokenTrackingAsyncOpenAI
@@ -63,6 +64,7 @@ class OllamaAdapter(BaseLLMAdapter):
             model_name=f"ollama/{self._ollama_model}",
             thinking_config=thinking_config,
             retry_policy=settings.ollama_retry_policy,
+            response_cache=get_llm_response_cache(settings),
         )
 
         chat_kwargs: dict[str, Any] = {
@@ -74,6 +76,8 @@ class OllamaAdapter(BaseLLMAdapter):
             usage_tracker=self._token_usage,
             think_level=self._think_level,
             provider_name="ollama",
+            response_cache=self._response_cache,
+            thinking_config=self._thinking_config,
             **chat_kwargs,
         )
 
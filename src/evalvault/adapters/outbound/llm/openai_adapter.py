@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from evalvault.adapters.outbound.cache.llm_response_cache import get_llm_response_cache
 from evalvault.adapters.outbound.llm.base import (
     BaseLLMAdapter,
     create_openai_embeddings_with_legacy,
@@ -42,6 +43,7 @@ class OpenAIAdapter(BaseLLMAdapter):
         super().__init__(
             model_name=settings.openai_model,
             retry_policy=settings.openai_retry_policy,
+            response_cache=get_llm_response_cache(settings),
         )
         self._embedding_model_name = settings.openai_embedding_model
 
@@ -54,6 +56,8 @@ class OpenAIAdapter(BaseLLMAdapter):
         # Create token-tracking async OpenAI client
         self._client = TokenTrackingAsyncOpenAI(
             usage_tracker=self._token_usage,
+            response_cache=self._response_cache,
+            thinking_config=self._thinking_config,
             **client_kwargs,
         )
 
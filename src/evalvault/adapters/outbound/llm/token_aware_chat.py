@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from typing import Any
 
 from instructor.function_calls import extract_json_from_codeblock
 from openai import AsyncAzureOpenAI, AsyncOpenAI
+from openai.types.chat import ChatCompletion
 
+from evalvault.adapters.outbound.cache.llm_response_cache import (
+    SQLiteLLMResponseCache,
+    make_llm_cache_key,
+)
 from evalvault.adapters.outbound.llm.base import TokenUsage
 from evalvault.config.phoenix_support import instrumentation_span, set_span_attributes
+from evalvault.ports.outbound.llm_port import ThinkingConfig
 
 
 def _min_completion_tokens_for_model(model: str | None) -> int:
@@ -50,6 +57,78 @@ def _record_usage_attributes(span: Any, prompt: int, completion: int) -> None:
     )
 
 
+def _completion_cache_key(
+    cache: SQLiteLLMResponseCache | None,
+    provider: str,
+    kwargs: dict[str, Any],
+    thinking_config: ThinkingConfig | None,
+) -> str | None:
+    """Return the response-cache key for a request, or None when caching is off."""
+
+    if cache is None or kwargs.get("stream"):
+        return None
+    try:
+        return make_llm_cache_key(provider, kwargs, thinking_config)
+    except TypeError:
+        # Arguments that cannot be hashed deterministically bypass the cache.
+        return None
+
+
+async def _load_cached_completion(
+    cache: SQLiteLLMResponseCache | None,
+    cache_key: str | None,
+    span: Any,
+) -> ChatCompletion | None:
+    """Rehydrate a cached chat completion, dropping entries that no longer validate.
+
+    SQLite access runs in a worker thread so concurrent judge calls do not
+    block the event loop on disk I/O.
+    """
+
+    if cache is None or cache_key is None or not cache.readable:
+        return None
+    payload = await asyncio.to_thread(cache.get, cache_key)
+    if payload is None:
+        set_span_attributes(span, {"llm.cache.hit": False})
+        return None
+    try:
+        response = ChatCompletion.model_validate(payload)
+    except Exception:
+        await asyncio.to_thread(cache.delete, cache_key)
+        return None
+    set_span_attributes(span, {"llm.cache.hit": True})
+    return response
+
+
+async def _store_cached_completion(
+    cache: SQLiteLLMResponseCache | None,
+    cache_key: str | None,
+    provider: str,
+    kwargs: dict[str, Any],
+    response: Any,
+) -> None:
+    """Persist a raw chat completion (before any in-place normalization)."""
+
+    if cache is None or cache_key is None or not cache.writable:
+        return
+    dump = getattr(response, "model_dump", None)
+    if not callable(dump):
+        return
+    try:
+        payload = dump(mode="json")
+    except Exception:
+        return
+    if not isinstance(payload, dict):
+        return
+    await asyncio.to_thread(
+        cache.set,
+        cache_key,
+        payload,
+        provider=provider,
+        model=str(kwargs.get("model") or ""),
+    )
+
+
 def _first_tool_name(tools: Any) -> str | None:
     if not isinstance(tools, list) or not tools:
         return None
@@ -103,19 +182,27 @@ def _normalize_tool_calls(response: Any, tools: Any | None = None) -> None:
 
 
 class TokenTrackingAsyncOpenAI(AsyncOpenAI):
-    """AsyncOpenAI wrapper that tracks token usage from responses."""
+    """AsyncOpenAI wrapper that tracks token usage from responses.
+
+    When ``response_cache`` is given, identical requests are served from the
+    persistent LLM response cache (cache hits record no token usage).
+    """
 
     def __init__(
         self,
         usage_tracker: TokenUsage,
         *,
         provider_name: str = "openai",
+        response_cache: SQLiteLLMResponseCache | None = None,
+        thinking_config: ThinkingConfig | None = None,
         **kwargs: Any,
     ):
         super().__init__(**kwargs)
         self._usage_tracker = usage_tracker
         self._original_chat = self.chat
         self._provider_name = provider_name
+        self._response_cache = response_cache
+        self._thinking_config = thinking_config
 
         # Wrap chat.completions.create to capture usage
         self.chat = self._create_tracking_chat()
@@ -124,6 +211,8 @@ class TokenTrackingAsyncOpenAI(AsyncOpenAI):
         """Create a chat wrapper that tracks token usage."""
 
         provider_name = self._provider_name
+        response_cache = self._response_cache
+        thinking_config = self._thinking_config
 
         class TrackingCompletions:
             def __init__(inner_self, completions: Any, tracker: TokenUsage):  # noqa: N805
@@ -149,6 +238,14 @@ class TokenTrackingAsyncOpenAI(AsyncOpenAI):
 
                 span_attrs = _build_llm_span_attrs(provider_name, kwargs)
                 with instrumentation_span("llm.chat_completion", span_attrs) as span:
+                    cache_key = _completion_cache_key(
+                        response_cache, provider_name, kwargs, thinking_config
+                    )
+                    cached = await _load_cached_completion(response_cache, cache_key, span)
+                    if cached is not None:
+                        if provider_name == "ollama":
+                            _normalize_tool_calls(cached, kwargs.get("tools"))
+                        return cached
                     try:
                         response = await inner_self._completions.create(**kwargs)
                     except TypeError as exc:
@@ -159,6 +256,9 @@ class TokenTrackingAsyncOpenAI(AsyncOpenAI):
                             response = await inner_self._completions.create(**fallback_kwargs)
                         else:
                             raise
+                    await _store_cached_completion(
+                        response_cache, cache_key, provider_name, kwargs, response
+                    )
                     if provider_name == "ollama":
                         _normalize_tool_calls(response, kwargs.get("tools"))
                     # Extract usage from response
@@ -190,15 +290,25 @@ class ThinkingTokenTrackingAsyncOpenAI(TokenTrackingAsyncOpenAI):
         usage_tracker: TokenUsage,
         think_level: str | None = None,
         provider_name: str = "openai",
+        response_cache: SQLiteLLMResponseCache | None = None,
+        thinking_config: ThinkingConfig | None = None,
         **kwargs: Any,
     ):
         self._think_level = think_level
-        super().__init__(usage_tracker=usage_tracker, provider_name=provider_name, **kwargs)
+        super().__init__(
+            usage_tracker=usage_tracker,
+            provider_name=provider_name,
+            response_cache=response_cache,
+            thinking_config=thinking_config,
+            **kwargs,
+        )
 
     def _create_tracking_chat(self) -> Any:
         """Create a chat wrapper that tracks token usage and injects thinking params."""
         think_level = self._think_level
         provider_name = self._provider_name
+        response_cache = self._response_cache
+        thinking_config = self._thinking_config
 
         class ThinkingTrackingCompletions:
             def __init__(inner_self, completions: Any, tracker: TokenUsage):  # noqa: N805
@@ -232,6 +342,14 @@ class ThinkingTokenTrackingAsyncOpenAI(TokenTrackingAsyncOpenAI):
 
                 span_attrs = _build_llm_span_attrs(provider_name, kwargs)
                 with instrumentation_span("llm.chat_completion", span_attrs) as span:
+                    cache_key = _completion_cache_key(
+                        response_cache, provider_name, kwargs, thinking_config
+                    )
+                    cached = await _load_cached_completion(response_cache, cache_key, span)
+                    if cached is not None:
+                        if provider_name == "ollama":
+                            _normalize_tool_calls(cached, kwargs.get("tools"))
+                        return cached
                     try:
                         response = await inner_self._completions.create(**kwargs)
                     except TypeError as exc:
@@ -242,6 +360,9 @@ class ThinkingTokenTrackingAsyncOpenAI(TokenTrackingAsyncOpenAI):
                             response = await inner_self._completions.create(**fallback_kwargs)
                         else:
                             raise
+                    await _store_cached_completion(
+                        response_cache, cache_key, provider_name, kwargs, response
+                    )
                     if provider_name == "ollama":
                         _normalize_tool_calls(response, kwargs.get("tools"))
 
@@ -268,15 +389,23 @@ class ThinkingTokenTrackingAsyncOpenAI(TokenTrackingAsyncOpenAI):
 class TokenTrackingAsyncAzureOpenAI(AsyncAzureOpenAI):
     """Azure OpenAI client with token tracking."""
 
-    def __init__(self, usage_tracker: TokenUsage, **kwargs: Any):
+    def __init__(
+        self,
+        usage_tracker: TokenUsage,
+        *,
+        response_cache: SQLiteLLMResponseCache | None = None,
+        **kwargs: Any,
+    ):
         super().__init__(**kwargs)
         self._usage_tracker = usage_tracker
         self._original_chat = self.chat
         self._provider_name = "azure-openai"
+        self._response_cache = response_cache
         self.chat = self._create_tracking_chat()
 
     def _create_tracking_chat(self) -> Any:
         """Create a chat wrapper that tracks token usage."""
+        response_cache = self._response_cache
 
         class TrackingCompletions:
             def __init__(inner_self, completions: Any, tracker: TokenUsage):  # noqa: N805
@@ -286,7 +415,14 @@ class TokenTrackingAsyncAzureOpenAI(AsyncAzureOpenAI):
             async def create(inner_self, **kwargs: Any) -> Any:  # noqa: N805
                 span_attrs = _build_llm_span_attrs("azure-openai", kwargs)
                 with instrumentation_span("llm.chat_completion", span_attrs) as span:
+                    cache_key = _completion_cache_key(response_cache, "azure-openai", kwargs, None)
+                    cached = await _load_cached_completion(response_cache, cache_key, span)
+                    if cached is not None:
+                        return cached
                     response = await inner_self._completions.create(**kwargs)
+                    await _store_cached_completion(
+                        response_cache, cache_key, "azure-openai", kwargs, response
+                    )
                     if hasattr(response, "usage") and response.usage:
                         prompt_tokens = response.usage.prompt_tokens or 0
                         completion_tokens = response.usage.completion_tokens or 0
@@ -4,6 +4,7 @@ from typing import Any
 
 from openai import AsyncOpenAI, OpenAI
 
+from evalvault.adapters.outbound.cache.llm_response_cache import get_llm_response_cache
 from evalvault.adapters.outbound.llm.base import (
     BaseLLMAdapter,
     create_openai_embeddings_with_legacy,
@@ -25,6 +26,7 @@ class VLLMAdapter(BaseLLMAdapter):
         super().__init__(
             model_name=settings.vllm_model,
             retry_policy=settings.vllm_retry_policy,
+            response_cache=get_llm_response_cache(settings),
         )
         self._embedding_model_name = settings.vllm_embedding_model
 
@@ -40,6 +42,8 @@ class VLLMAdapter(BaseLLMAdapter):
         self._client = TokenTrackingAsyncOpenAI(
             usage_tracker=self._token_usage,
             provider_name="vllm",
+            response_cache=self._response_cache,
+            thinking_config=self._thinking_config,
             **client_kwargs,
         )
 
@@ -6,6 +6,7 @@ Kiwi 형태소 분석기를 기반으로 토큰화, 키워드 추출, 검색 등
 Modules:
     kiwi_tokenizer: Kiwi 기반 토크나이저
     korean_stopwords: 한국어 불용어 사전
+    bm25_index: 증분 역색인 BM25 엔진
     bm25_retriever: BM25 기반 검색기
     document_chunker: 문서 청킹
     hybrid_retriever: 하이브리드 검색 (BM25 + Dense)
@@ -13,6 +14,7 @@ Modules:
     korean_evaluation: 한국어 RAG 평가 유틸리티
 """
 
+from evalvault.adapters.outbound.nlp.korean.bm25_index import BM25InvertedIndex
 from evalvault.adapters.outbound.nlp.korean.bm25_retriever import (
     KoreanBM25Retriever,
     RetrievalResult,
@@ -55,6 +57,7 @@ __all__ = [
     "STOPWORD_POS_TAGS",
     "is_stopword",
     # BM25 Retriever
+    "BM25InvertedIndex",
     "KoreanBM25Retriever",
     "RetrievalResult",
     # Document Chunker
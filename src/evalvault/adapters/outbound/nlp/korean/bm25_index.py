@@ -0,0 +1,273 @@
+"""Incremental inverted-index BM25 engine.
+
+``rank_bm25.BM25Okapi``와 동일한 점수를 계산하는 역색인 기반 BM25 엔진입니다.
+``BM25Okapi``는 문서가 추가될 때마다 전체 코퍼스로 다시 생성해야 하지만,
+이 엔진은 어휘(vocabulary), 용어별 posting 배열, 문서 길이 통계를 유지하므로
+
+- 문서 추가는 새 문서의 토큰 수에 비례하는 비용만 들고,
+- 문서 삭제는 tombstone 표시와 통계 갱신만 수행하며,
+- tombstone이 쌓이면 ``compact()``로 posting을 재작성해 공간을 회수합니다.
+
+IDF/평균 문서 길이는 살아 있는 문서만으로 계산되므로, 삭제 후 점수는
+남은 문서로 ``BM25Okapi``를 새로 만든 것과 같습니다.
+
+검색 시에는 posting으로부터 용어 x 문서 BM25 가중치 CSR 행렬을 한 번 만들어
+두고(변경 시 무효화), 쿼리 점수를 희소 행 합(쿼리 용어 빈도 벡터 x 가중치
+행렬)으로 계산합니다. 여러 쿼리는 한 번의 희소 행렬 곱으로 처리됩니다.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+from scipy import sparse
+
+_INDEX_TYPECODE = "q"
+
+
+class BM25InvertedIndex:
+    """Okapi BM25 역색인 (append / tombstone delete / compaction 지원).
+
+    문서 ID는 추가된 순서의 슬롯 번호이며 ``compact()`` 전까지 유지됩니다.
+    삭제된 슬롯은 점수 계산에서 ``-inf``로 표시됩니다.
+
+    Example:
+        >>> index = BM25InvertedIndex()
+        >>> index.add([["보험료", "납입"], ["보장", "금액"]])
+        range(0, 2)
+        >>> scores = index.get_scores(["보험료"])
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, epsilon: float = 0.25) -> None:
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self._vocab: dict[str, int] = {}
+        self._doc_freq = array(_INDEX_TYPECODE)
+        self._posting_docs: list[array] = []
+        self._posting_freqs: list[array] = []
+        self._doc_terms: list[tuple[int, ...]] = []
+        self._doc_len = array(_INDEX_TYPECODE)
+        self._alive = bytearray()
+        self._live_count = 0
+        self._total_len = 0
+        self._weight_matrix: sparse.csr_matrix | None = None
+
+    @property
+    def slot_count(self) -> int:
+        """삭제된 문서를 포함한 슬롯 수."""
+        return len(self._doc_len)
+
+    @property
+    def live_count(self) -> int:
+        """삭제되지 않은 문서 수."""
+        return self._live_count
+
+    @property
+    def deleted_count(self) -> int:
+        """compact 대기 중인 tombstone 수."""
+        return self.slot_count - self._live_count
+
+    @property
+    def vocabulary_size(self) -> int:
+        """살아 있는 문서에 한 번 이상 등장한 용어 수."""
+        return sum(1 for df in self._doc_freq if df > 0)
+
+    @property
+    def avgdl(self) -> float:
+        """살아 있는 문서의 평균 토큰 수."""
+        return self._total_len / self._live_count if self._live_count else 0.0
+
+    def is_alive(self, doc_id: int) -> bool:
+        return 0 <= doc_id < self.slot_count and bool(self._alive[doc_id])
+
+    def add(self, tokenized_docs: Iterable[Sequence[str]]) -> range:
+        """토큰화된 문서를 추가하고 새 슬롯 범위를 반환합니다."""
+        start = self.slot_count
+        for tokens in tokenized_docs:
+            doc_id = self.slot_count
+            counts = Counter(tokens)
+            term_ids = []
+            for token, freq in counts.items():
+                term_id = self._vocab.get(token)
+                if term_id is None:
+                    term_id = len(self._vocab)
+                    self._vocab[token] = term_id
+                    self._doc_freq.append(0)
+                    self._posting_docs.append(array(_INDEX_TYPECODE))
+                    self._posting_freqs.append(array(_INDEX_TYPECODE))
+                self._doc_freq[term_id] += 1
+                self._posting_docs[term_id].append(doc_id)
+                self._posting_freqs[term_id].append(freq)
+                term_ids.append(term_id)
+            self._doc_terms.append(tuple(term_ids))
+            self._doc_len.append(len(tokens))
+            self._alive.append(1)
+            self._live_count += 1
+            self._total_len += len(tokens)
+        self._invalidate()
+        return range(start, self.slot_count)
+
+    def delete(self, doc_ids: Iterable[int]) -> int:
+        """문서를 tombstone 처리하고 실제로 삭제된 수를 반환합니다."""
+        deleted = 0
+        for doc_id in doc_ids:
+            if not self.is_alive(doc_id):
+                continue
+            self._alive[doc_id] = 0
+            for term_id in self._doc_terms[doc_id]:
+                self._doc_freq[term_id] -= 1
+            self._live_count -= 1
+            self._total_len -= self._doc_len[doc_id]
+            deleted += 1
+        if deleted:
+            self._invalidate()
+        return deleted
+
+    def compact(self) -> list[int]:
+        """tombstone을 제거하고 슬롯을 재번호화합니다.
+
+        Returns:
+            살아남은 문서들의 이전 슬롯 번호 (새 슬롯 순서).
+        """
+        survivors = [doc_id for doc_id in range(self.slot_count) if self._alive[doc_id]]
+        if len(survivors) == self.slot_count:
+            return survivors
+        remap = np.full(self.slot_count, -1, dtype=np.int64)
+        remap[survivors] = np.arange(len(survivors), dtype=np.int64)
+        alive = np.frombuffer(bytes(self._alive), dtype=np.uint8).astype(bool)
+
+        old_vocab = sorted(self._vocab.items(), key=lambda item: item[1])
+        old_docs, old_freqs = self._posting_docs, self._posting_freqs
+        term_remap: dict[int, int] = {}
+        self._vocab = {}
+        self._doc_freq = array(_INDEX_TYPECODE)
+        self._posting_docs = []
+        self._posting_freqs = []
+        for token, old_id in old_vocab:
+            docs = np.frombuffer(old_docs[old_id], dtype=np.int64)
+            keep = alive[docs]
+            if not keep.any():
+                continue
+            term_remap[old_id] = len(self._vocab)
+            self._vocab[token] = len(self._vocab)
+            self._doc_freq.append(int(keep.sum()))
+            self._posting_docs.append(array(_INDEX_TYPECODE, remap[docs[keep]].tobytes()))
+            freqs = np.frombuffer(old_freqs[old_id], dtype=np.int64)
+            self._posting_freqs.append(array(_INDEX_TYPECODE, freqs[keep].tobytes()))
+
+        self._doc_terms = [
+            tuple(term_remap[term_id] for term_id in self._doc_terms[doc_id])
+            for doc_id in survivors
+        ]
+        self._doc_len = array(_INDEX_TYPECODE, (self._doc_len[doc_id] for doc_id in survivors))
+        self._alive = bytearray(b"\x01" * len(survivors))
+        self._invalidate()
+        return survivors
+
+    def get_scores(self, query_tokens: Sequence[str]) -> np.ndarray:
+        """모든 슬롯의 BM25 점수 (삭제된 슬롯은 ``-inf``)."""
+        return self.get_scores_batch([query_tokens])[0]
+
+    def get_scores_batch(self, queries: Sequence[Sequence[str]]) -> np.ndarray:
+        """여러 쿼리의 점수를 한 번의 희소 행렬 곱으로 계산합니다.
+
+        Returns:
+            ``(len(queries), slot_count)`` 점수 행렬 (삭제된 슬롯은 ``-inf``)
+        """
+        scores = np.zeros((len(queries), self.slot_count))
+        if not self._live_count:
+            scores[:] = -np.inf
+            return scores
+        query_matrix = self._query_matrix(queries)
+        if query_matrix.nnz:
+            scores += (query_matrix @ self._weights()).toarray()
+        if self.deleted_count:
+            scores[:, self._dead_mask()] = -np.inf
+        return scores
+
+    def _query_matrix(self, queries: Sequence[Sequence[str]]) -> sparse.csr_matrix:
+        rows: list[int] = []
+        cols: list[int] = []
+        for row, tokens in enumerate(queries):
+            for token in tokens:
+                term_id = self._vocab.get(token)
+                if term_id is not None:
+                    rows.append(row)
+                    cols.append(term_id)
+        # 중복 쿼리 토큰은 BM25Okapi처럼 가중치가 누적되도록 합산
+        return sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(queries), len(self._vocab))
+        )
+
+    def _weights(self) -> sparse.csr_matrix:
+        """용어 x 문서 BM25 가중치 CSR 행렬 (살아 있는 문서만)."""
+        if self._weight_matrix is None:
+            idf, length_norm = self._statistics()
+            lengths = np.fromiter(
+                (len(postings) for postings in self._posting_docs),
+                dtype=np.int64,
+                count=len(self._posting_docs),
+            )
+            if lengths.sum():
+                terms = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+                docs = np.concatenate(
+                    [np.frombuffer(p, dtype=np.int64) for p in self._posting_docs]
+                )
+                freqs = np.concatenate(
+                    [np.frombuffer(p, dtype=np.int64) for p in self._posting_freqs]
+                ).astype(np.float64)
+            else:
+                terms = docs = np.zeros(0, dtype=np.int64)
+                freqs = np.zeros(0)
+            if self.deleted_count:
+                keep = ~self._dead_mask()[docs]
+                terms, docs, freqs = terms[keep], docs[keep], freqs[keep]
+            weights = idf[terms] * (freqs * (self.k1 + 1) / (freqs + self.k1 * length_norm[docs]))
+            self._weight_matrix = sparse.csr_matrix(
+                (weights, (terms, docs)), shape=(len(self._vocab), self.slot_count)
+            )
+        return self._weight_matrix
+
+    def _statistics(self) -> tuple[np.ndarray, np.ndarray]:
+        doc_freq = np.frombuffer(self._doc_freq, dtype=np.int64).astype(np.float64)
+        present = doc_freq > 0
+        n = self._live_count
+        idf = np.zeros(len(doc_freq))
+        idf[present] = [math.log(n - df + 0.5) - math.log(df + 0.5) for df in doc_freq[present]]
+        if present.any():
+            # BM25Okapi와 동일: 음수 IDF는 평균 IDF의 epsilon 배로 대체
+            eps = self.epsilon * (math.fsum(idf[present]) / int(present.sum()))
+            idf[present & (idf < 0)] = eps
+        doc_len = np.frombuffer(self._doc_len, dtype=np.int64).astype(np.float64)
+        return idf, 1 - self.b + self.b * doc_len / self.avgdl
+
+    def _dead_mask(self) -> np.ndarray:
+        return np.frombuffer(bytes(self._alive), dtype=np.uint8) == 0
+
+    def _invalidate(self) -> None:
+        self._weight_matrix = None
+
+
+def top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """점수 상위 ``top_k`` 인덱스를 내림차순으로 반환합니다.
+
+    전체 정렬 대신 ``argpartition``으로 후보를 고른 뒤 후보만 정렬합니다.
+    동점은 인덱스 오름차순으로 정렬하며, ``-inf`` 점수는 제외합니다.
+    """
+    count = min(top_k, int(np.count_nonzero(scores > -np.inf)))
+    if count <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if count < len(scores):
+        candidates = np.argpartition(-scores, count - 1)[:count]
+    else:
+        candidates = np.arange(len(scores))
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
+
+
+__all__ = ["BM25InvertedIndex", "top_k_indices"]
@@ -18,6 +18,9 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from evalvault.adapters.outbound.nlp.korean.bm25_index import BM25InvertedIndex, top_k_indices
 from evalvault.config.phoenix_support import instrumentation_span, set_span_attributes
 
 if TYPE_CHECKING:
@@ -48,12 +51,15 @@ class KoreanBM25Retriever:
     """한국어 형태소 분석 기반 BM25 검색기.
 
     Kiwi 형태소 분석기를 사용하여 조사/어미를 제거한 후
-    BM25 알고리즘으로 검색합니다.
+    BM25 알고리즘으로 검색합니다. 역색인(BM25InvertedIndex)을 사용하므로
+    문서 추가는 새 문서만 토큰화하고, 삭제는 tombstone으로 처리한 뒤
+    tombstone 비율이 ``compact_ratio``를 넘으면 자동으로 compaction합니다.
 
     Attributes:
         tokenizer: KiwiTokenizer 인스턴스
         k1: BM25 k1 파라미터 (기본: 1.5)
         b: BM25 b 파라미터 (기본: 0.75)
+        compact_ratio: 자동 compaction 임계 tombstone 비율 (기본: 0.3)
 
     Example:
         >>> retriever = KoreanBM25Retriever(tokenizer)
@@ -66,6 +72,7 @@ class KoreanBM25Retriever:
         tokenizer: KiwiTokenizer,
         k1: float = 1.5,
         b: float = 0.75,
+        compact_ratio: float = 0.3,
     ) -> None:
         """KoreanBM25Retriever 초기화.
 
@@ -73,11 +80,13 @@ class KoreanBM25Retriever:
             tokenizer: 한국어 토크나이저
             k1: BM25 k1 파라미터 (term frequency 포화)
             b: BM25 b 파라미터 (문서 길이 정규화)
+            compact_ratio: 삭제 후 자동 compaction을 수행할 tombstone 비율
         """
         self._tokenizer = tokenizer
         self._k1 = k1
         self._b = b
-        self._bm25 = None
+        self._compact_ratio = compact_ratio
+        self._bm25: BM25InvertedIndex | None = None
         self._documents: list[str] = []
         self._tokenized_docs: list[list[str]] = []
 
@@ -88,8 +97,10 @@ class KoreanBM25Retriever:
 
     @property
     def document_count(self) -> int:
-        """인덱싱된 문서 수."""
-        return len(self._documents)
+        """인덱싱된 문서 수 (삭제된 문서 제외)."""
+        if self._bm25 is None:
+            return len(self._documents)
+        return self._bm25.live_count
 
     def index(self, documents: list[str]) -> int:
         """문서를 인덱싱합니다.
@@ -101,41 +112,17 @@ class KoreanBM25Retriever:
 
         Returns:
             인덱싱된 문서 수
-
-        Raises:
-            ImportError: rank-bm25가 설치되지 않은 경우
         """
         span_attrs = {"retriever.documents": len(documents), "retriever.type": "bm25"}
         with instrumentation_span("retriever.bm25.index", span_attrs) as span:
-            try:
-                from rank_bm25 import BM25Okapi
-            except ImportError as e:
-                raise ImportError(
-                    "rank-bm25가 설치되지 않았습니다. "
-                    "'uv add rank-bm25' 또는 'pip install rank-bm25'로 설치하세요."
-                ) from e
-
             if not documents:
                 logger.warning("빈 문서 리스트로 인덱싱 시도")
                 return 0
 
-            self._documents = documents
-            tokenized_docs: list[list[str]] = []
-            for doc in documents:
-                tokens = self._tokenizer.tokenize(doc)
-                if not tokens:
-                    tokens = self._fallback_tokenize(doc)
-                tokenized_docs.append(tokens)
-            self._tokenized_docs = tokenized_docs
-
-            # 빈 토큰 리스트 처리
-            self._tokenized_docs = [tokens if tokens else [""] for tokens in self._tokenized_docs]
-
-            self._bm25 = BM25Okapi(
-                self._tokenized_docs,
-                k1=self._k1,
-                b=self._b,
-            )
+            self._bm25 = BM25InvertedIndex(k1=self._k1, b=self._b)
+            self._documents = []
+            self._tokenized_docs = []
+            self._append(documents)
 
             if span:
                 set_span_attributes(
@@ -146,6 +133,18 @@ class KoreanBM25Retriever:
             logger.info(f"BM25 인덱스 구축 완료: {len(documents)}개 문서")
             return len(documents)
 
+    def _append(self, documents: list[str]) -> None:
+        tokenized_docs: list[list[str]] = []
+        for doc, tokens in zip(documents, self._tokenize_many(documents), strict=True):
+            if not tokens:
+                tokens = self._fallback_tokenize(doc)
+            # 빈 토큰 리스트 처리
+            tokenized_docs.append(tokens if tokens else [""])
+        assert self._bm25 is not None
+        self._bm25.add(tokenized_docs)
+        self._documents.extend(documents)
+        self._tokenized_docs.extend(tokenized_docs)
+
     def search(
         self,
         query: str,
@@ -174,38 +173,97 @@ class KoreanBM25Retriever:
             raise ValueError("인덱스가 구축되지 않았습니다. index()를 먼저 호출하세요.")
 
         with instrumentation_span("retriever.bm25.search", span_attrs) as span:
-            # 쿼리 토큰화
-            query_tokens = self._tokenizer.tokenize(query)
-            if not query_tokens:
-                query_tokens = self._fallback_tokenize(query)
+            query_tokens = self._tokenize_query(query)
             if not query_tokens:
-                logger.warning(f"쿼리에서 토큰을 추출할 수 없음: {query}")
                 return []
 
-            # BM25 점수 계산
+            # BM25 점수 계산 (CSR 가중치 행렬의 희소 행 합)
             scores = self._bm25.get_scores(query_tokens)
+            results = self._top_results(scores, top_k, include_tokens)
 
-            # 상위 k개 인덱스
-            top_indices = scores.argsort()[::-1][:top_k]
+            if span:
+                set_span_attributes(span, {"retriever.result_count": len(results)})
 
-            results = []
-            for idx in top_indices:
-                idx = int(idx)
-                score = float(scores[idx])
+            return results
 
-                result = RetrievalResult(
-                    document=self._documents[idx],
-                    score=score,
-                    doc_id=idx,
-                    tokens=self._tokenized_docs[idx] if include_tokens else None,
-                )
-                results.append(result)
+    def search_batch(
+        self,
+        queries: list[str],
+        top_k: int = 5,
+        include_tokens: bool = False,
+        batch_size: int = 64,
+    ) -> list[list[RetrievalResult]]:
+        """여러 쿼리를 한 번에 검색합니다.
 
-            if span:
-                set_span_attributes(span, {"retriever.result_count": len(results)})
+        ``batch_size``개 쿼리씩 묶어 한 번의 희소 행렬 곱으로 점수를 계산합니다.
+        각 쿼리의 결과는 ``search()``와 동일합니다.
+
+        Args:
+            queries: 검색 쿼리 리스트
+            top_k: 쿼리당 반환할 최대 결과 수
+            include_tokens: 결과에 토큰 포함 여부
+            batch_size: 한 번에 점수를 계산할 쿼리 수 (메모리: batch_size x 문서 수)
+
+        Returns:
+            쿼리 순서대로 정렬된 검색 결과 리스트
+
+        Raises:
+            ValueError: 인덱스가 구축되지 않은 경우
+        """
+        if not self.is_indexed:
+            raise ValueError("인덱스가 구축되지 않았습니다. index()를 먼저 호출하세요.")
 
+        span_attrs = {
+            "retriever.type": "bm25",
+            "retriever.queries": len(queries),
+            "retriever.top_k": top_k,
+        }
+        with instrumentation_span("retriever.bm25.search_batch", span_attrs):
+            tokenized = [
+                self._tokenize_query(query, tokens)
+                for query, tokens in zip(queries, self._tokenize_many(queries), strict=True)
+            ]
+            results: list[list[RetrievalResult]] = []
+            step = max(1, batch_size)
+            for start in range(0, len(tokenized), step):
+                chunk = tokenized[start : start + step]
+                scores = self._bm25.get_scores_batch(chunk)
+                for row, query_tokens in enumerate(chunk):
+                    if not query_tokens:
+                        results.append([])
+                        continue
+                    results.append(self._top_results(scores[row], top_k, include_tokens))
             return results
 
+    def _tokenize_many(self, texts: list[str]) -> list[list[str]]:
+        # KiwiTokenizer는 캐시 + 멀티스레드 배치 분석을 지원
+        tokenize_many = getattr(self._tokenizer, "tokenize_many", None)
+        if tokenize_many is not None:
+            return tokenize_many(texts)
+        return [self._tokenizer.tokenize(text) for text in texts]
+
+    def _tokenize_query(self, query: str, tokens: list[str] | None = None) -> list[str]:
+        query_tokens = self._tokenizer.tokenize(query) if tokens is None else tokens
+        if not query_tokens:
+            query_tokens = self._fallback_tokenize(query)
+        if not query_tokens:
+            logger.warning(f"쿼리에서 토큰을 추출할 수 없음: {query}")
+        return query_tokens
+
+    def _top_results(
+        self, scores: np.ndarray, top_k: int, include_tokens: bool
+    ) -> list[RetrievalResult]:
+        # 전체 정렬 대신 argpartition으로 상위 k개만 선택 (삭제된 문서는 -inf로 제외)
+        return [
+            RetrievalResult(
+                document=self._documents[idx],
+                score=float(scores[idx]),
+                doc_id=idx,
+                tokens=self._tokenized_docs[idx] if include_tokens else None,
+            )
+            for idx in map(int, top_k_indices(scores, top_k))
+        ]
+
     def _fallback_tokenize(self, text: str) -> list[str]:
         if not text:
             return []
@@ -239,12 +297,15 @@ class KoreanBM25Retriever:
         Returns:
             토큰 리스트
         """
-        if not 0 <= doc_id < len(self._tokenized_docs):
+        if self._bm25 is None or not self._bm25.is_alive(doc_id):
             raise IndexError(f"유효하지 않은 doc_id: {doc_id}")
         return self._tokenized_docs[doc_id]
 
     def add_documents(self, documents: list[str]) -> int:
-        """문서를 추가하고 인덱스를 재구축합니다.
+        """문서를 인덱스에 추가합니다.
+
+        새 문서만 토큰화하여 역색인에 덧붙이며, 기존 문서는 다시 처리하지 않습니다.
+        새 문서의 doc_id는 기존 슬롯 뒤에 이어서 부여됩니다.
 
         Args:
             documents: 추가할 문서 리스트
@@ -252,8 +313,51 @@ class KoreanBM25Retriever:
         Returns:
             전체 인덱싱된 문서 수
         """
-        all_docs = self._documents + documents
-        return self.index(all_docs)
+        if self._bm25 is None:
+            return self.index(documents)
+        if documents:
+            with instrumentation_span(
+                "retriever.bm25.add_documents",
+                {"retriever.type": "bm25", "retriever.documents": len(documents)},
+            ):
+                self._append(documents)
+            logger.info(f"BM25 인덱스에 {len(documents)}개 문서 추가")
+        return self.document_count
+
+    def delete_documents(self, doc_ids: list[int]) -> int:
+        """문서를 삭제(tombstone)합니다.
+
+        삭제된 문서는 즉시 검색 결과와 IDF/평균 길이 통계에서 제외됩니다.
+        tombstone 비율이 ``compact_ratio``를 넘으면 ``compact()``가 호출되어
+        doc_id가 재번호화됩니다.
+
+        Args:
+            doc_ids: 삭제할 문서 인덱스 리스트
+
+        Returns:
+            실제로 삭제된 문서 수
+        """
+        if self._bm25 is None:
+            return 0
+        deleted = self._bm25.delete(doc_ids)
+        if deleted and self._bm25.deleted_count > self._compact_ratio * self._bm25.slot_count:
+            self.compact()
+        return deleted
+
+    def compact(self) -> list[int]:
+        """tombstone을 제거하고 doc_id를 재번호화합니다.
+
+        Returns:
+            새 doc_id 순서대로 나열한 이전 doc_id 리스트
+        """
+        if self._bm25 is None:
+            return []
+        survivors = self._bm25.compact()
+        if len(survivors) != len(self._documents):
+            self._documents = [self._documents[doc_id] for doc_id in survivors]
+            self._tokenized_docs = [self._tokenized_docs[doc_id] for doc_id in survivors]
+            logger.info(f"BM25 인덱스 compaction 완료: {len(survivors)}개 문서 유지")
+        return survivors
 
     def clear(self) -> None:
         """인덱스를 초기화합니다."""
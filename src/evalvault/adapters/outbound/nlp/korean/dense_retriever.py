@@ -26,12 +26,18 @@ Example:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import threading
 import time
 from collections import OrderedDict
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import Enum
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -43,6 +49,35 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+INDEX_FORMAT_VERSION = 1
+# Manifest fields that determine the stored vectors; any mismatch means re-encode.
+_EMBEDDING_MANIFEST_KEYS = (
+    "format_version",
+    "model_name",
+    "matryoshka_dim",
+    "normalize_embeddings",
+    "corpus_hash",
+    "document_count",
+)
+# Manifest fields that determine the stored FAISS index; a mismatch only rebuilds FAISS.
+_FAISS_MANIFEST_KEYS = (
+    "faiss_index_type",
+    "faiss_ivf_nlist",
+    "faiss_hnsw_m",
+    "faiss_pq_m",
+    "faiss_pq_nbits",
+)
+
+
+def corpus_hash(documents: Sequence[str]) -> str:
+    """Order-sensitive content hash of a corpus (doc ids are list positions)."""
+    digest = hashlib.sha256()
+    for document in documents:
+        encoded = document.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
 
 class DeviceType(Enum):
     """디바이스 타입."""
@@ -265,6 +300,8 @@ class KoreanDenseRetriever:
         self._faiss_gpu_active = False
         self._query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
         self._search_cache: OrderedDict[tuple[str, int], list[tuple[int, float]]] = OrderedDict()
+        # search_batch/스레드 풀에서 동시에 검색할 수 있으므로 LRU 갱신을 보호
+        self._cache_lock = threading.Lock()
 
     @property
     def is_indexed(self) -> bool:
@@ -463,18 +500,26 @@ class KoreanDenseRetriever:
             embedding = self.encode([query])[0]
             return np.asarray(embedding, dtype=np.float32)
 
-        cached = self._query_cache.get(query)
-        if cached is not None:
-            self._query_cache.move_to_end(query)
-            return cached
+        with self._cache_lock:
+            cached = self._query_cache.get(query)
+            if cached is not None:
+                self._query_cache.move_to_end(query)
+                return cached
 
         embedding = self.encode([query])[0]
+        return self._remember_query_embedding(query, embedding)
+
+    def _remember_query_embedding(self, query: str, embedding: np.ndarray) -> np.ndarray:
+        """쿼리 임베딩을 캐시에 저장합니다."""
         embedding = np.asarray(embedding, dtype=np.float32)
-        self._query_cache[query] = embedding
-        self._query_cache.move_to_end(query)
+        if self._query_cache_size <= 0:
+            return embedding
+        with self._cache_lock:
+            self._query_cache[query] = embedding
+            self._query_cache.move_to_end(query)
 
-        if len(self._query_cache) > self._query_cache_size:
-            self._query_cache.popitem(last=False)
+            if len(self._query_cache) > self._query_cache_size:
+                self._query_cache.popitem(last=False)
 
         return embedding
 
@@ -483,9 +528,10 @@ class KoreanDenseRetriever:
         if self._search_cache_size <= 0:
             return None
         key = (query, top_k)
-        cached = self._search_cache.get(key)
-        if cached is not None:
-            self._search_cache.move_to_end(key)
+        with self._cache_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None:
+                self._search_cache.move_to_end(key)
         return cached
 
     def _store_search_cache(
@@ -498,10 +544,11 @@ class KoreanDenseRetriever:
         if self._search_cache_size <= 0:
             return
         key = (query, top_k)
-        self._search_cache[key] = results
-        self._search_cache.move_to_end(key)
-        if len(self._search_cache) > self._search_cache_size:
-            self._search_cache.popitem(last=False)
+        with self._cache_lock:
+            self._search_cache[key] = results
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > self._search_cache_size:
+                self._search_cache.popitem(last=False)
 
     def _select_top_k(self, scores: np.ndarray, top_k: int) -> np.ndarray:
         """상위 k개 인덱스를 효율적으로 선택."""
@@ -549,7 +596,6 @@ class KoreanDenseRetriever:
         metric = faiss.METRIC_INNER_PRODUCT
         index: Any
         ivf_nlist = min(self._faiss_ivf_nlist, max(1, embeddings.shape[0]))
-        ivf_nprobe = min(self._faiss_ivf_nprobe, ivf_nlist)
 
         if index_type in {"ivf_pq", "pq"} and dimension % self._faiss_pq_m != 0:
             logger.warning(
@@ -602,6 +648,16 @@ class KoreanDenseRetriever:
         if hasattr(index, "is_trained") and not index.is_trained:
             index.train(embeddings)
 
+        index = self._place_faiss_index(faiss, index, embeddings.shape[0])
+        index.add(embeddings)
+        self._faiss_index = index
+        logger.info("FAISS index ready: %s vectors", embeddings.shape[0])
+
+    def _place_faiss_index(self, faiss: Any, index: Any, vector_count: int) -> Any:
+        """GPU 이동과 IVF nprobe 설정을 적용합니다."""
+        ivf_nlist = min(self._faiss_ivf_nlist, max(1, vector_count))
+        ivf_nprobe = min(self._faiss_ivf_nprobe, ivf_nlist)
+
         use_gpu = self._resolve_faiss_gpu(faiss)
         self._faiss_gpu_active = False
 
@@ -620,10 +676,7 @@ class KoreanDenseRetriever:
         else:
             self._faiss_ivf_nlist_used = None
             self._faiss_ivf_nprobe_used = None
-
-        index.add(embeddings)
-        self._faiss_index = index
-        logger.info("FAISS index ready: %s vectors", embeddings.shape[0])
+        return index
 
     def _search_with_faiss(
         self,
@@ -851,12 +904,65 @@ class KoreanDenseRetriever:
         Returns:
             검색 결과 리스트 (점수 내림차순)
 
+        Raises:
+            ValueError: 인덱스가 구축되지 않은 경우
+        """
+        if not self.is_indexed:
+            raise ValueError("인덱스가 구축되지 않았습니다. index()를 먼저 호출하세요.")
+        return self._search(query, top_k, include_embeddings)
+
+    def search_batch(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+        include_embeddings: bool = False,
+    ) -> list[list[DenseRetrievalResult]]:
+        """여러 쿼리를 한 번에 검색합니다.
+
+        캐시에 없는 쿼리 임베딩을 한 번의 ``encode`` 호출로 계산한 뒤
+        쿼리별로 검색합니다. 결과는 쿼리마다 ``search()``와 동일합니다.
+
+        Args:
+            queries: 검색 쿼리 목록
+            top_k: 쿼리당 반환할 최대 결과 수
+            include_embeddings: 결과에 임베딩 포함 여부
+
+        Returns:
+            쿼리 순서대로 정렬된 검색 결과 리스트
+
         Raises:
             ValueError: 인덱스가 구축되지 않은 경우
         """
         if not self.is_indexed:
             raise ValueError("인덱스가 구축되지 않았습니다. index()를 먼저 호출하세요.")
 
+        queries = list(queries)
+        precomputed: dict[str, np.ndarray] = {}
+        if top_k > 0:
+            search_k = min(top_k, self.document_count)
+            pending = [
+                query
+                for query in dict.fromkeys(queries)
+                if query not in self._query_cache and (query, search_k) not in self._search_cache
+            ]
+            if pending:
+                embeddings = self.encode(pending)
+                precomputed = {
+                    query: self._remember_query_embedding(query, embedding)
+                    for query, embedding in zip(pending, embeddings, strict=True)
+                }
+        return [
+            self._search(query, top_k, include_embeddings, precomputed.get(query))
+            for query in queries
+        ]
+
+    def _search(
+        self,
+        query: str,
+        top_k: int,
+        include_embeddings: bool,
+        query_embedding: np.ndarray | None = None,
+    ) -> list[DenseRetrievalResult]:
         if top_k <= 0:
             return []
 
@@ -873,7 +979,8 @@ class KoreanDenseRetriever:
             if cache_hit:
                 results = self._build_results(cached, include_embeddings)
             else:
-                query_embedding = self._get_cached_query_embedding(query)
+                if query_embedding is None:
+                    query_embedding = self._get_cached_query_embedding(query)
                 if self._normalize_embeddings:
                     query_embedding = self._normalize_vector(query_embedding)
 
@@ -945,6 +1052,193 @@ class KoreanDenseRetriever:
 
         return embedding_func
 
+    def index_manifest(self, documents: Sequence[str]) -> dict[str, Any]:
+        """인덱스 재사용 여부를 판단하는 매니페스트를 생성합니다."""
+        return {
+            "format_version": INDEX_FORMAT_VERSION,
+            "model_name": self._model_name,
+            "matryoshka_dim": self._matryoshka_dim,
+            "normalize_embeddings": bool(self._normalize_embeddings),
+            "corpus_hash": corpus_hash(documents),
+            "document_count": len(documents),
+            "faiss_index_type": self._faiss_index_type,
+            "faiss_ivf_nlist": self._faiss_ivf_nlist,
+            "faiss_hnsw_m": self._faiss_hnsw_m,
+            "faiss_pq_m": self._faiss_pq_m,
+            "faiss_pq_nbits": self._faiss_pq_nbits,
+        }
+
+    def index_cache_path(self, cache_dir: str | Path, documents: Sequence[str]) -> Path:
+        """모델/차원/정규화/코퍼스별 인덱스 디렉터리 경로."""
+        manifest = self.index_manifest(documents)
+        key = json.dumps(
+            {name: manifest[name] for name in _EMBEDDING_MANIFEST_KEYS}, sort_keys=True
+        )
+        return Path(cache_dir) / hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+
+    def save_index(self, path: str | Path) -> Path:
+        """임베딩 인덱스를 디스크에 저장합니다.
+
+        ``embeddings.npy`` (정규화 시 ``normalized.npy``)는 ``np.load(mmap_mode="r")``로
+        바로 매핑되는 형식이며, FAISS 인덱스는 네이티브 파일로 저장합니다.
+        ``manifest.json``은 마지막에 기록되므로 중단된 저장은 재사용되지 않습니다.
+
+        Args:
+            path: 인덱스 디렉터리
+
+        Returns:
+            저장된 디렉터리 경로
+
+        Raises:
+            ValueError: 인덱스가 구축되지 않은 경우
+        """
+        if not self.is_indexed or self._embeddings is None:
+            raise ValueError("인덱스가 구축되지 않았습니다. index()를 먼저 호출하세요.")
+
+        target = Path(path)
+        target.mkdir(parents=True, exist_ok=True)
+        manifest_path = target / "manifest.json"
+        manifest_path.unlink(missing_ok=True)
+
+        np.save(target / "embeddings.npy", np.ascontiguousarray(self._embeddings, np.float32))
+        normalized_path = target / "normalized.npy"
+        if self._normalized_embeddings is not None:
+            np.save(normalized_path, np.ascontiguousarray(self._normalized_embeddings, np.float32))
+        else:
+            normalized_path.unlink(missing_ok=True)
+        with open(target / "documents.json", "w", encoding="utf-8") as f:
+            json.dump(self._documents, f, ensure_ascii=False)
+
+        faiss_path = target / "faiss.index"
+        faiss_path.unlink(missing_ok=True)
+        if self._faiss_index is not None:
+            import faiss  # type: ignore
+
+            index = self._faiss_index
+            if self._faiss_gpu_active:  # pragma: no cover - optional GPU path
+                index = faiss.index_gpu_to_cpu(index)
+            faiss.write_index(index, str(faiss_path))
+
+        manifest = {
+            **self.index_manifest(self._documents),
+            "embedding_dim": int(self._embeddings.shape[1]),
+            "faiss_index": faiss_path.exists(),
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+        tmp_path = target / "manifest.json.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, manifest_path)
+        logger.info("Dense 인덱스 저장 완료: %s (%s개 문서)", target, len(self._documents))
+        return target
+
+    def load_index(self, path: str | Path, documents: Sequence[str] | None = None) -> bool:
+        """저장된 인덱스를 매니페스트가 일치할 때만 불러옵니다.
+
+        임베딩은 ``np.load(mmap_mode="r")``로 복사 없이 매핑됩니다. FAISS 설정만
+        다르면 저장된 임베딩으로 FAISS 인덱스만 다시 만듭니다.
+
+        Args:
+            path: ``save_index``로 저장한 디렉터리
+            documents: 현재 코퍼스 (지정 시 코퍼스 해시가 일치해야 함).
+                생략하면 저장된 문서를 사용합니다.
+
+        Returns:
+            인덱스를 불러왔으면 True, 없거나 매니페스트가 다르면 False
+        """
+        source = Path(path)
+        manifest_path = source / "manifest.json"
+        if not manifest_path.exists():
+            return False
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            if documents is None:
+                with open(source / "documents.json", encoding="utf-8") as f:
+                    corpus: Sequence[str] = json.load(f)
+            else:
+                corpus = documents
+        except (OSError, ValueError) as exc:
+            logger.warning("Dense 인덱스 매니페스트를 읽지 못했습니다 (%s): %s", source, exc)
+            return False
+
+        expected = self.index_manifest(corpus)
+        mismatched = [
+            name for name in _EMBEDDING_MANIFEST_KEYS if manifest.get(name) != expected[name]
+        ]
+        if mismatched:
+            logger.info("Dense 인덱스 매니페스트 불일치 (%s): %s", source, ", ".join(mismatched))
+            return False
+
+        embeddings = np.load(source / "embeddings.npy", mmap_mode="r")
+        if embeddings.shape[0] != len(corpus):
+            logger.warning("Dense 인덱스 크기가 코퍼스와 다릅니다: %s", source)
+            return False
+        normalized: np.ndarray | None = None
+        if self._normalize_embeddings:
+            normalized_path = source / "normalized.npy"
+            normalized = (
+                np.load(normalized_path, mmap_mode="r")
+                if normalized_path.exists()
+                else self._normalize_matrix(np.asarray(embeddings))
+            )
+
+        self._documents = list(corpus)
+        self._embeddings = embeddings
+        self._normalized_embeddings = normalized
+        self._faiss_index = None
+        self._faiss_gpu_active = False
+        if self._use_faiss:
+            faiss_reusable = manifest.get("faiss_index") and all(
+                manifest.get(name) == expected[name] for name in _FAISS_MANIFEST_KEYS
+            )
+            if faiss_reusable:
+                self._load_faiss_index(source / "faiss.index", len(corpus))
+            if self._faiss_index is None:
+                self._build_faiss_index(normalized if normalized is not None else embeddings)
+        self._clear_search_cache()
+        logger.info("Dense 인덱스 로드 완료: %s (%s개 문서)", source, len(corpus))
+        return True
+
+    def _load_faiss_index(self, path: Path, vector_count: int) -> None:
+        """네이티브 FAISS 파일을 읽습니다 (가능하면 mmap)."""
+        try:
+            import faiss  # type: ignore
+        except ImportError:
+            logger.warning("faiss not installed. Falling back to numpy search.")
+            return
+        try:
+            index = faiss.read_index(str(path), faiss.IO_FLAG_MMAP)
+        except Exception:
+            try:
+                index = faiss.read_index(str(path))
+            except Exception as exc:
+                logger.warning("Failed to read FAISS index %s: %s", path, exc)
+                return
+        self._faiss_index = self._place_faiss_index(faiss, index, vector_count)
+
+    def index_with_cache(self, documents: list[str], cache_dir: str | Path) -> int:
+        """캐시된 인덱스가 있으면 불러오고, 없으면 인덱싱 후 저장합니다.
+
+        Args:
+            documents: 인덱싱할 문서 리스트
+            cache_dir: 인덱스 캐시 루트 디렉터리
+
+        Returns:
+            인덱싱된 문서 수
+        """
+        if not documents:
+            return self.index(documents)
+        path = self.index_cache_path(cache_dir, documents)
+        if self.load_index(path, documents):
+            return len(documents)
+        count = self.index(documents)
+        try:
+            self.save_index(path)
+        except OSError as exc:
+            logger.warning("Dense 인덱스를 저장하지 못했습니다 (%s): %s", path, exc)
+        return count
+
     def add_documents(self, documents: list[str]) -> int:
         """문서를 추가하고 인덱스를 재구축합니다.
 
@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+from evalvault.adapters.outbound.nlp.korean.bm25_index import top_k_indices
 from evalvault.adapters.outbound.nlp.korean.bm25_retriever import (
     KoreanBM25Retriever,
     RetrievalResult,
@@ -75,12 +76,16 @@ class KoreanHybridRetriever:
     BM25(희소)와 Dense(밀집) 검색을 결합하여 정확한 용어 매칭과
     의미적 유사도를 모두 활용합니다.
 
+    Dense 검색용 임베딩은 인덱싱 시 한 번 L2 정규화된 float32 행렬로 저장되며,
+    각 검색 경로는 ``argpartition``으로 상위 ``candidate_k``개 후보만 골라 융합합니다.
+
     Attributes:
         tokenizer: KiwiTokenizer 인스턴스
         embedding_func: 임베딩 생성 함수
         bm25_weight: BM25 점수 가중치 (기본: 0.5)
         dense_weight: Dense 점수 가중치 (기본: 0.5)
         fusion_method: 결과 융합 방법
+        candidate_k: 검색 경로별 융합 후보 수 (None이면 전체 문서)
 
     Example:
         >>> retriever = KoreanHybridRetriever(
@@ -101,6 +106,7 @@ class KoreanHybridRetriever:
         dense_weight: float = 0.5,
         fusion_method: FusionMethod = FusionMethod.RRF,
         rrf_k: int = 60,
+        candidate_k: int | None = 100,
     ) -> None:
         """KoreanHybridRetriever 초기화.
 
@@ -111,6 +117,8 @@ class KoreanHybridRetriever:
             dense_weight: Dense 점수 가중치
             fusion_method: 결과 융합 방법
             rrf_k: RRF 파라미터 (기본: 60)
+            candidate_k: 검색 경로(BM25/Dense)별로 융합에 넘길 후보 수.
+                ``top_k``보다 작으면 ``top_k``를 사용하며, None이면 전체 문서를 사용합니다.
         """
         self._tokenizer = tokenizer
         self._embedding_func = embedding_func
@@ -118,11 +126,12 @@ class KoreanHybridRetriever:
         self._dense_weight = dense_weight
         self._fusion_method = fusion_method
         self._rrf_k = rrf_k
+        self._candidate_k = candidate_k
 
         # BM25 검색기
         self._bm25_retriever = KoreanBM25Retriever(tokenizer)
 
-        # Dense 검색용 저장소
+        # Dense 검색용 저장소 (L2 정규화된 float32 행렬)
         self._documents: list[str] = []
         self._embeddings: np.ndarray | None = None
 
@@ -176,7 +185,7 @@ class KoreanHybridRetriever:
             if compute_embeddings and self._embedding_func is not None:
                 try:
                     embeddings = self._embedding_func(documents)
-                    self._embeddings = np.array(embeddings)
+                    self._embeddings = self._normalize_rows(embeddings)
                     logger.info(f"Dense 임베딩 계산 완료: {len(documents)}개 문서")
                 except Exception as e:
                     logger.warning(f"임베딩 계산 실패: {e}")
@@ -190,6 +199,33 @@ class KoreanHybridRetriever:
 
             return len(documents)
 
+    def add_documents(self, documents: list[str]) -> int:
+        """문서를 추가합니다.
+
+        BM25 역색인에는 새 문서만 덧붙이고, 임베딩도 새 문서에 대해서만 계산합니다.
+
+        Args:
+            documents: 추가할 문서 리스트
+
+        Returns:
+            전체 인덱싱된 문서 수
+        """
+        if not self.is_indexed:
+            return self.index(documents)
+        if not documents:
+            return len(self._documents)
+
+        self._bm25_retriever.add_documents(documents)
+        self._documents = self._documents + documents
+        if self._embeddings is not None and self._embedding_func is not None:
+            try:
+                new_embeddings = self._normalize_rows(self._embedding_func(documents))
+                self._embeddings = np.vstack([self._embeddings, new_embeddings])
+            except Exception as e:
+                logger.warning(f"임베딩 계산 실패: {e}")
+                self._embeddings = None
+        return len(self._documents)
+
     def search(
         self,
         query: str,
@@ -221,75 +257,144 @@ class KoreanHybridRetriever:
             "retriever.use_dense": use_dense,
         }
         with instrumentation_span("retriever.hybrid.search", span_attrs) as span:
+            candidate_k = self._candidate_count(top_k)
             # 검색 실행
             bm25_results: list[RetrievalResult] = []
             dense_results: list[tuple[int, float]] = []
 
             if use_bm25:
-                bm25_results = self._bm25_retriever.search(query, top_k=len(self._documents))
+                bm25_results = self._bm25_retriever.search(query, top_k=candidate_k)
 
             if use_dense and self.has_embeddings and self._embedding_func is not None:
-                dense_results = self._search_dense(query)
-
-            # 결과 융합
-            if use_bm25 and use_dense and bm25_results and dense_results:
-                fused = self._fuse_results(bm25_results, dense_results, top_k)
-            elif use_bm25 and bm25_results:
-                fused = self._convert_bm25_results(bm25_results[:top_k])
-            elif use_dense and dense_results:
-                fused = self._convert_dense_results(dense_results[:top_k])
-            else:
-                fused = []
+                dense_results = self._search_dense(query, candidate_k)
+
+            fused = self._combine(bm25_results, dense_results, top_k, use_bm25, use_dense)
 
             if span:
                 set_span_attributes(span, {"retriever.result_count": len(fused)})
 
             return fused
 
-    def _search_dense(self, query: str) -> list[tuple[int, float]]:
+    def search_batch(
+        self,
+        queries: list[str],
+        top_k: int = 5,
+        use_bm25: bool = True,
+        use_dense: bool = True,
+        batch_size: int = 256,
+    ) -> list[list[HybridResult]]:
+        """여러 쿼리를 한 번에 하이브리드 검색합니다.
+
+        모든 쿼리를 한 번의 임베딩 호출로 변환한 뒤 ``batch_size``개씩
+        단일 행렬 곱(GEMM)으로 Dense 유사도를 계산하고, BM25는
+        ``KoreanBM25Retriever.search_batch``로 점수를 계산합니다.
+
+        Args:
+            queries: 검색 쿼리 리스트
+            top_k: 쿼리당 반환할 최대 결과 수
+            use_bm25: BM25 검색 사용 여부
+            use_dense: Dense 검색 사용 여부
+            batch_size: 한 번에 유사도를 계산할 쿼리 수
+
+        Returns:
+            쿼리 순서대로 정렬된 하이브리드 검색 결과 리스트
+
+        Raises:
+            ValueError: 인덱스가 구축되지 않은 경우
+        """
+        if not self.is_indexed:
+            raise ValueError("인덱스가 구축되지 않았습니다. index()를 먼저 호출하세요.")
+
+        span_attrs = {
+            "retriever.type": "hybrid",
+            "retriever.queries": len(queries),
+            "retriever.top_k": top_k,
+        }
+        with instrumentation_span("retriever.hybrid.search_batch", span_attrs):
+            candidate_k = self._candidate_count(top_k)
+            bm25_batches: list[list[RetrievalResult]] = [[] for _ in queries]
+            dense_batches: list[list[tuple[int, float]]] = [[] for _ in queries]
+
+            if use_bm25 and queries:
+                bm25_batches = self._bm25_retriever.search_batch(queries, top_k=candidate_k)
+
+            if use_dense and self.has_embeddings and self._embedding_func is not None and queries:
+                dense_batches = self._search_dense_batch(queries, candidate_k, batch_size)
+
+            return [
+                self._combine(bm25_results, dense_results, top_k, use_bm25, use_dense)
+                for bm25_results, dense_results in zip(bm25_batches, dense_batches, strict=True)
+            ]
+
+    def _candidate_count(self, top_k: int) -> int:
+        if self._candidate_k is None:
+            return len(self._documents)
+        return max(top_k, self._candidate_k)
+
+    def _combine(
+        self,
+        bm25_results: list[RetrievalResult],
+        dense_results: list[tuple[int, float]],
+        top_k: int,
+        use_bm25: bool,
+        use_dense: bool,
+    ) -> list[HybridResult]:
+        """결과 융합."""
+        if use_bm25 and use_dense and bm25_results and dense_results:
+            return self._fuse_results(bm25_results, dense_results, top_k)
+        if use_bm25 and bm25_results:
+            return self._convert_bm25_results(bm25_results[:top_k])
+        if use_dense and dense_results:
+            return self._convert_dense_results(dense_results[:top_k])
+        return []
+
+    def _search_dense(self, query: str, candidate_k: int) -> list[tuple[int, float]]:
         """Dense 검색을 수행합니다.
 
         Args:
             query: 검색 쿼리
+            candidate_k: 반환할 후보 수
 
         Returns:
             (doc_id, similarity) 리스트 (유사도 내림차순)
         """
+        return self._search_dense_batch([query], candidate_k)[0]
+
+    def _search_dense_batch(
+        self,
+        queries: list[str],
+        candidate_k: int,
+        batch_size: int = 256,
+    ) -> list[list[tuple[int, float]]]:
+        """쿼리 임베딩을 한 번에 계산하고 정규화 행렬과의 GEMM으로 유사도를 구합니다."""
         if self._embedding_func is None or self._embeddings is None:
-            return []
+            return [[] for _ in queries]
 
         try:
-            # 쿼리 임베딩
-            query_embedding = self._embedding_func([query])[0]
-            query_vec = np.array(query_embedding)
-
-            # 코사인 유사도 계산
-            similarities = self._cosine_similarity(query_vec, self._embeddings)
-
-            # 정렬
-            sorted_indices = np.argsort(similarities)[::-1]
-
-            return [(int(idx), float(similarities[idx])) for idx in sorted_indices]
+            # 쿼리 임베딩 (한 번의 호출)
+            query_matrix = self._normalize_rows(self._embedding_func(queries))
+
+            results: list[list[tuple[int, float]]] = []
+            step = max(1, batch_size)
+            for start in range(0, len(queries), step):
+                # 코사인 유사도 = 정규화된 벡터의 내적
+                similarities = query_matrix[start : start + step] @ self._embeddings.T
+                for row in similarities:
+                    top = top_k_indices(row, candidate_k)
+                    results.append([(int(idx), float(row[idx])) for idx in top])
+            return results
 
         except Exception as e:
             logger.warning(f"Dense 검색 실패: {e}")
-            return []
-
-    def _cosine_similarity(
-        self,
-        query_vec: np.ndarray,
-        doc_vecs: np.ndarray,
-    ) -> np.ndarray:
-        """코사인 유사도를 계산합니다."""
-        query_norm = np.linalg.norm(query_vec)
-        if query_norm == 0:
-            return np.zeros(len(doc_vecs))
-
-        doc_norms = np.linalg.norm(doc_vecs, axis=1)
-        doc_norms[doc_norms == 0] = 1  # 0으로 나누기 방지
-
-        similarities = np.dot(doc_vecs, query_vec) / (doc_norms * query_norm)
-        return similarities
+            return [[] for _ in queries]
+
+    @staticmethod
+    def _normalize_rows(vectors: list[list[float]] | np.ndarray) -> np.ndarray:
+        """L2 정규화된 float32 행렬 (노름이 0인 행은 0 벡터 유지)."""
+        matrix = np.array(vectors, dtype=np.float32, ndmin=2)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1  # 0으로 나누기 방지
+        return matrix / norms
 
     def _fuse_results(
         self,
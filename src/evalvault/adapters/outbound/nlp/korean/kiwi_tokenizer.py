@@ -13,12 +13,13 @@ Example:
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import logging
 import os
 import platform
 import sys
 import tempfile
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -28,6 +29,12 @@ from evalvault.adapters.outbound.nlp.korean.korean_stopwords import (
     STOPWORD_POS_TAGS,
     is_stopword,
 )
+from evalvault.adapters.outbound.nlp.korean.token_cache import (
+    KiwiTokenCache,
+    Morphemes,
+    get_kiwi_token_cache,
+    text_digest,
+)
 
 if TYPE_CHECKING:
     from kiwipiepy import Kiwi
@@ -121,6 +128,8 @@ class KiwiTokenizer:
 
     형태소 분석을 통해 의미있는 토큰을 추출합니다.
     조사/어미 제거, 원형 변환, 불용어 필터링을 지원합니다.
+    형태소 분석 결과는 텍스트 해시 기반 토큰 캐시(KiwiTokenCache)에 저장되어
+    같은 텍스트를 다시 분석하지 않습니다.
 
     Attributes:
         remove_particles: 조사(J*) 제거 여부
@@ -147,6 +156,8 @@ class KiwiTokenizer:
         user_dict_path: str | Path | None = None,
         num_workers: int = 0,
         model_type: str | None = None,
+        token_cache: KiwiTokenCache | None = None,
+        use_token_cache: bool = True,
     ):
         """KiwiTokenizer 초기화.
 
@@ -160,6 +171,8 @@ class KiwiTokenizer:
             user_dict_path: 사용자 사전 경로 (TSV 형식)
             num_workers: 병렬 처리 워커 수 (0=자동)
             model_type: Kiwi 모델 타입 (cong, cong-global 등)
+            token_cache: 형태소 분석 결과 캐시 (기본: 프로세스 공용 캐시)
+            use_token_cache: 토큰 캐시 사용 여부
         """
         self.remove_particles = remove_particles
         self.remove_endings = remove_endings
@@ -173,6 +186,31 @@ class KiwiTokenizer:
         # num_workers: -1=single thread, 0=auto (deprecated), >0=specific count
         self._num_workers = num_workers if num_workers != 0 else -1
         self._model_type = model_type
+        self._token_cache = (token_cache or get_kiwi_token_cache()) if use_token_cache else None
+        self._user_words: list[tuple[str, str, float]] = []
+        self._cache_namespace: str | None = None
+
+    @property
+    def token_cache(self) -> KiwiTokenCache | None:
+        """형태소 분석 결과 캐시."""
+        return self._token_cache
+
+    @property
+    def cache_namespace(self) -> str:
+        """캐시 namespace (kiwipiepy 버전, 모델 타입, 사용자 사전 해시)."""
+        if self._cache_namespace is None:
+            try:
+                from kiwipiepy import __version__ as kiwi_version
+            except ImportError:
+                kiwi_version = "unknown"
+            digest = hashlib.sha256()
+            digest.update(f"{kiwi_version}\0{self._model_type or 'default'}\0".encode())
+            if self._user_dict_path and self._user_dict_path.exists():
+                digest.update(self._user_dict_path.read_bytes())
+            for word, tag, score in self._user_words:
+                digest.update(f"\0{word}\t{tag}\t{score}".encode())
+            self._cache_namespace = digest.hexdigest()
+        return self._cache_namespace
 
     @property
     def kiwi(self) -> Kiwi:
@@ -243,19 +281,56 @@ class KiwiTokenizer:
         """
         if not text or not text.strip():
             return []
+        return self.analyze_many([text])[0]
 
-        tokens = []
-        for token in self.kiwi.tokenize(text):
-            tokens.append(
-                Token(
-                    form=token.form,
-                    tag=token.tag,
-                    lemma=token.lemma if hasattr(token, "lemma") else token.form,
-                    start=token.start,
-                    end=token.end,
+    def analyze_many(self, texts: Iterable[str]) -> list[list[Token]]:
+        """여러 텍스트를 형태소 분석합니다.
+
+        캐시에 없는 텍스트만 중복 제거 후 Kiwi의 멀티스레드 배치 API로 분석합니다.
+
+        Args:
+            texts: 분석할 텍스트 목록
+
+        Returns:
+            입력 순서대로 Token 리스트 (필터링 전)
+        """
+        texts = list(texts)
+        digests = {text: text_digest(text) for text in texts if text and text.strip()}
+        cached: dict[str, Morphemes] = {}
+        if self._token_cache is not None and digests:
+            cached = self._token_cache.get_many(self.cache_namespace, set(digests.values()))
+
+        pending = [text for text, digest in digests.items() if digest not in cached]
+        if pending:
+            analyzed = self._run_kiwi(pending)
+            fresh = {
+                digests[text]: morphemes for text, morphemes in zip(pending, analyzed, strict=True)
+            }
+            if self._token_cache is not None:
+                self._token_cache.set_many(self.cache_namespace, fresh)
+            cached.update(fresh)
+
+        return [
+            [Token(*morpheme) for morpheme in cached[digests[text]]] if text in digests else []
+            for text in texts
+        ]
+
+    def _run_kiwi(self, texts: list[str]) -> list[Morphemes]:
+        # 단일 str은 싱글스레드, str 리스트는 Kiwi 내부 워커 스레드로 분배됩니다.
+        batches = [self.kiwi.tokenize(texts[0])] if len(texts) == 1 else self.kiwi.tokenize(texts)
+        return [
+            tuple(
+                (
+                    token.form,
+                    token.tag,
+                    token.lemma if hasattr(token, "lemma") else token.form,
+                    token.start,
+                    token.end,
                 )
+                for token in tokens
             )
-        return tokens
+            for tokens in batches
+        ]
 
     def tokenize(self, text: str) -> list[str]:
         """텍스트를 토큰화합니다.
@@ -268,7 +343,20 @@ class KiwiTokenizer:
         Returns:
             토큰 리스트 (문자열)
         """
-        tokens = self.analyze(text)
+        return self._select_tokens(self.analyze(text))
+
+    def tokenize_many(self, texts: Iterable[str]) -> list[list[str]]:
+        """여러 텍스트를 한 번에 토큰화합니다.
+
+        Args:
+            texts: 토큰화할 텍스트 목록
+
+        Returns:
+            입력 순서대로 토큰 리스트
+        """
+        return [self._select_tokens(tokens) for tokens in self.analyze_many(texts)]
+
+    def _select_tokens(self, tokens: list[Token]) -> list[str]:
         result = []
 
         for token in tokens:
@@ -395,6 +483,9 @@ class KiwiTokenizer:
             score: 단어 점수 (기본: 0.0)
         """
         self.kiwi.add_user_word(word, tag, score)
+        # 사전이 바뀌면 이전 분석 결과를 재사용하지 않도록 namespace 갱신
+        self._user_words.append((word, tag, score))
+        self._cache_namespace = None
 
     def add_insurance_terms(self, terms: list[str]) -> None:
         """보험 용어를 일괄 추가합니다.
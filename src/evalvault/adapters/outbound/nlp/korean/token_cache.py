@@ -0,0 +1,231 @@
+"""Content-hash keyed cache for Kiwi morphological analysis.
+
+한 번의 실행에서 같은 질문/컨텍스트/답변이 BM25 인덱싱, 충실도 검사,
+형태소 분석 모듈, GraphRAG 키워드 추출 등에서 반복해서 형태소 분석됩니다.
+이 모듈은 분석 결과(필터링 전 형태소 목록)를 텍스트의 SHA-256 해시로 저장하는
+프로세스 내 LRU 캐시와 선택적인 SQLite 디스크 저장소를 제공합니다.
+
+캐시 키에는 Kiwi 모델 타입, kiwipiepy 버전, 사용자 사전 해시로 구성된
+namespace가 포함되므로 분석기 구성이 바뀌면 이전 결과를 재사용하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from evalvault.config.settings import Settings
+
+# (form, tag, lemma, start, end)
+Morpheme = tuple[str, str, str, int, int]
+Morphemes = tuple[Morpheme, ...]
+
+
+def text_digest(text: str) -> str:
+    """텍스트 내용 해시 (캐시 키)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class KiwiTokenCache:
+    """Kiwi 형태소 분석 결과 캐시 (LRU + 선택적 SQLite 저장소).
+
+    메모리 LRU에서 먼저 찾고, 없으면 디스크 저장소를 조회한 뒤 메모리에
+    올립니다. 새 분석 결과는 두 계층에 모두 기록됩니다.
+    """
+
+    def __init__(self, max_entries: int = 50_000, db_path: str | Path | None = None) -> None:
+        """캐시 초기화.
+
+        Args:
+            max_entries: 메모리 LRU 최대 항목 수 (0이면 메모리 캐시 비활성화)
+            db_path: SQLite 디스크 저장소 경로 (None이면 비활성화)
+        """
+        self.max_entries = max(0, int(max_entries))
+        self.db_path = Path(db_path) if db_path else None
+        self._entries: OrderedDict[tuple[str, str], Morphemes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._conn()
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS kiwi_token_cache (
+                    namespace TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    morphemes TEXT NOT NULL,
+                    PRIMARY KEY (namespace, text_hash)
+                )
+                """
+            )
+            conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def get_many(self, namespace: str, digests: Iterable[str]) -> dict[str, Morphemes]:
+        """캐시된 분석 결과를 조회합니다 (없는 키는 결과에서 제외)."""
+        found: dict[str, Morphemes] = {}
+        missing: list[str] = []
+        with self._lock:
+            for digest in digests:
+                entry = self._entries.get((namespace, digest))
+                if entry is None:
+                    missing.append(digest)
+                    continue
+                self._entries.move_to_end((namespace, digest))
+                found[digest] = entry
+                self._hits += 1
+        if missing and self.db_path is not None:
+            loaded = self._load(namespace, missing)
+            if loaded:
+                self._remember(namespace, loaded)
+                found.update(loaded)
+            with self._lock:
+                self._disk_hits += len(loaded)
+                self._misses += len(missing) - len(loaded)
+        elif missing:
+            with self._lock:
+                self._misses += len(missing)
+        return found
+
+    def set_many(self, namespace: str, entries: Mapping[str, Morphemes]) -> None:
+        """분석 결과를 메모리와 디스크에 기록합니다."""
+        if not entries:
+            return
+        self._remember(namespace, entries)
+        if self.db_path is None:
+            return
+        conn = self._conn()
+        conn.executemany(
+            "INSERT OR REPLACE INTO kiwi_token_cache (namespace, text_hash, morphemes) "
+            "VALUES (?, ?, ?)",
+            [
+                (namespace, digest, json.dumps(morphemes, ensure_ascii=False))
+                for digest, morphemes in entries.items()
+            ],
+        )
+        conn.commit()
+
+    def _remember(self, namespace: str, entries: Mapping[str, Morphemes]) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            for digest, morphemes in entries.items():
+                self._entries[(namespace, digest)] = morphemes
+                self._entries.move_to_end((namespace, digest))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _load(self, namespace: str, digests: list[str]) -> dict[str, Morphemes]:
+        loaded: dict[str, Morphemes] = {}
+        conn = self._conn()
+        # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+        for start in range(0, len(digests), 500):
+            chunk = digests[start : start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = conn.execute(
+                "SELECT text_hash, morphemes FROM kiwi_token_cache "
+                f"WHERE namespace = ? AND text_hash IN ({placeholders})",
+                (namespace, *chunk),
+            ).fetchall()
+            for digest, payload in rows:
+                with suppress(TypeError, ValueError):
+                    loaded[digest] = tuple(tuple(item) for item in json.loads(payload))
+        return loaded
+
+    def clear(self) -> None:
+        """메모리 캐시와 디스크 저장소를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._disk_hits = self._misses = 0
+        if self.db_path is not None:
+            conn = self._conn()
+            conn.execute("DELETE FROM kiwi_token_cache")
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for conn in connections:
+            with suppress(sqlite3.Error):
+                conn.close()
+        self._local = threading.local()
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._disk_hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_entries,
+                "path": str(self.db_path) if self.db_path else None,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits + self._disk_hits) / total if total else 0.0,
+            }
+
+
+_shared_caches: dict[tuple[int, str], KiwiTokenCache] = {}
+_active_cache: KiwiTokenCache | None = None
+_configured = False
+_shared_caches_lock = threading.Lock()
+
+
+def get_kiwi_token_cache(settings: Settings | None = None) -> KiwiTokenCache | None:
+    """프로세스 공용 토큰 캐시를 반환합니다.
+
+    ``settings``를 주면 해당 설정(크기/디스크 경로)의 캐시를 공용 캐시로
+    지정하고, 이후 ``settings`` 없이 생성되는 ``KiwiTokenizer``가 이를 공유합니다.
+    설정이 주어진 적이 없으면 기본 크기의 메모리 전용 캐시를 사용합니다.
+    ``kiwi_token_cache_size``가 0이고 디스크 경로도 없으면 ``None``을 반환합니다.
+    """
+    global _active_cache, _configured
+    with _shared_caches_lock:
+        if settings is None:
+            if _active_cache is None and not _configured:
+                _active_cache = KiwiTokenCache()
+            return _active_cache
+        _configured = True
+        max_entries = int(getattr(settings, "kiwi_token_cache_size", 50_000))
+        path = str(getattr(settings, "kiwi_token_cache_path", "") or "")
+        if not max_entries and not path:
+            _active_cache = None
+            return None
+        key = (max_entries, path)
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = KiwiTokenCache(max_entries=max_entries, db_path=path or None)
+            _shared_caches[key] = cache
+        _active_cache = cache
+        return cache
+
+
+__all__ = [
+    "KiwiTokenCache",
+    "Morpheme",
+    "Morphemes",
+    "get_kiwi_token_cache",
+    "text_digest",
+]
@@ -32,6 +32,16 @@ class _RetrieverWrapper(RetrieverPort):
     def search(self, query: str, top_k: int = 5) -> Sequence[RetrieverResultProtocol]:
         return self._retriever.search(query, top_k=top_k)
 
+    def search_batch(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+    ) -> Sequence[Sequence[RetrieverResultProtocol]]:
+        search_batch = getattr(self._retriever, "search_batch", None)
+        if callable(search_batch):
+            return search_batch(list(queries), top_k=top_k)
+        return [self._retriever.search(query, top_k=top_k) for query in queries]
+
 
 class KoreanNLPToolkit(KoreanNLPToolkitPort):
     """Concrete implementation of KoreanNLPToolkitPort."""
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 from evalvault.ports.outbound.korean_nlp_port import KoreanNLPToolkitPort
 
+if TYPE_CHECKING:
+    from evalvault.config.settings import Settings
+
 logger = logging.getLogger(__name__)
 
 
-def try_create_korean_toolkit() -> KoreanNLPToolkitPort | None:
+def try_create_korean_toolkit(settings: Settings | None = None) -> KoreanNLPToolkitPort | None:
     try:
+        from evalvault.adapters.outbound.nlp.korean.token_cache import get_kiwi_token_cache
         from evalvault.adapters.outbound.nlp.korean.toolkit import KoreanNLPToolkit
     except Exception as exc:
         logger.debug("Korean toolkit import failed: %s", exc)
         return None
+    if settings is not None:
+        # 이후 생성되는 KiwiTokenizer가 설정된 공용 토큰 캐시를 공유
+        get_kiwi_token_cache(settings)
     try:
         return KoreanNLPToolkit()
     except Exception as exc:
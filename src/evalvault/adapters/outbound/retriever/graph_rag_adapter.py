@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Iterable
 from typing import Any
 
+from evalvault.adapters.outbound.kg.columnar_graph import ColumnarKnowledgeGraph
 from evalvault.adapters.outbound.kg.networkx_adapter import NetworkXKnowledgeGraph
 from evalvault.domain.entities.graph_rag import EntityNode, KnowledgeSubgraph, RelationEdge
 from evalvault.domain.entities.kg import EntityModel, RelationModel
@@ -14,11 +15,11 @@ from evalvault.ports.outbound.graph_retriever_port import GraphRetrieverPort
 
 
 class GraphRAGAdapter(GraphRetrieverPort):
-    """GraphRAG adapter over NetworkXKnowledgeGraph."""
+    """GraphRAG adapter over NetworkXKnowledgeGraph or a columnar KG."""
 
     def __init__(
         self,
-        kg: NetworkXKnowledgeGraph,
+        kg: NetworkXKnowledgeGraph | ColumnarKnowledgeGraph,
         *,
         entity_extractor: EntityExtractor | None = None,
     ) -> None:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from abc import ABC, abstractmethod
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from contextlib import AbstractContextManager, closing
 from datetime import datetime
 from pathlib import Path
@@ -12,6 +12,7 @@ from typing import Any, cast
 
 from evalvault.domain.entities import (
     EvaluationRun,
+    EvaluationRunSummary,
     FeedbackSummary,
     MetricScore,
     MultiTurnConversationRecord,
@@ -40,11 +41,17 @@ class SQLQueries:
         metric_name_column: str = "metric_name",
         test_case_returning_clause: str = "",
         feedback_returning_clause: str = "",
+        bulk_returning_clause: str = "",
     ) -> None:
         self.placeholder = placeholder
         self.metric_name_column = metric_name_column
         self._test_case_returning = test_case_returning_clause
         self._feedback_returning = feedback_returning_clause
+        self._bulk_returning = bulk_returning_clause
+
+    @property
+    def supports_bulk_returning(self) -> bool:
+        return bool(self._bulk_returning)
 
     def _values(self, count: int) -> str:
         return ", ".join([self.placeholder] * count)
@@ -73,6 +80,16 @@ class SQLQueries:
             query = f"{query.strip()} {self._test_case_returning}"
         return query
 
+    def insert_test_cases_bulk(self, row_count: int) -> str:
+        rows = ", ".join(f"({self._values(12)})" for _ in range(row_count))
+        return f"""
+        INSERT INTO test_case_results (
+            run_id, test_case_id, tokens_used, latency_ms,
+            cost_usd, trace_id, started_at, finished_at,
+            question, answer, contexts, ground_truth
+        ) VALUES {rows} {self._bulk_returning}
+        """
+
     def insert_metric_score(self) -> str:
         values = self._values(5)
         return f"""
@@ -112,6 +129,15 @@ class SQLQueries:
             query = f"{query.strip()} {self._test_case_returning}"
         return query
 
+    def insert_multiturn_turns_bulk(self, row_count: int) -> str:
+        rows = ", ".join(f"({self._values(8)})" for _ in range(row_count))
+        return f"""
+        INSERT INTO multiturn_turn_results (
+            run_id, conversation_id, turn_id, turn_index, role,
+            passed, latency_ms, metadata
+        ) VALUES {rows} {self._bulk_returning}
+        """
+
     def insert_multiturn_metric_score(self) -> str:
         values = self._values(4)
         return f"""
@@ -175,12 +201,16 @@ class SQLQueries:
         ORDER BY id
         """
 
-    def select_metric_scores(self) -> str:
+    def select_metric_scores_by_run(self) -> str:
+        # One round trip for every metric row of a run; callers group by
+        # ``result_id`` instead of querying once per test case.
         return f"""
-        SELECT {self.metric_name_column} AS metric_name, score, threshold, reason
-        FROM metric_scores
-        WHERE result_id = {self.placeholder}
-        ORDER BY id
+        SELECT m.result_id, m.{self.metric_name_column} AS metric_name,
+               m.score, m.threshold, m.reason
+        FROM metric_scores m
+        JOIN test_case_results t ON m.result_id = t.id
+        WHERE t.run_id = {self.placeholder}
+        ORDER BY m.result_id, m.id
         """
 
     def select_multiturn_run(self) -> str:
@@ -251,6 +281,20 @@ class SQLQueries:
         WHERE run_id = {self.placeholder}
         """
 
+    def update_run_progress(self) -> str:
+        p = self.placeholder
+        return f"""
+        UPDATE evaluation_runs
+        SET model_name = {p}, finished_at = {p}, total_tokens = {p},
+            total_cost_usd = {p}, pass_rate = {p}, metrics_evaluated = {p},
+            thresholds = {p}, tracker_trace_ids = {p}, metadata = {p},
+            retrieval_metadata = {p}
+        WHERE run_id = {p}
+        """
+
+    def select_run_test_case_ids(self) -> str:
+        return f"SELECT test_case_id FROM test_case_results WHERE run_id = {self.placeholder}"
+
     def delete_run(self) -> str:
         return f"DELETE FROM evaluation_runs WHERE run_id = {self.placeholder}"
 
@@ -263,6 +307,48 @@ class SQLQueries:
     def list_runs_ordering(self) -> str:
         return f" ORDER BY started_at DESC LIMIT {self.placeholder} OFFSET {self.placeholder}"
 
+    def list_run_summaries_base(self) -> str:
+        return """
+        SELECT run_id, dataset_name, dataset_version, model_name,
+               started_at, finished_at, total_tokens, total_cost_usd,
+               metrics_evaluated, thresholds, metadata, project_id
+        FROM evaluation_runs
+        WHERE 1=1
+        """
+
+    def list_run_summaries_ordering(self) -> str:
+        # ``run_id`` breaks ties so the keyset cursor is total.
+        return (
+            f" ORDER BY started_at DESC, run_id DESC"
+            f" LIMIT {self.placeholder} OFFSET {self.placeholder}"
+        )
+
+    def select_run_case_counts(self, run_count: int) -> str:
+        # A case passes when none of its metrics is below threshold; NULL and 0
+        # thresholds fall back to 0.7 exactly as get_run hydration does.
+        return f"""
+        SELECT t.run_id,
+               COUNT(*) AS total_test_cases,
+               SUM(CASE WHEN EXISTS (
+                   SELECT 1 FROM metric_scores m
+                   WHERE m.result_id = t.id
+                     AND COALESCE(m.score, 0) < COALESCE(NULLIF(m.threshold, 0), 0.7)
+               ) THEN 0 ELSE 1 END) AS passed_test_cases
+        FROM test_case_results t
+        WHERE t.run_id IN ({self._values(run_count)})
+        GROUP BY t.run_id
+        """
+
+    def select_run_metric_averages(self, run_count: int) -> str:
+        return f"""
+        SELECT t.run_id, m.{self.metric_name_column} AS metric_name,
+               AVG(COALESCE(m.score, 0)) AS avg_score
+        FROM metric_scores m
+        JOIN test_case_results t ON m.result_id = t.id
+        WHERE t.run_id IN ({self._values(run_count)})
+        GROUP BY t.run_id, m.{self.metric_name_column}
+        """
+
     def upsert_regression_baseline(self) -> str:
         raise NotImplementedError("Override in subclass")
 
@@ -274,10 +360,23 @@ class SQLQueries:
         WHERE baseline_key = {self.placeholder}
         """
 
+    def upsert_analysis_cache_entry(self) -> str:
+        raise NotImplementedError("Override in subclass")
+
+    def select_analysis_cache_entry(self) -> str:
+        return f"SELECT payload FROM analysis_cache WHERE cache_key = {self.placeholder}"
+
+    def delete_analysis_cache_entries(self) -> str:
+        return f"DELETE FROM analysis_cache WHERE run_id = {self.placeholder}"
+
 
 class BaseSQLStorageAdapter(ABC):
     """Shared serialization and SQL helpers for DB-API based adapters."""
 
+    # Rows per multi-row INSERT statement; keeps bound parameters well below
+    # SQLite's 32766 limit (12 columns per test case row).
+    bulk_chunk_size = 500
+
     def __init__(self, queries: SQLQueries) -> None:
         self.queries = queries
 
@@ -307,23 +406,132 @@ class BaseSQLStorageAdapter(ABC):
             return conn.execute(query)
         return conn.execute(query, params)
 
+    def _executemany(
+        self,
+        conn: Any,
+        query: str,
+        params_seq: Sequence[Sequence[object]],
+    ) -> None:
+        if not params_seq:
+            return
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(query, params_seq)
+        finally:
+            cursor.close()
+
+    def _insert_many_returning_ids(
+        self,
+        conn: Any,
+        rows: Sequence[Sequence[object]],
+        *,
+        bulk_query: Callable[[int], str],
+        single_query: str,
+    ) -> list[int]:
+        """Insert rows and return their ids in input order.
+
+        Uses one multi-row ``INSERT ... RETURNING id`` per chunk when the
+        backend supports it and falls back to per-row ``lastrowid`` otherwise.
+        Ids come from a sequence assigned in VALUES order, so sorting the
+        returned ids restores input order regardless of RETURNING row order.
+        """
+        if not self.queries.supports_bulk_returning:
+            return [
+                self._fetch_lastrowid(self._execute(conn, single_query, params)) for params in rows
+            ]
+
+        ids: list[int] = []
+        for start in range(0, len(rows), self.bulk_chunk_size):
+            chunk = rows[start : start + self.bulk_chunk_size]
+            flat_params = [value for params in chunk for value in params]
+            cursor = self._execute(conn, bulk_query(len(chunk)), flat_params)
+            chunk_ids = sorted(int(self._row_value(row, "id")) for row in cursor.fetchall())
+            if len(chunk_ids) != len(chunk):
+                raise RuntimeError(
+                    f"Bulk insert returned {len(chunk_ids)} ids for {len(chunk)} rows"
+                )
+            ids.extend(chunk_ids)
+        return ids
+
     # CRUD helpers -------------------------------------------------------
 
-    def save_run(self, run: EvaluationRun) -> str:
+    def save_run(self, run: EvaluationRun, *, commit_every: int | None = None) -> str:
+        """Persist a run with bulk inserts.
+
+        ``commit_every`` commits after roughly that many test cases so very large
+        runs do not hold one long write transaction; a failure then leaves the
+        already committed chunks in place. By default the run is saved atomically.
+        """
+        chunk_size = self.bulk_chunk_size
+        if commit_every is not None:
+            chunk_size = max(1, min(chunk_size, commit_every))
+
         with self._get_connection() as conn:
             self._execute(conn, self.queries.insert_run(), self._run_params(run))
+            self._insert_test_case_results(
+                conn,
+                run.run_id,
+                run.results,
+                chunk_size=chunk_size,
+                commit_each_chunk=commit_every is not None,
+            )
+            conn.commit()
+            return run.run_id
 
-            for result in run.results:
-                result_id = self._insert_test_case(conn, run.run_id, result)
-                for metric in result.metrics:
-                    self._execute(
-                        conn,
-                        self.queries.insert_metric_score(),
-                        self._metric_params(result_id, metric),
-                    )
+    def append_run_results(self, run: EvaluationRun, results: Sequence[TestCaseResult]) -> int:
+        """Append test case results to a run and refresh its run row atomically.
 
+        The run row is created from ``run`` on first use and updated from it
+        afterwards (totals, metadata, pass rate), in the same transaction as the
+        inserted results. Streaming evaluation calls this once per finished
+        chunk, so a crash keeps every committed chunk for ``--resume``.
+        """
+        with self._get_connection() as conn:
+            cursor = self._execute(
+                conn, self.queries.update_run_progress(), self._run_progress_params(run)
+            )
+            if not cursor.rowcount:
+                self._execute(conn, self.queries.insert_run(), self._run_params(run))
+            self._insert_test_case_results(
+                conn, run.run_id, results, chunk_size=self.bulk_chunk_size
+            )
             conn.commit()
-            return run.run_id
+        return len(results)
+
+    def list_completed_test_case_ids(self, run_id: str) -> set[str]:
+        """Return the ids of the test cases already stored for a run."""
+        with self._get_connection() as conn:
+            rows = self._execute(conn, self.queries.select_run_test_case_ids(), (run_id,))
+            return {self._row_value(row, "test_case_id") for row in rows.fetchall()}
+
+    def _insert_test_case_results(
+        self,
+        conn: Any,
+        run_id: str,
+        results: Sequence[TestCaseResult],
+        *,
+        chunk_size: int,
+        commit_each_chunk: bool = False,
+    ) -> None:
+        for start in range(0, len(results), chunk_size):
+            chunk = results[start : start + chunk_size]
+            result_ids = self._insert_many_returning_ids(
+                conn,
+                [self._test_case_params(run_id, result) for result in chunk],
+                bulk_query=self.queries.insert_test_cases_bulk,
+                single_query=self.queries.insert_test_case(),
+            )
+            self._executemany(
+                conn,
+                self.queries.insert_metric_score(),
+                [
+                    self._metric_params(result_id, metric)
+                    for result_id, result in zip(result_ids, chunk, strict=True)
+                    for metric in result.metrics
+                ],
+            )
+            if commit_each_chunk:
+                conn.commit()
 
     def save_multiturn_run(
         self,
@@ -338,43 +546,37 @@ class BaseSQLStorageAdapter(ABC):
                 conn, self.queries.insert_multiturn_run(), self._multiturn_run_params(run)
             )
 
-            for conversation in conversations:
-                self._execute(
-                    conn,
-                    self.queries.insert_multiturn_conversation(),
-                    self._multiturn_conversation_params(conversation),
-                )
+            self._executemany(
+                conn,
+                self.queries.insert_multiturn_conversation(),
+                [
+                    self._multiturn_conversation_params(conversation)
+                    for conversation in conversations
+                ],
+            )
 
-            for turn in turn_results:
-                cursor = self._execute(
-                    conn,
-                    self.queries.insert_multiturn_turn(),
-                    self._multiturn_turn_params(run.run_id, turn),
-                )
-                turn_result_id = self._fetch_lastrowid(cursor)
-                for metric_name, score in (turn.metrics or {}).items():
-                    threshold = None
-                    if metric_thresholds and metric_name in metric_thresholds:
-                        threshold = metric_thresholds[metric_name]
-                    self._execute(
-                        conn,
-                        self.queries.insert_multiturn_metric_score(),
-                        self._multiturn_metric_params(
-                            turn_result_id, metric_name, score, threshold
-                        ),
+            turn_result_ids = self._insert_many_returning_ids(
+                conn,
+                [self._multiturn_turn_params(run.run_id, turn) for turn in turn_results],
+                bulk_query=self.queries.insert_multiturn_turns_bulk,
+                single_query=self.queries.insert_multiturn_turn(),
+            )
+            thresholds = metric_thresholds or {}
+            self._executemany(
+                conn,
+                self.queries.insert_multiturn_metric_score(),
+                [
+                    self._multiturn_metric_params(
+                        turn_result_id, metric_name, score, thresholds.get(metric_name)
                     )
+                    for turn_result_id, turn in zip(turn_result_ids, turn_results, strict=True)
+                    for metric_name, score in (turn.metrics or {}).items()
+                ],
+            )
 
             conn.commit()
             return run.run_id
 
-    def _insert_test_case(self, conn, run_id: str, result: TestCaseResult) -> int:
-        cursor = self._execute(
-            conn,
-            self.queries.insert_test_case(),
-            self._test_case_params(run_id, result),
-        )
-        return self._fetch_lastrowid(cursor)
-
     def get_run(self, run_id: str, project_id: str | None = None) -> EvaluationRun:
         with self._get_connection() as conn:
             cursor = self._execute(conn, self.queries.select_run(), (run_id,))
@@ -393,7 +595,13 @@ class BaseSQLStorageAdapter(ABC):
                 conn, self.queries.select_test_case_results(), (run_id,)
             ).fetchall()
 
-            results = [self._row_to_test_case(conn, row) for row in result_rows]
+            metrics_by_result = (
+                self._fetch_metric_scores_by_run(conn, run_id) if result_rows else {}
+            )
+            results = [
+                self._row_to_test_case(row, metrics_by_result.get(row["id"], []))
+                for row in result_rows
+            ]
 
             return EvaluationRun(
                 run_id=run_row["run_id"],
@@ -451,6 +659,93 @@ class BaseSQLStorageAdapter(ABC):
             return [self.get_run(run_id) for run_id in run_ids]
         return [self.get_run(run_id, project_id=project_id) for run_id in run_ids]
 
+    def list_run_summaries(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        *,
+        after: tuple[datetime, str] | None = None,
+        dataset_name: str | None = None,
+        model_name: str | None = None,
+        project_id: str | None = None,
+    ) -> list[EvaluationRunSummary]:
+        """List run summaries from aggregate SQL without hydrating test cases.
+
+        Prefer keyset pagination: pass the ``(started_at, run_id)`` of the last
+        summary of the previous page as ``after``; ``offset`` is kept for callers
+        that page by position. Each page costs three queries regardless of how
+        many test cases the runs contain.
+        """
+        placeholder = self.queries.placeholder
+        query = self.queries.list_run_summaries_base()
+        params: list[Any] = []
+
+        if dataset_name:
+            query += f" AND dataset_name = {placeholder}"
+            params.append(dataset_name)
+        if model_name:
+            query += f" AND model_name = {placeholder}"
+            params.append(model_name)
+        if project_id is not None:
+            query += f" AND project_id = {placeholder}"
+            params.append(project_id)
+        if after is not None:
+            after_started_at, after_run_id = after
+            started_at = self._serialize_datetime(after_started_at)
+            query += (
+                f" AND (started_at < {placeholder}"
+                f" OR (started_at = {placeholder} AND run_id < {placeholder}))"
+            )
+            params.extend([started_at, started_at, after_run_id])
+
+        query += self.queries.list_run_summaries_ordering()
+        params.extend([limit, offset])
+
+        with self._get_connection() as conn:
+            run_rows = self._execute(conn, query, params).fetchall()
+            if not run_rows:
+                return []
+            run_ids = [str(row["run_id"]) for row in run_rows]
+
+            counts = {
+                str(row["run_id"]): row
+                for row in self._execute(
+                    conn, self.queries.select_run_case_counts(len(run_ids)), run_ids
+                ).fetchall()
+            }
+            averages: dict[str, dict[str, float]] = {}
+            for row in self._execute(
+                conn, self.queries.select_run_metric_averages(len(run_ids)), run_ids
+            ).fetchall():
+                avg_score = self._maybe_float(self._row_value(row, "avg_score"))
+                if avg_score is not None:
+                    averages.setdefault(str(row["run_id"]), {})[row["metric_name"]] = avg_score
+
+        summaries: list[EvaluationRunSummary] = []
+        for row in run_rows:
+            run_id = str(row["run_id"])
+            count_row = counts.get(run_id)
+            summaries.append(
+                EvaluationRunSummary(
+                    run_id=run_id,
+                    dataset_name=row["dataset_name"],
+                    dataset_version=row["dataset_version"] or "",
+                    model_name=row["model_name"],
+                    started_at=self._deserialize_datetime(row["started_at"]) or datetime.now(),
+                    finished_at=self._deserialize_datetime(row["finished_at"]),
+                    project_id=self._row_value(row, "project_id"),
+                    metrics_evaluated=self._deserialize_json(row["metrics_evaluated"]) or [],
+                    thresholds=self._deserialize_json(row["thresholds"]) or {},
+                    total_tokens=row["total_tokens"] or 0,
+                    total_cost_usd=self._maybe_float(row["total_cost_usd"]),
+                    tracker_metadata=self._deserialize_json(row["metadata"]) or {},
+                    total_test_cases=int(count_row["total_test_cases"] or 0) if count_row else 0,
+                    passed_test_cases=int(count_row["passed_test_cases"] or 0) if count_row else 0,
+                    avg_metric_scores=averages.get(run_id, {}),
+                )
+            )
+        return summaries
+
     def delete_run(self, run_id: str) -> bool:
         with self._get_connection() as conn:
             cursor = self._execute(conn, self.queries.delete_run(), (run_id,))
@@ -682,6 +977,39 @@ class BaseSQLStorageAdapter(ABC):
                 "updated_at": self._row_value(row, "updated_at"),
             }
 
+    def save_analysis_cache_entry(
+        self,
+        cache_key: str,
+        run_id: str,
+        analysis_type: str,
+        payload: bytes,
+    ) -> None:
+        """Store a serialized analysis result; rows are removed with their run."""
+        now = self._serialize_datetime(datetime.now())
+        with self._get_connection() as conn:
+            self._execute(
+                conn,
+                self.queries.upsert_analysis_cache_entry(),
+                (cache_key, run_id, analysis_type, payload, now),
+            )
+            conn.commit()
+
+    def get_analysis_cache_entry(self, cache_key: str) -> bytes | None:
+        with self._get_connection() as conn:
+            row = self._execute(
+                conn, self.queries.select_analysis_cache_entry(), (cache_key,)
+            ).fetchone()
+            if not row:
+                return None
+            payload = self._row_value(row, "payload")
+            return bytes(payload) if payload is not None else None
+
+    def delete_analysis_cache_entries(self, run_id: str) -> int:
+        with self._get_connection() as conn:
+            cursor = self._execute(conn, self.queries.delete_analysis_cache_entries(), (run_id,))
+            conn.commit()
+            return cursor.rowcount if cursor.rowcount is not None else 0
+
     # Serialization helpers --------------------------------------------
 
     def _run_params(self, run: EvaluationRun) -> Sequence[Any]:
@@ -707,6 +1035,21 @@ class BaseSQLStorageAdapter(ABC):
             run.project_id or DEFAULT_PROJECT_ID,
         )
 
+    def _run_progress_params(self, run: EvaluationRun) -> Sequence[Any]:
+        return (
+            run.model_name,
+            self._serialize_datetime(run.finished_at),
+            run.total_tokens,
+            run.total_cost_usd,
+            run.pass_rate,
+            self._serialize_json(run.metrics_evaluated),
+            self._serialize_json(run.thresholds),
+            self._serialize_json(run.tracker_trace_ids) if run.tracker_trace_ids else None,
+            self._serialize_json(run.tracker_metadata),
+            self._serialize_json(run.retrieval_metadata),
+            run.run_id,
+        )
+
     def _test_case_params(self, run_id: str, result: TestCaseResult) -> Sequence[Any]:
         return (
             run_id,
@@ -782,9 +1125,7 @@ class BaseSQLStorageAdapter(ABC):
     ) -> Sequence[Any]:
         return (turn_result_id, metric_name, score, threshold)
 
-    def _row_to_test_case(self, conn, row) -> TestCaseResult:
-        result_id = row["id"]
-        metrics = self._fetch_metric_scores(conn, result_id)
+    def _row_to_test_case(self, row, metrics: list[MetricScore]) -> TestCaseResult:
         return TestCaseResult(
             test_case_id=row["test_case_id"],
             metrics=metrics,
@@ -816,18 +1157,21 @@ class BaseSQLStorageAdapter(ABC):
             created_at=created_at,
         )
 
-    def _fetch_metric_scores(self, conn, result_id: int) -> list[MetricScore]:
-        rows = self._execute(conn, self.queries.select_metric_scores(), (result_id,)).fetchall()
+    def _fetch_metric_scores_by_run(self, conn, run_id: str) -> dict[Any, list[MetricScore]]:
+        """Load all metric scores of a run in one query, grouped by result id."""
+        rows = self._execute(conn, self.queries.select_metric_scores_by_run(), (run_id,))
         metric_column = self.queries.metric_name_column
-        return [
-            MetricScore(
-                name=self._resolve_metric_name(row, metric_column),
-                score=self._maybe_float(self._row_value(row, "score")) or 0.0,
-                threshold=self._maybe_float(self._row_value(row, "threshold")) or 0.7,
-                reason=self._row_value(row, "reason"),
+        grouped: dict[Any, list[MetricScore]] = {}
+        for row in rows.fetchall():
+            grouped.setdefault(self._row_value(row, "result_id"), []).append(
+                MetricScore(
+                    name=self._resolve_metric_name(row, metric_column),
+                    score=self._maybe_float(self._row_value(row, "score")) or 0.0,
+                    threshold=self._maybe_float(self._row_value(row, "threshold")) or 0.7,
+                    reason=self._row_value(row, "reason"),
+                )
             )
-            for row in rows
-        ]
+        return grouped
 
     def _resolve_metric_name(self, row, fallback_column: str) -> str:
         name = self._row_value(row, "metric_name")
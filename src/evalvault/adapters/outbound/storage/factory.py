@@ -4,7 +4,9 @@ import logging
 from pathlib import Path
 
 from evalvault.adapters.outbound.storage.postgres_adapter import PostgreSQLStorageAdapter
+from evalvault.adapters.outbound.storage.postgres_pool import PostgresPoolConfig
 from evalvault.adapters.outbound.storage.sqlite_adapter import SQLiteStorageAdapter
+from evalvault.adapters.outbound.storage.sqlite_tuning import SQLiteTuning
 from evalvault.config.settings import Settings
 from evalvault.ports.outbound.storage_port import StoragePort
 
@@ -32,7 +34,9 @@ def build_storage_adapter(
         resolved_db_path = resolved_settings.evalvault_db_path
         if resolved_db_path is None:
             raise RuntimeError("SQLite backend selected but evalvault_db_path is not set.")
-        return SQLiteStorageAdapter(db_path=resolved_db_path)
+        return SQLiteStorageAdapter(
+            db_path=resolved_db_path, tuning=SQLiteTuning.from_settings(resolved_settings)
+        )
 
     conn_string = resolved_settings.postgres_connection_string
     if not conn_string:
@@ -44,7 +48,10 @@ def build_storage_adapter(
         conn_string = f"host={host} port={port} dbname={database} user={user} password={password}"
 
     try:
-        return PostgreSQLStorageAdapter(connection_string=conn_string)
+        return PostgreSQLStorageAdapter(
+            connection_string=conn_string,
+            pool_config=PostgresPoolConfig.from_settings(resolved_settings),
+        )
     except Exception as exc:
         if not fallback_to_sqlite:
             raise
@@ -52,7 +59,9 @@ def build_storage_adapter(
         resolved_db_path = resolved_settings.evalvault_db_path
         if resolved_db_path is None:
             raise
-        return SQLiteStorageAdapter(db_path=resolved_db_path)
+        return SQLiteStorageAdapter(
+            db_path=resolved_db_path, tuning=SQLiteTuning.from_settings(resolved_settings)
+        )
 
 
 __all__ = ["build_storage_adapter"]
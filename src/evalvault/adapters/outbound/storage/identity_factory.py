@@ -5,12 +5,18 @@ from evalvault.config.settings import Settings
 from evalvault.ports.outbound.identity_port import IdentityStoragePort
 
 
-def _build_postgres_identity_storage(connection_string: str) -> IdentityStoragePort:
+def _build_postgres_identity_storage(
+    connection_string: str, settings: Settings | None = None
+) -> IdentityStoragePort:
     from evalvault.adapters.outbound.storage.postgres_identity import (
         PostgresIdentityStorageAdapter,
     )
+    from evalvault.adapters.outbound.storage.postgres_pool import PostgresPoolConfig
 
-    return PostgresIdentityStorageAdapter(connection_string=connection_string)
+    pool_config = PostgresPoolConfig.from_settings(settings) if settings is not None else None
+    return PostgresIdentityStorageAdapter(
+        connection_string=connection_string, pool_config=pool_config
+    )
 
 
 def build_identity_storage_adapter(settings: Settings | None = None) -> IdentityStoragePort:
@@ -28,7 +34,7 @@ def build_identity_storage_adapter(settings: Settings | None = None) -> Identity
         user = resolved_settings.postgres_user or "postgres"
         password = resolved_settings.postgres_password or ""
         conn_string = f"host={host} port={port} dbname={database} user={user} password={password}"
-    return _build_postgres_identity_storage(conn_string)
+    return _build_postgres_identity_storage(conn_string, resolved_settings)
 
 
 __all__ = ["build_identity_storage_adapter"]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from evalvault.adapters.outbound.storage.sqlite_job_queue import SqliteJobQueueAdapter
+from evalvault.config.settings import Settings
+from evalvault.ports.outbound.job_queue_port import JobQueuePort
+
+
+def build_job_queue_adapter(settings: Settings | None = None) -> JobQueuePort:
+    """Build the evaluation job queue on the configured persistence backend."""
+    resolved_settings = settings or Settings()
+    backend = getattr(resolved_settings, "db_backend", "postgres")
+    if backend == "sqlite":
+        return SqliteJobQueueAdapter(db_path=resolved_settings.evalvault_db_path)
+
+    from evalvault.adapters.outbound.storage.postgres_job_queue import PostgresJobQueueAdapter
+    from evalvault.adapters.outbound.storage.postgres_pool import (
+        PostgresPoolConfig,
+        build_postgres_conninfo,
+    )
+
+    return PostgresJobQueueAdapter(
+        connection_string=build_postgres_conninfo(resolved_settings),
+        pool_config=PostgresPoolConfig.from_settings(resolved_settings),
+    )
+
+
+__all__ = ["build_job_queue_adapter"]
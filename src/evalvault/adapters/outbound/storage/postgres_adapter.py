@@ -13,6 +13,10 @@ from psycopg.rows import dict_row
 
 from evalvault.adapters.outbound.analysis.pipeline_helpers import to_serializable
 from evalvault.adapters.outbound.storage.base_sql import BaseSQLStorageAdapter, SQLQueries
+from evalvault.adapters.outbound.storage.postgres_pool import (
+    PostgresPoolConfig,
+    get_connection_pool,
+)
 from evalvault.domain.entities.analysis import (
     AnalysisType,
     CorrelationInsight,
@@ -38,6 +42,7 @@ class PostgresQueries(SQLQueries):
             metric_name_column="name",
             test_case_returning_clause="RETURNING id",
             feedback_returning_clause="RETURNING id",
+            bulk_returning_clause="RETURNING id",
         )
 
     def upsert_regression_baseline(self) -> str:
@@ -55,6 +60,16 @@ class PostgresQueries(SQLQueries):
             updated_at = EXCLUDED.updated_at
         """
 
+    def upsert_analysis_cache_entry(self) -> str:
+        return """
+        INSERT INTO analysis_cache (
+            cache_key, run_id, analysis_type, payload, created_at
+        ) VALUES (%s, %s, %s, %s, %s)
+        ON CONFLICT (cache_key) DO UPDATE SET
+            payload = EXCLUDED.payload,
+            created_at = EXCLUDED.created_at
+        """
+
 
 class PostgreSQLStorageAdapter(BaseSQLStorageAdapter):
     """PostgreSQL 기반 평가 결과 저장 어댑터.
@@ -71,6 +86,7 @@ class PostgreSQLStorageAdapter(BaseSQLStorageAdapter):
         user: str = "postgres",
         password: str = "",
         connection_string: str | None = None,
+        pool_config: PostgresPoolConfig | None = None,
     ):
         """Initialize PostgreSQL storage adapter.
 
@@ -81,6 +97,8 @@ class PostgreSQLStorageAdapter(BaseSQLStorageAdapter):
             user: Database user (default: postgres)
             password: Database password
             connection_string: Full connection string (overrides other params if provided)
+            pool_config: Share long-lived connections through a psycopg pool
+                (default: connect per operation)
         """
         super().__init__(PostgresQueries())
         if connection_string:
@@ -89,7 +107,14 @@ class PostgreSQLStorageAdapter(BaseSQLStorageAdapter):
             self._conn_string = (
                 f"host={host} port={port} dbname={database} user={user} password={password}"
             )
+        # Schema bootstrap connects directly so an unreachable database fails fast
+        # instead of leaving a pool retrying in the background.
         self._init_schema()
+        self._pool = (
+            get_connection_pool(self._conn_string, pool_config, row_factory=dict_row)
+            if pool_config is not None
+            else None
+        )
 
     def _init_schema(self) -> None:
         """Initialize database schema from postgres_schema.sql."""
@@ -114,6 +139,10 @@ class PostgreSQLStorageAdapter(BaseSQLStorageAdapter):
 
     @contextmanager
     def _get_connection(self):
+        if self._pool is not None:
+            with self._pool.connection() as conn:
+                yield conn
+            return
         with psycopg.connect(self._conn_string, row_factory=dict_row) as conn:
             yield conn
 
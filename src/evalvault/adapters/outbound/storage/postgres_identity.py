@@ -13,6 +13,10 @@ from typing import Any
 import psycopg  # type: ignore[import-not-found]
 from psycopg.rows import dict_row  # type: ignore[import-not-found]
 
+from evalvault.adapters.outbound.storage.postgres_pool import (
+    PostgresPoolConfig,
+    get_connection_pool,
+)
 from evalvault.domain.entities.auth import ApiKey, Membership, Project, RefreshToken, Role, User
 
 _SCHEMA = """
@@ -116,6 +120,7 @@ class PostgresIdentityStorageAdapter:
         user: str = "postgres",
         password: str = "",
         connection_string: str | None = None,
+        pool_config: PostgresPoolConfig | None = None,
     ) -> None:
         if connection_string:
             self._conn_string = connection_string
@@ -123,10 +128,18 @@ class PostgresIdentityStorageAdapter:
             self._conn_string = (
                 f"host={host} port={port} dbname={database} user={user} password={password}"
             )
+        self._pool: Any = None
         self._ensure_schema()
+        # Identity lookups run on every authenticated request; share the pool.
+        if pool_config is not None:
+            self._pool = get_connection_pool(self._conn_string, pool_config, row_factory=dict_row)
 
     @contextmanager
     def _conn(self):
+        if self._pool is not None:
+            with self._pool.connection() as conn:
+                yield conn
+            return
         with psycopg.connect(self._conn_string, row_factory=dict_row) as conn:
             yield conn
 
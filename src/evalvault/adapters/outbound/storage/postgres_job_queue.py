@@ -0,0 +1,241 @@
+"""PostgreSQL-backed evaluation job queue.
+
+Implements ``JobQueuePort`` with the same table and semantics as the SQLite job
+queue, using JSONB/timestamptz columns. Claims take a transaction-scoped
+advisory lock so the per-project running count and the status flip are atomic
+across worker processes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import psycopg  # type: ignore[import-not-found]
+from psycopg.rows import dict_row  # type: ignore[import-not-found]
+from psycopg.types.json import Jsonb  # type: ignore[import-not-found]
+
+from evalvault.adapters.outbound.storage.postgres_pool import (
+    PostgresPoolConfig,
+    get_connection_pool,
+)
+from evalvault.domain.entities.job import EvaluationJob, JobStatus
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluation_jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    payload JSONB NOT NULL,
+    progress JSONB,
+    run_id TEXT,
+    error TEXT,
+    cancel_requested BOOLEAN NOT NULL DEFAULT FALSE,
+    worker_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL,
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ,
+    heartbeat_at TIMESTAMPTZ
+);
+CREATE INDEX IF NOT EXISTS idx_evaluation_jobs_status ON evaluation_jobs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_evaluation_jobs_project ON evaluation_jobs(project_id, status);
+"""
+
+# pg_advisory_xact_lock 키 (job claim 직렬화)
+_CLAIM_LOCK_KEY = 0x65766A6F62
+
+_CLAIM_CANDIDATE = """
+SELECT job_id FROM evaluation_jobs AS j
+WHERE j.status = 'queued'
+  AND (
+      SELECT COUNT(*) FROM evaluation_jobs AS r
+      WHERE r.status = 'running' AND r.project_id = j.project_id
+  ) < %s
+ORDER BY j.created_at, j.job_id
+LIMIT 1
+"""
+
+
+class PostgresJobQueueAdapter:
+    """PostgreSQL implementation of ``JobQueuePort``."""
+
+    def __init__(
+        self,
+        *,
+        connection_string: str,
+        pool_config: PostgresPoolConfig | None = None,
+    ) -> None:
+        self._conn_string = connection_string
+        self._pool: Any = None
+        self._ensure_schema()
+        # 진행 상황 갱신/재접속 폴링이 잦으므로 풀을 공유
+        if pool_config is not None:
+            self._pool = get_connection_pool(self._conn_string, pool_config, row_factory=dict_row)
+
+    @contextmanager
+    def _conn(self):
+        if self._pool is not None:
+            with self._pool.connection() as conn:
+                yield conn
+            return
+        with psycopg.connect(self._conn_string, row_factory=dict_row) as conn:
+            yield conn
+
+    def _ensure_schema(self) -> None:
+        with self._conn() as conn:
+            conn.execute(_SCHEMA)
+
+    def enqueue(self, job: EvaluationJob) -> str:
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO evaluation_jobs (job_id, kind, project_id, status, payload, progress,"
+                " run_id, error, cancel_requested, worker_id, attempts, created_at)"
+                " VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+                (
+                    job.job_id,
+                    job.kind,
+                    job.project_id,
+                    job.status.value,
+                    Jsonb(job.payload),
+                    Jsonb(job.progress),
+                    job.run_id,
+                    job.error,
+                    job.cancel_requested,
+                    job.worker_id,
+                    job.attempts,
+                    job.created_at,
+                ),
+            )
+        return job.job_id
+
+    def get_job(self, job_id: str) -> EvaluationJob | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT * FROM evaluation_jobs WHERE job_id = %s", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(
+        self,
+        *,
+        project_id: str | None = None,
+        statuses: Iterable[JobStatus] | None = None,
+        limit: int = 50,
+    ) -> list[EvaluationJob]:
+        query = "SELECT * FROM evaluation_jobs WHERE 1=1"
+        params: list[Any] = []
+        if project_id is not None:
+            query += " AND project_id = %s"
+            params.append(project_id)
+        status_values = [JobStatus(status).value for status in statuses or ()]
+        if status_values:
+            query += " AND status = ANY(%s)"
+            params.append(status_values)
+        query += " ORDER BY created_at DESC, job_id DESC LIMIT %s"
+        params.append(limit)
+        with self._conn() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def claim_next(self, worker_id: str, *, max_per_project: int) -> EvaluationJob | None:
+        with self._conn() as conn, conn.transaction():
+            conn.execute("SELECT pg_advisory_xact_lock(%s)", (_CLAIM_LOCK_KEY,))
+            row = conn.execute(_CLAIM_CANDIDATE, (max(1, max_per_project),)).fetchone()
+            if row is None:
+                return None
+            claimed = conn.execute(
+                "UPDATE evaluation_jobs SET status = 'running', worker_id = %s,"
+                " attempts = attempts + 1, started_at = now(), heartbeat_at = now()"
+                " WHERE job_id = %s RETURNING *",
+                (worker_id, row["job_id"]),
+            ).fetchone()
+        return self._row_to_job(claimed)
+
+    def update_progress(self, job_id: str, progress: dict[str, Any] | None = None) -> None:
+        with self._conn() as conn:
+            if progress is None:
+                conn.execute(
+                    "UPDATE evaluation_jobs SET heartbeat_at = now() WHERE job_id = %s",
+                    (job_id,),
+                )
+            else:
+                conn.execute(
+                    "UPDATE evaluation_jobs SET progress = %s, heartbeat_at = now()"
+                    " WHERE job_id = %s",
+                    (Jsonb(progress), job_id),
+                )
+
+    def finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        *,
+        run_id: str | None = None,
+        error: str | None = None,
+    ) -> bool:
+        with self._conn() as conn:
+            cursor = conn.execute(
+                "UPDATE evaluation_jobs SET status = %s, run_id = COALESCE(%s, run_id),"
+                " error = %s, finished_at = now() WHERE job_id = %s AND status = 'running'",
+                (JobStatus(status).value, run_id, error, job_id),
+            )
+        return (cursor.rowcount or 0) > 0
+
+    def request_cancel(self, job_id: str) -> EvaluationJob | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "UPDATE evaluation_jobs SET cancel_requested = TRUE,"
+                " status = CASE WHEN status = 'queued' THEN 'cancelled' ELSE status END,"
+                " finished_at = CASE WHEN status = 'queued' THEN now() ELSE finished_at END"
+                " WHERE job_id = %s RETURNING *",
+                (job_id,),
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def requeue_stale(self, stale_after_seconds: float, *, max_attempts: int) -> int:
+        cutoff = datetime.now(UTC) - timedelta(seconds=stale_after_seconds)
+        with self._conn() as conn, conn.transaction():
+            conn.execute(
+                "UPDATE evaluation_jobs SET status = 'failed', finished_at = now(),"
+                " error = 'Worker stopped responding too many times'"
+                " WHERE status = 'running' AND heartbeat_at < %s AND attempts >= %s",
+                (cutoff, max_attempts),
+            )
+            cursor = conn.execute(
+                "UPDATE evaluation_jobs SET status = 'queued', worker_id = NULL"
+                " WHERE status = 'running' AND heartbeat_at < %s AND NOT cancel_requested",
+                (cutoff,),
+            )
+            conn.execute(
+                "UPDATE evaluation_jobs SET status = 'cancelled', finished_at = now()"
+                " WHERE status = 'running' AND heartbeat_at < %s AND cancel_requested",
+                (cutoff,),
+            )
+        return cursor.rowcount or 0
+
+    @staticmethod
+    def _row_to_job(row: dict[str, Any]) -> EvaluationJob:
+        return EvaluationJob(
+            job_id=row["job_id"],
+            kind=row["kind"],
+            project_id=row["project_id"],
+            status=JobStatus(row["status"]),
+            payload=dict(row["payload"] or {}),
+            progress=dict(row["progress"] or {}),
+            run_id=row["run_id"],
+            error=row["error"],
+            cancel_requested=bool(row["cancel_requested"]),
+            worker_id=row["worker_id"],
+            attempts=int(row["attempts"]),
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            heartbeat_at=row["heartbeat_at"],
+        )
+
+
+__all__ = ["PostgresJobQueueAdapter"]
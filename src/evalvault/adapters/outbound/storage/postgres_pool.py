@@ -0,0 +1,245 @@
+"""Shared psycopg connection pools for the PostgreSQL adapters.
+
+Every PostgreSQL adapter used to call ``psycopg.connect`` per operation, so each
+API request paid a TCP + auth handshake (often several). Pools are shared per
+``(conninfo, row factory, config)`` so the storage, identity and domain-memory
+adapters built for the same database reuse long-lived connections.
+
+``psycopg_pool`` is optional (``psycopg[pool]``); without it the adapters keep
+their per-operation connects.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from evalvault.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PostgresPoolConfig:
+    """Connection pool sizing and connection options."""
+
+    min_size: int = 1
+    max_size: int = 10
+    timeout_seconds: float = 30.0
+    max_idle_seconds: float = 600.0
+    health_check: bool = True
+    prepare_threshold: int | None = 5
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> PostgresPoolConfig | None:
+        """Return the pool config, or None when pooling is disabled or unavailable."""
+        if not getattr(settings, "postgres_pool_enabled", False) or not pooling_available():
+            return None
+        max_size = max(1, int(settings.postgres_pool_max_size))
+        return cls(
+            min_size=min(max(0, int(settings.postgres_pool_min_size)), max_size),
+            max_size=max_size,
+            timeout_seconds=float(settings.postgres_pool_timeout_seconds),
+            max_idle_seconds=float(settings.postgres_pool_max_idle_seconds),
+            health_check=bool(settings.postgres_pool_health_check),
+            prepare_threshold=settings.postgres_prepare_threshold,
+        )
+
+
+def build_postgres_conninfo(settings: Settings) -> str:
+    """Connection string from settings, matching the storage factories."""
+    if settings.postgres_connection_string:
+        return settings.postgres_connection_string
+    host = settings.postgres_host or "localhost"
+    user = settings.postgres_user or "postgres"
+    password = settings.postgres_password or ""
+    return (
+        f"host={host} port={settings.postgres_port} dbname={settings.postgres_database} "
+        f"user={user} password={password}"
+    )
+
+
+def pooling_available() -> bool:
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_PoolKey = tuple[str, str, PostgresPoolConfig]
+
+_pools: dict[_PoolKey, Any] = {}
+_async_pools: dict[_PoolKey, Any] = {}
+_pools_lock = threading.Lock()
+
+
+def _row_factory_name(row_factory: Callable[..., Any] | None) -> str:
+    return getattr(row_factory, "__name__", "tuple_row") if row_factory else "tuple_row"
+
+
+def _pool_kwargs(
+    config: PostgresPoolConfig, row_factory: Callable[..., Any] | None
+) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {"prepare_threshold": config.prepare_threshold}
+    if row_factory is not None:
+        kwargs["row_factory"] = row_factory
+    return kwargs
+
+
+def get_connection_pool(
+    conninfo: str,
+    config: PostgresPoolConfig,
+    *,
+    row_factory: Callable[..., Any] | None = None,
+) -> Any:
+    """Return the process-wide ``psycopg_pool.ConnectionPool`` for a database."""
+    key = (conninfo, _row_factory_name(row_factory), config)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            from psycopg_pool import ConnectionPool
+
+            pool = ConnectionPool(
+                conninfo,
+                min_size=config.min_size,
+                max_size=config.max_size,
+                timeout=config.timeout_seconds,
+                max_idle=config.max_idle_seconds,
+                kwargs=_pool_kwargs(config, row_factory),
+                check=ConnectionPool.check_connection if config.health_check else None,
+                name=f"evalvault-{len(_pools) + 1}",
+                open=True,
+            )
+            _pools[key] = pool
+        return pool
+
+
+async def get_async_connection_pool(
+    conninfo: str,
+    config: PostgresPoolConfig,
+    *,
+    row_factory: Callable[..., Any] | None = None,
+) -> Any:
+    """Return the shared ``AsyncConnectionPool`` for async API routes.
+
+    Must be awaited from the event loop that will use it (the API lifespan loop).
+    """
+    key = (conninfo, _row_factory_name(row_factory), config)
+    pool = _async_pools.get(key)
+    if pool is None:
+        from psycopg_pool import AsyncConnectionPool
+
+        pool = AsyncConnectionPool(
+            conninfo,
+            min_size=config.min_size,
+            max_size=config.max_size,
+            timeout=config.timeout_seconds,
+            max_idle=config.max_idle_seconds,
+            kwargs=_pool_kwargs(config, row_factory),
+            check=AsyncConnectionPool.check_connection if config.health_check else None,
+            name=f"evalvault-async-{len(_async_pools) + 1}",
+            open=False,
+        )
+        _async_pools[key] = pool
+        await pool.open()
+    return pool
+
+
+class PooledConnection:
+    """Checked-out pool connection whose ``close()`` returns it to the pool.
+
+    Lets code written as ``conn = connect(); try: ... finally: conn.close()``
+    run unchanged on top of a pool.
+    """
+
+    def __init__(self, pool: Any, conn: Any) -> None:
+        self._pool = pool
+        self._conn: Any | None = conn
+
+    def __getattr__(self, name: str) -> Any:
+        if self._conn is None:
+            raise AttributeError(f"connection already returned to the pool: {name}")
+        return getattr(self._conn, name)
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool.putconn(conn)
+
+    def __enter__(self) -> PooledConnection:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        conn = self._conn
+        try:
+            if conn is not None and not conn.closed:
+                if exc_type is None:
+                    conn.commit()
+                else:
+                    conn.rollback()
+        finally:
+            self.close()
+
+
+def pool_stats() -> list[dict[str, Any]]:
+    """Saturation and wait-time counters for every shared pool.
+
+    ``requests_waiting`` and ``pool_available`` show saturation right now;
+    ``requests_wait_ms`` / ``requests_num`` give the mean checkout wait.
+    """
+    with _pools_lock:
+        pools = [("sync", pool) for pool in _pools.values()]
+    pools.extend(("async", pool) for pool in list(_async_pools.values()))
+    stats: list[dict[str, Any]] = []
+    for kind, pool in pools:
+        entry: dict[str, Any] = {"name": pool.name, "kind": kind, **pool.get_stats()}
+        requests = entry.get("requests_num", 0)
+        entry["requests_wait_ms_avg"] = (
+            entry.get("requests_wait_ms", 0) / requests if requests else 0.0
+        )
+        stats.append(entry)
+    return stats
+
+
+def close_connection_pools() -> None:
+    """Close every shared sync pool (registered with ``atexit``)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        try:
+            pool.close()
+        except Exception as exc:  # pragma: no cover - best effort on shutdown
+            logger.debug("Failed to close connection pool %s: %s", pool.name, exc)
+
+
+async def close_async_connection_pools() -> None:
+    pools = list(_async_pools.values())
+    _async_pools.clear()
+    for pool in pools:
+        try:
+            await pool.close()
+        except Exception as exc:  # pragma: no cover - best effort on shutdown
+            logger.debug("Failed to close async connection pool %s: %s", pool.name, exc)
+
+
+atexit.register(close_connection_pools)
+
+
+__all__ = [
+    "PooledConnection",
+    "PostgresPoolConfig",
+    "build_postgres_conninfo",
+    "close_async_connection_pools",
+    "close_connection_pools",
+    "get_async_connection_pool",
+    "get_connection_pool",
+    "pool_stats",
+    "pooling_available",
+]
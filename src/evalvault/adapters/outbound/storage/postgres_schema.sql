@@ -247,6 +247,17 @@ CREATE TABLE IF NOT EXISTS analysis_reports (
 CREATE INDEX IF NOT EXISTS idx_reports_run_id ON analysis_reports(run_id);
 CREATE INDEX IF NOT EXISTS idx_reports_experiment_id ON analysis_reports(experiment_id);
 
+-- Analysis cache table
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    cache_key VARCHAR(255) PRIMARY KEY,
+    run_id UUID NOT NULL REFERENCES evaluation_runs(run_id) ON DELETE CASCADE,
+    analysis_type VARCHAR(50) NOT NULL,
+    payload BYTEA NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_analysis_cache_run_id ON analysis_cache(run_id);
+
 -- Ops reports table
 CREATE TABLE IF NOT EXISTS ops_reports (
     report_id UUID PRIMARY KEY,
@@ -275,6 +275,18 @@ CREATE TABLE IF NOT EXISTS analysis_reports (
 CREATE INDEX IF NOT EXISTS idx_reports_run_id ON analysis_reports(run_id);
 CREATE INDEX IF NOT EXISTS idx_reports_experiment_id ON analysis_reports(experiment_id);
 
+-- Analysis cache table (API 서버 분석 결과 영속 캐시, run 삭제 시 함께 삭제)
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    cache_key TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    analysis_type TEXT NOT NULL,  -- 'bundle'
+    payload BLOB NOT NULL,  -- Serialized analysis result
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (run_id) REFERENCES evaluation_runs(run_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_analysis_cache_run_id ON analysis_cache(run_id);
+
 -- Ops reports table
 CREATE TABLE IF NOT EXISTS ops_reports (
     report_id TEXT PRIMARY KEY,
@@ -13,6 +13,12 @@ from typing import TYPE_CHECKING, Any, cast
 
 from evalvault.adapters.outbound.analysis.pipeline_helpers import to_serializable
 from evalvault.adapters.outbound.storage.base_sql import BaseSQLStorageAdapter, SQLQueries
+from evalvault.adapters.outbound.storage.sqlite_tuning import (
+    SQLiteTuning,
+    SQLiteWriteQueue,
+    ThreadLocalConnections,
+    route_writes_through,
+)
 from evalvault.domain.entities.analysis import (
     AnalysisType,
     CorrelationInsight,
@@ -35,6 +41,12 @@ if TYPE_CHECKING:
 
 
 class SQLiteQueries(SQLQueries):
+    def __init__(self) -> None:
+        # RETURNING is available from SQLite 3.35; older builds insert row by row.
+        super().__init__(
+            bulk_returning_clause="RETURNING id" if sqlite3.sqlite_version_info >= (3, 35) else "",
+        )
+
     def upsert_regression_baseline(self) -> str:
         return """
         INSERT OR REPLACE INTO regression_baselines (
@@ -43,6 +55,13 @@ class SQLiteQueries(SQLQueries):
         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """
 
+    def upsert_analysis_cache_entry(self) -> str:
+        return """
+        INSERT OR REPLACE INTO analysis_cache (
+            cache_key, run_id, analysis_type, payload, created_at
+        ) VALUES (?, ?, ?, ?, ?)
+        """
+
 
 class SQLiteStorageAdapter(BaseSQLStorageAdapter):
     """SQLite 기반 평가 결과 저장 어댑터.
@@ -50,16 +69,59 @@ class SQLiteStorageAdapter(BaseSQLStorageAdapter):
     Implements StoragePort using SQLite database for local persistence.
     """
 
-    def __init__(self, db_path: str | Path = "data/db/evalvault.db"):
+    # Routed through the writer queue in high-throughput mode.
+    _QUEUED_WRITE_METHODS = (
+        "save_run",
+        "save_multiturn_run",
+        "delete_run",
+        "update_run_metadata",
+        "save_run_cluster_map",
+        "delete_run_cluster_map",
+        "save_feedback",
+        "set_regression_baseline",
+        "save_prompt_set",
+        "link_prompt_set_to_run",
+        "save_experiment",
+        "update_experiment",
+        "save_analysis",
+        "save_analysis_result",
+        "delete_analysis",
+        "save_nlp_analysis",
+        "save_dataset_feature_analysis",
+        "save_pipeline_result",
+        "save_analysis_report",
+        "save_ops_report",
+        "save_stage_event",
+        "save_stage_events",
+        "save_stage_metrics",
+        "save_benchmark_run",
+        "delete_benchmark_run",
+        "save_analysis_cache_entry",
+        "delete_analysis_cache_entries",
+    )
+
+    def __init__(
+        self,
+        db_path: str | Path = "data/db/evalvault.db",
+        *,
+        tuning: SQLiteTuning | None = None,
+    ):
         """Initialize SQLite storage adapter.
 
         Args:
             db_path: Path to SQLite database file (default: data/db/evalvault.db)
+            tuning: High-throughput mode (WAL, per-thread connections, writer queue);
+                None keeps a fresh connection per call on the default journal
         """
         super().__init__(SQLiteQueries())
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._tuning = tuning
+        self._connections = ThreadLocalConnections(self._connect) if tuning else None
+        self._writer = SQLiteWriteQueue() if tuning and tuning.writer_queue else None
         self._init_db()
+        if self._writer is not None:
+            route_writes_through(self._writer, self, self._QUEUED_WRITE_METHODS)
 
     def _init_db(self) -> None:
         """Initialize database schema from schema.sql."""
@@ -68,6 +130,8 @@ class SQLiteStorageAdapter(BaseSQLStorageAdapter):
             schema_sql = f.read()
 
         conn = sqlite3.connect(self.db_path)
+        if self._tuning is not None:
+            self._tuning.apply(conn)
         conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
         conn.executescript(schema_sql)
         self._apply_migrations(conn)
@@ -76,15 +140,26 @@ class SQLiteStorageAdapter(BaseSQLStorageAdapter):
 
     def _connect(self) -> Any:
         """Create a DB-API connection with the expected options."""
+        if self._tuning is not None:
+            return self._tuning.connect(self.db_path, row_factory=sqlite3.Row)
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         return conn
 
     def _get_connection(self) -> AbstractContextManager[sqlite3.Connection]:
+        if self._connections is not None:
+            return self._connections.connection()
         conn = self._connect()
         return closing(cast(sqlite3.Connection, conn))
 
+    def close(self) -> None:
+        """Drain the writer queue and close cached connections (high-throughput mode)."""
+        if self._writer is not None:
+            self._writer.close()
+        if self._connections is not None:
+            self._connections.close_all()
+
     def _apply_migrations(self, conn: Any) -> None:
         """Apply schema migrations for legacy databases."""
         conn = cast(Any, conn)
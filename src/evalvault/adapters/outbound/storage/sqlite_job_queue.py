@@ -0,0 +1,252 @@
+"""SQLite-backed evaluation job queue.
+
+Implements ``JobQueuePort`` over a SQLite file. The ``evaluation_jobs`` table is
+created idempotently and lives in the same database file as the evaluation
+tables. Claims run inside ``BEGIN IMMEDIATE`` so concurrent workers never take
+the same job or exceed the per-project limit. Datetimes are ISO-8601 strings
+(UTC), which keeps lexical comparison valid for stale-heartbeat checks.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from evalvault.domain.entities.job import EvaluationJob, JobStatus
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluation_jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    progress TEXT,
+    run_id TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    heartbeat_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_evaluation_jobs_status ON evaluation_jobs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_evaluation_jobs_project ON evaluation_jobs(project_id, status);
+"""
+
+_CLAIM_CANDIDATE = """
+SELECT job_id FROM evaluation_jobs AS j
+WHERE j.status = 'queued'
+  AND (
+      SELECT COUNT(*) FROM evaluation_jobs AS r
+      WHERE r.status = 'running' AND r.project_id = j.project_id
+  ) < ?
+ORDER BY j.created_at, j.job_id
+LIMIT 1
+"""
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+class SqliteJobQueueAdapter:
+    """SQLite implementation of ``JobQueuePort``."""
+
+    def __init__(self, db_path: str | Path = "data/db/evalvault.db") -> None:
+        self._db_path = str(db_path)
+        parent = Path(self._db_path).parent
+        if str(parent) not in ("", "."):
+            parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_schema()
+
+    @contextmanager
+    def _conn(self, *, immediate: bool = False):
+        # autocommit 모드에서 트랜잭션을 직접 관리 (claim은 쓰기 잠금을 먼저 획득)
+        conn = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _ensure_schema(self) -> None:
+        conn = sqlite3.connect(self._db_path, timeout=30)
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def enqueue(self, job: EvaluationJob) -> str:
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO evaluation_jobs (job_id, kind, project_id, status, payload, progress,"
+                " run_id, error, cancel_requested, worker_id, attempts, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job.job_id,
+                    job.kind,
+                    job.project_id,
+                    job.status.value,
+                    json.dumps(job.payload, ensure_ascii=False),
+                    json.dumps(job.progress, ensure_ascii=False),
+                    job.run_id,
+                    job.error,
+                    int(job.cancel_requested),
+                    job.worker_id,
+                    job.attempts,
+                    job.created_at.isoformat(),
+                ),
+            )
+        return job.job_id
+
+    def get_job(self, job_id: str) -> EvaluationJob | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT * FROM evaluation_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(
+        self,
+        *,
+        project_id: str | None = None,
+        statuses: Iterable[JobStatus] | None = None,
+        limit: int = 50,
+    ) -> list[EvaluationJob]:
+        query = "SELECT * FROM evaluation_jobs WHERE 1=1"
+        params: list[Any] = []
+        if project_id is not None:
+            query += " AND project_id = ?"
+            params.append(project_id)
+        status_values = [JobStatus(status).value for status in statuses or ()]
+        if status_values:
+            query += f" AND status IN ({', '.join('?' * len(status_values))})"
+            params.extend(status_values)
+        query += " ORDER BY created_at DESC, job_id DESC LIMIT ?"
+        params.append(limit)
+        with self._conn() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def claim_next(self, worker_id: str, *, max_per_project: int) -> EvaluationJob | None:
+        with self._conn(immediate=True) as conn:
+            row = conn.execute(_CLAIM_CANDIDATE, (max(1, max_per_project),)).fetchone()
+            if row is None:
+                return None
+            now = _now()
+            conn.execute(
+                "UPDATE evaluation_jobs SET status = 'running', worker_id = ?,"
+                " attempts = attempts + 1, started_at = ?, heartbeat_at = ?"
+                " WHERE job_id = ?",
+                (worker_id, now, now, row["job_id"]),
+            )
+            claimed = conn.execute(
+                "SELECT * FROM evaluation_jobs WHERE job_id = ?", (row["job_id"],)
+            ).fetchone()
+        return self._row_to_job(claimed)
+
+    def update_progress(self, job_id: str, progress: dict[str, Any] | None = None) -> None:
+        with self._conn() as conn:
+            if progress is None:
+                conn.execute(
+                    "UPDATE evaluation_jobs SET heartbeat_at = ? WHERE job_id = ?",
+                    (_now(), job_id),
+                )
+            else:
+                conn.execute(
+                    "UPDATE evaluation_jobs SET progress = ?, heartbeat_at = ? WHERE job_id = ?",
+                    (json.dumps(progress, ensure_ascii=False), _now(), job_id),
+                )
+
+    def finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        *,
+        run_id: str | None = None,
+        error: str | None = None,
+    ) -> bool:
+        with self._conn() as conn:
+            cursor = conn.execute(
+                "UPDATE evaluation_jobs SET status = ?, run_id = COALESCE(?, run_id), error = ?,"
+                " finished_at = ? WHERE job_id = ? AND status = 'running'",
+                (JobStatus(status).value, run_id, error, _now(), job_id),
+            )
+        return cursor.rowcount > 0
+
+    def request_cancel(self, job_id: str) -> EvaluationJob | None:
+        with self._conn(immediate=True) as conn:
+            conn.execute(
+                "UPDATE evaluation_jobs SET status = 'cancelled', cancel_requested = 1,"
+                " finished_at = ? WHERE job_id = ? AND status = 'queued'",
+                (_now(), job_id),
+            )
+            conn.execute(
+                "UPDATE evaluation_jobs SET cancel_requested = 1"
+                " WHERE job_id = ? AND status = 'running'",
+                (job_id,),
+            )
+            row = conn.execute(
+                "SELECT * FROM evaluation_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def requeue_stale(self, stale_after_seconds: float, *, max_attempts: int) -> int:
+        cutoff = (datetime.now(UTC) - timedelta(seconds=stale_after_seconds)).isoformat()
+        with self._conn(immediate=True) as conn:
+            conn.execute(
+                "UPDATE evaluation_jobs SET status = 'failed', finished_at = ?,"
+                " error = 'Worker stopped responding too many times'"
+                " WHERE status = 'running' AND heartbeat_at < ? AND attempts >= ?",
+                (_now(), cutoff, max_attempts),
+            )
+            cursor = conn.execute(
+                "UPDATE evaluation_jobs SET status = 'queued', worker_id = NULL"
+                " WHERE status = 'running' AND heartbeat_at < ? AND cancel_requested = 0",
+                (cutoff,),
+            )
+            conn.execute(
+                "UPDATE evaluation_jobs SET status = 'cancelled', finished_at = ?"
+                " WHERE status = 'running' AND heartbeat_at < ? AND cancel_requested = 1",
+                (_now(), cutoff),
+            )
+        return cursor.rowcount
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> EvaluationJob:
+        def parse(value: str | None) -> datetime | None:
+            return datetime.fromisoformat(value) if value else None
+
+        return EvaluationJob(
+            job_id=row["job_id"],
+            kind=row["kind"],
+            project_id=row["project_id"],
+            status=JobStatus(row["status"]),
+            payload=json.loads(row["payload"]),
+            progress=json.loads(row["progress"]) if row["progress"] else {},
+            run_id=row["run_id"],
+            error=row["error"],
+            cancel_requested=bool(row["cancel_requested"]),
+            worker_id=row["worker_id"],
+            attempts=int(row["attempts"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            started_at=parse(row["started_at"]),
+            finished_at=parse(row["finished_at"]),
+            heartbeat_at=parse(row["heartbeat_at"]),
+        )
+
+
+__all__ = ["SqliteJobQueueAdapter"]
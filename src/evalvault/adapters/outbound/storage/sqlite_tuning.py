@@ -0,0 +1,215 @@
+"""Opt-in high-throughput mode for the SQLite adapters.
+
+By default the SQLite adapters open a fresh connection per call on the rollback
+journal, so an evaluation saving results blocks API reads of the same file.
+High-throughput mode switches the database to WAL (readers no longer wait for
+the writer), relaxes fsyncs to ``synchronous=NORMAL``, sizes the page cache and
+mmap window, reuses one connection per thread and funnels writes through a
+single writer thread so concurrent writers queue instead of spinning on
+``SQLITE_BUSY``.
+"""
+
+from __future__ import annotations
+
+import functools
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from evalvault.config.settings import Settings
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SQLiteTuning:
+    """Connection pragmas and write routing for high-throughput mode."""
+
+    busy_timeout_ms: int = 5000
+    cache_size_mb: int = 64
+    mmap_size_mb: int = 256
+    writer_queue: bool = True
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> SQLiteTuning | None:
+        """Return the tuning, or None when high-throughput mode is off."""
+        if not getattr(settings, "sqlite_high_throughput", False):
+            return None
+        return cls(
+            busy_timeout_ms=int(settings.sqlite_busy_timeout_ms),
+            cache_size_mb=int(settings.sqlite_cache_size_mb),
+            mmap_size_mb=int(settings.sqlite_mmap_size_mb),
+            writer_queue=bool(settings.sqlite_writer_queue),
+        )
+
+    def connect(
+        self, db_path: str | Path, *, row_factory: Callable[..., Any] | None = None
+    ) -> sqlite3.Connection:
+        # Cached connections are closed from whichever thread tears the cache down.
+        conn = sqlite3.connect(
+            db_path, timeout=self.busy_timeout_ms / 1000, check_same_thread=False
+        )
+        if row_factory is not None:
+            conn.row_factory = row_factory
+        self.apply(conn)
+        return conn
+
+    def apply(self, conn: sqlite3.Connection) -> None:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        # Negative cache_size is in KiB rather than pages.
+        conn.execute(f"PRAGMA cache_size = -{int(self.cache_size_mb) * 1024}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size_mb) * 1024 * 1024}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA foreign_keys = ON")
+
+
+@dataclass
+class _ThreadConnection:
+    thread: threading.Thread
+    conn: sqlite3.Connection
+    depth: int = 0
+
+
+class ThreadLocalConnections:
+    """One reusable connection per thread.
+
+    Checkouts nest: only the outermost release rolls back a transaction the
+    caller left open, so helpers that re-enter the adapter share its work.
+    Connections owned by threads that have exited are closed lazily.
+    """
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection]) -> None:
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._entries: dict[int, _ThreadConnection] = {}
+
+    def _entry(self) -> _ThreadConnection:
+        current = threading.current_thread()
+        entry = self._entries.get(current.ident or 0)
+        if entry is not None and entry.thread is current:
+            return entry
+        entry = _ThreadConnection(thread=current, conn=self._factory())
+        with self._lock:
+            stale = [
+                ident
+                for ident, other in self._entries.items()
+                if ident == current.ident or not other.thread.is_alive()
+            ]
+            for ident in stale:
+                self._entries.pop(ident).conn.close()
+            self._entries[current.ident or 0] = entry
+        return entry
+
+    def acquire(self) -> sqlite3.Connection:
+        entry = self._entry()
+        entry.depth += 1
+        return entry.conn
+
+    def release(self) -> None:
+        entry = self._entries.get(threading.get_ident())
+        if entry is None or entry.depth == 0:
+            return
+        entry.depth -= 1
+        if entry.depth == 0 and entry.conn.in_transaction:
+            entry.conn.rollback()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release()
+
+    def checkout(self) -> ReusedConnection:
+        """Connection whose ``close()`` releases it back to this thread's cache."""
+        return ReusedConnection(self, self.acquire())
+
+    def close_all(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.conn.close()
+
+
+class ReusedConnection:
+    """Cached connection for ``conn = get(); try: ... finally: conn.close()`` callers."""
+
+    def __init__(self, owner: ThreadLocalConnections, conn: sqlite3.Connection) -> None:
+        self._owner = owner
+        self._conn: sqlite3.Connection | None = conn
+
+    def __getattr__(self, name: str) -> Any:
+        if self._conn is None:
+            raise AttributeError(f"connection already released: {name}")
+        return getattr(self._conn, name)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn = None
+            self._owner.release()
+
+
+class SQLiteWriteQueue:
+    """Runs writes one at a time on a dedicated writer thread.
+
+    Callers still get the return value (or exception) of the write; reads stay
+    on the caller's own connection and, under WAL, never wait for the writer.
+    Writes issued from the writer thread itself run inline.
+    """
+
+    def __init__(self, name: str = "evalvault-sqlite-writer") -> None:
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=name, initializer=self._mark_writer
+        )
+
+    def _mark_writer(self) -> None:
+        self._local.is_writer = True
+
+    def on_writer_thread(self) -> bool:
+        return bool(getattr(self._local, "is_writer", False))
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def call(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        if self.on_writer_thread():
+            return fn(*args, **kwargs)
+        return self.submit(fn, *args, **kwargs).result()
+
+    def wrap(self, fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        def queued(*args: Any, **kwargs: Any) -> T:
+            return self.call(fn, *args, **kwargs)
+
+        return queued
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+def route_writes_through(
+    queue: SQLiteWriteQueue, adapter: Any, method_names: tuple[str, ...]
+) -> None:
+    """Shadow ``adapter``'s write methods with versions that run on ``queue``."""
+    for name in method_names:
+        setattr(adapter, name, queue.wrap(getattr(adapter, name)))
+
+
+__all__ = [
+    "ReusedConnection",
+    "SQLiteTuning",
+    "SQLiteWriteQueue",
+    "ThreadLocalConnections",
+    "route_writes_through",
+]
@@ -0,0 +1,310 @@
+"""Background export of evaluation runs to tracker backends.
+
+``MultiTrackerAdapter.log_evaluation_run`` exports one run while the caller
+waits. For large runs (thousands of test-case spans/scores) that is minutes of
+wall time at the end of ``evalvault run``, so ``run --tracker-async`` instead
+persists the run locally, records a spool entry and hands the export to a
+detached ``evalvault ops drain-trackers`` process built on this module:
+
+* :class:`TrackerExportPipeline` -- one worker thread and one bounded queue per
+  backend. A submitted run is exported to every backend concurrently; a slow
+  backend only back-pressures its own queue. Failures follow the
+  :class:`BaseTrackerAdapter.safe_emit` policy (logged, never raised).
+* :class:`TrackerExportSpool` -- durable JSON entries (one file per run) that
+  survive a crashed or killed drainer. Entries are claimed by atomic rename, so
+  concurrent drainers never export the same run twice, and stale claims are
+  returned to the spool.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from evalvault.domain.entities import EvaluationRun
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+ExportCallback = Callable[[EvaluationRun, dict[str, str]], None]
+
+
+@dataclass
+class _PendingExport:
+    run: EvaluationRun
+    remaining: int
+    on_complete: ExportCallback | None
+    trace_ids: dict[str, str] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class TrackerExportPipeline:
+    """Export runs to several trackers from per-backend worker threads.
+
+    Example::
+
+        with TrackerExportPipeline([("mlflow", mlflow), ("phoenix", phoenix)]) as pipeline:
+            pipeline.submit(run, on_complete=lambda run, ids: print(ids))
+            pipeline.drain()
+    """
+
+    def __init__(self, trackers: Sequence[tuple[str, Any]], *, queue_size: int = 8) -> None:
+        """Start one worker thread per tracker.
+
+        Args:
+            trackers: ordered ``[(provider_name, tracker_adapter)]`` pairs.
+            queue_size: runs buffered per backend before :meth:`submit` blocks.
+
+        Raises:
+            ValueError: when ``trackers`` is empty.
+        """
+        if not trackers:
+            raise ValueError("TrackerExportPipeline requires at least one tracker")
+        self._trackers = list(trackers)
+        self._queues: dict[str, queue.Queue] = {}
+        self._threads: list[threading.Thread] = []
+        for provider, tracker in self._trackers:
+            backend_queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+            thread = threading.Thread(
+                target=self._worker,
+                args=(provider, tracker, backend_queue),
+                name=f"evalvault-tracker-{provider}",
+                daemon=True,
+            )
+            self._queues[provider] = backend_queue
+            self._threads.append(thread)
+            thread.start()
+        self._closed = False
+
+    def __enter__(self) -> TrackerExportPipeline:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def submit(self, run: EvaluationRun, on_complete: ExportCallback | None = None) -> None:
+        """Queue ``run`` on every backend (blocks while a backend queue is full).
+
+        ``on_complete(run, trace_ids)`` is called once, from the worker thread
+        of the last backend to finish; ``trace_ids`` maps each provider that
+        succeeded to its trace ID.
+        """
+        if self._closed:
+            raise RuntimeError("TrackerExportPipeline is closed")
+        pending = _PendingExport(run=run, remaining=len(self._trackers), on_complete=on_complete)
+        for provider, _ in self._trackers:
+            self._queues[provider].put(pending)
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every submitted export finished; ``False`` on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for backend_queue in self._queues.values():
+            with backend_queue.all_tasks_done:
+                while backend_queue.unfinished_tasks:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    backend_queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = None) -> None:
+        """Finish queued exports and stop the worker threads."""
+        if self._closed:
+            return
+        self._closed = True
+        for backend_queue in self._queues.values():
+            backend_queue.put(_STOP)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            thread.join(remaining)
+
+    def _worker(self, provider: str, tracker: Any, backend_queue: queue.Queue) -> None:
+        while True:
+            item = backend_queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._export(provider, tracker, item)
+            finally:
+                backend_queue.task_done()
+
+    @staticmethod
+    def _export(provider: str, tracker: Any, pending: _PendingExport) -> None:
+        trace_id = None
+        try:
+            trace_id = tracker.log_evaluation_run(pending.run)
+        except Exception as exc:
+            # 백그라운드 스레드에서는 호출자에게 전달할 수 없으므로 ValueError도 기록만 한다.
+            logger.warning(
+                "tracker export[%s] failed for run %s (%s); continuing",
+                provider,
+                pending.run.run_id,
+                exc,
+            )
+        with pending.lock:
+            if trace_id:
+                pending.trace_ids[provider] = trace_id
+            pending.remaining -= 1
+            done = pending.remaining == 0
+        if done and pending.on_complete is not None:
+            try:
+                pending.on_complete(pending.run, dict(pending.trace_ids))
+            except Exception as exc:
+                logger.warning("tracker export callback failed for %s: %s", pending.run.run_id, exc)
+
+
+@dataclass
+class SpoolEntry:
+    """A run whose tracker export is still pending."""
+
+    run_id: str
+    providers: list[str]
+    db_path: str | None = None
+    phoenix_options: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    last_error: str | None = None
+    created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpoolEntry:
+        known = {name for name in cls.__dataclass_fields__}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+class TrackerExportSpool:
+    """Directory of pending tracker exports (``<run_id>.json``).
+
+    A drainer claims an entry by renaming it to ``<run_id>.<token>.claimed``;
+    :meth:`complete` deletes the claim, :meth:`release` puts it back (counting
+    the attempt), :meth:`dead_letter` parks it as ``<run_id>.failed`` and
+    :meth:`recover_stale` returns claims whose drainer died.
+    """
+
+    _PENDING_SUFFIX = ".json"
+    _CLAIMED_SUFFIX = ".claimed"
+    _FAILED_SUFFIX = ".failed"
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def add(self, entry: SpoolEntry) -> Path:
+        """Write ``entry`` atomically, replacing a pending entry for the same run."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{entry.run_id}{self._PENDING_SUFFIX}"
+        self._write(path, entry)
+        return path
+
+    def pending(self) -> list[SpoolEntry]:
+        """Pending (unclaimed) entries, oldest first."""
+        entries = []
+        for path in self._pending_paths():
+            entry = self._read(path)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    def claim(self, limit: int | None = None) -> list[tuple[SpoolEntry, Path]]:
+        """Claim up to ``limit`` pending entries for this process."""
+        claimed: list[tuple[SpoolEntry, Path]] = []
+        token = uuid4().hex[:12]
+        for path in self._pending_paths():
+            if limit is not None and len(claimed) >= limit:
+                break
+            target = path.with_name(f"{path.stem}.{token}{self._CLAIMED_SUFFIX}")
+            try:
+                os.replace(path, target)
+            except FileNotFoundError:
+                continue  # 다른 drainer가 먼저 가져감
+            entry = self._read(target)
+            if entry is None:
+                target.unlink(missing_ok=True)
+                continue
+            claimed.append((entry, target))
+        return claimed
+
+    def complete(self, claim_path: Path) -> None:
+        claim_path.unlink(missing_ok=True)
+
+    def release(self, entry: SpoolEntry, claim_path: Path, *, error: str | None = None) -> None:
+        """Return a claimed entry to the spool after a failed attempt."""
+        entry.attempts += 1
+        entry.last_error = error
+        self.add(entry)
+        claim_path.unlink(missing_ok=True)
+
+    def dead_letter(self, entry: SpoolEntry, claim_path: Path, *, error: str) -> Path:
+        """Park an entry that exhausted its attempts; it is no longer drained."""
+        entry.attempts += 1
+        entry.last_error = error
+        path = self.directory / f"{entry.run_id}{self._FAILED_SUFFIX}"
+        self._write(path, entry)
+        claim_path.unlink(missing_ok=True)
+        return path
+
+    def failed(self) -> list[SpoolEntry]:
+        """Entries given up on by :meth:`dead_letter`."""
+        if not self.directory.exists():
+            return []
+        paths = sorted(self.directory.glob(f"*{self._FAILED_SUFFIX}"))
+        return [entry for entry in map(self._read, paths) if entry is not None]
+
+    def recover_stale(self, older_than_seconds: float) -> int:
+        """Return claims untouched for ``older_than_seconds`` to the pending set."""
+        if not self.directory.exists():
+            return 0
+        cutoff = time.time() - older_than_seconds
+        recovered = 0
+        for path in self.directory.glob(f"*{self._CLAIMED_SUFFIX}"):
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            entry = self._read(path)
+            if entry is not None:
+                self.add(entry)
+                recovered += 1
+            path.unlink(missing_ok=True)
+        return recovered
+
+    def _pending_paths(self) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        dated: list[tuple[float, Path]] = []
+        for path in self.directory.glob(f"*{self._PENDING_SUFFIX}"):
+            try:
+                dated.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue  # 다른 drainer가 방금 가져감
+        return [path for _, path in sorted(dated)]
+
+    @staticmethod
+    def _write(path: Path, entry: SpoolEntry) -> None:
+        tmp_path = path.with_name(f".{path.name}.{uuid4().hex[:8]}.tmp")
+        tmp_path.write_text(json.dumps(asdict(entry), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _read(path: Path) -> SpoolEntry | None:
+        try:
+            return SpoolEntry.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as exc:
+            logger.warning("Ignoring unreadable tracker spool entry %s: %s", path, exc)
+            return None
+
+
+__all__ = ["SpoolEntry", "TrackerExportPipeline", "TrackerExportSpool"]
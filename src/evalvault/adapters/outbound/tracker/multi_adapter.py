@@ -22,6 +22,10 @@ primitive that:
   callers can fan provider-specific metadata (Phoenix trace URL,
   Langfuse trace ID, etc.) back into ``run.tracker_metadata`` without
   reaching for the underlying adapters.
+* Exports a full run to all backends concurrently (one thread per
+  backend), so the wall time is the slowest backend rather than the sum.
+  Fire-and-forget exports live in
+  :mod:`evalvault.adapters.outbound.tracker.export_pipeline`.
 
 Notes
 -----
@@ -38,6 +42,7 @@ from __future__ import annotations
 
 import uuid
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from evalvault.adapters.outbound.tracker.base import BaseTrackerAdapter
@@ -75,13 +80,16 @@ class MultiTrackerAdapter(BaseTrackerAdapter, TrackerPort):
     # do not map onto a single backend, so the label is generic.
     _lookup_label = "MultiTrace"
 
-    def __init__(self, trackers: Sequence[tuple[str, Any]]):
+    def __init__(self, trackers: Sequence[tuple[str, Any]], *, concurrent: bool = True):
         """Create a composite over ``trackers``.
 
         Args:
             trackers: ordered ``[(provider_name, tracker_adapter)]``
                 pairs. The order is preserved when fanning out calls,
                 which keeps logged events deterministic across runs.
+            concurrent: export :meth:`log_evaluation_run` to all
+                backends in parallel threads. Lifecycle calls
+                (``start_trace`` ... ``end_trace``) stay sequential.
 
         Raises:
             ValueError: when ``trackers`` is empty. A composite over
@@ -92,6 +100,7 @@ class MultiTrackerAdapter(BaseTrackerAdapter, TrackerPort):
         if not trackers:
             raise ValueError("MultiTrackerAdapter requires at least one tracker")
         self._trackers: list[tuple[str, Any]] = list(trackers)
+        self._concurrent = concurrent
         # parent trace_id -> {provider name: per-tracker trace_id}
         self._active_traces: dict[str, dict[str, str]] = {}
         # Per-provider trace IDs from the most recent log_evaluation_run.
@@ -242,8 +251,10 @@ class MultiTrackerAdapter(BaseTrackerAdapter, TrackerPort):
 
         Each backend's call is wrapped with :meth:`safe_emit`, so a
         Phoenix outage no longer prevents MLflow from recording the run
-        (or vice versa). Per-provider trace IDs are stashed in
-        :attr:`last_trace_ids` for the caller.
+        (or vice versa). Backends run concurrently unless the adapter was
+        built with ``concurrent=False``. Per-provider trace IDs are
+        stashed in :attr:`last_trace_ids` for the caller, in tracker
+        order.
 
         Returns:
             The first non-``None`` trace ID, mainly to keep the
@@ -251,16 +262,31 @@ class MultiTrackerAdapter(BaseTrackerAdapter, TrackerPort):
             prefer :attr:`last_trace_ids` for routing metadata to the
             right provider key.
         """
-        per_tracker: dict[str, str] = {}
-        for provider, tracker in self._trackers:
-            trace_id = self.safe_emit(
+
+        def emit(provider: str, tracker: Any) -> str | None:
+            return self.safe_emit(
                 f"log_evaluation_run[{provider}]",
                 tracker.log_evaluation_run,
                 run,
                 default=None,
             )
-            if trace_id is not None:
-                per_tracker[provider] = trace_id
+
+        if self._concurrent and len(self._trackers) > 1:
+            with ThreadPoolExecutor(
+                max_workers=len(self._trackers), thread_name_prefix="evalvault-tracker"
+            ) as executor:
+                futures = [
+                    (provider, executor.submit(emit, provider, tracker))
+                    for provider, tracker in self._trackers
+                ]
+                # result() re-raises caller-side ValueError, as in the serial path.
+                results = [(provider, future.result()) for provider, future in futures]
+        else:
+            results = [(provider, emit(provider, tracker)) for provider, tracker in self._trackers]
+
+        per_tracker = {
+            provider: trace_id for provider, trace_id in results if trace_id is not None
+        }
         self.last_trace_ids = per_tracker
         # TrackerPort.log_evaluation_run returns ``str``. Empty string
         # signals "every backend failed" to callers that only look at
@@ -29,6 +29,10 @@ from evalvault.ports.outbound.tracker_port import TrackerPort
 if TYPE_CHECKING:
     from opentelemetry.sdk.trace import TracerProvider
 
+# BatchSpanProcessor 기본 큐(2048)를 넘는 span은 버려지므로 대규모 run에 맞춰 키운다.
+_SPAN_QUEUE_SIZE = 16384
+_SPAN_EXPORT_BATCH_SIZE = 512
+
 
 class PhoenixAdapter(BaseTrackerAdapter, TrackerPort):
     """Phoenix implementation of TrackerPort using OpenTelemetry.
@@ -55,17 +59,23 @@ class PhoenixAdapter(BaseTrackerAdapter, TrackerPort):
         service_name: str = "evalvault",
         project_name: str | None = None,
         annotations_enabled: bool = True,
+        annotation_batch_size: int = 100,
     ):
         """Initialize Phoenix adapter with OpenTelemetry.
 
         Args:
             endpoint: Phoenix OTLP endpoint (default: http://localhost:6006/v1/traces)
             service_name: Service name for traces (default: evalvault)
+            annotation_batch_size: Span annotations sent per request while
+                logging an evaluation run (default: 100)
         """
         self._endpoint = endpoint
         self._service_name = service_name
         self._project_name = project_name
         self._annotations_enabled = annotations_enabled
+        self._annotation_batch_size = max(1, annotation_batch_size)
+        # log_evaluation_run 동안 test case별 annotation을 모아 일괄 전송
+        self._annotation_buffer: list[dict[str, Any]] | None = None
         self._tracer: Any | None = None
         self._tracer_provider: TracerProvider | None = None
         self._active_spans: dict[str, Any] = {}
@@ -112,7 +122,11 @@ class PhoenixAdapter(BaseTrackerAdapter, TrackerPort):
 
             # Add OTLP exporter for Phoenix
             otlp_exporter = OTLPSpanExporter(endpoint=self._endpoint)
-            span_processor = BatchSpanProcessor(otlp_exporter)
+            span_processor = BatchSpanProcessor(
+                otlp_exporter,
+                max_queue_size=_SPAN_QUEUE_SIZE,
+                max_export_batch_size=_SPAN_EXPORT_BATCH_SIZE,
+            )
             self._tracer_provider.add_span_processor(span_processor)
 
             # Set as global tracer provider
@@ -165,31 +179,61 @@ class PhoenixAdapter(BaseTrackerAdapter, TrackerPort):
             from opentelemetry.trace import format_span_id
 
             span_id = format_span_id(span.get_span_context().span_id)
+        except Exception:
+            return
+        annotation = {
+            "name": name,
+            "span_id": span_id,
+            "annotator_kind": "CODE",
+            "result": {"label": label, "score": score, "explanation": explanation},
+        }
+        if self._annotation_buffer is not None:
+            self._annotation_buffer.append(annotation)
+            return
+        self._send_annotation(client, annotation)
+
+    @staticmethod
+    def _send_annotation(client: Any, annotation: dict[str, Any]) -> None:
+        result = annotation["result"]
+        try:
             spans_client = getattr(client, "spans", None)
             add_span_annotation = (
                 getattr(spans_client, "add_span_annotation", None) if spans_client else None
             )
-            if callable(add_span_annotation):
-                add_span_annotation(
-                    annotation_name=name,
-                    annotator_kind="CODE",
-                    span_id=span_id,
-                    label=label,
-                    score=score,
-                    explanation=explanation,
-                )
-                return
-            client.annotations.add_span_annotation(
-                annotation_name=name,
-                annotator_kind="CODE",
-                span_id=span_id,
-                label=label,
-                score=score,
-                explanation=explanation,
+            if not callable(add_span_annotation):
+                add_span_annotation = client.annotations.add_span_annotation
+            add_span_annotation(
+                annotation_name=annotation["name"],
+                annotator_kind=annotation["annotator_kind"],
+                span_id=annotation["span_id"],
+                label=result["label"],
+                score=result["score"],
+                explanation=result["explanation"],
             )
         except Exception:
             return
 
+    def _flush_annotations(self, annotations: list[dict[str, Any]]) -> None:
+        """Send buffered annotations in batches (one request per batch)."""
+        client = self._get_annotations_client()
+        if client is None or not annotations:
+            return
+        spans_client = getattr(client, "spans", None)
+        log_span_annotations = (
+            getattr(spans_client, "log_span_annotations", None) if spans_client else None
+        )
+        if not callable(log_span_annotations):
+            # 일괄 API가 없는 구버전 클라이언트는 span별로 전송
+            for annotation in annotations:
+                self._send_annotation(client, annotation)
+            return
+        size = self._annotation_batch_size
+        for start in range(0, len(annotations), size):
+            try:
+                log_span_annotations(span_annotations=annotations[start : start + size])
+            except Exception:
+                return
+
     def start_trace(self, name: str, metadata: dict[str, Any] | None = None) -> str:
         """Start a new trace.
 
@@ -406,9 +450,14 @@ class PhoenixAdapter(BaseTrackerAdapter, TrackerPort):
                 comment=f"Pass rate: {summary['pass_rate']:.1%} ({summary['passed']}/{summary['total']})",
             )
 
-        # Log individual test case results as child spans
-        for result in run.results:
-            self._log_test_case_span(trace_id, result, run)
+        # Log individual test case results as child spans; their annotations
+        # are buffered and sent in batches once the spans are flushed.
+        self._annotation_buffer = []
+        try:
+            for result in run.results:
+                self._log_test_case_span(trace_id, result, run)
+        finally:
+            annotations, self._annotation_buffer = self._annotation_buffer, None
 
         # Save structured artifact
         structured_artifact = {
@@ -458,6 +507,7 @@ class PhoenixAdapter(BaseTrackerAdapter, TrackerPort):
 
         # End the trace
         self.end_trace(trace_id)
+        self._flush_annotations(annotations)
 
         return trace_id
 
@@ -3,9 +3,10 @@
 from pathlib import Path
 from typing import Any
 
-from pydantic import AliasChoices, Field, PrivateAttr
+from pydantic import AliasChoices, Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from evalvault.adapters.outbound.cache.llm_response_cache import parse_llm_cache_mode
 from evalvault.adapters.outbound.llm.base import RetryPolicy
 from evalvault.config.secret_manager import (
     SecretProviderError,
@@ -13,6 +14,7 @@ from evalvault.config.secret_manager import (
     is_secret_reference,
     resolve_secret_reference,
 )
+from evalvault.domain.services.batch_executor import parse_provider_concurrency
 
 
 def _detect_repo_root(start: Path, max_depth: int = 6) -> Path | None:
@@ -224,10 +226,53 @@ class Settings(BaseSettings):
         default="data/db/evalvault_memory.db",
         description="SQLite database path for Domain Memory storage.",
     )
+    sqlite_high_throughput: bool = Field(
+        default=False,
+        description=(
+            "Opt-in SQLite tuning: WAL journal, synchronous=NORMAL, per-thread "
+            "connection reuse and a single writer queue."
+        ),
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000, ge=0, description="SQLite busy timeout in high-throughput mode."
+    )
+    sqlite_cache_size_mb: int = Field(
+        default=64, ge=0, description="SQLite page cache per connection in high-throughput mode."
+    )
+    sqlite_mmap_size_mb: int = Field(
+        default=256, ge=0, description="SQLite memory-mapped I/O size in high-throughput mode."
+    )
+    sqlite_writer_queue: bool = Field(
+        default=True,
+        description="Serialize SQLite writes on one writer thread in high-throughput mode.",
+    )
+
+    @field_validator("llm_cache_mode", mode="before")
+    @classmethod
+    def _validate_llm_cache_mode(cls, value: Any) -> str:
+        return parse_llm_cache_mode(value).value
+
+    @field_validator("llm_provider_concurrency", mode="before")
+    @classmethod
+    def _validate_llm_provider_concurrency(cls, value: Any) -> str:
+        text = "" if value is None else str(value)
+        parse_provider_concurrency(text)
+        return text
+
+    @field_validator("postgres_prepare_threshold", mode="before")
+    @classmethod
+    def _validate_postgres_prepare_threshold(cls, value: Any) -> Any:
+        if isinstance(value, str) and value.strip().lower() in {"", "none", "off"}:
+            return None
+        return value
 
     def model_post_init(self, __context: Any) -> None:
         self.evalvault_db_path = _resolve_storage_path(self.evalvault_db_path)
         self.evalvault_memory_db_path = _resolve_storage_path(self.evalvault_memory_db_path)
+        self.llm_cache_path = _resolve_storage_path(self.llm_cache_path)
+        if self.kiwi_token_cache_path:
+            self.kiwi_token_cache_path = _resolve_storage_path(self.kiwi_token_cache_path)
+        self.dense_index_cache_dir = _resolve_storage_path(self.dense_index_cache_dir)
         self.ollama_base_url = _ensure_http_scheme(self.ollama_base_url)
         self._resolve_secret_references()
 
@@ -302,6 +347,115 @@ class Settings(BaseSettings):
         description="Retry+timeout policy applied to Anthropic adapter calls.",
     )
 
+    # Persistent LLM judge response cache
+    llm_cache_mode: str = Field(
+        default="off",
+        description="LLM response cache mode: 'off', 'readwrite', 'readonly', or 'refresh'.",
+    )
+    llm_cache_path: str = Field(
+        default="data/cache/llm_responses.db",
+        description="SQLite path for the persistent LLM response cache.",
+    )
+    dense_index_cache_dir: str = Field(
+        default="data/cache/dense_index",
+        description=(
+            "Directory for persisted dense retriever indexes, reused when the model, "
+            "dimension, normalization and corpus match (empty disables)."
+        ),
+    )
+    kiwi_token_cache_size: int = Field(
+        default=50_000,
+        ge=0,
+        description="In-process LRU size for Kiwi morphological analysis results (0 disables).",
+    )
+    kiwi_token_cache_path: str = Field(
+        default="",
+        description=(
+            "Optional SQLite path persisting Kiwi analysis results across runs, keyed by "
+            "model type and user dictionary hash (empty disables)."
+        ),
+    )
+    api_retriever_cache_mb: int = Field(
+        default=2048,
+        ge=0,
+        description=(
+            "Approximate memory budget for retrievers the API server reuses across runs, "
+            "keyed by docs file fingerprint and mode (0 disables reuse)."
+        ),
+    )
+    api_retriever_warmup: str = Field(
+        default="",
+        description=(
+            "Comma-separated mode:docs_path corpora the API server indexes in the "
+            "background at startup (e.g. hybrid:data/retriever_docs/guide.jsonl)."
+        ),
+    )
+    api_analysis_cache_size: int = Field(
+        default=256,
+        ge=0,
+        description=(
+            "Number of analysis bundles the API server keeps in memory across requests, "
+            "keyed by run id and analysis options (0 disables the cache)."
+        ),
+    )
+    api_analysis_cache_ttl_seconds: int = Field(
+        default=24 * 3600,
+        ge=1,
+        description="Time-to-live in seconds for in-memory API analysis cache entries.",
+    )
+    api_analysis_cache_persist: bool = Field(
+        default=False,
+        description=(
+            "Also store analysis bundles in the run DB (analysis_cache table) so they "
+            "survive API server restarts."
+        ),
+    )
+    job_worker_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Evaluation jobs an `evalvault worker` runs at once (one process each).",
+    )
+    job_max_per_project: int = Field(
+        default=2,
+        ge=1,
+        description="Maximum running evaluation jobs per project across all workers.",
+    )
+    job_poll_interval_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        description="How often workers poll the job table and job event streams refresh.",
+    )
+    job_stale_after_seconds: int = Field(
+        default=300,
+        ge=10,
+        description=(
+            "Running jobs whose worker heartbeat is older than this are requeued "
+            "(the worker process crashed or was killed)."
+        ),
+    )
+    job_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Attempts before a job abandoned by workers is marked failed.",
+    )
+    llm_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 3600,
+        ge=0,
+        description="Cached LLM response lifetime in seconds (0 disables expiry).",
+    )
+    llm_cache_max_entries: int = Field(
+        default=100_000,
+        ge=1,
+        description="Maximum cached LLM responses before LRU eviction.",
+    )
+    llm_provider_concurrency: str = Field(
+        default="",
+        description=(
+            "Per-provider cap on in-flight judge requests, e.g. 'openai=16,ollama=2'. "
+            "Limits adapt downward on 429 responses."
+        ),
+    )
+
     # OpenAI Configuration
     openai_api_key: str | None = Field(default=None, description="OpenAI API key")
     openai_base_url: str | None = Field(
@@ -438,6 +592,11 @@ class Settings(BaseSettings):
         default=True,
         description="Enable automatic Phoenix span annotations",
     )
+    phoenix_annotation_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="Span annotations sent per Phoenix request when logging a run.",
+    )
     phoenix_api_token: str | None = Field(
         default=None,
         description="Phoenix API token for cloud deployments (optional)",
@@ -458,6 +617,15 @@ class Settings(BaseSettings):
         default="mlflow+phoenix",
         description="Tracker provider: 'langfuse', 'mlflow', 'phoenix', 'none', or combinations",
     )
+    tracker_export_queue_size: int = Field(
+        default=8,
+        ge=1,
+        description="Runs buffered per tracker backend in the background export pipeline.",
+    )
+    tracker_spool_dir: str = Field(
+        default="data/tracker_spool",
+        description="Directory of pending exports for `evalvault run --tracker-async`.",
+    )
 
     # Cluster map configuration
     cluster_map_auto_enabled: bool = Field(
@@ -510,6 +678,35 @@ class Settings(BaseSettings):
     postgres_connection_string: str | None = Field(
         default=None, description="PostgreSQL connection string (overrides other postgres settings)"
     )
+    postgres_pool_enabled: bool = Field(
+        default=True,
+        description=(
+            "Share long-lived PostgreSQL connections through psycopg_pool "
+            "(falls back to per-operation connects when psycopg_pool is not installed)."
+        ),
+    )
+    postgres_pool_min_size: int = Field(
+        default=1, ge=0, description="Connections the PostgreSQL pool keeps open."
+    )
+    postgres_pool_max_size: int = Field(
+        default=10, ge=1, description="Maximum PostgreSQL pool connections."
+    )
+    postgres_pool_timeout_seconds: float = Field(
+        default=30.0, gt=0, description="Seconds to wait for a pooled connection."
+    )
+    postgres_pool_max_idle_seconds: float = Field(
+        default=600.0, gt=0, description="Idle seconds before a pooled connection is closed."
+    )
+    postgres_pool_health_check: bool = Field(
+        default=True, description="Check pooled connections before handing them out."
+    )
+    postgres_prepare_threshold: int | None = Field(
+        default=5,
+        description=(
+            "Executions before psycopg prepares a statement server-side; "
+            "unset to disable (required behind transaction-mode PgBouncer)."
+        ),
+    )
 
 
 # Global settings instance (lazy initialization)
@@ -71,6 +71,7 @@ from evalvault.domain.entities.result import (
     ClaimLevelResult,
     ClaimVerdict,
     EvaluationRun,
+    EvaluationRunSummary,
     MetricScore,
     MetricType,
     RunClusterMap,
@@ -167,6 +168,7 @@ __all__ = [
     "ClaimLevelResult",
     "ClaimVerdict",
     "EvaluationRun",
+    "EvaluationRunSummary",
     "MetricScore",
     "MetricType",
     "RunClusterMap",
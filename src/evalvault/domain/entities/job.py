@@ -0,0 +1,82 @@
+"""Durable evaluation job entities.
+
+API 서버가 요청한 평가를 HTTP 연결과 분리해 별도 worker 프로세스(`evalvault worker`)가
+실행하도록 job 테이블에 기록한다. 진행 상황도 job에 저장되므로 어떤 클라이언트든
+다시 접속해 이어서 볼 수 있다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Any
+from uuid import uuid4
+
+from evalvault.domain.entities.auth import DEFAULT_PROJECT_ID
+
+
+class JobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_terminal(self) -> bool:
+        return self in {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
+@dataclass
+class EvaluationJob:
+    """평가 job 한 건.
+
+    Attributes:
+        payload: ``EvalRequest`` 필드 (JSON 직렬화 가능)
+        project_id: 동시 실행 제한 단위 (미지정 run은 기본 프로젝트)
+        progress: 마지막 진행 상황 (current/total/percent/status/message 등)
+        cancel_requested: 실행 중 취소 요청 여부 (worker가 프로세스를 종료)
+        heartbeat_at: worker가 마지막으로 살아있음을 기록한 시각
+    """
+
+    payload: dict[str, Any]
+    project_id: str = DEFAULT_PROJECT_ID
+    job_id: str = field(default_factory=lambda: uuid4().hex)
+    kind: str = "evaluation"
+    status: JobStatus = JobStatus.QUEUED
+    progress: dict[str, Any] = field(default_factory=dict)
+    run_id: str | None = None
+    error: str | None = None
+    cancel_requested: bool = False
+    worker_id: str | None = None
+    attempts: int = 0
+    created_at: datetime = field(default_factory=_now)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    heartbeat_at: datetime | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "project_id": self.project_id,
+            "status": self.status.value,
+            "progress": dict(self.progress),
+            "run_id": self.run_id,
+            "error": self.error,
+            "cancel_requested": self.cancel_requested,
+            "worker_id": self.worker_id,
+            "attempts": self.attempts,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "heartbeat_at": self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+        }
+
+
+__all__ = ["EvaluationJob", "JobStatus"]
@@ -142,6 +142,12 @@ class TestCaseResult:
     contexts: list[str] | None = None
     ground_truth: str | None = None
 
+    # 토큰 세부 내역 (병렬 모드에서도 테스트 케이스별로 정확히 집계)
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # metric_name -> {"prompt_tokens", "completion_tokens", "total_tokens"}
+    metric_token_usage: dict[str, dict[str, int]] | None = None
+
     @property
     def all_passed(self) -> bool:
         """모든 메트릭이 threshold를 통과했는지."""
@@ -323,3 +329,39 @@ class RunClusterMapInfo:
     item_count: int
     source: str | None = None
     created_at: datetime | None = None
+
+
+@dataclass
+class EvaluationRunSummary:
+    """목록 조회용 평가 실행 요약.
+
+    테스트 케이스 본문을 적재하지 않고 저장소 집계값만으로 구성합니다.
+    ``EvaluationRun``과 같은 기준으로 통과 수와 메트릭 평균을 계산합니다.
+    """
+
+    run_id: str
+    dataset_name: str = ""
+    dataset_version: str = ""
+    model_name: str = ""
+    started_at: datetime = field(default_factory=datetime.now)
+    finished_at: datetime | None = None
+    project_id: str | None = None
+    metrics_evaluated: list[str] = field(default_factory=list)
+    thresholds: dict[str, float] = field(default_factory=dict)
+    total_tokens: int = 0
+    total_cost_usd: float | None = None
+    tracker_metadata: dict[str, Any] = field(default_factory=dict)
+    total_test_cases: int = 0
+    passed_test_cases: int = 0
+    avg_metric_scores: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def pass_rate(self) -> float:
+        """테스트 케이스 통과율 (``EvaluationRun.pass_rate``와 동일 기준)."""
+        if not self.total_test_cases:
+            return 0.0
+        return self.passed_test_cases / self.total_test_cases
+
+    def get_avg_score(self, metric_name: str) -> float | None:
+        """특정 메트릭의 평균 점수."""
+        return self.avg_metric_scores.get(metric_name)
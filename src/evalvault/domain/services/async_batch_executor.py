@@ -17,6 +17,8 @@ import time
 from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
 
+from evalvault.domain.services.batch_executor import is_rate_limit_error
+
 
 @dataclass
 class BatchResult[R]:
@@ -286,11 +288,7 @@ class AsyncBatchExecutor[T, R]:
         Returns:
             레이트 리밋 오류 여부
         """
-        error_str = str(error).lower()
-        return any(
-            keyword in error_str
-            for keyword in ["429", "rate limit", "too many requests", "quota exceeded"]
-        )
+        return is_rate_limit_error(error)
 
     def get_current_batch_size(self) -> int:
         """현재 배치 크기 반환."""
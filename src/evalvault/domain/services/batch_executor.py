@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Sequence
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+_RATE_LIMIT_MARKERS = ("429", "rate limit", "too many requests", "quota exceeded")
 
 
 def chunked[T](items: Sequence[T], size: int) -> list[Sequence[T]]:
@@ -36,4 +42,295 @@ async def run_in_batches[T, R](
     return results
 
 
-__all__ = ["chunked", "run_in_batches"]
+def is_rate_limit_error(error: BaseException) -> bool:
+    """레이트 리밋(429) 오류 여부 확인."""
+
+    if getattr(error, "status_code", None) == 429:
+        return True
+    error_str = str(error).lower()
+    return any(marker in error_str for marker in _RATE_LIMIT_MARKERS)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit for requests sent to one LLM provider.
+
+    The limit halves on a rate-limit (429) response and grows by one after
+    ``increase_after`` consecutive successes, up to ``max_limit``. A limiter
+    may be shared by several concurrent evaluations in the same process.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        *,
+        min_limit: int = 1,
+        max_limit: int | None = None,
+        increase_after: int = 20,
+        decrease_cooldown_seconds: float = 1.0,
+    ) -> None:
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max_limit
+        self.increase_after = max(1, increase_after)
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self.rate_limited_count = 0
+        self._limit = self._clamp(limit)
+        self._in_flight = 0
+        self._success_streak = 0
+        self._last_decrease = 0.0
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def set_max_limit(self, max_limit: int | None) -> None:
+        """상한을 갱신하고 현재 한도를 그 범위로 맞춘다."""
+        self.max_limit = max_limit
+        if max_limit is not None:
+            self._limit = self._clamp(max_limit)
+
+    def _clamp(self, value: int) -> int:
+        value = max(self.min_limit, value)
+        if self.max_limit is not None:
+            value = min(self.max_limit, value)
+        return value
+
+    def _get_condition(self) -> asyncio.Condition:
+        # asyncio primitives are loop-bound; CLI runs may call asyncio.run repeatedly.
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._in_flight = 0
+        return self._condition
+
+    async def acquire(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+    def record_success(self) -> None:
+        self._success_streak += 1
+        if self._success_streak >= self.increase_after:
+            self._success_streak = 0
+            self._limit = self._clamp(self._limit + 1)
+
+    def record_rate_limit(self) -> None:
+        """429 수신 시 한도를 절반으로 줄인다 (쿨다운 내 중복 감소 방지)."""
+        self.rate_limited_count += 1
+        self._success_streak = 0
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown_seconds:
+            return
+        self._last_decrease = now
+        self._limit = self._clamp(self._limit // 2)
+
+
+_provider_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+_provider_limits: dict[str, int] = {}
+_provider_limiters_lock = threading.Lock()
+
+
+def _normalize_provider(provider: str | None) -> str:
+    if not isinstance(provider, str):
+        return "default"
+    return provider.strip().lower() or "default"
+
+
+def configure_provider_concurrency(limits: Mapping[str, int]) -> None:
+    """프로바이더별 최대 동시 요청 수를 설정한다 (예: ``{"openai": 16, "ollama": 2}``)."""
+
+    with _provider_limiters_lock:
+        for provider, limit in limits.items():
+            key = _normalize_provider(provider)
+            value = int(limit)
+            if value <= 0:
+                raise ValueError(f"Concurrency limit for '{provider}' must be positive")
+            _provider_limits[key] = value
+            limiter = _provider_limiters.get(key)
+            if limiter is not None:
+                limiter.set_max_limit(value)
+
+
+def parse_provider_concurrency(value: str | None) -> dict[str, int]:
+    """``"openai=16,ollama=2"`` 형식의 문자열을 파싱한다."""
+
+    limits: dict[str, int] = {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        provider, sep, raw_limit = part.partition("=")
+        if not sep or not provider.strip():
+            raise ValueError(f"Invalid provider concurrency entry: '{part}'")
+        try:
+            limits[_normalize_provider(provider)] = int(raw_limit)
+        except ValueError as exc:
+            raise ValueError(f"Invalid provider concurrency entry: '{part}'") from exc
+    return limits
+
+
+def get_provider_limiter(
+    provider: str | None,
+    default_limit: int,
+) -> AdaptiveConcurrencyLimiter:
+    """프로바이더 공유 리미터 반환 (없으면 설정값 또는 ``default_limit``으로 생성)."""
+
+    key = _normalize_provider(provider)
+    with _provider_limiters_lock:
+        limiter = _provider_limiters.get(key)
+        if limiter is None:
+            configured = _provider_limits.get(key)
+            limiter = AdaptiveConcurrencyLimiter(
+                configured or default_limit,
+                max_limit=configured,
+            )
+            _provider_limiters[key] = limiter
+        return limiter
+
+
+def report_rate_limit(provider: str | None, error: BaseException) -> bool:
+    """Feed a 429 error into the provider limiter, if one is active."""
+
+    if not is_rate_limit_error(error):
+        return False
+    with _provider_limiters_lock:
+        limiter = _provider_limiters.get(_normalize_provider(provider))
+    if limiter is not None:
+        limiter.record_rate_limit()
+    return True
+
+
+def reset_provider_limiters() -> None:
+    """Drop shared limiters and configured limits (tests/process reset)."""
+
+    with _provider_limiters_lock:
+        _provider_limiters.clear()
+        _provider_limits.clear()
+
+
+@dataclass(frozen=True)
+class WindowProgress:
+    """Sliding-window 실행 진행 상황."""
+
+    index: int
+    completed: int
+    total: int
+    in_flight: int
+    queued: int
+    limit: int
+
+
+async def run_sliding_window[T, R](
+    items: Sequence[T],
+    *,
+    worker: Callable[[T], Awaitable[R]],
+    concurrency: int = 10,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
+    return_exceptions: bool = True,
+    on_progress: Callable[[WindowProgress], None] | None = None,
+) -> list[R | Exception]:
+    """Execute awaitable tasks with a bounded sliding window.
+
+    Unlike :func:`run_in_batches`, a slot is refilled as soon as any task
+    finishes, so one slow item never idles the other ``concurrency - 1``
+    slots. ``limiter`` additionally caps in-flight work per provider and
+    adapts to 429 responses. Results keep the input order.
+    """
+
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+    total = len(items)
+    if total == 0:
+        return []
+
+    results: list[R | Exception | None] = [None] * total
+    next_index = 0
+    completed = 0
+    in_flight = 0
+
+    async def run_one(index: int) -> None:
+        nonlocal completed, in_flight
+        if limiter is not None:
+            await limiter.acquire()
+        in_flight += 1
+        try:
+            results[index] = await worker(items[index])
+            if limiter is not None:
+                limiter.record_success()
+        except Exception as exc:
+            if limiter is not None and is_rate_limit_error(exc):
+                limiter.record_rate_limit()
+            if not return_exceptions:
+                raise
+            results[index] = exc
+        finally:
+            in_flight -= 1
+            completed += 1
+            if limiter is not None:
+                await limiter.release()
+        if on_progress:
+            on_progress(
+                WindowProgress(
+                    index=index,
+                    completed=completed,
+                    total=total,
+                    in_flight=in_flight,
+                    queued=total - next_index,
+                    limit=min(concurrency, limiter.limit) if limiter else concurrency,
+                )
+            )
+
+    async def consume() -> None:
+        nonlocal next_index
+        while next_index < total:
+            index = next_index
+            next_index += 1
+            await run_one(index)
+
+    consumers = [asyncio.create_task(consume()) for _ in range(min(concurrency, total))]
+    try:
+        await asyncio.gather(*consumers)
+    except BaseException:
+        for task in consumers:
+            task.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+        raise
+    return results  # type: ignore[return-value]
+
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "WindowProgress",
+    "chunked",
+    "configure_provider_concurrency",
+    "get_provider_limiter",
+    "is_rate_limit_error",
+    "parse_provider_concurrency",
+    "report_rate_limit",
+    "reset_provider_limiters",
+    "run_in_batches",
+    "run_sliding_window",
+]
@@ -304,6 +304,7 @@ class RagasEvaluator:
             calculate_cost=self._calculate_cost,
             summarize_error=self._summarize_ragas_error,
             use_structured_output_getter=_summary_faithfulness_structured_output_enabled,
+            metric_concurrency_getter=lambda: getattr(self, "_metric_concurrency", 1),
         )
 
     @property
@@ -335,6 +336,7 @@ class RagasEvaluator:
         prompt_overrides: dict[str, str] | None = None,
         claim_level: bool = False,
         language: str | None = None,
+        metric_concurrency: int = 1,
     ) -> EvaluationRun:
         """데이터셋을 Ragas로 평가.
 
@@ -350,6 +352,7 @@ class RagasEvaluator:
             retriever_top_k: retriever 결과 상위 k개 사용
             retriever_doc_ids: retriever 결과 doc_id 인덱스 해석용 문서 ID 목록
             claim_level: Claim-level faithfulness 분석 활성화 여부 (기본값: False)
+            metric_concurrency: 샘플 하나에서 동시에 실행할 메트릭 수 (기본값: 1, 순차)
 
         Returns:
             평가 결과가 담긴 EvaluationRun
@@ -358,6 +361,7 @@ class RagasEvaluator:
             임계값 우선순위: CLI 옵션 > 데이터셋 내장 > 기본값(0.7)
         """
         self._claim_level = claim_level
+        self._metric_concurrency = max(1, int(metric_concurrency))
         self._active_llm_provider = getattr(llm, "provider_name", None)
         self._active_llm_model = llm.get_model_name()
         self._active_llm = llm
@@ -470,6 +474,7 @@ class RagasEvaluator:
         # Aggregate results
         total_tokens = 0
         total_cost = 0.0
+        tokens_by_metric: dict[str, dict[str, int]] = {}
         for test_case in dataset.test_cases:
             eval_result = eval_results_by_test_case.get(test_case.id, TestCaseEvalResult(scores={}))
 
@@ -505,14 +510,25 @@ class RagasEvaluator:
                 answer=test_case.answer,
                 contexts=test_case.contexts,
                 ground_truth=test_case.ground_truth,
+                prompt_tokens=eval_result.prompt_tokens,
+                completion_tokens=eval_result.completion_tokens,
+                metric_token_usage=eval_result.metric_token_usage,
             )
             run.results.append(test_case_result)
             total_tokens += eval_result.tokens_used
             total_cost += eval_result.cost_usd
+            for metric_name, usage in (eval_result.metric_token_usage or {}).items():
+                bucket = tokens_by_metric.setdefault(
+                    metric_name, {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+                )
+                for key in bucket:
+                    bucket[key] += int(usage.get(key, 0))
 
         # Set total tokens and cost
         run.total_tokens = total_tokens
         run.total_cost_usd = total_cost if total_cost > 0 else None
+        if tokens_by_metric:
+            run.tracker_metadata["token_usage_by_metric"] = tokens_by_metric
 
         # Finalize run
         run.finished_at = datetime.now()
@@ -43,6 +43,7 @@ class MemoryAwareEvaluator:
         on_progress: Callable[[int, int, str], None] | None = None,
         prompt_overrides: dict[str, str] | None = None,
         claim_level: bool = False,
+        metric_concurrency: int = 1,
     ) -> EvaluationRun:
         """Run evaluation after adjusting thresholds with memory reliability."""
 
@@ -56,6 +57,9 @@ class MemoryAwareEvaluator:
             reliability=reliability,
         )
 
+        extra_kwargs: dict[str, int] = {}
+        if metric_concurrency != 1:
+            extra_kwargs["metric_concurrency"] = metric_concurrency
         return await self._evaluator.evaluate(
             dataset=dataset,
             metrics=metrics,
@@ -69,6 +73,7 @@ class MemoryAwareEvaluator:
             on_progress=on_progress,
             prompt_overrides=prompt_overrides,
             claim_level=claim_level,
+            **extra_kwargs,
         )
 
     def augment_context_with_facts(
@@ -41,12 +41,22 @@ from evalvault.domain.entities import (
     Dataset,
     TestCase,
 )
-from evalvault.domain.services.batch_executor import run_in_batches
+from evalvault.domain.services.batch_executor import (
+    WindowProgress,
+    get_provider_limiter,
+    report_rate_limit,
+    run_sliding_window,
+)
 from evalvault.domain.services.prompt_catalog import (
     PROMPT_REGISTRY,
     SummaryFaithfulnessVerdict,
 )
-from evalvault.ports.outbound.llm_port import LLMPort
+from evalvault.ports.outbound.llm_port import (
+    LLMPort,
+    TokenUsageScope,
+    metric_usage_scope,
+    token_usage_scope,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +82,8 @@ class TestCaseEvalResult:
     finished_at: datetime | None = None
     latency_ms: int = 0
     claim_details: dict[str, ClaimLevelResult] | None = None  # metric_name -> ClaimLevelResult
+    # metric_name -> {"prompt_tokens", "completion_tokens", "total_tokens"}
+    metric_token_usage: dict[str, dict[str, int]] | None = None
 
 
 @dataclass
@@ -84,6 +96,26 @@ class ParallelSampleOutcome:
     latency_ms: int
     error: Exception | None = None
     claim_details: dict[str, ClaimLevelResult] | None = None
+    usage: TokenUsageScope | None = None
+
+
+@dataclass
+class _MetricOutcome:
+    """Result of scoring one metric, merged into the sample in metric order."""
+
+    score: float
+    claim_result: ClaimLevelResult | None = None
+    # Set when Ragas faithfulness failed and fallback scoring took over.
+    ragas_error: Exception | None = None
+
+
+def _prefix_claim_ids(claim_result: ClaimLevelResult, test_case_id: str) -> ClaimLevelResult:
+    """Update claim IDs with the test_case_id prefix."""
+    for claim in claim_result.claims:
+        if not claim.claim_id.startswith(test_case_id):
+            idx = claim.claim_id.split("-")[-1]
+            claim.claim_id = f"{test_case_id}-claim-{idx}"
+    return claim_result
 
 
 ScoreSampleCallable = Callable[
@@ -123,6 +155,7 @@ class MetricScorer:
         calculate_cost: Callable[[str, int, int], float],
         summarize_error: Callable[[Exception], str],
         use_structured_output_getter: Callable[[], bool] | None = None,
+        metric_concurrency_getter: Callable[[], int] | None = None,
     ) -> None:
         self._faithfulness_metrics = faithfulness_metrics
         self._metric_args = metric_args
@@ -138,6 +171,9 @@ class MetricScorer:
         self._calculate_cost_cb = calculate_cost
         self._summarize_error = summarize_error
         self._use_structured_output_getter = use_structured_output_getter or (lambda: False)
+        self._metric_concurrency_getter = metric_concurrency_getter or (lambda: 1)
+        # Provider-wide request budget used when metrics fan out within a sample.
+        self._request_budget: int | None = None
         self._faithfulness_ragas_failed = False
 
     @property
@@ -161,6 +197,7 @@ class MetricScorer:
         """순차 평가 (기존 로직)."""
         results: dict[str, TestCaseEvalResult] = {}
         total = len(ragas_samples)
+        self._request_budget = max(1, int(self._metric_concurrency_getter() or 1))
 
         for idx, sample in enumerate(ragas_samples):
             test_case_id = dataset.test_cases[idx].id
@@ -171,7 +208,8 @@ class MetricScorer:
 
             # 단일 테스트 케이스 평가
             test_case_started_at = datetime.now()
-            scores, claim_details = await score_sample(sample, ragas_metrics, test_case_id)
+            with token_usage_scope() as usage:
+                scores, claim_details = await score_sample(sample, ragas_metrics, test_case_id)
             test_case_finished_at = datetime.now()
 
             latency_ms = int((test_case_finished_at - test_case_started_at).total_seconds() * 1000)
@@ -202,6 +240,7 @@ class MetricScorer:
                 finished_at=test_case_finished_at,
                 latency_ms=latency_ms,
                 claim_details=claim_details if claim_details else None,
+                metric_token_usage=dict(usage.by_metric) or None,
             )
 
             if on_progress:
@@ -220,46 +259,48 @@ class MetricScorer:
         batch_size: int = 5,
         on_progress: Callable[[int, int, str], None] | None = None,
     ) -> dict[str, TestCaseEvalResult]:
-        """병렬 평가 (배치 단위로 동시 실행).
+        """병렬 평가 (sliding window로 동시 실행).
+
+        한 샘플이 끝나는 즉시 다음 샘플을 투입해 항상 ``batch_size``개의 요청을
+        유지한다. 프로바이더별 공유 리미터가 동시 요청 수를 제한하고 429 응답에
+        따라 한도를 조절한다.
 
         Args:
             dataset: 데이터셋
             ragas_samples: Ragas 샘플 목록
             ragas_metrics: 평가할 메트릭 목록
             llm: LLM 어댑터
-            batch_size: 동시 실행할 테스트 케이스 수
+            batch_size: 동시에 진행할 테스트 케이스 수 (window 크기)
 
         Returns:
             테스트 케이스별 평가 결과
         """
         results: dict[str, TestCaseEvalResult] = {}
         sample_pairs = list(zip(dataset.test_cases, ragas_samples, strict=True))
-        total_samples = len(sample_pairs)
-        completed_count = 0
+        provider = self._active_llm_provider_getter()
 
         async def worker(pair: tuple[TestCase, Any]):
             test_case, sample = pair
             started_at = datetime.now()
             error: Exception | None = None
             claim_details: dict[str, ClaimLevelResult] | None = None
-            try:
-                scores, claim_details = await score_sample(sample, ragas_metrics, test_case.id)
-            except Exception as exc:  # pragma: no cover - safe fallback
-                logger.warning(
-                    "Failed to evaluate test case '%s' in parallel mode: %s",
-                    test_case.id,
-                    exc,
-                )
-                scores = {metric.name: 0.0 for metric in ragas_metrics}
-                error = exc
+            # Each worker gets its own usage scope; adapters report into it via
+            # contextvars, so concurrent samples are accounted for separately.
+            with token_usage_scope() as usage:
+                try:
+                    scores, claim_details = await score_sample(sample, ragas_metrics, test_case.id)
+                except Exception as exc:  # pragma: no cover - safe fallback
+                    logger.warning(
+                        "Failed to evaluate test case '%s' in parallel mode: %s",
+                        test_case.id,
+                        exc,
+                    )
+                    report_rate_limit(provider, exc)
+                    scores = {metric.name: 0.0 for metric in ragas_metrics}
+                    error = exc
             finished_at = datetime.now()
             latency_ms = int((finished_at - started_at).total_seconds() * 1000)
 
-            nonlocal completed_count
-            completed_count += 1
-            if on_progress:
-                on_progress(completed_count, total_samples, f"Evaluated {test_case.id}")
-
             return (
                 test_case.id,
                 ParallelSampleOutcome(
@@ -269,14 +310,34 @@ class MetricScorer:
                     latency_ms=latency_ms,
                     error=error,
                     claim_details=claim_details if claim_details else None,
+                    usage=usage,
                 ),
             )
 
-        batched_outcomes = await run_in_batches(
+        def window_progress(progress: WindowProgress) -> None:
+            if on_progress:
+                test_case_id = sample_pairs[progress.index][0].id
+                message = f"Evaluated {test_case_id}"
+                if progress.in_flight or progress.queued:
+                    message += f" (in flight {progress.in_flight}, queued {progress.queued})"
+                on_progress(progress.completed, progress.total, message)
+
+        window = max(1, batch_size)
+        metric_concurrency = max(1, int(self._metric_concurrency_getter() or 1))
+        if metric_concurrency > 1:
+            # Metric calls acquire the provider budget themselves; holding a
+            # provider slot per sample as well could deadlock the window.
+            self._request_budget = window * metric_concurrency
+            window_limiter = None
+        else:
+            window_limiter = get_provider_limiter(provider, window)
+        batched_outcomes = await run_sliding_window(
             sample_pairs,
             worker=worker,
-            batch_size=batch_size,
+            concurrency=window,
+            limiter=window_limiter,
             return_exceptions=True,
+            on_progress=window_progress,
         )
 
         for outcome in batched_outcomes:
@@ -290,35 +351,48 @@ class MetricScorer:
                     test_case_id,
                     sample_outcome.error,
                 )
+            usage = sample_outcome.usage
             results[test_case_id] = TestCaseEvalResult(
                 scores=sample_outcome.scores,
-                tokens_used=0,
-                prompt_tokens=0,
-                completion_tokens=0,
-                cost_usd=0.0,
+                tokens_used=usage.total_tokens if usage else 0,
+                prompt_tokens=usage.prompt_tokens if usage else 0,
+                completion_tokens=usage.completion_tokens if usage else 0,
                 started_at=sample_outcome.started_at,
                 finished_at=sample_outcome.finished_at,
                 latency_ms=sample_outcome.latency_ms,
                 claim_details=sample_outcome.claim_details,
+                metric_token_usage=(dict(usage.by_metric) or None) if usage else None,
             )
 
-        # 전체 토큰 사용량 가져와서 테스트 케이스별로 평균 분배
+        # 테스트 케이스별 토큰은 usage scope로 정확히 집계된다. 스코프에 보고하지 않는
+        # 어댑터의 사용량(어댑터 합계 - 스코프 합계)만 균등 분배한다.
         if hasattr(llm, "get_and_reset_token_usage"):
             total_prompt, total_completion, total_tokens = llm.get_and_reset_token_usage()
-            if total_samples > 0:
-                avg_tokens = total_tokens // total_samples
-                avg_prompt = total_prompt // total_samples
-                avg_completion = total_completion // total_samples
-
-                for test_case_id in results:
-                    results[test_case_id].tokens_used = avg_tokens
-                    results[test_case_id].prompt_tokens = avg_prompt
-                    results[test_case_id].completion_tokens = avg_completion
-                    results[test_case_id].cost_usd = self._calculate_cost_cb(
-                        llm.get_model_name(),
-                        avg_prompt,
-                        avg_completion,
+            if results:
+                scoped_prompt = sum(r.prompt_tokens for r in results.values())
+                scoped_completion = sum(r.completion_tokens for r in results.values())
+                scoped_total = sum(r.tokens_used for r in results.values())
+                extra_prompt = max(0, total_prompt - scoped_prompt) // len(results)
+                extra_completion = max(0, total_completion - scoped_completion) // len(results)
+                extra_total = max(0, total_tokens - scoped_total) // len(results)
+                if extra_total:
+                    logger.debug(
+                        "Distributing %d unattributed tokens evenly across %d test cases",
+                        total_tokens - scoped_total,
+                        len(results),
                     )
+                for eval_result in results.values():
+                    eval_result.prompt_tokens += extra_prompt
+                    eval_result.completion_tokens += extra_completion
+                    eval_result.tokens_used += extra_total
+
+        model_name = llm.get_model_name()
+        for eval_result in results.values():
+            eval_result.cost_usd = self._calculate_cost_cb(
+                model_name,
+                eval_result.prompt_tokens,
+                eval_result.completion_tokens,
+            )
 
         return results
 
@@ -331,6 +405,10 @@ class MetricScorer:
     ) -> tuple[dict[str, float], dict[str, ClaimLevelResult]]:
         """단일 샘플에 대해 모든 메트릭 점수 계산.
 
+        ``metric_concurrency`` > 1이면 독립적인 메트릭을 동시에 실행한다. 이때
+        faithfulness 실패 래치는 샘플 시작 시점 값으로 고정되고, 점수·claim
+        상세·래치 갱신은 메트릭 순서대로 병합되어 결과가 실행 순서와 무관하다.
+
         Args:
             sample: 평가할 Ragas 샘플
             ragas_metrics: 메트릭 인스턴스 목록
@@ -342,139 +420,176 @@ class MetricScorer:
         scores: dict[str, float] = {}
         claim_details: dict[str, ClaimLevelResult] = {}
 
-        for metric in ragas_metrics:
-            if metric.name in self._faithfulness_metrics:
-                if self._active_llm_provider_getter() == "ollama":
-                    fallback_score = self._korean_fallback_score(sample)
-                    if fallback_score is None:
-                        fallback_score = await self._faithfulness_fallback_score(sample)
-                    if fallback_score is not None:
-                        scores[metric.name] = fallback_score
-                        continue
-                if self._faithfulness_ragas_failed:
-                    if metric.name == "summary_faithfulness":
-                        judge_score = await self._score_summary_faithfulness_judge(sample)
-                        if judge_score is not None:
-                            scores[metric.name] = judge_score
-                            continue
-                    fallback_score = await self._faithfulness_fallback_score(sample)
-                    if fallback_score is not None:
-                        scores[metric.name] = fallback_score
-                        continue
-            try:
-                # Ragas >=0.4 uses ascore() with kwargs
-                if hasattr(metric, "ascore"):
-                    all_args = {
-                        "user_input": sample.user_input,
-                        "response": sample.response,
-                        "retrieved_contexts": sample.retrieved_contexts,
-                        "reference_contexts": sample.reference_contexts,
-                        "reference": sample.reference,
-                    }
-                    required_args = self._metric_args.get(
-                        metric.name,
-                        ["user_input", "response", "retrieved_contexts"],
+        concurrency = max(1, int(self._metric_concurrency_getter() or 1))
+        if concurrency == 1 or len(ragas_metrics) < 2:
+            for metric in ragas_metrics:
+                with metric_usage_scope(metric.name):
+                    outcome = await self._score_metric(
+                        sample,
+                        metric,
+                        test_case_id=test_case_id,
+                        ragas_failed=self._faithfulness_ragas_failed,
                     )
-                    kwargs = {
-                        k: v for k, v in all_args.items() if k in required_args and v is not None
-                    }
-                    result = await metric.ascore(**kwargs)
-                    ragas_input = kwargs
-                elif hasattr(metric, "single_turn_ascore"):
-                    # Legacy Ragas <0.4 API
-                    result = await metric.single_turn_ascore(sample)
-                    ragas_input = {
-                        "user_input": sample.user_input,
-                        "response": sample.response,
-                        "retrieved_contexts": sample.retrieved_contexts,
-                        "reference_contexts": sample.reference_contexts,
-                        "reference": sample.reference,
-                    }
-                else:
-                    raise AttributeError(
-                        f"{metric.__class__.__name__} does not support scoring API."
+                self._apply_metric_outcome(metric.name, outcome, scores, claim_details)
+            return scores, claim_details
+
+        ragas_failed = self._faithfulness_ragas_failed
+        provider = self._active_llm_provider_getter()
+        limiter = get_provider_limiter(provider, self._request_budget or concurrency)
+        fan_out = asyncio.Semaphore(concurrency)
+
+        async def run(metric: Any) -> _MetricOutcome:
+            async with fan_out, limiter.slot():
+                with metric_usage_scope(metric.name):
+                    return await self._score_metric(
+                        sample,
+                        metric,
+                        test_case_id=test_case_id,
+                        ragas_failed=ragas_failed,
                     )
 
-                # Handle MetricResult (v0.4+), score attr, or raw float
-                if hasattr(result, "value"):
-                    score_value = result.value
-                elif hasattr(result, "score"):
-                    score_value = result.score
-                else:
-                    score_value = result
+        outcomes = await asyncio.gather(*(run(metric) for metric in ragas_metrics))
+        for metric, outcome in zip(ragas_metrics, outcomes, strict=True):
+            self._apply_metric_outcome(metric.name, outcome, scores, claim_details)
+        return scores, claim_details
 
-                try:
-                    score_value = float(score_value)
-                except (TypeError, ValueError):
-                    logger.warning(
-                        "Metric %s returned non-numeric score (%r). Using 0.0.",
-                        metric.name,
-                        score_value,
-                    )
-                    score_value = 0.0
-
-                if math.isnan(score_value):
-                    if metric.name == "summary_faithfulness":
-                        judge_score = await self._score_summary_faithfulness_judge(sample)
-                        if judge_score is not None:
-                            scores[metric.name] = judge_score
-                            continue
-                    logger.warning(
-                        "Metric %s returned NaN. Using 0.0. ragas_input=%s ragas_output=%r",
-                        metric.name,
-                        ragas_input,
-                        result,
-                    )
-                    score_value = 0.0
-
-                scores[metric.name] = score_value
-
-                # Collect claim details when claim_level is enabled for faithfulness metrics
-                if self._claim_level_getter() and metric.name in self._faithfulness_metrics:
-                    claim_result = self._korean_fallback_details(sample)
-                    if isinstance(claim_result, ClaimLevelResult):
-                        # Update claim IDs with test_case_id prefix
-                        for claim in claim_result.claims:
-                            if not claim.claim_id.startswith(test_case_id):
-                                idx = claim.claim_id.split("-")[-1]
-                                claim.claim_id = f"{test_case_id}-claim-{idx}"
-                        claim_details[metric.name] = claim_result
-
-            except Exception as e:
-                fallback_score = None
-                fallback_claim_result = None
+    def _apply_metric_outcome(
+        self,
+        metric_name: str,
+        outcome: _MetricOutcome,
+        scores: dict[str, float],
+        claim_details: dict[str, ClaimLevelResult],
+    ) -> None:
+        scores[metric_name] = outcome.score
+        if outcome.claim_result is not None:
+            claim_details[metric_name] = outcome.claim_result
+        if outcome.ragas_error is not None and not self._faithfulness_ragas_failed:
+            logger.warning(
+                "Failed to score metric %s via Ragas (%s). Switching to fallback scoring.",
+                metric_name,
+                self._summarize_error(outcome.ragas_error),
+            )
+            self._faithfulness_ragas_failed = True
+
+    async def _score_metric(
+        self,
+        sample: SingleTurnSample,
+        metric: Any,
+        *,
+        test_case_id: str,
+        ragas_failed: bool,
+    ) -> _MetricOutcome:
+        """메트릭 하나의 점수 계산 (공유 상태는 변경하지 않음)."""
+        if metric.name in self._faithfulness_metrics:
+            if self._active_llm_provider_getter() == "ollama":
+                fallback_score = self._korean_fallback_score(sample)
+                if fallback_score is None:
+                    fallback_score = await self._faithfulness_fallback_score(sample)
+                if fallback_score is not None:
+                    return _MetricOutcome(score=fallback_score)
+            if ragas_failed:
                 if metric.name == "summary_faithfulness":
-                    fallback_score = await self._score_summary_faithfulness_judge(sample)
-                if fallback_score is None and metric.name in self._faithfulness_metrics:
-                    if not self._faithfulness_ragas_failed:
-                        logger.warning(
-                            "Failed to score metric %s via Ragas (%s). "
-                            "Switching to fallback scoring.",
-                            metric.name,
-                            self._summarize_error(e),
-                        )
-                        self._faithfulness_ragas_failed = True
-                    # When claim_level is enabled, get detailed results
-                    if self._claim_level_getter():
-                        fallback_claim_result = self._korean_fallback_details(sample)
-                        if isinstance(fallback_claim_result, ClaimLevelResult):
-                            fallback_score = fallback_claim_result.support_rate
-                            # Update claim IDs with test_case_id prefix
-                            for claim in fallback_claim_result.claims:
-                                if not claim.claim_id.startswith(test_case_id):
-                                    idx = claim.claim_id.split("-")[-1]
-                                    claim.claim_id = f"{test_case_id}-claim-{idx}"
-                            claim_details[metric.name] = fallback_claim_result
-                    else:
-                        fallback_score = await self._faithfulness_fallback_score(sample)
+                    judge_score = await self._score_summary_faithfulness_judge(sample)
+                    if judge_score is not None:
+                        return _MetricOutcome(score=judge_score)
+                fallback_score = await self._faithfulness_fallback_score(sample)
                 if fallback_score is not None:
-                    scores[metric.name] = fallback_score
-                else:
-                    # 개별 메트릭 실패 시 로그 출력 후 0.0으로 처리
-                    logger.error(f"Failed to score metric {metric.name}: {e}", exc_info=True)
-                    scores[metric.name] = 0.0
+                    return _MetricOutcome(score=fallback_score)
+        try:
+            # Ragas >=0.4 uses ascore() with kwargs
+            if hasattr(metric, "ascore"):
+                all_args = {
+                    "user_input": sample.user_input,
+                    "response": sample.response,
+                    "retrieved_contexts": sample.retrieved_contexts,
+                    "reference_contexts": sample.reference_contexts,
+                    "reference": sample.reference,
+                }
+                required_args = self._metric_args.get(
+                    metric.name,
+                    ["user_input", "response", "retrieved_contexts"],
+                )
+                kwargs = {k: v for k, v in all_args.items() if k in required_args and v is not None}
+                result = await metric.ascore(**kwargs)
+                ragas_input = kwargs
+            elif hasattr(metric, "single_turn_ascore"):
+                # Legacy Ragas <0.4 API
+                result = await metric.single_turn_ascore(sample)
+                ragas_input = {
+                    "user_input": sample.user_input,
+                    "response": sample.response,
+                    "retrieved_contexts": sample.retrieved_contexts,
+                    "reference_contexts": sample.reference_contexts,
+                    "reference": sample.reference,
+                }
+            else:
+                raise AttributeError(f"{metric.__class__.__name__} does not support scoring API.")
+
+            # Handle MetricResult (v0.4+), score attr, or raw float
+            if hasattr(result, "value"):
+                score_value = result.value
+            elif hasattr(result, "score"):
+                score_value = result.score
+            else:
+                score_value = result
 
-        return scores, claim_details
+            try:
+                score_value = float(score_value)
+            except (TypeError, ValueError):
+                logger.warning(
+                    "Metric %s returned non-numeric score (%r). Using 0.0.",
+                    metric.name,
+                    score_value,
+                )
+                score_value = 0.0
+
+            if math.isnan(score_value):
+                if metric.name == "summary_faithfulness":
+                    judge_score = await self._score_summary_faithfulness_judge(sample)
+                    if judge_score is not None:
+                        return _MetricOutcome(score=judge_score)
+                logger.warning(
+                    "Metric %s returned NaN. Using 0.0. ragas_input=%s ragas_output=%r",
+                    metric.name,
+                    ragas_input,
+                    result,
+                )
+                score_value = 0.0
+
+            # Collect claim details when claim_level is enabled for faithfulness metrics
+            claim_result = None
+            if self._claim_level_getter() and metric.name in self._faithfulness_metrics:
+                details = self._korean_fallback_details(sample)
+                if isinstance(details, ClaimLevelResult):
+                    claim_result = _prefix_claim_ids(details, test_case_id)
+            return _MetricOutcome(score=score_value, claim_result=claim_result)
+
+        except Exception as e:
+            report_rate_limit(self._active_llm_provider_getter(), e)
+            fallback_score = None
+            fallback_claim_result = None
+            ragas_error: Exception | None = None
+            if metric.name == "summary_faithfulness":
+                fallback_score = await self._score_summary_faithfulness_judge(sample)
+            if fallback_score is None and metric.name in self._faithfulness_metrics:
+                ragas_error = e
+                # When claim_level is enabled, get detailed results
+                if self._claim_level_getter():
+                    details = self._korean_fallback_details(sample)
+                    if isinstance(details, ClaimLevelResult):
+                        fallback_claim_result = _prefix_claim_ids(details, test_case_id)
+                        fallback_score = fallback_claim_result.support_rate
+                else:
+                    fallback_score = await self._faithfulness_fallback_score(sample)
+            if fallback_score is None:
+                # 개별 메트릭 실패 시 로그 출력 후 0.0으로 처리
+                logger.error(f"Failed to score metric {metric.name}: {e}", exc_info=True)
+                fallback_score = 0.0
+            return _MetricOutcome(
+                score=fallback_score,
+                claim_result=fallback_claim_result,
+                ragas_error=ragas_error,
+            )
 
     async def score_summary_faithfulness_judge(self, sample: SingleTurnSample) -> float | None:
         return await self._score_summary_faithfulness_judge(sample)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import time
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from typing import Any
 
@@ -13,7 +14,11 @@ from evalvault.domain.services.document_versioning import (
     parse_contract_date,
     select_chunks_for_contract_date,
 )
-from evalvault.ports.outbound.korean_nlp_port import RetrieverPort, RetrieverResultProtocol
+from evalvault.ports.outbound.korean_nlp_port import (
+    BatchRetrieverPort,
+    RetrieverPort,
+    RetrieverResultProtocol,
+)
 
 
 def apply_retriever_to_dataset(
@@ -22,18 +27,46 @@ def apply_retriever_to_dataset(
     retriever: RetrieverPort,
     top_k: int,
     doc_ids: Sequence[str] | None,
+    max_workers: int = 4,
 ) -> dict[str, dict[str, Any]]:
-    """Populate empty contexts via retriever and return retrieval metadata."""
+    """Populate empty contexts via retriever and return retrieval metadata.
+
+    Retrievers exposing ``search_batch`` (``BatchRetrieverPort``) are queried once
+    for all pending questions and ``retrieval_time_ms`` records the amortized
+    per-query time. Other retrievers are queried through a bounded thread pool
+    (``max_workers``; 1 keeps the serial loop), which overlaps searches that
+    release the GIL such as FAISS/numpy scoring.
+    """
 
-    retrieval_metadata: dict[str, dict[str, Any]] = {}
     resolved_doc_ids = list(doc_ids or [])
+    pending = [
+        test_case for test_case in dataset.test_cases if not _has_contexts(test_case.contexts)
+    ]
+    if not pending:
+        return {}
 
-    for test_case in dataset.test_cases:
-        if _has_contexts(test_case.contexts):
-            continue
+    questions = [test_case.question for test_case in pending]
+    if isinstance(retriever, BatchRetrieverPort):
         started_at = time.perf_counter()
-        results = retriever.search(test_case.question, top_k=top_k)
+        batch_results = retriever.search_batch(questions, top_k=top_k)
         elapsed_ms = (time.perf_counter() - started_at) * 1000
+        if len(batch_results) != len(questions):
+            raise ValueError(
+                f"search_batch returned {len(batch_results)} result lists "
+                f"for {len(questions)} queries"
+            )
+        per_query_ms = elapsed_ms / len(questions)
+        timed_results = [(results, per_query_ms) for results in batch_results]
+    elif max_workers > 1 and len(questions) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(questions))) as executor:
+            timed_results = list(
+                executor.map(lambda question: _timed_search(retriever, question, top_k), questions)
+            )
+    else:
+        timed_results = [_timed_search(retriever, question, top_k) for question in questions]
+
+    retrieval_metadata: dict[str, dict[str, Any]] = {}
+    for test_case, (results, elapsed_ms) in zip(pending, timed_results, strict=True):
         contexts, doc_id_list, scores = _normalize_retrieval_results(
             results,
             doc_ids=resolved_doc_ids,
@@ -61,6 +94,16 @@ def apply_retriever_to_dataset(
     return retrieval_metadata
 
 
+def _timed_search(
+    retriever: RetrieverPort,
+    question: str,
+    top_k: int,
+) -> tuple[Sequence[RetrieverResultProtocol], float]:
+    started_at = time.perf_counter()
+    results = retriever.search(question, top_k=top_k)
+    return results, (time.perf_counter() - started_at) * 1000
+
+
 def _has_contexts(contexts: Sequence[str]) -> bool:
     return any(ctx.strip() for ctx in contexts)
 
@@ -53,6 +53,19 @@ class EvalProgress:
     eta_seconds: float | None = None
     rate: float | None = None
 
+    def to_event_data(self) -> dict[str, Any]:
+        """스트리밍 progress 이벤트의 ``data`` 페이로드."""
+        return {
+            "current": self.current,
+            "total": self.total,
+            "percent": self.percent,
+            "status": self.status,
+            "message": self.current_metric or self.error_message or "",
+            "elapsed_seconds": self.elapsed_seconds,
+            "eta_seconds": self.eta_seconds,
+            "rate": self.rate,
+        }
+
 
 @dataclass
 class RunSummary:
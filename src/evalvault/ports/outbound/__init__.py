@@ -41,6 +41,7 @@ from evalvault.ports.outbound.improvement_port import (
 from evalvault.ports.outbound.intent_classifier_port import IntentClassifierPort
 from evalvault.ports.outbound.judge_calibration_port import JudgeCalibrationPort
 from evalvault.ports.outbound.korean_nlp_port import (
+    BatchRetrieverPort,
     FaithfulnessResultProtocol,
     KoreanNLPToolkitPort,
     RetrieverPort,
@@ -101,6 +102,7 @@ __all__ = [
     "TracerPort",
     "KoreanNLPToolkitPort",
     "FaithfulnessResultProtocol",
+    "BatchRetrieverPort",
     "RetrieverPort",
     "RetrieverResultProtocol",
     "BenchmarkBackend",
@@ -0,0 +1,58 @@
+"""Outbound port for the durable evaluation job queue.
+
+API 서버는 job을 넣고(enqueue) 진행 상황을 조회하며, ``evalvault worker`` 프로세스가
+job을 가져가(claim) 실행 결과를 기록한다. 평가 데이터(``StoragePort``)와 분리된
+계약이지만 같은 DB에 테이블을 둔다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, Protocol
+
+from evalvault.domain.entities.job import EvaluationJob, JobStatus
+
+
+class JobQueuePort(Protocol):
+    def enqueue(self, job: EvaluationJob) -> str:
+        """job을 대기열에 추가하고 job_id를 반환합니다."""
+        ...
+
+    def get_job(self, job_id: str) -> EvaluationJob | None: ...
+
+    def list_jobs(
+        self,
+        *,
+        project_id: str | None = None,
+        statuses: Iterable[JobStatus] | None = None,
+        limit: int = 50,
+    ) -> list[EvaluationJob]:
+        """최근 생성 순으로 job 목록을 조회합니다."""
+        ...
+
+    def claim_next(self, worker_id: str, *, max_per_project: int) -> EvaluationJob | None:
+        """프로젝트별 실행 중 job 수가 제한보다 적은 가장 오래된 대기 job을 원자적으로 가져옵니다."""
+        ...
+
+    def update_progress(self, job_id: str, progress: dict[str, Any] | None = None) -> None:
+        """진행 상황과 heartbeat를 갱신합니다 (``progress``가 None이면 heartbeat만)."""
+        ...
+
+    def finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        *,
+        run_id: str | None = None,
+        error: str | None = None,
+    ) -> bool:
+        """실행 중인 job을 종료 상태로 전환합니다. 이미 종료된 job이면 False."""
+        ...
+
+    def request_cancel(self, job_id: str) -> EvaluationJob | None:
+        """대기 중이면 즉시 취소하고, 실행 중이면 취소 요청을 표시합니다."""
+        ...
+
+    def requeue_stale(self, stale_after_seconds: float, *, max_attempts: int) -> int:
+        """heartbeat가 끊긴 실행 중 job을 다시 대기열로 돌립니다 (시도 횟수 초과 시 실패)."""
+        ...
@@ -37,6 +37,18 @@ class RetrieverPort(Protocol):
         """Search documents."""
 
 
+@runtime_checkable
+class BatchRetrieverPort(Protocol):
+    """Optional retriever capability for scoring many queries in one call."""
+
+    def search_batch(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+    ) -> Sequence[Sequence[RetrieverResultProtocol]]:
+        """Search documents for each query, preserving query order."""
+
+
 class KoreanNLPToolkitPort(Protocol):
     """Toolkit providing Korean NLP helpers."""
 
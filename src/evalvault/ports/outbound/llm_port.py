@@ -1,7 +1,11 @@
 """LLM adapter port for Ragas evaluation."""
 
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -43,6 +47,80 @@ class GenerationOptions:
     seed: int | None = None
 
 
+@dataclass
+class TokenUsageScope:
+    """Token usage attributed to one unit of work (e.g. a single test case).
+
+    Adapters report every provider response through :func:`record_scoped_usage`;
+    the counts land in the scope active in the calling task/thread, so
+    concurrent test cases are accounted for independently. Counts are also
+    broken down by the metric active via :func:`metric_usage_scope`.
+    """
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    by_metric: dict[str, dict[str, int]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(
+        self,
+        prompt: int,
+        completion: int,
+        total: int | None = None,
+        *,
+        metric: str | None = None,
+    ) -> None:
+        total_value = total if total is not None else prompt + completion
+        with self._lock:
+            self.prompt_tokens += prompt
+            self.completion_tokens += completion
+            self.total_tokens += total_value
+            if metric:
+                bucket = self.by_metric.setdefault(
+                    metric, {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+                )
+                bucket["prompt_tokens"] += prompt
+                bucket["completion_tokens"] += completion
+                bucket["total_tokens"] += total_value
+
+
+_active_usage_scope: ContextVar[TokenUsageScope | None] = ContextVar(
+    "evalvault_token_usage_scope", default=None
+)
+_active_usage_metric: ContextVar[str | None] = ContextVar(
+    "evalvault_token_usage_metric", default=None
+)
+
+
+@contextmanager
+def token_usage_scope() -> Iterator[TokenUsageScope]:
+    """Attribute LLM token usage inside the block to a fresh scope."""
+    scope = TokenUsageScope()
+    token = _active_usage_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _active_usage_scope.reset(token)
+
+
+@contextmanager
+def metric_usage_scope(metric_name: str) -> Iterator[None]:
+    """Tag usage recorded inside the block with ``metric_name``."""
+    token = _active_usage_metric.set(metric_name)
+    try:
+        yield
+    finally:
+        _active_usage_metric.reset(token)
+
+
+def record_scoped_usage(prompt: int, completion: int, total: int | None = None) -> None:
+    """Add usage to the active :class:`TokenUsageScope`, if any."""
+    scope = _active_usage_scope.get()
+    if scope is not None:
+        scope.add(prompt, completion, total, metric=_active_usage_metric.get())
+
+
 class LLMPort(ABC):
     """LLM adapter interface for Ragas metrics evaluation.
 
@@ -1,10 +1,13 @@
 """결과 저장 인터페이스."""
 
+from collections.abc import Sequence
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Protocol
 
 from evalvault.domain.entities import (
     EvaluationRun,
+    EvaluationRunSummary,
     FeedbackSummary,
     MultiTurnConversationRecord,
     MultiTurnRunRecord,
@@ -13,6 +16,7 @@ from evalvault.domain.entities import (
     RunClusterMap,
     RunClusterMapInfo,
     SatisfactionFeedback,
+    TestCaseResult,
 )
 from evalvault.domain.entities.experiment import Experiment
 from evalvault.domain.entities.stage import StageEvent, StageMetric
@@ -24,17 +28,37 @@ class StoragePort(Protocol):
     SQLite, PostgreSQL 등 다양한 저장소에 평가 결과를 저장합니다.
     """
 
-    def save_run(self, run: EvaluationRun) -> str:
+    def save_run(self, run: EvaluationRun, *, commit_every: int | None = None) -> str:
         """평가 실행 결과를 저장합니다.
 
         Args:
             run: 저장할 평가 실행 결과
+            commit_every: 지정 시 해당 테스트 케이스 수마다 중간 커밋 (대용량 run용)
 
         Returns:
             저장된 run의 ID
         """
         ...
 
+    def append_run_results(self, run: EvaluationRun, results: Sequence[TestCaseResult]) -> int:
+        """평가 실행에 테스트 케이스 결과를 추가 저장합니다.
+
+        run 레코드가 없으면 생성하고, 있으면 ``run``의 집계/메타데이터로 갱신합니다.
+        결과 추가와 run 갱신은 하나의 트랜잭션으로 커밋됩니다 (스트리밍 평가용).
+
+        Args:
+            run: run 레코드 헤더 (results는 저장하지 않음)
+            results: 이번에 추가할 테스트 케이스 결과
+
+        Returns:
+            추가된 결과 수
+        """
+        ...
+
+    def list_completed_test_case_ids(self, run_id: str) -> set[str]:
+        """run에 이미 저장된 테스트 케이스 ID 집합을 반환합니다 (재개용)."""
+        ...
+
     def save_multiturn_run(
         self,
         run: MultiTurnRunRecord,
@@ -104,6 +128,31 @@ class StoragePort(Protocol):
         """
         ...
 
+    def list_run_summaries(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        *,
+        after: tuple[datetime, str] | None = None,
+        dataset_name: str | None = None,
+        model_name: str | None = None,
+        project_id: str | None = None,
+    ) -> list[EvaluationRunSummary]:
+        """테스트 케이스를 적재하지 않고 평가 실행 요약 목록을 조회합니다.
+
+        Args:
+            limit: 최대 조회 개수
+            offset: 조회 시작 위치 (선택, keyset 커서 권장)
+            after: 이전 페이지 마지막 요약의 ``(started_at, run_id)`` (keyset 커서)
+            dataset_name: 필터링할 데이터셋 이름 (선택)
+            model_name: 필터링할 모델 이름 (선택)
+            project_id: 지정 시 해당 프로젝트 소속 run만 반환(G4 격리)
+
+        Returns:
+            EvaluationRunSummary 리스트 (최신순)
+        """
+        ...
+
     def delete_run(self, run_id: str) -> bool: ...
 
     def save_stage_events(self, events: list[StageEvent]) -> int: ...
@@ -274,3 +323,21 @@ class StoragePort(Protocol):
     def get_regression_baseline(self, baseline_key: str) -> dict[str, Any] | None:
         """회귀 테스트 베이스라인을 조회합니다."""
         ...
+
+    def save_analysis_cache_entry(
+        self,
+        cache_key: str,
+        run_id: str,
+        analysis_type: str,
+        payload: bytes,
+    ) -> None:
+        """직렬화된 분석 결과를 캐시 테이블에 저장합니다 (run 삭제 시 함께 삭제)."""
+        ...
+
+    def get_analysis_cache_entry(self, cache_key: str) -> bytes | None:
+        """캐시된 분석 결과를 조회합니다."""
+        ...
+
+    def delete_analysis_cache_entries(self, run_id: str) -> int:
+        """run의 캐시된 분석 결과를 모두 삭제합니다."""
+        ...
@@ -0,0 +1,130 @@
+"""Live FastAPI evaluation job routes (enqueue / list / cancel / re-attach stream).
+
+Drives the real app via TestClient over a real SQLite job queue and identity
+store; no worker runs, so job state transitions are applied through the queue
+directly the way an ``evalvault worker`` would.
+"""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from evalvault.adapters.inbound.api.main import create_app
+from evalvault.adapters.outbound.auth.jwt_token_service import JwtTokenService
+from evalvault.adapters.outbound.storage.sqlite_identity import SqliteIdentityStorageAdapter
+from evalvault.adapters.outbound.storage.sqlite_job_queue import SqliteJobQueueAdapter
+from evalvault.config.model_config import reset_model_config
+from evalvault.config.settings import reset_settings
+from evalvault.domain.entities.auth import Membership, Project, Role, User
+from evalvault.domain.entities.job import JobStatus
+
+SECRET = "job-routes-secret"
+BODY = {
+    "dataset_path": "data/datasets/proj-a/qa.json",
+    "metrics": ["faithfulness"],
+    "model": "gpt-5-nano",
+}
+
+
+@pytest.fixture
+def wired(tmp_path, monkeypatch):
+    reset_settings()
+    reset_model_config()
+    monkeypatch.delenv("API_AUTH_TOKENS", raising=False)
+    monkeypatch.setenv("JOB_POLL_INTERVAL_SECONDS", "0.1")
+
+    identity = SqliteIdentityStorageAdapter(db_path=tmp_path / "identity.db")
+    identity.create_project(Project(name="A", slug="a", id="proj-a"))
+    identity.create_project(Project(name="B", slug="b", id="proj-b"))
+    editor = User(email="editor@x", hashed_password="h")
+    viewer = User(email="viewer@x", hashed_password="h")
+    identity.create_user(editor)
+    identity.create_user(viewer)
+    identity.add_membership(Membership(user_id=editor.id, project_id="proj-a", role=Role.editor))
+    identity.add_membership(Membership(user_id=viewer.id, project_id="proj-a", role=Role.viewer))
+    identity.add_membership(Membership(user_id=editor.id, project_id="proj-b", role=Role.editor))
+
+    queue = SqliteJobQueueAdapter(db_path=tmp_path / "jobs.db")
+    tokens = JwtTokenService(secret=SECRET)
+
+    with patch("evalvault.adapters.inbound.api.main.create_adapter", return_value=MagicMock()):
+        app = create_app()
+        app.state.identity_store = identity
+        app.state.token_service = tokens
+        app.state.job_queue = queue
+        with TestClient(app) as client:
+            yield SimpleNamespace(
+                client=client, queue=queue, tokens=tokens, editor=editor, viewer=viewer
+            )
+    reset_settings()
+
+
+def _headers(env, user, project_id: str = "proj-a") -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {env.tokens.issue_access_token(user.id)}",
+        "X-Project-Id": project_id,
+    }
+
+
+def test_enqueue_returns_queued_job(wired):
+    resp = wired.client.post("/api/v1/jobs", json=BODY, headers=_headers(wired, wired.editor))
+
+    assert resp.status_code == 202
+    job = resp.json()
+    assert job["status"] == "queued"
+    assert job["project_id"] == "proj-a"
+    stored = wired.queue.get_job(job["job_id"])
+    assert stored.payload["metrics"] == ["faithfulness"]
+    assert stored.payload["dataset_path"].endswith("data/datasets/proj-a/qa.json")
+
+
+def test_enqueue_requires_editor(wired):
+    resp = wired.client.post("/api/v1/jobs", json=BODY, headers=_headers(wired, wired.viewer))
+    assert resp.status_code == 403
+
+
+def test_foreign_project_job_is_not_found(wired):
+    job_id = wired.client.post(
+        "/api/v1/jobs", json=BODY, headers=_headers(wired, wired.editor)
+    ).json()["job_id"]
+
+    other = _headers(wired, wired.editor, "proj-b")
+    assert wired.client.get(f"/api/v1/jobs/{job_id}", headers=other).status_code == 404
+    assert wired.client.get("/api/v1/jobs", headers=other).json() == []
+    listed = wired.client.get("/api/v1/jobs", headers=_headers(wired, wired.viewer)).json()
+    assert [job["job_id"] for job in listed] == [job_id]
+
+
+def test_cancel_queued_job_then_conflict(wired):
+    headers = _headers(wired, wired.editor)
+    job_id = wired.client.post("/api/v1/jobs", json=BODY, headers=headers).json()["job_id"]
+
+    assert (
+        wired.client.post(f"/api/v1/jobs/{job_id}/cancel", headers=_headers(wired, wired.viewer))
+    ).status_code == 403
+    resp = wired.client.post(f"/api/v1/jobs/{job_id}/cancel", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "cancelled"
+    assert wired.client.post(f"/api/v1/jobs/{job_id}/cancel", headers=headers).status_code == 409
+
+
+def test_events_replay_finished_job_as_ndjson_and_sse(wired):
+    headers = _headers(wired, wired.editor)
+    job_id = wired.client.post("/api/v1/jobs", json=BODY, headers=headers).json()["job_id"]
+    wired.queue.claim_next("w1", max_per_project=1)
+    wired.queue.update_progress(job_id, {"current": 1, "total": 1, "percent": 100.0})
+    wired.queue.finish(job_id, JobStatus.SUCCEEDED, run_id="run-9")
+
+    resp = wired.client.get(f"/api/v1/jobs/{job_id}/events", headers=headers)
+    events = [json.loads(line) for line in resp.text.splitlines() if line]
+    assert [event["type"] for event in events] == ["status", "progress", "result"]
+    assert events[-1]["data"] == {"run_id": "run-9", "status": "completed", "job_id": job_id}
+
+    sse = wired.client.get(f"/api/v1/jobs/{job_id}/events?format=sse", headers=headers)
+    assert sse.headers["content-type"].startswith("text/event-stream")
+    assert "event: result\ndata: " in sse.text
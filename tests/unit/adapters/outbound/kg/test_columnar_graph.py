@@ -0,0 +1,188 @@
+"""Unit tests for ColumnarKnowledgeGraph."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from evalvault.adapters.inbound.cli.commands.run_helpers import load_knowledge_graph
+from evalvault.adapters.outbound.kg.columnar_graph import ColumnarKnowledgeGraph, is_columnar_kg
+from evalvault.adapters.outbound.kg.graph_rag_retriever import GraphRAGRetriever
+from evalvault.adapters.outbound.kg.networkx_adapter import NetworkXKnowledgeGraph
+from evalvault.domain.entities.kg import EntityModel, RelationModel
+
+
+@pytest.fixture
+def source_kg() -> NetworkXKnowledgeGraph:
+    kg = NetworkXKnowledgeGraph()
+    kg.add_entity(
+        EntityModel(
+            name="삼성생명",
+            entity_type="organization",
+            canonical_name="삼성생명보험",
+            source_document_id="doc-001",
+            attributes={"country": "KR"},
+            confidence=0.9,
+            provenance="regex",
+        )
+    )
+    kg.add_entity(
+        EntityModel(
+            name="종신보험",
+            entity_type="product",
+            source_document_id="doc-002",
+            confidence=0.8,
+        )
+    )
+    kg.add_entity(EntityModel(name="사망보험금", entity_type="coverage", confidence=0.7))
+    kg.add_entity(EntityModel(name="고립", entity_type="product"))
+    kg.add_relation(
+        RelationModel(
+            source="삼성생명",
+            target="종신보험",
+            relation_type="provides",
+            attributes={"since": 2020},
+            confidence=0.85,
+        )
+    )
+    kg.add_relation(
+        RelationModel(
+            source="종신보험", target="사망보험금", relation_type="covers", confidence=0.6
+        )
+    )
+    kg.add_relation(
+        RelationModel(source="삼성생명", target="사망보험금", relation_type="pays", confidence=0.5)
+    )
+    return kg
+
+
+@pytest.fixture
+def columnar_kg(source_kg: NetworkXKnowledgeGraph, tmp_path: Path) -> ColumnarKnowledgeGraph:
+    path = ColumnarKnowledgeGraph.save(source_kg, tmp_path / "kg", metadata={"origin": "test"})
+    return ColumnarKnowledgeGraph.load(path)
+
+
+def _relation_keys(relations: list[RelationModel]) -> list[tuple[str, str, str]]:
+    return sorted((r.source, r.relation_type, r.target) for r in relations)
+
+
+def test_round_trip_preserves_entities_and_relations(
+    source_kg: NetworkXKnowledgeGraph, columnar_kg: ColumnarKnowledgeGraph
+) -> None:
+    assert is_columnar_kg(columnar_kg.path)
+    assert columnar_kg.metadata == {"origin": "test"}
+    assert len(columnar_kg) == source_kg.get_node_count()
+
+    for entity in source_kg.get_all_entities():
+        assert columnar_kg.get_entity(entity.name) == entity
+    assert columnar_kg.get_entity("없음") is None
+    assert "삼성생명" in columnar_kg
+
+    assert _relation_keys(columnar_kg.get_all_relations()) == _relation_keys(
+        source_kg.get_all_relations()
+    )
+    relation = columnar_kg.get_relations("삼성생명", "종신보험")[0]
+    assert relation.attributes == {"since": 2020}
+    assert relation.confidence == pytest.approx(0.85)
+
+
+def test_adjacency_queries_match_networkx(
+    source_kg: NetworkXKnowledgeGraph, columnar_kg: ColumnarKnowledgeGraph
+) -> None:
+    for name in ("삼성생명", "종신보험", "사망보험금", "고립"):
+        assert _relation_keys(columnar_kg.get_outgoing_relations(name)) == _relation_keys(
+            source_kg.get_outgoing_relations(name)
+        )
+        assert _relation_keys(columnar_kg.get_incoming_relations(name)) == _relation_keys(
+            source_kg.get_incoming_relations(name)
+        )
+        assert sorted(e.name for e in columnar_kg.find_neighbors(name, depth=2)) == sorted(
+            e.name for e in source_kg.find_neighbors(name, depth=2)
+        )
+        assert columnar_kg.get_degree(name) == source_kg.get_degree(name)
+
+    provides = columnar_kg.get_outgoing_relations("삼성생명", relation_type="provides")
+    assert [r.target for r in provides] == ["종신보험"]
+    assert columnar_kg.has_relation("종신보험", "사망보험금")
+    assert not columnar_kg.has_relation("사망보험금", "종신보험")
+    assert columnar_kg.get_source_document_ids() == source_kg.get_source_document_ids()
+
+
+def test_statistics_match_networkx(
+    source_kg: NetworkXKnowledgeGraph, columnar_kg: ColumnarKnowledgeGraph
+) -> None:
+    expected = source_kg.get_statistics()
+    actual = columnar_kg.get_statistics()
+
+    assert actual.keys() == expected.keys()
+    assert actual["entity_types"] == expected["entity_types"]
+    assert actual["relation_types"] == expected["relation_types"]
+    assert actual["isolated_entities"] == expected["isolated_entities"]
+    assert actual["average_entity_confidence"] == pytest.approx(
+        expected["average_entity_confidence"]
+    )
+
+
+def test_load_memory_maps_columns(columnar_kg: ColumnarKnowledgeGraph) -> None:
+    reloaded = ColumnarKnowledgeGraph.load(columnar_kg.path)
+
+    assert any(isinstance(array, np.memmap) for array in reloaded._columns.values())
+    assert reloaded.to_networkx().to_dict() == columnar_kg.to_networkx().to_dict()
+
+
+def test_empty_graph_round_trip(tmp_path: Path) -> None:
+    path = ColumnarKnowledgeGraph.save(NetworkXKnowledgeGraph(), tmp_path / "empty")
+    graph = ColumnarKnowledgeGraph.load(path)
+
+    assert len(graph) == 0
+    assert graph.get_all_relations() == []
+    assert graph.find_neighbors("없음") == []
+    assert graph.get_statistics()["num_entities"] == 0
+
+
+def test_load_rejects_invalid_directory(tmp_path: Path) -> None:
+    (tmp_path / "manifest.json").write_text(json.dumps({"format": "other"}), encoding="utf-8")
+
+    assert not is_columnar_kg(tmp_path)
+    with pytest.raises(ValueError):
+        ColumnarKnowledgeGraph.load(tmp_path)
+
+
+def test_load_knowledge_graph_accepts_columnar_directory(
+    columnar_kg: ColumnarKnowledgeGraph, tmp_path: Path
+) -> None:
+    loaded = load_knowledge_graph(columnar_kg.path)
+    assert isinstance(loaded, ColumnarKnowledgeGraph)
+
+    with pytest.raises(ValueError):
+        load_knowledge_graph(tmp_path)
+
+
+def test_graphrag_retriever_on_columnar_graph(columnar_kg: ColumnarKnowledgeGraph) -> None:
+    retriever = GraphRAGRetriever(columnar_kg)
+
+    results = retriever.search("삼성생명 종신보험 보장", top_k=3)
+
+    assert results
+    assert results[0].doc_id in {"doc-001", "doc-002"}
+    assert "kg" in results[0].metadata
+
+
+def test_graphrag_update_graph_materializes_columnar(
+    columnar_kg: ColumnarKnowledgeGraph,
+) -> None:
+    retriever = GraphRAGRetriever(columnar_kg)
+    addition = NetworkXKnowledgeGraph()
+    addition.add_entity(
+        EntityModel(name="암진단특약", entity_type="coverage", source_document_id="doc-003")
+    )
+
+    retriever.update_graph(addition)
+
+    assert isinstance(retriever._kg, NetworkXKnowledgeGraph)
+    assert retriever._kg.has_entity("삼성생명")
+    assert retriever._kg.has_entity("암진단특약")
+    assert any(result.doc_id == "doc-003" for result in retriever.search("암진단특약", top_k=3))
@@ -0,0 +1,71 @@
+"""Unit tests for EntityNameMatcher."""
+
+from __future__ import annotations
+
+import random
+
+from evalvault.adapters.outbound.kg.entity_matcher import EntityNameMatcher
+
+
+def test_matches_overlapping_and_nested_patterns() -> None:
+    matcher = EntityNameMatcher()
+    matcher.add("he", ["he"])
+    matcher.add("she", ["she"])
+    matcher.add("his", ["his"])
+    matcher.add("hers", ["hers"])
+
+    assert matcher.match("ushers") == {"she", "he", "hers"}
+    assert matcher.match("this") == {"his"}
+    assert matcher.match("") == set()
+
+
+def test_multiple_patterns_and_shared_patterns() -> None:
+    matcher = EntityNameMatcher()
+    matcher.add("암진단특약", ["암진단특약", "암진단"])
+    matcher.add("암진단비", ["암진단비", "암진단"])
+
+    assert matcher.match("암진단 보장은?") == {"암진단특약", "암진단비"}
+    assert matcher.match("암진단특약 해지") == {"암진단특약", "암진단비"}
+    assert len(matcher) == 2
+
+
+def test_discard_and_replace_patterns() -> None:
+    matcher = EntityNameMatcher()
+    matcher.add("alpha", ["alpha", "a-corp"])
+    matcher.add("beta", ["beta"])
+
+    assert matcher.discard("alpha") is True
+    assert matcher.discard("alpha") is False
+    assert matcher.match("alpha a-corp beta") == {"beta"}
+
+    matcher.add("beta", ["b-plan"])
+    assert matcher.match("beta") == set()
+    assert matcher.match("b-plan") == {"beta"}
+    assert "beta" in matcher
+    assert matcher.names() == {"beta"}
+
+
+def test_incremental_add_after_match() -> None:
+    matcher = EntityNameMatcher()
+    matcher.add("ab", ["ab"])
+    assert matcher.match("xabc") == {"ab"}
+
+    matcher.add("bc", ["bc"])
+    matcher.add("abcd", ["abcd"])
+    assert matcher.match("xabcd") == {"ab", "bc", "abcd"}
+
+
+def test_matches_brute_force_substring_search() -> None:
+    rng = random.Random(7)
+    alphabet = "가나다ab"
+    matcher = EntityNameMatcher()
+    patterns: dict[str, str] = {}
+    for idx in range(200):
+        pattern = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+        patterns[f"e{idx}"] = pattern
+        matcher.add(f"e{idx}", [pattern])
+
+    for _ in range(100):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        expected = {name for name, pattern in patterns.items() if pattern in text}
+        assert matcher.match(text) == expected
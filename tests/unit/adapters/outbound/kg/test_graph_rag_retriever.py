@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -27,6 +29,26 @@ class _FakeRetriever:
         return self._results[:top_k]
 
 
+class _BarrierRetriever(_FakeRetriever):
+    def __init__(self, results: list[_FakeResult], barrier: threading.Barrier) -> None:
+        super().__init__(results)
+        self._barrier = barrier
+
+    def search(self, query: str, top_k: int = 5) -> list[_FakeResult]:
+        self._barrier.wait()
+        return super().search(query, top_k)
+
+
+class _SlowRetriever(_FakeRetriever):
+    def __init__(self, results: list[_FakeResult], delay: float) -> None:
+        super().__init__(results)
+        self._delay = delay
+
+    def search(self, query: str, top_k: int = 5) -> list[_FakeResult]:
+        time.sleep(self._delay)
+        return super().search(query, top_k)
+
+
 @pytest.fixture
 def sample_kg() -> NetworkXKnowledgeGraph:
     fixture_path = Path("tests/fixtures/kg/minimal_graph.json")
@@ -122,3 +144,105 @@ def test_graphrag_update_graph_merges_entities(sample_kg: NetworkXKnowledgeGraph
     assert stats["entities_added"] == 1
     assert results
     assert results[0].doc_id == "doc-003"
+
+
+def test_graphrag_entity_matching_honors_min_length_and_canonical_name() -> None:
+    kg = NetworkXKnowledgeGraph()
+    for name, canonical in (("AB", None), ("BetaPlan", "beta plan"), ("X", None)):
+        kg.add_entity(
+            EntityModel(
+                name=name,
+                entity_type="product",
+                canonical_name=canonical,
+                source_document_id="doc-001",
+                confidence=0.9,
+                provenance="manual",
+            )
+        )
+    retriever = GraphRAGRetriever(kg, keyword_extractor=lambda text: [], min_entity_match_length=2)
+
+    assert set(retriever._extract_query_entities("ab and beta plan with x")) == {
+        "AB",
+        "BetaPlan",
+    }
+
+
+def test_graphrag_entity_matcher_tracks_direct_graph_changes(
+    sample_kg: NetworkXKnowledgeGraph,
+) -> None:
+    retriever = GraphRAGRetriever(sample_kg, keyword_extractor=lambda text: [])
+    assert "AlphaCorp" in retriever._extract_query_entities("about alphacorp")
+
+    sample_kg.remove_entity("AlphaCorp")
+    sample_kg.add_entity(
+        EntityModel(
+            name="DeltaFund",
+            entity_type="product",
+            source_document_id="doc-004",
+            confidence=0.9,
+            provenance="manual",
+        )
+    )
+
+    assert retriever._extract_query_entities("about alphacorp") == []
+    assert retriever._extract_query_entities("deltafund returns") == ["DeltaFund"]
+
+
+def test_graphrag_runs_legs_concurrently(sample_kg: NetworkXKnowledgeGraph) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    bm25 = _BarrierRetriever([_FakeResult(doc_id="doc-002", score=0.9)], barrier)
+    dense = _BarrierRetriever([_FakeResult(doc_id="doc-003", score=0.8)], barrier)
+    retriever = GraphRAGRetriever(
+        sample_kg, bm25_retriever=bm25, dense_retriever=dense, keyword_extractor=lambda t: []
+    )
+
+    results = retriever.search("Unrelated query", top_k=2)
+    retriever.close()
+
+    assert {result.doc_id for result in results} == {"doc-002", "doc-003"}
+
+
+def test_graphrag_degrades_when_leg_exceeds_timeout(sample_kg: NetworkXKnowledgeGraph) -> None:
+    bm25 = _FakeRetriever([_FakeResult(doc_id="doc-002", score=0.9)])
+    dense = _SlowRetriever([_FakeResult(doc_id="doc-003", score=0.8)], delay=1.0)
+    retriever = GraphRAGRetriever(
+        sample_kg,
+        bm25_retriever=bm25,
+        dense_retriever=dense,
+        keyword_extractor=lambda t: [],
+        leg_timeout_seconds=0.1,
+    )
+
+    started = time.perf_counter()
+    results, leg_ms, degraded = retriever._run_legs("Unrelated query", top_k=1)
+    elapsed = time.perf_counter() - started
+    retriever.close()
+
+    assert elapsed < 0.9
+    assert degraded == ["dense"]
+    assert results["bm25"][0] == ["doc-002"]
+    assert results["dense"] == ([], {})
+    assert "dense" not in leg_ms
+    assert {"kg", "bm25"} <= set(leg_ms)
+
+
+def test_graphrag_sequential_mode_matches_concurrent(sample_kg: NetworkXKnowledgeGraph) -> None:
+    bm25 = _FakeRetriever([_FakeResult(doc_id="doc-002", score=0.9)])
+    dense = _FakeRetriever([_FakeResult(doc_id="doc-003", score=0.95)])
+    kwargs = {"bm25_retriever": bm25, "dense_retriever": dense, "keyword_extractor": lambda t: []}
+    concurrent = GraphRAGRetriever(sample_kg, **kwargs)
+    sequential = GraphRAGRetriever(sample_kg, concurrent_legs=False, **kwargs)
+
+    expected = concurrent.search("AlphaCorp provides BetaPlan", top_k=3)
+    actual = sequential.search("AlphaCorp provides BetaPlan", top_k=3)
+    concurrent.close()
+
+    assert [(r.doc_id, r.score) for r in actual] == [(r.doc_id, r.score) for r in expected]
+    _, leg_ms, degraded = sequential._run_legs("AlphaCorp", top_k=1)
+    assert set(leg_ms) == {"kg", "bm25", "dense"}
+    assert degraded == []
+
+
+def test_graphrag_rejects_non_positive_leg_timeout(sample_kg: NetworkXKnowledgeGraph) -> None:
+    with pytest.raises(ValueError, match="leg_timeout_seconds"):
+        GraphRAGRetriever(sample_kg, leg_timeout_seconds=0)
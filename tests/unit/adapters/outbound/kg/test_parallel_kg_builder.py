@@ -44,3 +44,46 @@ def test_parallel_kg_builder_streaming_iterable() -> None:
 
     assert result.stats.documents_processed == 2
     assert result.documents_by_id == {}
+
+
+def test_parallel_kg_builder_workers_match_serial() -> None:
+    docs = DOCS * 6
+    serial = ParallelKGBuilder(workers=1, batch_size=3).build(docs)
+    parallel = ParallelKGBuilder(workers=2, batch_size=3, store_documents=True).build(docs)
+
+    assert parallel.graph.to_dict() == serial.graph.to_dict()
+    assert parallel.stats.snapshot() | {"elapsed_ms": 0} == serial.stats.snapshot() | {
+        "elapsed_ms": 0
+    }
+    assert parallel.stats.chunks_processed == 4
+    assert parallel.documents_by_id["doc-11"] == docs[11]
+
+
+def test_parallel_kg_builder_reuses_worker_extractor(monkeypatch) -> None:
+    from evalvault.adapters.outbound.kg import parallel_kg_builder
+
+    created: list[object] = []
+    original = parallel_kg_builder.EntityExtractor
+
+    def tracking_extractor():
+        extractor = original()
+        created.append(extractor)
+        return extractor
+
+    monkeypatch.setattr(parallel_kg_builder, "_worker_extractor", None)
+    monkeypatch.setattr(parallel_kg_builder, "EntityExtractor", tracking_extractor)
+
+    ParallelKGBuilder(workers=1, batch_size=1).build(DOCS * 3)
+
+    assert len(created) == 1
+
+
+def test_parallel_kg_builder_keeps_highest_confidence_entity() -> None:
+    from evalvault.adapters.outbound.kg.parallel_kg_builder import _extract_batch
+
+    extraction = _extract_batch([("a", DOCS[0]), ("b", DOCS[0])])
+
+    names = [row[0] for row in extraction.entities]
+    assert len(names) == len(set(names))
+    assert all(row[5] == "a" for row in extraction.entities)
+    assert extraction.entities_seen == 2 * len(extraction.entities)
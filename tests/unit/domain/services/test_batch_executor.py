@@ -0,0 +1,191 @@
+"""Tests for the sliding-window batch executor and provider limiters."""
+
+import asyncio
+
+import pytest
+
+from evalvault.domain.services.batch_executor import (
+    AdaptiveConcurrencyLimiter,
+    WindowProgress,
+    configure_provider_concurrency,
+    get_provider_limiter,
+    is_rate_limit_error,
+    parse_provider_concurrency,
+    report_rate_limit,
+    reset_provider_limiters,
+    run_sliding_window,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    reset_provider_limiters()
+    yield
+    reset_provider_limiters()
+
+
+class TestRunSlidingWindow:
+    """run_sliding_window 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_preserves_order_and_bounds_concurrency(self):
+        active = 0
+        peak = 0
+
+        async def worker(item: int) -> int:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001 * (item % 3))
+            active -= 1
+            return item * 2
+
+        results = await run_sliding_window(list(range(20)), worker=worker, concurrency=4)
+
+        assert results == [item * 2 for item in range(20)]
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_slow_item_does_not_stall_other_slots(self):
+        release_slow = asyncio.Event()
+        finished: list[int] = []
+
+        async def worker(item: int) -> int:
+            if item == 0:
+                await release_slow.wait()
+            finished.append(item)
+            if len(finished) == 5:
+                release_slow.set()
+            return item
+
+        await asyncio.wait_for(
+            run_sliding_window(list(range(6)), worker=worker, concurrency=2), timeout=1
+        )
+
+        # With batch barriers items 2..5 could not start until item 0 finished.
+        assert finished[:5] == [1, 2, 3, 4, 5]
+        assert finished[-1] == 0
+
+    @pytest.mark.asyncio
+    async def test_progress_reports_queue_and_in_flight(self):
+        updates: list[WindowProgress] = []
+
+        async def worker(item: int) -> int:
+            await asyncio.sleep(0)
+            return item
+
+        await run_sliding_window(
+            list(range(5)), worker=worker, concurrency=2, on_progress=updates.append
+        )
+
+        assert [update.completed for update in updates] == [1, 2, 3, 4, 5]
+        assert all(update.total == 5 for update in updates)
+        assert all(update.in_flight <= 2 for update in updates)
+        assert updates[-1].queued == 0
+        assert updates[0].queued == 3
+
+    @pytest.mark.asyncio
+    async def test_exceptions_are_returned_in_place(self):
+        async def worker(item: int) -> int:
+            if item == 1:
+                raise RuntimeError("boom")
+            return item
+
+        results = await run_sliding_window([0, 1, 2], worker=worker, concurrency=2)
+
+        assert results[0] == 0
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == 2
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate_when_requested(self):
+        async def worker(item: int) -> int:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await run_sliding_window([0, 1], worker=worker, return_exceptions=False)
+
+    @pytest.mark.asyncio
+    async def test_limiter_caps_in_flight_below_window(self):
+        limiter = AdaptiveConcurrencyLimiter(2)
+        active = 0
+        peak = 0
+
+        async def worker(item: int) -> int:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return item
+
+        await run_sliding_window(list(range(10)), worker=worker, concurrency=8, limiter=limiter)
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """AdaptiveConcurrencyLimiter 테스트."""
+
+    def test_rate_limit_halves_and_successes_recover(self):
+        limiter = AdaptiveConcurrencyLimiter(8, increase_after=2, decrease_cooldown_seconds=0)
+        limiter.record_rate_limit()
+        assert limiter.limit == 4
+        limiter.record_success()
+        limiter.record_success()
+        assert limiter.limit == 5
+        assert limiter.rate_limited_count == 1
+
+    def test_cooldown_collapses_burst_of_429s(self):
+        limiter = AdaptiveConcurrencyLimiter(8, decrease_cooldown_seconds=60)
+        for _ in range(5):
+            limiter.record_rate_limit()
+        assert limiter.limit == 4
+
+    def test_limits_respect_bounds(self):
+        limiter = AdaptiveConcurrencyLimiter(2, max_limit=2, increase_after=1)
+        limiter.record_success()
+        assert limiter.limit == 2
+        limiter.record_rate_limit()
+        assert limiter.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_worker_shrinks_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(4, decrease_cooldown_seconds=0)
+
+        async def worker(item: int) -> int:
+            raise RuntimeError("Error code: 429 - Too Many Requests")
+
+        await run_sliding_window([0], worker=worker, limiter=limiter)
+
+        assert limiter.limit == 2
+
+
+class TestProviderLimiters:
+    """프로바이더별 리미터 레지스트리 테스트."""
+
+    def test_parse_provider_concurrency(self):
+        assert parse_provider_concurrency("openai=16, Ollama=2") == {"openai": 16, "ollama": 2}
+        assert parse_provider_concurrency("") == {}
+        with pytest.raises(ValueError):
+            parse_provider_concurrency("openai")
+
+    def test_configured_limit_is_shared_per_provider(self):
+        configure_provider_concurrency({"openai": 3})
+        limiter = get_provider_limiter("OpenAI", default_limit=10)
+        assert limiter.limit == 3
+        assert get_provider_limiter("openai", default_limit=5) is limiter
+        assert get_provider_limiter("ollama", default_limit=5).limit == 5
+
+    def test_report_rate_limit_targets_provider(self):
+        limiter = get_provider_limiter("openai", default_limit=8)
+        assert report_rate_limit("openai", RuntimeError("rate limit exceeded")) is True
+        assert limiter.limit == 4
+        assert report_rate_limit("openai", RuntimeError("timeout")) is False
+
+    def test_is_rate_limit_error_checks_status_code(self):
+        error = RuntimeError("too busy")
+        error.status_code = 429  # type: ignore[attr-defined]
+        assert is_rate_limit_error(error)
+        assert not is_rate_limit_error(RuntimeError("bad request"))
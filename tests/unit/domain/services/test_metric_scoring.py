@@ -0,0 +1,248 @@
+"""Tests for MetricScorer intra-sample metric concurrency."""
+
+import asyncio
+
+import pytest
+from ragas import SingleTurnSample
+
+from evalvault.adapters.outbound.llm.base import TokenUsage
+from evalvault.domain.entities import ClaimLevelResult, ClaimVerdict, Dataset, TestCase
+from evalvault.domain.services.batch_executor import reset_provider_limiters
+from evalvault.domain.services.metric_scoring import MetricScorer
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    reset_provider_limiters()
+    yield
+    reset_provider_limiters()
+
+
+class _Metric:
+    def __init__(self, name: str, score: float = 0.5, delay: float = 0.01, error=None):
+        self.name = name
+        self._score = score
+        self._delay = delay
+        self._error = error
+
+    async def ascore(self, **kwargs):
+        await asyncio.sleep(self._delay)
+        if self._error is not None:
+            raise self._error
+        return self._score
+
+
+def _sample() -> SingleTurnSample:
+    return SingleTurnSample(
+        user_input="질문",
+        response="답변",
+        retrieved_contexts=["컨텍스트"],
+    )
+
+
+def _build_scorer(
+    *,
+    metric_concurrency: int,
+    fallback_score: float | None = 0.3,
+    claim_level: bool = False,
+    claim_details=None,
+) -> MetricScorer:
+    async def faithfulness_fallback(_sample):
+        return fallback_score
+
+    return MetricScorer(
+        faithfulness_metrics={"faithfulness", "summary_faithfulness"},
+        metric_args={},
+        custom_metric_map={},
+        reference_required_metrics=set(),
+        active_llm_provider_getter=lambda: "openai",
+        active_llm_getter=lambda: None,
+        prompt_language_getter=lambda: "ko",
+        claim_level_getter=lambda: claim_level,
+        korean_fallback_score=lambda _s: None,
+        korean_fallback_details=lambda _s: claim_details,
+        faithfulness_fallback_score=faithfulness_fallback,
+        calculate_cost=lambda *_args: 0.0,
+        summarize_error=str,
+        metric_concurrency_getter=lambda: metric_concurrency,
+    )
+
+
+class TestScoreSingleSampleConcurrency:
+    """score_single_sample 메트릭 동시 실행 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_run_concurrently_in_metric_order(self):
+        active = 0
+        peak = 0
+
+        class _Tracked(_Metric):
+            async def ascore(self, **kwargs):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                try:
+                    return await super().ascore(**kwargs)
+                finally:
+                    active -= 1
+
+        metrics = [_Tracked(f"m{i}", score=i / 10, delay=0.01 * (4 - i)) for i in range(4)]
+        scorer = _build_scorer(metric_concurrency=4)
+
+        scores, _ = await scorer.score_single_sample(_sample(), metrics, test_case_id="tc-1")
+
+        assert list(scores) == ["m0", "m1", "m2", "m3"]
+        assert scores == {"m0": 0.0, "m1": 0.1, "m2": 0.2, "m3": 0.3}
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_fan_out_is_bounded(self):
+        active = 0
+        peak = 0
+
+        class _Tracked(_Metric):
+            async def ascore(self, **kwargs):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                try:
+                    return await super().ascore(**kwargs)
+                finally:
+                    active -= 1
+
+        scorer = _build_scorer(metric_concurrency=2)
+        await scorer.score_single_sample(
+            _sample(), [_Tracked(f"m{i}") for i in range(5)], test_case_id="tc-1"
+        )
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_faithfulness_latch_is_deterministic(self):
+        metrics = [
+            _Metric("faithfulness", error=RuntimeError("parse error"), delay=0.02),
+            _Metric("answer_relevancy", score=0.9, delay=0.0),
+        ]
+        scorer = _build_scorer(metric_concurrency=2, fallback_score=0.4)
+
+        scores, _ = await scorer.score_single_sample(_sample(), metrics, test_case_id="tc-1")
+
+        assert scores == {"faithfulness": 0.4, "answer_relevancy": 0.9}
+        assert scorer.faithfulness_ragas_failed is True
+
+        # Subsequent samples go straight to the fallback, as in sequential mode.
+        healthy = [_Metric("faithfulness", score=1.0), _Metric("answer_relevancy", score=0.9)]
+        scores, _ = await scorer.score_single_sample(_sample(), healthy, test_case_id="tc-2")
+        assert scores["faithfulness"] == 0.4
+
+    @pytest.mark.asyncio
+    async def test_claim_details_match_sequential_mode(self):
+        def claim_result() -> ClaimLevelResult:
+            return ClaimLevelResult(
+                total_claims=1,
+                supported_claims=1,
+                not_supported_claims=0,
+                partially_supported_claims=0,
+                claims=[ClaimVerdict(claim_id="x-claim-0", claim_text="c", verdict="supported")],
+            )
+
+        results = []
+        for concurrency in (1, 3):
+            scorer = _build_scorer(
+                metric_concurrency=concurrency,
+                claim_level=True,
+                claim_details=claim_result(),
+            )
+            results.append(
+                await scorer.score_single_sample(
+                    _sample(),
+                    [_Metric("faithfulness", score=0.8), _Metric("answer_relevancy")],
+                    test_case_id="tc-9",
+                )
+            )
+
+        (seq_scores, seq_claims), (par_scores, par_claims) = results
+        assert seq_scores == par_scores
+        assert list(seq_claims) == list(par_claims) == ["faithfulness"]
+        assert par_claims["faithfulness"].claims[0].claim_id == "tc-9-claim-0"
+
+
+class _UsageLLM:
+    """LLM double whose adapter-level counter mirrors TokenTrackingAsyncOpenAI."""
+
+    def __init__(self):
+        self.usage = TokenUsage()
+
+    def get_model_name(self) -> str:
+        return "gpt-5.4-mini"
+
+    def get_and_reset_token_usage(self):
+        return self.usage.get_and_reset()
+
+
+class _BillingMetric(_Metric):
+    """Records provider usage proportional to the question length."""
+
+    def __init__(self, name: str, llm: _UsageLLM, weight: int):
+        super().__init__(name, score=1.0, delay=0.0)
+        self._llm = llm
+        self._weight = weight
+
+    async def ascore(self, **kwargs):
+        # Interleave with other in-flight samples before reporting usage.
+        await asyncio.sleep(0.001 * len(kwargs["user_input"]))
+        tokens = len(kwargs["user_input"]) * self._weight
+        self._llm.usage.add(tokens, 1)
+        return 1.0
+
+
+class TestParallelTokenAttribution:
+    """병렬 모드 테스트 케이스별 토큰 집계 테스트."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("metric_concurrency", [1, 2])
+    async def test_tokens_are_attributed_per_case_and_metric(self, metric_concurrency):
+        llm = _UsageLLM()
+        questions = {"tc-short": "q", "tc-long": "q" * 10, "tc-mid": "q" * 4}
+        dataset = Dataset(
+            name="ds",
+            version="1",
+            test_cases=[
+                TestCase(id=case_id, question=question, answer="a", contexts=["c"])
+                for case_id, question in questions.items()
+            ],
+        )
+        samples = [
+            SingleTurnSample(user_input=tc.question, response=tc.answer, retrieved_contexts=["c"])
+            for tc in dataset.test_cases
+        ]
+        metrics = [_BillingMetric("answer_relevancy", llm, 10), _BillingMetric("m2", llm, 1)]
+        scorer = _build_scorer(metric_concurrency=metric_concurrency)
+        scorer._calculate_cost_cb = lambda _model, prompt, completion: prompt / 1000
+
+        results = await scorer.evaluate_parallel(
+            dataset=dataset,
+            ragas_samples=samples,
+            ragas_metrics=metrics,
+            llm=llm,
+            score_sample=lambda sample, ms, tcid: scorer.score_single_sample(
+                sample, ms, test_case_id=tcid
+            ),
+            batch_size=3,
+        )
+
+        for case_id, question in questions.items():
+            result = results[case_id]
+            length = len(question)
+            assert result.prompt_tokens == length * 11
+            assert result.completion_tokens == 2
+            assert result.tokens_used == length * 11 + 2
+            assert result.cost_usd == pytest.approx(length * 11 / 1000)
+            assert result.metric_token_usage == {
+                "answer_relevancy": {
+                    "prompt_tokens": length * 10,
+                    "completion_tokens": 1,
+                    "total_tokens": length * 10 + 1,
+                },
+                "m2": {"prompt_tokens": length, "completion_tokens": 1, "total_tokens": length + 1},
+            }
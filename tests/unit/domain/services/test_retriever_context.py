@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from types import SimpleNamespace
 
+import pytest
+
 from evalvault.domain.entities.dataset import Dataset, TestCase
 from evalvault.domain.services.retriever_context import (
     _compact_values,
@@ -33,6 +36,30 @@ class DummyRetriever:
         return self._results
 
 
+class DummyBatchRetriever(DummyRetriever):
+    def __init__(self, results_by_query):
+        super().__init__([])
+        self._results_by_query = results_by_query
+        self.batches: list[tuple[list[str], int]] = []
+
+    def search_batch(self, queries, top_k: int = 5):
+        self.batches.append((list(queries), top_k))
+        return [self._results_by_query[query] for query in queries]
+
+
+class ConcurrentRetriever:
+    """Blocks until two searches are in flight to prove the thread-pool fallback."""
+
+    def __init__(self):
+        self._barrier = threading.Barrier(2, timeout=5)
+        self.threads: set[int] = set()
+
+    def search(self, query: str, top_k: int = 5):
+        self.threads.add(threading.get_ident())
+        self._barrier.wait()
+        return [DummyResult(document=f"ctx-{query}", score=1.0, doc_id=0)]
+
+
 def test_apply_retriever_populates_contexts_and_metadata() -> None:
     test_cases = [
         TestCase(id="tc-1", question="Q1", answer="A1", contexts=[]),
@@ -119,3 +146,104 @@ def test_compact_values_returns_sorted_list() -> None:
 def test_extract_graph_attributes_empty_results() -> None:
     results = [SimpleNamespace(metadata=None)]
     assert _extract_graph_attributes(results) == {}
+
+
+def test_apply_retriever_uses_search_batch_when_available() -> None:
+    test_cases = [
+        TestCase(id="tc-1", question="Q1", answer="A1", contexts=[]),
+        TestCase(id="tc-2", question="Q2", answer="A2", contexts=["existing"]),
+        TestCase(id="tc-3", question="Q3", answer="A3", contexts=[]),
+    ]
+    dataset = Dataset(name="test", version="1.0.0", test_cases=test_cases)
+    retriever = DummyBatchRetriever(
+        {
+            "Q1": [DummyResult(document="ctx-1", score=0.5, doc_id=0)],
+            "Q3": [
+                DummyResult(
+                    document="ctx-3",
+                    score=0.7,
+                    doc_id=1,
+                    metadata={"kg": {"entities": ["e1"], "relations": []}},
+                )
+            ],
+        }
+    )
+
+    metadata = apply_retriever_to_dataset(
+        dataset=dataset,
+        retriever=retriever,
+        top_k=3,
+        doc_ids=["doc-a", "doc-b"],
+    )
+
+    assert retriever.batches == [(["Q1", "Q3"], 3)]
+    assert retriever.queries == []
+    assert test_cases[0].contexts == ["ctx-1"]
+    assert test_cases[2].contexts == ["ctx-3"]
+    assert set(metadata) == {"tc-1", "tc-3"}
+    assert metadata["tc-1"]["doc_ids"] == ["doc-a"]
+    assert metadata["tc-3"]["doc_ids"] == ["doc-b"]
+    assert metadata["tc-1"]["retrieval_time_ms"] == metadata["tc-3"]["retrieval_time_ms"]
+    assert metadata["tc-3"]["graph_nodes"] == 1
+    assert metadata["tc-3"]["retriever"] == "graphrag"
+
+
+def test_apply_retriever_rejects_mismatched_batch_results() -> None:
+    dataset = Dataset(
+        name="test",
+        version="1.0.0",
+        test_cases=[TestCase(id="tc-1", question="Q1", answer="A1", contexts=[])],
+    )
+
+    class ShortBatchRetriever(DummyRetriever):
+        def search_batch(self, queries, top_k: int = 5):
+            return []
+
+    with pytest.raises(ValueError, match="search_batch returned 0 result lists"):
+        apply_retriever_to_dataset(
+            dataset=dataset,
+            retriever=ShortBatchRetriever([]),
+            top_k=1,
+            doc_ids=None,
+        )
+
+
+def test_apply_retriever_searches_concurrently_without_batch_support() -> None:
+    test_cases = [
+        TestCase(id=f"tc-{idx}", question=f"Q{idx}", answer="A", contexts=[]) for idx in range(4)
+    ]
+    dataset = Dataset(name="test", version="1.0.0", test_cases=test_cases)
+    retriever = ConcurrentRetriever()
+
+    metadata = apply_retriever_to_dataset(
+        dataset=dataset,
+        retriever=retriever,
+        top_k=1,
+        doc_ids=["doc-a"],
+        max_workers=2,
+    )
+
+    assert len(retriever.threads) == 2
+    assert list(metadata) == [f"tc-{idx}" for idx in range(4)]
+    assert [case.contexts for case in test_cases] == [[f"ctx-Q{idx}"] for idx in range(4)]
+    assert all(meta["retrieval_time_ms"] >= 0 for meta in metadata.values())
+
+
+def test_apply_retriever_serial_when_single_worker() -> None:
+    test_cases = [
+        TestCase(id="tc-1", question="Q1", answer="A1", contexts=[]),
+        TestCase(id="tc-2", question="Q2", answer="A2", contexts=[]),
+    ]
+    dataset = Dataset(name="test", version="1.0.0", test_cases=test_cases)
+    retriever = DummyRetriever([DummyResult(document="ctx", score=0.1, doc_id=0)])
+
+    metadata = apply_retriever_to_dataset(
+        dataset=dataset,
+        retriever=retriever,
+        top_k=2,
+        doc_ids=None,
+        max_workers=1,
+    )
+
+    assert retriever.queries == [("Q1", 2), ("Q2", 2)]
+    assert set(metadata) == {"tc-1", "tc-2"}
@@ -0,0 +1,153 @@
+"""Unit tests for the API server analysis cache."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from evalvault.adapters.inbound.api import analysis_cache
+from evalvault.adapters.inbound.api.analysis_cache import AnalysisCacheKey, AnalysisResultCache
+from evalvault.adapters.outbound.storage.sqlite_adapter import SQLiteStorageAdapter
+from evalvault.domain.entities import EvaluationRun, MetricScore, TestCaseResult
+
+
+def _make_run(run_id: str = "run-cache-001", cases: int = 4) -> EvaluationRun:
+    return EvaluationRun(
+        run_id=run_id,
+        dataset_name="insurance-qa",
+        dataset_version="1.0.0",
+        model_name="gpt-5-nano",
+        started_at=datetime(2025, 1, 1, 10, 0, 0),
+        finished_at=datetime(2025, 1, 1, 10, 5, 0),
+        metrics_evaluated=["faithfulness", "answer_relevancy"],
+        thresholds={"faithfulness": 0.7, "answer_relevancy": 0.7},
+        results=[
+            TestCaseResult(
+                test_case_id=f"tc-{index:03d}",
+                metrics=[
+                    MetricScore(name="faithfulness", score=0.5 + index * 0.1, threshold=0.7),
+                    MetricScore(name="answer_relevancy", score=0.9 - index * 0.1, threshold=0.7),
+                ],
+                question=f"질문 {index}",
+                answer=f"답변 {index}",
+                contexts=[f"컨텍스트 {index}"],
+            )
+            for index in range(cases)
+        ],
+    )
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> SQLiteStorageAdapter:
+    adapter = SQLiteStorageAdapter(db_path=tmp_path / "runs.db")
+    adapter.save_run(_make_run())
+    return adapter
+
+
+def test_key_depends_on_run_type_and_options() -> None:
+    key = AnalysisCacheKey.build("run-1", "bundle", {"nlp": True, "causal": False})
+
+    assert key == AnalysisCacheKey.build("run-1", "bundle", {"causal": False, "nlp": True})
+    assert key != AnalysisCacheKey.build("run-1", "bundle", {"nlp": False, "causal": False})
+    assert key.cache_key.startswith("analysis:run-1:bundle:")
+
+
+def test_memory_hit_and_run_invalidation() -> None:
+    cache = AnalysisResultCache(max_size=16)
+    key = AnalysisCacheKey.build("run-1", "bundle", {"nlp": False})
+    other = AnalysisCacheKey.build("run-2", "bundle", {"nlp": False})
+
+    assert cache.get(key) is None
+    cache.set(key, {"value": 1})
+    cache.set(other, {"value": 2})
+    assert cache.get(key) == {"value": 1}
+
+    assert cache.invalidate_run("run-1") == 1
+    assert cache.get(key) is None
+    assert cache.get(other) == {"value": 2}
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["invalidations"] == 1
+
+
+def test_zero_size_disables_cache() -> None:
+    cache = AnalysisResultCache(max_size=0)
+    key = AnalysisCacheKey.build("run-1", "bundle", {})
+
+    cache.set(key, {"value": 1})
+
+    assert cache.get(key) is None
+
+
+def test_persistent_tier_survives_new_cache(storage: SQLiteStorageAdapter) -> None:
+    key = AnalysisCacheKey.build("run-cache-001", "bundle", {"nlp": False})
+    AnalysisResultCache(persist=True).set(key, {"scores": [0.1, 0.2]}, storage=storage)
+
+    restarted = AnalysisResultCache(persist=True)
+    assert restarted.get(key, storage=storage) == {"scores": [0.1, 0.2]}
+    assert restarted.get(key, storage=storage) == {"scores": [0.1, 0.2]}
+
+    stats = restarted.get_stats()
+    assert stats["persistent_hits"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_persistent_rows_follow_run_lifecycle(storage: SQLiteStorageAdapter) -> None:
+    cache = AnalysisResultCache(persist=True)
+    key = AnalysisCacheKey.build("run-cache-001", "bundle", {})
+    cache.set(key, {"value": 1}, storage=storage)
+
+    cache.invalidate_run("run-cache-001", storage=storage)
+    assert storage.get_analysis_cache_entry(key.cache_key) is None
+
+    cache.set(key, {"value": 1}, storage=storage)
+    storage.delete_run("run-cache-001")
+    assert storage.get_analysis_cache_entry(key.cache_key) is None
+
+
+def test_stats_window_reports_hit_rate_since_last_call() -> None:
+    cache = AnalysisResultCache(max_size=16)
+    key = AnalysisCacheKey.build("run-1", "bundle", {})
+    cache.get(key)
+    cache.set(key, {"value": 1})
+    cache.get(key)
+
+    first = cache.stats_window()
+    assert first["window"]["hits"] == 1
+    assert first["window"]["hit_rate"] == pytest.approx(0.5)
+
+    cache.get(key)
+    assert cache.stats_window()["window"]["hit_rate"] == pytest.approx(1.0)
+
+
+def test_web_adapter_reuses_analysis_bundle(storage: SQLiteStorageAdapter, monkeypatch) -> None:
+    from evalvault.adapters.inbound.api import adapter as adapter_module
+    from evalvault.adapters.inbound.api.adapter import WebUIAdapter
+
+    monkeypatch.setattr(analysis_cache, "_cache", AnalysisResultCache(max_size=16))
+    original = adapter_module.AnalysisService.analyze_run
+    calls: list[str] = []
+
+    def counting_analyze(service, run, **kwargs):
+        calls.append(run.run_id)
+        return original(service, run, **kwargs)
+
+    monkeypatch.setattr(adapter_module.AnalysisService, "analyze_run", counting_analyze)
+    web = WebUIAdapter(storage=storage, evaluator=MagicMock())
+
+    first = web.build_dashboard_payload("run-cache-001", include_nlp=False, include_causal=False)
+    second = web.build_dashboard_payload("run-cache-001", include_nlp=False, include_causal=False)
+    assert first == second
+    assert len(calls) == 1
+
+    web.build_dashboard_payload("run-cache-001", include_nlp=False, include_causal=True)
+    assert len(calls) == 2
+    assert web.get_analysis_cache_stats()["hits"] == 1
+
+    assert web.delete_run("run-cache-001")
+    assert analysis_cache.get_analysis_cache().get_stats()["total_size"] == 0
@@ -0,0 +1,197 @@
+"""Unit tests for the API server retriever registry."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from evalvault.adapters.inbound.api import retriever_registry
+from evalvault.adapters.inbound.api.retriever_registry import (
+    RetrieverRegistry,
+    estimate_footprint,
+    parse_warmup_corpora,
+)
+
+
+class _CountingBuilder:
+    def __init__(self, *, delay: float = 0.0, fail: bool = False, nbytes: int = 0) -> None:
+        self.calls: list[tuple[Path, str]] = []
+        self._delay = delay
+        self._fail = fail
+        self._nbytes = nbytes
+        self._lock = threading.Lock()
+
+    def __call__(self, path: Path, mode: str):
+        with self._lock:
+            self.calls.append((path, mode))
+        time.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("index build failed")
+        retriever = MagicMock()
+        retriever.embeddings = np.zeros(self._nbytes, dtype=np.uint8)
+        documents = path.read_text(encoding="utf-8").splitlines()
+        return retriever, [f"doc-{i}" for i in range(len(documents))], documents
+
+
+@pytest.fixture
+def docs_file(tmp_path: Path) -> Path:
+    path = tmp_path / "docs.txt"
+    path.write_text("보험료 납입\n사망보험금 지급\n", encoding="utf-8")
+    return path
+
+
+def test_reuses_retriever_for_same_corpus_and_mode(docs_file: Path) -> None:
+    registry = RetrieverRegistry(max_bytes=1 << 30)
+    builder = _CountingBuilder()
+
+    first, doc_ids = registry.get_or_build(docs_file, "bm25", builder)
+    second, _ = registry.get_or_build(docs_file, "bm25", builder)
+    registry.get_or_build(docs_file, "hybrid", builder)
+
+    assert first is second
+    assert doc_ids == ["doc-0", "doc-1"]
+    assert [mode for _, mode in builder.calls] == ["bm25", "hybrid"]
+    assert registry.get_stats()["hits"] == 1
+
+
+def test_rebuilds_when_corpus_changes(docs_file: Path) -> None:
+    registry = RetrieverRegistry(max_bytes=1 << 30)
+    builder = _CountingBuilder()
+    first, _ = registry.get_or_build(docs_file, "bm25", builder)
+
+    docs_file.write_text("보험료 납입\n사망보험금 지급\n해지환급금\n", encoding="utf-8")
+    stat = docs_file.stat()
+    os.utime(docs_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second, doc_ids = registry.get_or_build(docs_file, "bm25", builder)
+
+    assert second is not first
+    assert len(doc_ids) == 3
+    # 이전 버전 인덱스는 교체되어 하나만 남음
+    assert registry.get_stats()["entries"] == 1
+
+
+def test_concurrent_requests_share_one_build(docs_file: Path) -> None:
+    registry = RetrieverRegistry(max_bytes=1 << 30)
+    builder = _CountingBuilder(delay=0.2)
+    results: list[object] = []
+
+    def request() -> None:
+        retriever, _ = registry.get_or_build(docs_file, "bm25", builder)
+        results.append(retriever)
+
+    threads = [threading.Thread(target=request) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builder.calls) == 1
+    assert len(results) == 6
+    assert all(retriever is results[0] for retriever in results)
+
+
+def test_failed_build_is_not_cached(docs_file: Path) -> None:
+    registry = RetrieverRegistry(max_bytes=1 << 30)
+
+    with pytest.raises(RuntimeError):
+        registry.get_or_build(docs_file, "bm25", _CountingBuilder(fail=True))
+
+    builder = _CountingBuilder()
+    registry.get_or_build(docs_file, "bm25", builder)
+    assert len(builder.calls) == 1
+
+
+def test_evicts_least_recently_used_by_footprint(tmp_path: Path) -> None:
+    registry = RetrieverRegistry(max_bytes=2_500)
+    builder = _CountingBuilder(nbytes=1_000)
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"docs-{index}.txt"
+        path.write_text(f"문서 {index}\n", encoding="utf-8")
+        paths.append(path)
+
+    registry.get_or_build(paths[0], "bm25", builder)
+    registry.get_or_build(paths[1], "bm25", builder)
+    registry.get_or_build(paths[0], "bm25", builder)
+    registry.get_or_build(paths[2], "bm25", builder)
+
+    stats = registry.get_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    registry.get_or_build(paths[0], "bm25", builder)
+    assert len(builder.calls) == 3
+
+
+def test_zero_budget_disables_reuse(docs_file: Path) -> None:
+    registry = RetrieverRegistry(max_bytes=0)
+    builder = _CountingBuilder()
+
+    registry.get_or_build(docs_file, "bm25", builder)
+    registry.get_or_build(docs_file, "bm25", builder)
+
+    assert len(builder.calls) == 2
+
+
+def test_estimate_footprint_counts_nested_arrays() -> None:
+    inner = MagicMock()
+    inner.__dict__["_embeddings"] = np.zeros((10, 8), dtype=np.float32)
+    outer = type("Retriever", (), {})()
+    outer.dense = inner
+
+    assert estimate_footprint(outer, ["abcd"]) == 10 * 8 * 4 + 4 * 4
+
+
+def test_parse_warmup_corpora() -> None:
+    assert parse_warmup_corpora("hybrid:data/a.jsonl, data/b.txt,,bm25:data/c.json") == [
+        ("hybrid", Path("data/a.jsonl")),
+        ("bm25", Path("data/b.txt")),
+        ("bm25", Path("data/c.json")),
+    ]
+    assert parse_warmup_corpora("") == []
+
+
+def test_warm_up_builds_in_background(docs_file: Path) -> None:
+    registry = RetrieverRegistry(max_bytes=1 << 30)
+    builder = _CountingBuilder()
+
+    thread = registry.warm_up(
+        [("bm25", docs_file), ("bm25", docs_file.with_name("missing.txt"))], builder
+    )
+    thread.join(timeout=5)
+
+    registry.get_or_build(docs_file, "bm25", builder)
+    assert len(builder.calls) == 1
+
+
+def test_web_adapter_build_retriever_uses_registry(tmp_path: Path, monkeypatch) -> None:
+    from evalvault.adapters.inbound.api.adapter import WebUIAdapter
+
+    (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+    docs_dir = tmp_path / "data"
+    docs_dir.mkdir()
+    (docs_dir / "docs.txt").write_text("보험료 납입\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(retriever_registry, "_registry", RetrieverRegistry(max_bytes=1 << 30))
+
+    adapter = WebUIAdapter(storage=MagicMock(), evaluator=MagicMock())
+    built: list[Path] = []
+
+    def fake_index(path: Path, mode: str):
+        built.append(path)
+        return MagicMock(), ["doc-1"], ["보험료 납입"]
+
+    monkeypatch.setattr(adapter, "_build_retriever_index", fake_index)
+    config = {"mode": "bm25", "docs_path": "data/docs.txt", "top_k": 3}
+
+    first = adapter._build_retriever(config, MagicMock())
+    second = adapter._build_retriever(config, MagicMock())
+
+    assert len(built) == 1
+    assert first[0] is second[0]
+    assert first[1:] == (["doc-1"], 3, "bm25", str(docs_dir / "docs.txt"))
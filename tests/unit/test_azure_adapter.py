@@ -147,6 +147,7 @@ class TestAzureOpenAIAdapter:
 
         mock_azure_client.assert_called_once_with(
             usage_tracker=ANY,
+            response_cache=None,
             azure_endpoint="https://test.openai.azure.com",
             api_key="test-key",
             api_version="2024-02-15-preview",
@@ -213,6 +213,55 @@ class TestCLIRun:
         assert kwargs["dataset_path"] == dataset_file
         assert kwargs["metrics"] == ["faithfulness"]
         assert kwargs["chunk_size"] == 1
+        assert kwargs["resume_run_id"] is None
+        mock_get_loader.assert_not_called()
+
+    @patch(f"{RUN_COMMAND_MODULE}._evaluate_streaming_run", new_callable=AsyncMock)
+    @patch(f"{RUN_COMMAND_MODULE}.get_llm_adapter")
+    @patch(f"{RUN_COMMAND_MODULE}.RagasEvaluator")
+    @patch(f"{RUN_COMMAND_MODULE}.get_loader")
+    @patch(f"{RUN_COMMAND_MODULE}.Settings")
+    def test_run_resume_implies_streaming(
+        self,
+        mock_settings_cls,
+        mock_get_loader,
+        mock_evaluator_cls,
+        mock_get_llm_adapter,
+        mock_stream_helper,
+        mock_evaluation_run,
+        tmp_path,
+    ):
+        dataset_file = tmp_path / "dataset.csv"
+        dataset_file.write_text("id,question,answer,contexts\n", encoding="utf-8")
+
+        mock_settings = MagicMock()
+        mock_settings.openai_api_key = "key"
+        mock_settings.openai_model = get_test_model()
+        mock_settings.llm_provider = "openai"
+        mock_settings.evalvault_profile = None
+        mock_settings.phoenix_enabled = False
+        mock_settings_cls.return_value = mock_settings
+        mock_get_llm_adapter.return_value = MagicMock()
+        mock_stream_helper.return_value = mock_evaluation_run
+
+        result = runner.invoke(
+            app,
+            [
+                "run",
+                str(dataset_file),
+                "--metrics",
+                "faithfulness",
+                "--resume",
+                "run-123",
+                "--db",
+                str(tmp_path / "runs.db"),
+            ],
+        )
+
+        assert result.exit_code == 0, result.stdout
+        _, kwargs = mock_stream_helper.await_args
+        assert kwargs["resume_run_id"] == "run-123"
+        assert kwargs["storage"] is not None
         mock_get_loader.assert_not_called()
 
     @patch(f"{RUN_COMMAND_MODULE}.get_loader")
@@ -693,6 +742,52 @@ class TestKGCLI:
         assert "stats" in data
         assert "graph" in data
 
+    def test_kg_build_columnar_output(self, tmp_path):
+        """--format columnar 옵션으로 컬럼형 디렉터리 저장."""
+        sample_file = tmp_path / "doc.txt"
+        sample_file.write_text("삼성생명의 종신보험은 사망보험금을 보장합니다.", encoding="utf-8")
+        output = tmp_path / "kg_columnar"
+
+        result = runner.invoke(
+            app,
+            ["kg", "build", str(sample_file), "--output", str(output), "--format", "columnar"],
+        )
+
+        assert result.exit_code == 0
+        manifest = json.loads((output / "manifest.json").read_text(encoding="utf-8"))
+        assert manifest["metadata"]["type"] == "kg_build_result"
+
+        inspect = runner.invoke(app, ["kg", "inspect", str(output)])
+        assert inspect.exit_code == 0
+        assert "Entities" in inspect.stdout
+
+    def test_kg_build_rejects_unknown_format(self, tmp_path):
+        """지원하지 않는 --format 값은 오류."""
+        sample_file = tmp_path / "doc.txt"
+        sample_file.write_text("삼성생명의 종신보험은 사망보험금을 보장합니다.", encoding="utf-8")
+
+        result = runner.invoke(app, ["kg", "build", str(sample_file), "--format", "parquet"])
+
+        assert result.exit_code == 1
+
+    def test_kg_convert_and_inspect_entity(self, tmp_path):
+        """KG JSON을 컬럼형으로 변환하고 엔티티 주변을 조회."""
+        output = tmp_path / "kg_columnar"
+
+        result = runner.invoke(
+            app, ["kg", "convert", "tests/fixtures/kg/minimal_graph.json", str(output)]
+        )
+        assert result.exit_code == 0
+        assert "(2 entities, 1 relations)" in " ".join(result.stdout.split())
+
+        inspect = runner.invoke(app, ["kg", "inspect", str(output), "--entity", "AlphaCorp"])
+        assert inspect.exit_code == 0
+        assert "provides" in inspect.stdout
+        assert "BetaPlan" in inspect.stdout
+
+        missing = runner.invoke(app, ["kg", "inspect", str(output), "--entity", "Nobody"])
+        assert missing.exit_code == 1
+
     def test_kg_build_with_workers_and_batch(self, tmp_path):
         """--workers, --batch-size 옵션 전달."""
         sample_file = tmp_path / "doc.txt"
@@ -3855,6 +3950,79 @@ class TestRunHelperFunctions:
         assert result.total_cost_usd == pytest.approx(0.3)
         assert result.thresholds["faithfulness"] == 0.6
 
+    @pytest.mark.asyncio
+    async def test_evaluate_streaming_run_persists_chunks_and_resumes(self, tmp_path):
+        from evalvault.adapters.outbound.storage.sqlite_adapter import SQLiteStorageAdapter
+
+        dataset_file = tmp_path / "cases.csv"
+        rows = "".join(f'{index},"Q{index}","A{index}","[\\"ctx\\"]"\n' for index in range(1, 6))
+        dataset_file.write_text("id,question,answer,contexts\n" + rows, encoding="utf-8")
+        template = Dataset(
+            name="stream-ds",
+            version="stream",
+            test_cases=[],
+            metadata={},
+            source_file=str(dataset_file),
+            thresholds={},
+        )
+        storage = SQLiteStorageAdapter(db_path=tmp_path / "runs.db")
+        evaluated: list[list[str]] = []
+
+        def fake_evaluate(*, dataset, fail_on: int | None = None, **_kwargs):
+            evaluated.append([case.id for case in dataset.test_cases])
+            if len(evaluated) == fail_on:
+                raise RuntimeError("LLM quota exceeded")
+            return EvaluationRun(
+                dataset_name="stream-ds",
+                model_name="mock",
+                results=[
+                    TestCaseResult(
+                        test_case_id=case.id,
+                        metrics=[MetricScore(name="faithfulness", score=0.9, threshold=0.6)],
+                    )
+                    for case in dataset.test_cases
+                ],
+                total_tokens=len(dataset.test_cases),
+            )
+
+        evaluator = MagicMock()
+        evaluator.evaluate = AsyncMock(side_effect=lambda **kw: fake_evaluate(fail_on=2, **kw))
+        checkpoints: list[str] = []
+        stream_kwargs = {
+            "dataset_path": dataset_file,
+            "dataset_template": template,
+            "metrics": ["faithfulness"],
+            "thresholds": {"faithfulness": 0.6},
+            "llm": MagicMock(),
+            "chunk_size": 2,
+            "parallel": False,
+            "batch_size": 5,
+            "storage": storage,
+        }
+
+        with pytest.raises(RuntimeError):
+            await run_command_module._evaluate_streaming_run(
+                evaluator=evaluator, on_checkpoint=checkpoints.append, **stream_kwargs
+            )
+
+        run_id = checkpoints[-1]
+        assert storage.list_completed_test_case_ids(run_id) == {"1", "2"}
+        assert storage.get_run(run_id).tracker_metadata["streaming"]["status"] == "in_progress"
+
+        evaluated.clear()
+        evaluator.evaluate = AsyncMock(side_effect=lambda **kw: fake_evaluate(**kw))
+        result = await run_command_module._evaluate_streaming_run(
+            evaluator=evaluator, resume_run_id=run_id, **stream_kwargs
+        )
+
+        assert evaluated == [["3", "4"], ["5"]]
+        assert result.run_id == run_id
+        assert [item.test_case_id for item in result.results] == ["1", "2", "3", "4", "5"]
+        assert result.total_tokens == 5
+        streaming = storage.get_run(run_id).tracker_metadata["streaming"]
+        assert streaming["status"] == "completed"
+        assert streaming["completed_cases"] == 5
+
     def test_build_streaming_dataset_template_for_json(self, tmp_path):
         dataset_file = tmp_path / "dataset.json"
         dataset_file.write_text(
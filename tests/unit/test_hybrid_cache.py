@@ -56,6 +56,21 @@ class TestHybridCacheBasic:
 
         assert deleted is False
 
+    def test_delete_prefix(self, cache):
+        """접두사 일괄 삭제 테스트 (hot/cold 모두)."""
+        cache.set("run-1:a", "value1")
+        cache.set("run-1:b", "value2")
+        cache.set("run-2:a", "value3")
+        for _ in range(HybridCache.HOT_PROMOTION_THRESHOLD):
+            cache.get("run-1:a")
+
+        removed = cache.delete_prefix("run-1:")
+
+        assert removed == 2
+        assert cache.get("run-1:a") is None
+        assert cache.get("run-1:b") is None
+        assert cache.get("run-2:a") == "value3"
+
     def test_clear_cache(self, cache):
         """캐시 전체 삭제 테스트."""
         cache.set("key1", "value1")
@@ -17,8 +17,9 @@ from evalvault.config.settings import Settings
 
 
 class _FakePostgresIdentityStore:
-    def __init__(self, connection_string: str) -> None:
+    def __init__(self, connection_string: str, settings: Settings | None = None) -> None:
         self.connection_string = connection_string
+        self.settings = settings
 
 
 def test_identity_factory_module_import_does_not_require_psycopg(monkeypatch) -> None:
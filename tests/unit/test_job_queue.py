@@ -0,0 +1,233 @@
+"""Durable evaluation job queue and worker supervisor."""
+
+from __future__ import annotations
+
+import multiprocessing
+import sqlite3
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from evalvault.adapters.inbound.api.job_worker import JobWorker, execute_job
+from evalvault.adapters.outbound.storage.sqlite_job_queue import SqliteJobQueueAdapter
+from evalvault.domain.entities.job import EvaluationJob, JobStatus
+from evalvault.ports.inbound.web_port import EvalProgress
+
+
+def _job(project_id: str = "proj-a", **payload) -> EvaluationJob:
+    return EvaluationJob(
+        payload={"dataset_path": "data/datasets/qa.json", "metrics": ["faithfulness"], **payload},
+        project_id=project_id,
+    )
+
+
+@pytest.fixture
+def queue(tmp_path) -> SqliteJobQueueAdapter:
+    return SqliteJobQueueAdapter(db_path=tmp_path / "jobs.db")
+
+
+def _sleep_forever(job_id: str) -> None:  # noqa: ARG001
+    time.sleep(60)
+
+
+def _exit_immediately(job_id: str) -> None:  # noqa: ARG001
+    return None
+
+
+def _wait_until(predicate, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.05)
+
+
+def test_enqueue_and_claim_in_submission_order(queue):
+    first, second = _job(), _job()
+    queue.enqueue(first)
+    queue.enqueue(second)
+
+    claimed = queue.claim_next("w1", max_per_project=5)
+
+    assert claimed.job_id == first.job_id
+    assert claimed.status == JobStatus.RUNNING
+    assert claimed.worker_id == "w1"
+    assert claimed.attempts == 1
+    assert claimed.payload["metrics"] == ["faithfulness"]
+    assert queue.get_job(second.job_id).status == JobStatus.QUEUED
+
+
+def test_claim_respects_per_project_limit(queue):
+    a1, a2, b1 = _job("proj-a"), _job("proj-a"), _job("proj-b")
+    for job in (a1, a2, b1):
+        queue.enqueue(job)
+
+    assert queue.claim_next("w1", max_per_project=1).job_id == a1.job_id
+    # proj-a is at its limit, so the later proj-b job goes next.
+    assert queue.claim_next("w1", max_per_project=1).job_id == b1.job_id
+    assert queue.claim_next("w1", max_per_project=1) is None
+
+    queue.finish(a1.job_id, JobStatus.SUCCEEDED, run_id="run-1")
+    assert queue.claim_next("w1", max_per_project=1).job_id == a2.job_id
+
+
+def test_finish_only_applies_to_running_jobs(queue):
+    job = _job()
+    queue.enqueue(job)
+    assert queue.finish(job.job_id, JobStatus.FAILED, error="x") is False
+
+    queue.claim_next("w1", max_per_project=1)
+    assert queue.finish(job.job_id, JobStatus.SUCCEEDED, run_id="run-1") is True
+    assert queue.finish(job.job_id, JobStatus.FAILED, error="late") is False
+
+    stored = queue.get_job(job.job_id)
+    assert stored.status == JobStatus.SUCCEEDED
+    assert stored.run_id == "run-1"
+    assert stored.finished_at is not None
+
+
+def test_cancel_queued_job_is_immediate_and_running_job_is_flagged(queue):
+    running, queued = _job(), _job()
+    queue.enqueue(running)
+    queue.enqueue(queued)
+    queue.claim_next("w1", max_per_project=1)
+
+    cancelled = queue.request_cancel(queued.job_id)
+    flagged = queue.request_cancel(running.job_id)
+
+    assert cancelled.status == JobStatus.CANCELLED
+    assert flagged.status == JobStatus.RUNNING
+    assert flagged.cancel_requested is True
+    assert queue.request_cancel("missing") is None
+
+
+def test_progress_and_list_filters(queue):
+    job_a, job_b = _job("proj-a"), _job("proj-b")
+    queue.enqueue(job_a)
+    queue.enqueue(job_b)
+    queue.update_progress(job_a.job_id, {"current": 2, "total": 4, "percent": 50.0})
+
+    assert queue.get_job(job_a.job_id).progress["percent"] == 50.0
+    assert [job.job_id for job in queue.list_jobs(project_id="proj-b")] == [job_b.job_id]
+    assert queue.list_jobs(statuses=[JobStatus.RUNNING]) == []
+    assert len(queue.list_jobs()) == 2
+
+
+def test_requeue_stale_recovers_abandoned_jobs(queue, tmp_path):
+    retry, exhausted = _job(), _job()
+    queue.enqueue(retry)
+    queue.enqueue(exhausted)
+    queue.claim_next("w1", max_per_project=5)
+    queue.claim_next("w1", max_per_project=5)
+
+    stale = (datetime.now(UTC) - timedelta(hours=1)).isoformat()
+    with sqlite3.connect(tmp_path / "jobs.db") as conn:
+        conn.execute("UPDATE evaluation_jobs SET heartbeat_at = ?", (stale,))
+        conn.execute(
+            "UPDATE evaluation_jobs SET attempts = 3 WHERE job_id = ?", (exhausted.job_id,)
+        )
+
+    assert queue.requeue_stale(60, max_attempts=3) == 1
+    assert queue.get_job(retry.job_id).status == JobStatus.QUEUED
+    assert queue.get_job(exhausted.job_id).status == JobStatus.FAILED
+
+
+class _FakeAdapter:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.requests = []
+        self.learned = []
+
+    async def run_evaluation(self, request, *, on_progress=None):
+        self.requests.append(request)
+        on_progress(EvalProgress(current=1, total=2, current_metric="", percent=50.0))
+        if self.fail:
+            raise RuntimeError("boom")
+        return SimpleNamespace(run_id="run-42")
+
+    async def learn_from_evaluation(self, run, memory_config):
+        self.learned.append((run.run_id, memory_config))
+
+
+def test_execute_job_records_progress_and_result(queue):
+    job = _job(memory_config={"enabled": True, "domain": "insurance"})
+    queue.enqueue(job)
+    claimed = queue.claim_next("w1", max_per_project=1)
+    adapter = _FakeAdapter()
+
+    status = execute_job(claimed, queue=queue, adapter=adapter, progress_interval=0)
+
+    stored = queue.get_job(job.job_id)
+    assert status == JobStatus.SUCCEEDED
+    assert stored.status == JobStatus.SUCCEEDED
+    assert stored.run_id == "run-42"
+    assert stored.progress["percent"] == 50.0
+    assert adapter.requests[0].dataset_path == "data/datasets/qa.json"
+    assert adapter.learned == [("run-42", {"enabled": True, "domain": "insurance"})]
+
+
+def test_execute_job_marks_failure(queue):
+    job = _job()
+    queue.enqueue(job)
+    claimed = queue.claim_next("w1", max_per_project=1)
+
+    status = execute_job(claimed, queue=queue, adapter=_FakeAdapter(fail=True))
+
+    stored = queue.get_job(job.job_id)
+    assert status == JobStatus.FAILED
+    assert stored.status == JobStatus.FAILED
+    assert stored.error == "boom"
+
+
+@pytest.fixture
+def fork_context():
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork start method unavailable")
+    return multiprocessing.get_context("fork")
+
+
+def test_worker_cancels_running_job_by_terminating_process(queue, fork_context):
+    job = _job()
+    queue.enqueue(job)
+    worker = JobWorker(
+        queue, concurrency=2, poll_interval=0.05, target=_sleep_forever, mp_context=fork_context
+    )
+
+    worker.tick()
+    assert worker.running_job_ids == [job.job_id]
+    process = worker._running[job.job_id].process
+
+    queue.request_cancel(job.job_id)
+    worker.tick()
+
+    assert worker.running_job_ids == []
+    assert not process.is_alive()
+    assert queue.get_job(job.job_id).status == JobStatus.CANCELLED
+
+
+def test_worker_fails_job_whose_process_exits_without_result(queue, fork_context):
+    jobs = [_job("proj-a"), _job("proj-a"), _job("proj-a")]
+    for job in jobs:
+        queue.enqueue(job)
+    worker = JobWorker(
+        queue,
+        concurrency=4,
+        max_per_project=2,
+        poll_interval=0.05,
+        target=_exit_immediately,
+        mp_context=fork_context,
+    )
+
+    worker.tick()
+    assert len(worker.running_job_ids) == 2
+
+    worker.drain(timeout=10)
+    assert worker.running_job_ids == []
+    assert queue.get_job(jobs[0].job_id).status == JobStatus.FAILED
+    assert "exited" in queue.get_job(jobs[0].job_id).error
+
+    worker.tick()
+    _wait_until(lambda: (worker._reap(), not worker.running_job_ids)[1])
+    assert queue.get_job(jobs[2].job_id).status == JobStatus.FAILED
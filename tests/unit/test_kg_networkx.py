@@ -190,6 +190,20 @@ class TestNetworkXKnowledgeGraphEntity:
         assert populated_kg.get_node_count() == initial_count - 1
         assert not populated_kg.has_entity("삼성생명")
 
+    def test_entity_revision_tracks_entity_changes(
+        self, empty_kg: NetworkXKnowledgeGraph, sample_entity: EntityModel
+    ) -> None:
+        """엔티티 변경 번호 테스트."""
+        assert empty_kg.entity_revision == 0
+
+        empty_kg.add_entity(sample_entity)
+        after_add = empty_kg.entity_revision
+        empty_kg.remove_entity("없는엔티티")
+        assert empty_kg.entity_revision == after_add
+
+        empty_kg.remove_entity(sample_entity.name)
+        assert empty_kg.entity_revision > after_add
+
     def test_remove_nonexistent_entity(self, empty_kg: NetworkXKnowledgeGraph) -> None:
         """존재하지 않는 엔티티 삭제 테스트."""
         result = empty_kg.remove_entity("없는엔티티")
@@ -17,6 +17,10 @@ try:
         KiwiTokenizer,
         is_stopword,
     )
+    from evalvault.adapters.outbound.nlp.korean.token_cache import (
+        KiwiTokenCache,
+        get_kiwi_token_cache,
+    )
 
     HAS_KIWI, KIWI_SKIP_REASON = kiwi_ready()
     KIWI_SKIP_REASON = KIWI_SKIP_REASON or "kiwipiepy unavailable"
@@ -297,6 +301,86 @@ class TestKiwiTokenizerUserDict:
             assert term in tokens
 
 
+@pytest.mark.skipif(not HAS_KIWI, reason=KIWI_SKIP_REASON)
+class TestKiwiTokenCache:
+    """형태소 분석 결과 캐시 테스트."""
+
+    def test_repeated_text_is_analyzed_once(self, monkeypatch):
+        """같은 텍스트는 Kiwi를 다시 호출하지 않음."""
+        tokenizer = KiwiTokenizer(token_cache=KiwiTokenCache())
+        calls: list[list[str]] = []
+        run_kiwi = tokenizer._run_kiwi
+        monkeypatch.setattr(
+            tokenizer, "_run_kiwi", lambda texts: calls.append(texts) or run_kiwi(texts)
+        )
+
+        first = tokenizer.tokenize("보험료 납입 기간은 20년입니다.")
+        assert tokenizer.tokenize("보험료 납입 기간은 20년입니다.") == first
+        assert tokenizer.extract_nouns("보험료 납입 기간은 20년입니다.")
+        assert len(calls) == 1
+        assert tokenizer.token_cache.get_stats()["hits"] == 2
+
+    def test_tokenize_many_matches_tokenize_and_dedupes(self, monkeypatch):
+        """배치 토큰화는 개별 결과와 같고 중복/캐시된 텍스트는 분석하지 않음."""
+        tokenizer = KiwiTokenizer(token_cache=KiwiTokenCache())
+        texts = ["보험금을 지급합니다.", "", "보장금액은 1억원입니다.", "보험금을 지급합니다."]
+        expected = [KiwiTokenizer(use_token_cache=False).tokenize(text) for text in texts]
+        tokenizer.tokenize(texts[0])
+        calls: list[list[str]] = []
+        run_kiwi = tokenizer._run_kiwi
+        monkeypatch.setattr(
+            tokenizer, "_run_kiwi", lambda batch: calls.append(batch) or run_kiwi(batch)
+        )
+
+        assert tokenizer.tokenize_many(texts) == expected
+        assert calls == [["보장금액은 1억원입니다."]]
+
+    def test_user_word_changes_cache_namespace(self):
+        """사용자 사전이 바뀌면 이전 분석 결과를 재사용하지 않음."""
+        tokenizer = KiwiTokenizer(token_cache=KiwiTokenCache())
+        text = "삼성화재다이렉트 보험에 가입했습니다"
+        before = tokenizer.cache_namespace
+        tokenizer.tokenize(text)
+
+        tokenizer.add_user_word("삼성화재다이렉트", "NNP", 0.0)
+
+        assert tokenizer.cache_namespace != before
+        assert "삼성화재다이렉트" in tokenizer.tokenize(text)
+
+    def test_disk_cache_survives_new_process_cache(self, tmp_path, monkeypatch):
+        """디스크 캐시는 새 캐시 인스턴스(다음 실행)에서도 재사용."""
+        db_path = tmp_path / "kiwi_tokens.db"
+        first = KiwiTokenizer(token_cache=KiwiTokenCache(db_path=db_path))
+        expected = first.tokenize_many(["보험료가 얼마인가요?", "만기 환급금"])
+        first.token_cache.close()
+
+        second = KiwiTokenizer(token_cache=KiwiTokenCache(db_path=db_path))
+        monkeypatch.setattr(second, "_run_kiwi", lambda texts: pytest.fail(f"re-analyzed {texts}"))
+
+        assert second.tokenize_many(["보험료가 얼마인가요?", "만기 환급금"]) == expected
+        assert second.token_cache.get_stats()["disk_hits"] == 2
+        second.token_cache.close()
+
+    def test_lru_evicts_oldest_entries(self):
+        cache = KiwiTokenCache(max_entries=2)
+        cache.set_many("ns", {"a": (), "b": ()})
+        cache.get_many("ns", ["a"])
+        cache.set_many("ns", {"c": ()})
+
+        assert set(cache.get_many("ns", ["a", "b", "c"])) == {"a", "c"}
+
+    def test_shared_cache_follows_settings(self, tmp_path):
+        from evalvault.config.settings import Settings
+
+        assert get_kiwi_token_cache(Settings(kiwi_token_cache_size=0)) is None
+        assert KiwiTokenizer().token_cache is None
+
+        configured = get_kiwi_token_cache(Settings(kiwi_token_cache_size=10))
+        assert configured is not None and configured.max_entries == 10
+        assert KiwiTokenizer().token_cache is configured
+        get_kiwi_token_cache(Settings())
+
+
 @pytest.mark.skipif(not HAS_KIWI, reason=KIWI_SKIP_REASON)
 class TestKiwiTokenizerNormalize:
     """텍스트 정규화 테스트."""
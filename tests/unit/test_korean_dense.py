@@ -231,6 +231,40 @@ class TestKoreanDenseRetrieverWithMock:
 
         assert mock_retriever._model.encode.call_count == 1
 
+    def test_search_batch_encodes_pending_queries_once(self, mock_retriever):
+        """search_batch는 캐시에 없는 쿼리를 한 번에 인코딩하고 search와 같은 결과를 반환."""
+        documents = [
+            "보험료 납입 기간은 20년입니다.",
+            "보장금액은 1억원입니다.",
+            "사망보험금이 지급됩니다.",
+        ]
+        mock_retriever.index(documents)
+
+        mock_retriever._model.encode.reset_mock()
+        mock_retriever._model.encode.return_value = np.array(
+            [
+                [0.9, 1.0, 1.1, 1.2],
+                [0.1, 0.2, 0.3, 0.4],
+            ]
+        )
+        batched = mock_retriever.search_batch(["사망", "보험료", "사망"], top_k=2)
+
+        assert mock_retriever._model.encode.call_count == 1
+        assert mock_retriever._model.encode.call_args.args[0] == ["사망", "보험료"]
+        assert len(batched) == 3
+
+        mock_retriever._model.encode.reset_mock()
+        for query, results in zip(["사망", "보험료", "사망"], batched, strict=True):
+            single = mock_retriever.search(query, top_k=2)
+            assert [r.doc_id for r in results] == [r.doc_id for r in single]
+            assert [r.score for r in results] == pytest.approx([r.score for r in single])
+        mock_retriever._model.encode.assert_not_called()
+
+    def test_search_batch_before_index(self, mock_retriever):
+        """인덱스 없이 배치 검색 시 에러."""
+        with pytest.raises(ValueError, match="인덱스가 구축되지 않았습니다"):
+            mock_retriever.search_batch(["테스트"])
+
     def test_search_before_index(self, mock_retriever):
         """인덱스 없이 검색 시 에러."""
         with pytest.raises(ValueError, match="인덱스가 구축되지 않았습니다"):
@@ -435,6 +469,111 @@ class TestKoreanDenseRetrieverFaiss:
         assert len(results) == 1
 
 
+class TestDenseIndexPersistence:
+    """Dense 인덱스 저장/로드 테스트."""
+
+    DOCUMENTS = ["보험료 납입 기간은 20년입니다.", "보장금액은 1억원입니다.", "사망보험금 지급"]
+    EMBEDDINGS = np.array(
+        [[0.1, 0.2, 0.3, 0.4], [0.5, 0.6, 0.7, 0.8], [0.9, 0.1, 0.1, 0.2]], dtype=np.float32
+    )
+
+    def _retriever(self, **kwargs) -> KoreanDenseRetriever:
+        retriever = KoreanDenseRetriever(device="cpu", **kwargs)
+        retriever._model = MagicMock()
+        retriever._model_type = "sentence-transformers"
+        retriever._model.encode.return_value = self.EMBEDDINGS
+        return retriever
+
+    def test_round_trip_is_memory_mapped_and_skips_encoding(self, tmp_path):
+        source = self._retriever(normalize_embeddings=True)
+        source.index(self.DOCUMENTS)
+        source.save_index(tmp_path / "idx")
+
+        loaded = self._retriever(normalize_embeddings=True)
+        assert loaded.load_index(tmp_path / "idx", self.DOCUMENTS) is True
+
+        loaded._model.encode.assert_not_called()
+        assert isinstance(loaded._embeddings, np.memmap)
+        assert isinstance(loaded._normalized_embeddings, np.memmap)
+        np.testing.assert_allclose(loaded._embeddings, self.EMBEDDINGS)
+
+        query = np.array([[0.9, 0.1, 0.1, 0.2]], dtype=np.float32)
+        source._model.encode.return_value = query
+        loaded._model.encode.return_value = query
+        expected = [(r.doc_id, r.score) for r in source.search("사망", top_k=2)]
+        actual = [(r.doc_id, r.score) for r in loaded.search("사망", top_k=2)]
+        assert actual == pytest.approx(expected)
+
+    def test_load_without_documents_uses_stored_corpus(self, tmp_path):
+        source = self._retriever()
+        source.index(self.DOCUMENTS)
+        source.save_index(tmp_path)
+
+        loaded = self._retriever()
+
+        assert loaded.load_index(tmp_path) is True
+        assert loaded.document_count == 3
+        assert loaded._documents == self.DOCUMENTS
+
+    @pytest.mark.parametrize(
+        ("kwargs", "documents"),
+        [
+            ({"matryoshka_dim": 2}, DOCUMENTS),
+            ({"normalize_embeddings": False}, DOCUMENTS),
+            ({}, [*DOCUMENTS[:2], "변경된 문서"]),
+            ({}, list(reversed(DOCUMENTS))),
+        ],
+    )
+    def test_manifest_mismatch_is_not_reused(self, tmp_path, kwargs, documents):
+        source = self._retriever()
+        source.index(self.DOCUMENTS)
+        source.save_index(tmp_path)
+
+        loaded = self._retriever(**kwargs)
+
+        assert loaded.load_index(tmp_path, documents) is False
+        assert not loaded.is_indexed
+
+    def test_missing_or_partial_index_is_not_reused(self, tmp_path):
+        source = self._retriever()
+        source.index(self.DOCUMENTS)
+        source.save_index(tmp_path)
+        (tmp_path / "manifest.json").unlink()
+
+        assert self._retriever().load_index(tmp_path, self.DOCUMENTS) is False
+        assert self._retriever().load_index(tmp_path / "absent", self.DOCUMENTS) is False
+
+    def test_index_with_cache_encodes_once_per_corpus(self, tmp_path):
+        first = self._retriever()
+        assert first.index_with_cache(self.DOCUMENTS, tmp_path) == 3
+
+        second = self._retriever()
+        assert second.index_with_cache(self.DOCUMENTS, tmp_path) == 3
+        second._model.encode.assert_not_called()
+
+        changed = self._retriever()
+        changed.index_with_cache([*self.DOCUMENTS, "새 문서"], tmp_path)
+        changed._model.encode.assert_called_once()
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_save_before_index_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="인덱스가 구축되지 않았습니다"):
+            self._retriever().save_index(tmp_path)
+
+    def test_faiss_index_round_trip(self, tmp_path):
+        pytest.importorskip("faiss")
+
+        source = self._retriever(use_faiss=True)
+        source.index(self.DOCUMENTS)
+        source.save_index(tmp_path)
+        assert (tmp_path / "faiss.index").exists()
+
+        loaded = self._retriever(use_faiss=True)
+        assert loaded.load_index(tmp_path, self.DOCUMENTS) is True
+        assert loaded._faiss_index is not None
+        assert loaded._faiss_index.ntotal == 3
+
+
 @pytest.mark.skipif(not KOREAN_READY, reason=KOREAN_SKIP_REASON)
 class TestHybridRetrieverDenseIntegration:
     """KoreanHybridRetriever와 Dense 통합 테스트."""
@@ -5,8 +5,10 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
+from evalvault.adapters.outbound.nlp.korean.bm25_index import BM25InvertedIndex, top_k_indices
 from tests.optional_deps import kiwi_ready, rank_bm25_ready
 
 # Check if kiwipiepy is available
@@ -146,6 +148,164 @@ class TestKoreanBM25Retriever:
         assert not retriever.is_indexed
         assert retriever.document_count == 0
 
+    def test_add_documents_tokenizes_only_new_documents(
+        self, tokenizer, sample_documents, monkeypatch
+    ):
+        """증분 추가 시 기존 문서는 다시 토큰화하지 않음."""
+        retriever = KoreanBM25Retriever(tokenizer)
+        retriever.index(sample_documents[:3])
+        seen: list[str] = []
+        tokenize_many = tokenizer.tokenize_many
+        monkeypatch.setattr(
+            tokenizer, "tokenize_many", lambda texts: seen.extend(texts) or tokenize_many(texts)
+        )
+
+        retriever.add_documents(sample_documents[3:])
+
+        assert seen == sample_documents[3:]
+        fresh = KoreanBM25Retriever(tokenizer)
+        fresh.index(sample_documents)
+        assert [(r.doc_id, r.score) for r in retriever.search("사망 보험금", top_k=5)] == [
+            (r.doc_id, r.score) for r in fresh.search("사망 보험금", top_k=5)
+        ]
+
+    def test_delete_documents_matches_rebuilt_index(self, tokenizer, sample_documents):
+        """삭제 후 점수는 남은 문서로 재구축한 인덱스와 동일."""
+        retriever = KoreanBM25Retriever(tokenizer, compact_ratio=1.0)
+        retriever.index(sample_documents)
+
+        assert retriever.delete_documents([0, 4, 4]) == 2
+        assert retriever.document_count == 3
+        results = retriever.search("사망 보험금", top_k=5)
+        assert {r.doc_id for r in results} == {1, 2, 3}
+        with pytest.raises(IndexError):
+            retriever.get_document_tokens(0)
+
+        rebuilt = KoreanBM25Retriever(tokenizer)
+        rebuilt.index(sample_documents[1:4])
+        expected = {r.document: r.score for r in rebuilt.search("사망 보험금", top_k=5)}
+        assert {r.document: r.score for r in results} == pytest.approx(expected)
+
+    def test_compaction_renumbers_documents(self, tokenizer, sample_documents):
+        """tombstone 비율 초과 시 자동 compaction."""
+        retriever = KoreanBM25Retriever(tokenizer, compact_ratio=0.3)
+        retriever.index(sample_documents)
+
+        retriever.delete_documents([1])
+        assert retriever.get_document_tokens(2)  # 아직 compaction 전: doc_id 유지
+
+        retriever.delete_documents([3])
+        assert retriever.document_count == 3
+        assert retriever.get_document_tokens(2) == tokenizer.tokenize(sample_documents[4])
+        results = retriever.search("보험금", top_k=5)
+        assert {r.doc_id for r in results} == {0, 1, 2}
+        assert {r.document for r in results} == {
+            sample_documents[0],
+            sample_documents[2],
+            sample_documents[4],
+        }
+
+    def test_scores_match_rank_bm25(self, tokenizer, sample_documents):
+        """rank_bm25.BM25Okapi와 점수 일치 (parity)."""
+        from rank_bm25 import BM25Okapi
+
+        retriever = KoreanBM25Retriever(tokenizer)
+        retriever.index(sample_documents[:2])
+        retriever.add_documents(sample_documents[2:] + ["", "보험료 보험료 납입"])
+        retriever.delete_documents([1])
+        retriever.compact()
+
+        corpus = [retriever.get_document_tokens(i) for i in range(retriever.document_count)]
+        reference = BM25Okapi(corpus)
+        for query in ["보험료 납입", "사망 보험금 보험금", "해지 환급금", "존재하지않는단어"]:
+            tokens = tokenizer.tokenize(query)
+            expected = reference.get_scores(tokens)
+            results = retriever.search(query, top_k=len(corpus))
+            actual = {r.doc_id: r.score for r in results}
+            assert [actual[i] for i in range(len(corpus))] == pytest.approx(list(expected))
+
+    def test_search_batch_matches_search(self, retriever, sample_documents):
+        """배치 검색 결과는 개별 검색과 동일."""
+        retriever.index(sample_documents)
+        retriever.delete_documents([2])
+        queries = ["보험료 납입", "", "사망 보험금", "해지 환급금", "보장금액"]
+
+        batched = retriever.search_batch(queries, top_k=3, batch_size=2)
+
+        assert len(batched) == len(queries)
+        for query, results in zip(queries, batched, strict=True):
+            expected = retriever.search(query, top_k=3)
+            assert [(r.doc_id, r.score) for r in results] == [(r.doc_id, r.score) for r in expected]
+
+    def test_search_batch_before_index(self, retriever):
+        """인덱싱 전 배치 검색 시 에러."""
+        with pytest.raises(ValueError, match="인덱스가 구축되지 않았습니다"):
+            retriever.search_batch(["테스트"])
+
+
+class TestBM25InvertedIndex:
+    """BM25InvertedIndex 테스트 (형태소 분석기 불필요)."""
+
+    def test_parity_with_rank_bm25_on_skewed_corpus(self):
+        rank_bm25 = pytest.importorskip("rank_bm25")
+        corpus = [["a", "b", "a"], ["a"], ["a", "c"], ["a", "b"], [""], ["d", "d", "d", "a"]]
+        index = BM25InvertedIndex()
+        index.add(corpus[:3])
+        index.add(corpus[3:])
+
+        reference = rank_bm25.BM25Okapi(corpus)
+        for query in (["a"], ["b", "b"], ["c", "d", "zzz"], [""]):
+            assert index.get_scores(query) == pytest.approx(reference.get_scores(query))
+
+    def test_delete_marks_tombstones_and_updates_statistics(self):
+        index = BM25InvertedIndex()
+        index.add([["a", "b"], ["a"], ["c", "c", "c"]])
+
+        assert index.delete([2, 2, 7]) == 1
+        assert index.live_count == 2
+        assert index.deleted_count == 1
+        assert index.vocabulary_size == 2
+        assert index.avgdl == 1.5
+        scores = index.get_scores(["c"])
+        assert scores[2] == float("-inf")
+        assert list(scores[:2]) == [0.0, 0.0]
+
+    def test_compact_drops_dead_postings(self):
+        index = BM25InvertedIndex()
+        index.add([["a", "b"], ["c"], ["a", "a"]])
+        index.delete([1])
+
+        assert index.compact() == [0, 2]
+        assert index.slot_count == 2
+        assert index.deleted_count == 0
+        assert index.vocabulary_size == 2
+
+        rebuilt = BM25InvertedIndex()
+        rebuilt.add([["a", "b"], ["a", "a"]])
+        for query in (["a"], ["b"], ["c"]):
+            assert index.get_scores(query) == pytest.approx(rebuilt.get_scores(query))
+
+    def test_batch_scores_match_single_queries(self):
+        index = BM25InvertedIndex()
+        index.add([["a", "b"], ["b", "c", "c"], ["d"], ["a", "d", "d"]])
+        index.delete([2])
+        queries = [["a"], ["c", "c", "b"], [], ["zzz"], ["d"]]
+
+        batch = index.get_scores_batch(queries)
+
+        assert batch.shape == (len(queries), index.slot_count)
+        for row, query in enumerate(queries):
+            assert list(batch[row]) == pytest.approx(list(index.get_scores(query)))
+        assert list(batch[2]) == [0.0, 0.0, float("-inf"), 0.0]
+
+    def test_top_k_indices_uses_partial_selection_order(self):
+        scores = np.array([0.5, 2.0, -np.inf, 2.0, 1.0, 0.0])
+
+        assert list(top_k_indices(scores, 3)) == [1, 3, 4]
+        assert list(top_k_indices(scores, 10)) == [1, 3, 4, 0, 5]
+        assert list(top_k_indices(scores, 0)) == []
+        assert list(top_k_indices(np.full(3, -np.inf), 2)) == []
+
 
 @pytest.mark.skipif(not KOREAN_READY, reason=KOREAN_SKIP_REASON)
 class TestKoreanDocumentChunker:
@@ -389,6 +549,82 @@ class TestKoreanHybridRetriever:
         assert retriever.is_indexed
         assert not retriever.has_embeddings  # 임베딩 함수가 없으므로
 
+    def test_embeddings_are_normalized_once(self, tokenizer, sample_documents):
+        """인덱싱 시 L2 정규화된 float32 행렬 저장."""
+        retriever = KoreanHybridRetriever(
+            tokenizer, embedding_func=lambda texts: [[3.0, 4.0], [0.0, 0.0]] * 2
+        )
+        retriever.index(sample_documents)
+
+        assert retriever._embeddings.dtype == np.float32
+        assert np.linalg.norm(retriever._embeddings, axis=1).tolist() == pytest.approx(
+            [1.0, 0.0, 1.0, 0.0]
+        )
+
+    @pytest.mark.parametrize("fusion_method", list(FusionMethod))
+    def test_search_batch_matches_search(
+        self, tokenizer, sample_documents, mock_embedding_func, fusion_method
+    ):
+        """배치 검색은 임베딩을 한 번만 호출하고 개별 검색과 같은 결과."""
+        calls: list[list[str]] = []
+
+        def embed(texts: list[str]) -> list[list[float]]:
+            calls.append(list(texts))
+            return mock_embedding_func(texts)
+
+        retriever = KoreanHybridRetriever(
+            tokenizer, embedding_func=embed, fusion_method=fusion_method
+        )
+        retriever.index(sample_documents)
+        queries = ["보험금 지급", "납입 기간", "환급금"]
+        calls.clear()
+
+        batched = retriever.search_batch(queries, top_k=3, batch_size=2)
+
+        assert calls == [queries]
+        for query, results in zip(queries, batched, strict=True):
+            expected = retriever.search(query, top_k=3)
+            assert [(r.doc_id, r.bm25_rank, r.dense_rank) for r in results] == [
+                (r.doc_id, r.bm25_rank, r.dense_rank) for r in expected
+            ]
+            # float32 GEMM과 GEMV는 마지막 자리 반올림이 다를 수 있음
+            assert [r.score for r in results] == pytest.approx(
+                [r.score for r in expected], rel=1e-5
+            )
+
+    def test_candidate_k_limits_fusion_candidates(
+        self, tokenizer, sample_documents, mock_embedding_func
+    ):
+        """각 검색 경로는 상위 candidate_k개 후보만 융합."""
+        retriever = KoreanHybridRetriever(
+            tokenizer, embedding_func=mock_embedding_func, candidate_k=1
+        )
+        retriever.index(sample_documents)
+
+        results = retriever.search("보험금 지급", top_k=2)
+
+        assert max(r.bm25_rank for r in results) <= 2
+        assert max(r.dense_rank for r in results) <= 2
+        assert len(retriever._search_dense("보험금 지급", 2)) == 2
+
+    def test_add_documents_embeds_only_new_documents(self, tokenizer, sample_documents):
+        """문서 추가 시 새 문서만 임베딩."""
+        embedded: list[str] = []
+
+        def embed(texts: list[str]) -> list[list[float]]:
+            embedded.extend(texts)
+            return [[float(len(text)), 1.0] for text in texts]
+
+        retriever = KoreanHybridRetriever(tokenizer, embedding_func=embed)
+        retriever.index(sample_documents[:2])
+        embedded.clear()
+
+        assert retriever.add_documents(sample_documents[2:]) == len(sample_documents)
+        assert embedded == sample_documents[2:]
+        assert retriever.document_count == len(sample_documents)
+        results = retriever.search_bm25_only("피보험자 사망", top_k=1)
+        assert results[0].document == sample_documents[3]
+
     def test_clear(self, tokenizer, sample_documents, mock_embedding_func):
         """인덱스 초기화."""
         retriever = KoreanHybridRetriever(tokenizer, embedding_func=mock_embedding_func)
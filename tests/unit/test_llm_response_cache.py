@@ -0,0 +1,207 @@
+"""Tests for the persistent LLM response cache."""
+
+import time
+
+import pytest
+from openai.types.chat import ChatCompletion
+from pydantic import BaseModel, ValidationError
+
+from evalvault.adapters.outbound.cache.llm_response_cache import (
+    LLMCacheMode,
+    SQLiteLLMResponseCache,
+    get_llm_response_cache,
+    make_llm_cache_key,
+    parse_llm_cache_mode,
+)
+from evalvault.adapters.outbound.llm.base import TokenUsage
+from evalvault.adapters.outbound.llm.token_aware_chat import TokenTrackingAsyncOpenAI
+from evalvault.config.settings import Settings
+from evalvault.domain.services.cache_metrics import CacheStatsTracker
+from evalvault.ports.outbound.llm_port import ThinkingConfig
+
+
+def _completion_payload(content: str = "ok") -> dict:
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 1700000000,
+        "model": "gpt-test",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+
+
+class _FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return ChatCompletion.model_validate(_completion_payload(f"answer-{self.calls}"))
+
+
+class TestCacheKey:
+    """make_llm_cache_key 테스트."""
+
+    def test_key_is_order_independent(self):
+        a = make_llm_cache_key("openai", {"model": "m", "temperature": 0.0, "messages": []})
+        b = make_llm_cache_key("openai", {"messages": [], "temperature": 0.0, "model": "m"})
+        assert a == b
+
+    def test_key_changes_with_inputs(self):
+        base = {"model": "m", "messages": [{"role": "user", "content": "q"}]}
+        key = make_llm_cache_key("openai", base)
+        assert key != make_llm_cache_key("ollama", base)
+        assert key != make_llm_cache_key("openai", {**base, "temperature": 0.7})
+        assert key != make_llm_cache_key("openai", {**base, "model": "other"})
+        assert key != make_llm_cache_key(
+            "openai", base, ThinkingConfig(enabled=True, think_level="high")
+        )
+
+    def test_response_format_schema_is_part_of_key(self):
+        class ScoreV1(BaseModel):
+            score: float
+
+        class ScoreV2(BaseModel):
+            score: float
+            reason: str
+
+        ScoreV2.__name__ = ScoreV1.__name__
+        base = {"model": "m", "messages": []}
+        key_v1 = make_llm_cache_key("openai", {**base, "response_format": ScoreV1})
+        key_v2 = make_llm_cache_key("openai", {**base, "response_format": ScoreV2})
+        assert key_v1 != key_v2
+
+    def test_unsupported_values_raise(self):
+        with pytest.raises(TypeError):
+            make_llm_cache_key("openai", {"model": "m", "messages": [object()]})
+
+    def test_parse_mode_aliases(self):
+        assert parse_llm_cache_mode(None) is LLMCacheMode.OFF
+        assert parse_llm_cache_mode("on") is LLMCacheMode.READ_WRITE
+        assert parse_llm_cache_mode("read-only") is LLMCacheMode.READ_ONLY
+        with pytest.raises(ValueError):
+            parse_llm_cache_mode("sometimes")
+
+
+class TestSQLiteLLMResponseCache:
+    """SQLiteLLMResponseCache 테스트."""
+
+    def test_roundtrip_persists_across_instances(self, tmp_path):
+        path = tmp_path / "llm.db"
+        SQLiteLLMResponseCache(path).set("k", {"value": 1})
+
+        reopened = SQLiteLLMResponseCache(path)
+        assert reopened.get("k") == {"value": 1}
+        assert reopened.get("missing") is None
+        stats = reopened.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = SQLiteLLMResponseCache(tmp_path / "llm.db", ttl_seconds=1)
+        cache.set("k", {"value": 1})
+        time.sleep(1.1)
+        assert cache.get("k") is None
+        assert cache.get_stats()["expired"] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        cache = SQLiteLLMResponseCache(tmp_path / "llm.db", max_entries=2, touch_interval_seconds=0)
+        cache.set("a", {"v": "a"})
+        time.sleep(0.01)
+        cache.set("b", {"v": "b"})
+        time.sleep(0.01)
+        assert cache.get("a") is not None
+        time.sleep(0.01)
+        cache.set("c", {"v": "c"})
+
+        assert cache.size() == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_readonly_and_refresh_modes(self, tmp_path):
+        path = tmp_path / "llm.db"
+        readonly = SQLiteLLMResponseCache(path, mode="readonly")
+        assert readonly.set("k", {"v": 1}) is False
+
+        refresh = SQLiteLLMResponseCache(path, mode=LLMCacheMode.REFRESH)
+        assert refresh.set("k", {"v": 1}) is True
+        assert refresh.get("k") is None
+        assert readonly.get("k") == {"v": 1}
+
+    def test_stats_feed_cache_stats_tracker(self, tmp_path):
+        cache = SQLiteLLMResponseCache(tmp_path / "llm.db")
+        tracker = CacheStatsTracker(cache.get_stats)
+        tracker.reset()
+        cache.set("k", {"v": 1})
+        cache.get("k")
+        cache.get("other")
+
+        window = tracker.window()
+        assert window.hits == 1
+        assert window.misses == 1
+        assert window.hit_rate == pytest.approx(0.5)
+
+    def test_get_llm_response_cache_respects_settings(self, tmp_path):
+        off = Settings(llm_cache_mode="off")
+        assert get_llm_response_cache(off) is None
+
+        settings = Settings(llm_cache_mode="readwrite", llm_cache_path=str(tmp_path / "c.db"))
+        first = get_llm_response_cache(settings)
+        assert first is not None
+        assert get_llm_response_cache(settings) is first
+
+        smaller = settings.model_copy(update={"llm_cache_max_entries": 10})
+        other = get_llm_response_cache(smaller)
+        assert other is not first
+        assert other.max_entries == 10
+
+    def test_settings_reject_invalid_mode(self):
+        assert Settings(llm_cache_mode="on").llm_cache_mode == "readwrite"
+        with pytest.raises(ValidationError):
+            Settings(llm_cache_mode="sometimes")
+
+    def test_access_times_are_buffered(self, tmp_path):
+        cache = SQLiteLLMResponseCache(tmp_path / "llm.db", touch_interval_seconds=0)
+        cache.set("k", {"v": 1})
+        cache.get("k")
+        cache.get("k")
+        assert cache._pending_touches
+        cache.flush()
+        assert not cache._pending_touches
+        cache.close()
+
+
+class TestTokenTrackingClientCache:
+    """TokenTrackingAsyncOpenAI 응답 캐시 연동 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_identical_request_served_from_cache(self, tmp_path):
+        cache = SQLiteLLMResponseCache(tmp_path / "llm.db")
+        usage = TokenUsage()
+        client = TokenTrackingAsyncOpenAI(usage_tracker=usage, api_key="test", response_cache=cache)
+        fake = _FakeCompletions()
+        client.chat.completions._completions = fake
+
+        request = {
+            "model": "gpt-test",
+            "messages": [{"role": "user", "content": "hello"}],
+            "temperature": 0.0,
+        }
+        first = await client.chat.completions.create(**request)
+        second = await client.chat.completions.create(**request)
+
+        assert fake.calls == 1
+        assert second.choices[0].message.content == first.choices[0].message.content
+        # Cache hits do not add token usage.
+        assert usage.total_tokens == 15
+
+        await client.chat.completions.create(**{**request, "temperature": 0.5})
+        assert fake.calls == 2
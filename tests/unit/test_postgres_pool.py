@@ -0,0 +1,152 @@
+"""Unit tests for the shared PostgreSQL connection pools."""
+
+from __future__ import annotations
+
+import pytest
+
+from evalvault.adapters.outbound.storage import postgres_pool
+from evalvault.adapters.outbound.storage.postgres_pool import (
+    PooledConnection,
+    PostgresPoolConfig,
+    get_connection_pool,
+    pool_stats,
+)
+from evalvault.config.settings import Settings
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.closed = False
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def execute(self, query: str):
+        return query
+
+
+class _FakePool:
+    instances: list[_FakePool] = []
+
+    def __init__(self, conninfo: str, **kwargs) -> None:
+        self.conninfo = conninfo
+        self.kwargs = kwargs
+        self.name = kwargs["name"]
+        self.returned: list[_FakeConnection] = []
+        self.closed = False
+        _FakePool.instances.append(self)
+
+    @staticmethod
+    def check_connection(conn) -> None:
+        return None
+
+    def getconn(self) -> _FakeConnection:
+        return _FakeConnection()
+
+    def putconn(self, conn: _FakeConnection) -> None:
+        self.returned.append(conn)
+
+    def get_stats(self) -> dict[str, int]:
+        return {"pool_size": 2, "pool_available": 1, "requests_num": 4, "requests_wait_ms": 10}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    import psycopg_pool
+
+    _FakePool.instances = []
+    monkeypatch.setattr(psycopg_pool, "ConnectionPool", _FakePool)
+    monkeypatch.setattr(postgres_pool, "_pools", {})
+    yield _FakePool
+    postgres_pool.close_connection_pools()
+
+
+def test_config_from_settings_respects_toggle_and_bounds() -> None:
+    assert PostgresPoolConfig.from_settings(Settings(postgres_pool_enabled=False)) is None
+
+    config = PostgresPoolConfig.from_settings(
+        Settings(
+            postgres_pool_min_size=20,
+            postgres_pool_max_size=4,
+            postgres_prepare_threshold="none",
+        )
+    )
+
+    assert config is not None
+    assert (config.min_size, config.max_size) == (4, 4)
+    assert config.prepare_threshold is None
+
+
+def test_pools_are_shared_per_database_and_row_factory(fake_pool) -> None:
+    from psycopg.rows import dict_row
+
+    config = PostgresPoolConfig(min_size=1, max_size=3, prepare_threshold=None)
+
+    first = get_connection_pool("dbname=a", config, row_factory=dict_row)
+    assert get_connection_pool("dbname=a", config, row_factory=dict_row) is first
+    assert get_connection_pool("dbname=a", config) is not first
+    assert get_connection_pool("dbname=b", config, row_factory=dict_row) is not first
+
+    assert first.kwargs["max_size"] == 3
+    assert first.kwargs["kwargs"] == {"prepare_threshold": None, "row_factory": dict_row}
+    assert first.kwargs["check"] is _FakePool.check_connection
+    assert len(fake_pool.instances) == 3
+
+
+def test_health_check_can_be_disabled(fake_pool) -> None:
+    pool = get_connection_pool("dbname=a", PostgresPoolConfig(health_check=False))
+
+    assert pool.kwargs["check"] is None
+
+
+def test_pooled_connection_returns_to_pool_on_close(fake_pool) -> None:
+    pool = get_connection_pool("dbname=a", PostgresPoolConfig())
+    conn = PooledConnection(pool, pool.getconn())
+
+    assert conn.execute("SELECT 1") == "SELECT 1"
+    conn.close()
+    conn.close()
+
+    assert len(pool.returned) == 1
+    with pytest.raises(AttributeError):
+        conn.execute("SELECT 1")
+
+
+def test_pooled_connection_context_commits_or_rolls_back(fake_pool) -> None:
+    pool = get_connection_pool("dbname=a", PostgresPoolConfig())
+
+    with PooledConnection(pool, pool.getconn()):
+        pass
+    with pytest.raises(RuntimeError), PooledConnection(pool, pool.getconn()):
+        raise RuntimeError("boom")
+
+    committed, rolled_back = pool.returned
+    assert (committed.commits, committed.rollbacks) == (1, 0)
+    assert (rolled_back.commits, rolled_back.rollbacks) == (0, 1)
+
+
+def test_pool_stats_report_saturation_and_wait(fake_pool) -> None:
+    get_connection_pool("dbname=a", PostgresPoolConfig())
+
+    (stats,) = pool_stats()
+
+    assert stats["kind"] == "sync"
+    assert stats["pool_available"] == 1
+    assert stats["requests_wait_ms_avg"] == 2.5
+
+
+def test_close_connection_pools_clears_registry(fake_pool) -> None:
+    pool = get_connection_pool("dbname=a", PostgresPoolConfig())
+
+    postgres_pool.close_connection_pools()
+
+    assert pool.closed
+    assert pool_stats() == []
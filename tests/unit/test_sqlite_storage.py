@@ -488,6 +488,293 @@ class TestSQLiteStorageAdapter:
         assert len(retrieved_run.results) == 0
 
 
+class TestSQLiteRunHydration:
+    """get_run 일괄 조회(N+1 제거) 테스트."""
+
+    @staticmethod
+    def _make_run(run_id: str, size: int) -> EvaluationRun:
+        return EvaluationRun(
+            run_id=run_id,
+            dataset_name="insurance-qa",
+            model_name="gpt-5-nano",
+            started_at=datetime(2025, 1, 1, 10, 0, 0),
+            results=[
+                TestCaseResult(
+                    test_case_id=f"tc-{index:04d}",
+                    metrics=[
+                        MetricScore(name=f"metric_{metric}", score=index / size, threshold=0.5)
+                        for metric in range(4)
+                    ],
+                )
+                for index in range(size)
+            ],
+        )
+
+    def _count_statements(self, adapter, run_id: str) -> tuple[int, EvaluationRun]:
+        statements: list[str] = []
+        connect = adapter._connect
+
+        def tracing_connect():
+            conn = connect()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        adapter._connect = tracing_connect
+        try:
+            run = adapter.get_run(run_id)
+        finally:
+            adapter._connect = connect
+        return len(statements), run
+
+    def test_query_count_is_constant_in_run_size(self, storage_adapter):
+        storage_adapter.save_run(self._make_run("small", 3))
+        storage_adapter.save_run(self._make_run("large", 300))
+
+        small_count, small_run = self._count_statements(storage_adapter, "small")
+        large_count, large_run = self._count_statements(storage_adapter, "large")
+
+        assert small_count == large_count
+        assert len(large_run.results) == 300
+        assert all(len(result.metrics) == 4 for result in large_run.results)
+        assert len(small_run.results) == 3
+
+    def test_metrics_stay_with_their_test_case(self, storage_adapter):
+        storage_adapter.save_run(self._make_run("run-a", 5))
+        storage_adapter.save_run(self._make_run("run-b", 2))
+
+        run = storage_adapter.get_run("run-a")
+
+        for index, result in enumerate(run.results):
+            assert result.test_case_id == f"tc-{index:04d}"
+            assert [metric.name for metric in result.metrics] == [
+                f"metric_{metric}" for metric in range(4)
+            ]
+            assert {metric.score for metric in result.metrics} == {index / 5}
+
+
+class TestSQLiteBulkWrites:
+    """save_run / save_multiturn_run 일괄 저장 테스트."""
+
+    def test_save_run_uses_constant_round_trips(self, storage_adapter, monkeypatch):
+        calls: list[str] = []
+        execute = storage_adapter._execute
+        executemany = storage_adapter._executemany
+
+        def counting_execute(conn, query, params=None):
+            calls.append("execute")
+            return execute(conn, query, params)
+
+        def counting_executemany(conn, query, params_seq):
+            calls.append("executemany")
+            return executemany(conn, query, params_seq)
+
+        monkeypatch.setattr(storage_adapter, "_execute", counting_execute)
+        monkeypatch.setattr(storage_adapter, "_executemany", counting_executemany)
+        counts = []
+        for size in (3, 300):
+            calls.clear()
+            storage_adapter.save_run(TestSQLiteRunHydration._make_run(f"run-{size}", size))
+            counts.append(len(calls))
+
+        # run row + one multi-row test case INSERT + one metric executemany
+        assert counts == [3, 3]
+        run = storage_adapter.get_run("run-300")
+        assert [result.test_case_id for result in run.results] == [
+            f"tc-{index:04d}" for index in range(300)
+        ]
+        assert all(len(result.metrics) == 4 for result in run.results)
+
+    def test_chunked_commits_preserve_ids(self, storage_adapter):
+        storage_adapter.bulk_chunk_size = 7
+        run = TestSQLiteRunHydration._make_run("chunked", 40)
+
+        storage_adapter.save_run(run, commit_every=10)
+
+        loaded = storage_adapter.get_run("chunked")
+        for index, result in enumerate(loaded.results):
+            assert result.test_case_id == f"tc-{index:04d}"
+            assert {metric.score for metric in result.metrics} == {index / 40}
+
+    def test_falls_back_to_row_inserts_without_returning(self, storage_adapter, sample_run):
+        storage_adapter.queries._bulk_returning = ""
+
+        storage_adapter.save_run(sample_run)
+
+        loaded = storage_adapter.get_run("test-run-001")
+        assert [len(result.metrics) for result in loaded.results] == [2, 2]
+        assert loaded.results[1].get_metric("faithfulness").score == 0.75
+
+    def test_append_run_results_creates_then_extends_run(self, storage_adapter):
+        run = TestSQLiteRunHydration._make_run("appended", 6)
+        first, second = run.results[:4], run.results[4:]
+        header = TestSQLiteRunHydration._make_run("appended", 0)
+        header.total_tokens = 10
+        header.tracker_metadata = {"streaming": {"status": "in_progress"}}
+
+        assert storage_adapter.append_run_results(header, first) == 4
+        header.total_tokens = 25
+        header.tracker_metadata = {"streaming": {"status": "completed"}}
+        storage_adapter.append_run_results(header, second)
+
+        loaded = storage_adapter.get_run("appended")
+        assert [result.test_case_id for result in loaded.results] == [
+            f"tc-{index:04d}" for index in range(6)
+        ]
+        assert loaded.total_tokens == 25
+        assert loaded.tracker_metadata["streaming"]["status"] == "completed"
+        assert storage_adapter.list_completed_test_case_ids("appended") == {
+            f"tc-{index:04d}" for index in range(6)
+        }
+        assert storage_adapter.list_completed_test_case_ids("missing") == set()
+
+    def test_save_multiturn_run_links_metrics_to_turns(self, storage_adapter, temp_db):
+        run = MultiTurnRunRecord(
+            run_id="mt-bulk",
+            dataset_name="ds",
+            dataset_version="1",
+            model_name="m",
+            started_at=datetime(2025, 1, 1, 10, 0, 0),
+            finished_at=None,
+            conversation_count=1,
+            turn_count=3,
+            metrics_evaluated=["turn_faithfulness"],
+        )
+        turns = [
+            MultiTurnTurnResult(
+                conversation_id="c1",
+                turn_id=f"t{index}",
+                turn_index=index,
+                role="assistant",
+                metrics={"turn_faithfulness": index / 10},
+            )
+            for index in range(3)
+        ]
+
+        storage_adapter.save_multiturn_run(
+            run,
+            [MultiTurnConversationRecord(run_id="mt-bulk", conversation_id="c1", turn_count=3)],
+            turns,
+            metric_thresholds={"turn_faithfulness": 0.5},
+        )
+
+        with sqlite3.connect(temp_db) as conn:
+            rows = conn.execute(
+                """
+                SELECT t.turn_id, m.score, m.threshold
+                FROM multiturn_metric_scores m
+                JOIN multiturn_turn_results t ON m.turn_result_id = t.id
+                ORDER BY t.turn_index
+                """
+            ).fetchall()
+        assert rows == [("t0", 0.0, 0.5), ("t1", 0.1, 0.5), ("t2", 0.2, 0.5)]
+
+
+class TestSQLiteRunSummaries:
+    """list_run_summaries 집계 조회 테스트."""
+
+    @staticmethod
+    def _make_run(run_id: str, minute: int, **kwargs) -> EvaluationRun:
+        return EvaluationRun(
+            run_id=run_id,
+            dataset_name=kwargs.pop("dataset_name", "insurance-qa"),
+            model_name=kwargs.pop("model_name", "gpt-5-nano"),
+            started_at=datetime(2025, 1, 1, 10, minute, 0),
+            metrics_evaluated=["faithfulness", "answer_relevancy"],
+            results=[
+                TestCaseResult(
+                    test_case_id=f"{run_id}-tc-{index}",
+                    metrics=[
+                        MetricScore(name="faithfulness", score=0.5 + index * 0.1, threshold=0.7),
+                        MetricScore(name="answer_relevancy", score=0.9, threshold=0.7),
+                    ],
+                )
+                for index in range(4)
+            ],
+            **kwargs,
+        )
+
+    def test_summary_matches_hydrated_run(self, storage_adapter, sample_run):
+        storage_adapter.save_run(sample_run)
+        storage_adapter.save_run(self._make_run("run-b", 30))
+
+        summaries = {s.run_id: s for s in storage_adapter.list_run_summaries()}
+
+        for run_id in ("test-run-001", "run-b"):
+            run = storage_adapter.get_run(run_id)
+            summary = summaries[run_id]
+            assert summary.total_test_cases == run.total_test_cases
+            assert summary.passed_test_cases == run.passed_test_cases
+            assert summary.pass_rate == pytest.approx(run.pass_rate)
+            assert summary.metrics_evaluated == run.metrics_evaluated
+            assert summary.tracker_metadata == run.tracker_metadata
+            for metric in run.metrics_evaluated:
+                assert summary.get_avg_score(metric) == pytest.approx(run.get_avg_score(metric))
+
+    def test_run_without_results_has_empty_aggregates(self, storage_adapter):
+        storage_adapter.save_run(
+            EvaluationRun(run_id="empty", dataset_name="ds", model_name="m", results=[])
+        )
+
+        (summary,) = storage_adapter.list_run_summaries()
+
+        assert summary.total_test_cases == 0
+        assert summary.pass_rate == 0.0
+        assert summary.avg_metric_scores == {}
+
+    def test_keyset_pagination_walks_all_runs(self, storage_adapter):
+        for minute in range(7):
+            storage_adapter.save_run(self._make_run(f"run-{minute}", minute))
+        # Same started_at as run-6: the run_id tie-breaker keeps paging total.
+        storage_adapter.save_run(self._make_run("run-6b", 6))
+
+        seen: list[str] = []
+        after = None
+        while True:
+            page = storage_adapter.list_run_summaries(limit=3, after=after)
+            if not page:
+                break
+            seen.extend(summary.run_id for summary in page)
+            after = (page[-1].started_at, page[-1].run_id)
+
+        assert seen == ["run-6b", "run-6", "run-5", "run-4", "run-3", "run-2", "run-1", "run-0"]
+
+    def test_filters_are_applied_in_sql(self, storage_adapter):
+        storage_adapter.save_run(self._make_run("a", 1, dataset_name="ds-a"))
+        storage_adapter.save_run(self._make_run("b", 2, model_name="other-model"))
+        storage_adapter.save_run(self._make_run("c", 3, project_id="project-x"))
+
+        assert [s.run_id for s in storage_adapter.list_run_summaries(dataset_name="ds-a")] == ["a"]
+        assert [s.run_id for s in storage_adapter.list_run_summaries(model_name="other-model")] == [
+            "b"
+        ]
+        assert [s.run_id for s in storage_adapter.list_run_summaries(project_id="project-x")] == [
+            "c"
+        ]
+
+    def test_query_count_does_not_grow_with_runs(self, storage_adapter):
+        statements: list[str] = []
+        connect = storage_adapter._connect
+
+        def tracing_connect():
+            conn = connect()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        storage_adapter._connect = tracing_connect
+        storage_adapter.save_run(self._make_run("first", 0))
+        statements.clear()
+        storage_adapter.list_run_summaries()
+        single = len(statements)
+
+        for minute in range(1, 20):
+            storage_adapter.save_run(self._make_run(f"run-{minute}", minute))
+        statements.clear()
+        summaries = storage_adapter.list_run_summaries()
+
+        assert len(summaries) == 20
+        assert len(statements) == single
+
+
 class TestSQLiteStorageNLPAnalysis:
     """NLP 분석 결과 저장 테스트."""
 
@@ -0,0 +1,175 @@
+"""Tests for the opt-in SQLite high-throughput mode."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import datetime
+
+import pytest
+
+from evalvault.adapters.outbound.domain_memory.sqlite_adapter import SQLiteDomainMemoryAdapter
+from evalvault.adapters.outbound.storage.sqlite_adapter import SQLiteStorageAdapter
+from evalvault.adapters.outbound.storage.sqlite_tuning import (
+    SQLiteTuning,
+    SQLiteWriteQueue,
+    ThreadLocalConnections,
+)
+from evalvault.config.settings import Settings
+from evalvault.domain.entities import EvaluationRun, MetricScore, TestCaseResult
+from evalvault.domain.entities.memory import FactualFact
+
+
+def _make_run(run_id: str) -> EvaluationRun:
+    return EvaluationRun(
+        run_id=run_id,
+        dataset_name="insurance-qa",
+        model_name="gpt-5-nano",
+        started_at=datetime(2025, 1, 1, 10, 0, 0),
+        results=[
+            TestCaseResult(
+                test_case_id="tc-001",
+                metrics=[MetricScore(name="faithfulness", score=0.9, threshold=0.7)],
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def tuned_storage(tmp_path):
+    adapter = SQLiteStorageAdapter(db_path=tmp_path / "runs.db", tuning=SQLiteTuning())
+    yield adapter
+    adapter.close()
+
+
+def test_tuning_from_settings_is_opt_in() -> None:
+    assert SQLiteTuning.from_settings(Settings()) is None
+
+    tuning = SQLiteTuning.from_settings(
+        Settings(sqlite_high_throughput=True, sqlite_busy_timeout_ms=250, sqlite_writer_queue=False)
+    )
+
+    assert tuning == SQLiteTuning(busy_timeout_ms=250, writer_queue=False)
+
+
+def test_connections_use_wal_and_relaxed_sync(tuned_storage) -> None:
+    with tuned_storage._get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64 * 1024
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_connections_are_reused_per_thread(tmp_path) -> None:
+    connections = ThreadLocalConnections(lambda: SQLiteTuning().connect(tmp_path / "t.db"))
+    with connections.connection() as first, connections.connection() as nested:
+        assert nested is first
+
+    seen: list[sqlite3.Connection] = []
+
+    def worker() -> None:
+        with connections.connection() as conn:
+            seen.append(conn)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    with connections.connection() as again:
+        assert again is first
+    assert seen[0] is not first
+    connections.close_all()
+
+
+def test_outermost_release_rolls_back_abandoned_transaction(tmp_path) -> None:
+    connections = ThreadLocalConnections(lambda: SQLiteTuning().connect(tmp_path / "t.db"))
+    with connections.connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+
+    with connections.connection() as outer:
+        outer.execute("INSERT INTO t VALUES (1)")
+        with connections.connection():
+            pass
+        assert outer.in_transaction
+    assert not outer.in_transaction
+    with connections.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+    connections.close_all()
+
+
+def test_write_queue_runs_on_one_thread_and_inlines_nested_writes() -> None:
+    queue = SQLiteWriteQueue()
+    names: list[str] = []
+
+    def inner() -> str:
+        names.append(threading.current_thread().name)
+        return "done"
+
+    def outer() -> str:
+        names.append(threading.current_thread().name)
+        return queue.call(inner)
+
+    try:
+        assert queue.call(outer) == "done"
+        with pytest.raises(ValueError):
+            queue.call(lambda: (_ for _ in ()).throw(ValueError("boom")))
+    finally:
+        queue.close()
+
+    assert len(set(names)) == 1
+    assert names[0].startswith("evalvault-sqlite-writer")
+
+
+def test_storage_writes_go_through_writer_queue(tuned_storage, monkeypatch) -> None:
+    threads: list[str] = []
+    execute = tuned_storage._execute
+
+    def tracking_execute(conn, query, params=None):
+        if query.lstrip().upper().startswith("INSERT"):
+            threads.append(threading.current_thread().name)
+        return execute(conn, query, params)
+
+    monkeypatch.setattr(tuned_storage, "_execute", tracking_execute)
+
+    tuned_storage.save_run(_make_run("run-1"))
+
+    assert threads and all(name.startswith("evalvault-sqlite-writer") for name in threads)
+    assert tuned_storage.get_run("run-1").results[0].metrics[0].score == 0.9
+
+
+def test_reads_do_not_wait_for_an_open_write_transaction(tuned_storage) -> None:
+    tuned_storage.save_run(_make_run("run-1"))
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold_write_lock() -> None:
+        with tuned_storage._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM evaluation_runs")
+            holding.set()
+            release.wait(5)
+            conn.rollback()
+
+    pending = tuned_storage._writer.submit(hold_write_lock)
+    assert holding.wait(5)
+    try:
+        # Under the rollback journal this read would block until the writer commits.
+        assert tuned_storage.get_run("run-1").run_id == "run-1"
+    finally:
+        release.set()
+        pending.result(5)
+
+
+def test_domain_memory_round_trip_in_high_throughput_mode(tmp_path) -> None:
+    adapter = SQLiteDomainMemoryAdapter(db_path=tmp_path / "memory.db", tuning=SQLiteTuning())
+    try:
+        fact_id = adapter.save_fact(
+            FactualFact(subject="보험료", predicate="납입", object="월납", domain="insurance")
+        )
+        assert adapter.get_fact(fact_id).object == "월납"
+        assert adapter.delete_fact(fact_id) is True
+        with pytest.raises(KeyError):
+            adapter.get_fact(fact_id)
+    finally:
+        adapter.close()
@@ -217,6 +217,48 @@ class TestWebUIAdapter:
         runs = adapter.list_runs()
         assert runs == []
 
+    def test_list_runs_uses_summary_projection(self, mock_storage, mock_evaluator):
+        """요약 조회 경로는 run 전체를 적재하지 않는다."""
+        from evalvault.adapters.inbound.api.adapter import WebUIAdapter
+        from evalvault.domain.entities import EvaluationRunSummary
+
+        started_at = datetime(2025, 1, 1, 10, 0, 0)
+        mock_storage.list_run_summaries.return_value = [
+            EvaluationRunSummary(
+                run_id="run-1",
+                dataset_name="insurance-qa",
+                model_name="gpt-5-nano",
+                started_at=started_at,
+                metrics_evaluated=["faithfulness"],
+                tracker_metadata={"run_mode": "simple"},
+                total_test_cases=4,
+                passed_test_cases=3,
+                avg_metric_scores={"faithfulness": 0.8},
+            )
+        ]
+        adapter = WebUIAdapter(storage=mock_storage, evaluator=mock_evaluator)
+
+        (summary,) = adapter.list_runs(
+            limit=10,
+            filters=RunFilters(dataset_name="insurance-qa"),
+            after=(started_at, "run-0"),
+        )
+
+        mock_storage.list_runs.assert_not_called()
+        mock_storage.get_run.assert_not_called()
+        mock_storage.list_run_summaries.assert_called_once_with(
+            limit=10,
+            offset=0,
+            after=(started_at, "run-0"),
+            dataset_name="insurance-qa",
+            model_name=None,
+            project_id=None,
+        )
+        assert summary.pass_rate == 0.75
+        assert summary.total_test_cases == 4
+        assert summary.run_mode == "simple"
+        assert summary.avg_metric_scores == {"faithfulness": 0.8}
+
     def test_list_runs_without_storage(self):
         """저장소 없이 평가 목록 조회."""
         from evalvault.adapters.inbound.api.adapter import WebUIAdapter